@@ -8,65 +8,77 @@ import sys
 from dataclasses import asdict
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
-
-import requests
-
-from src.obligation_alignment import align_obligations, alignment_to_payload
-from src.obligation_projections import (
-    PROJECTION_SCHEMA_VERSION,
-    action_view,
-    actor_view,
-    clause_view,
-    timeline_view,
-)
-from src.obligation_views import (
-    EXPLANATION_SCHEMA_VERSION,
-    build_explanations,
-    explanations_to_payload,
-)
-from src.obligations import extract_obligations_from_text, obligation_to_dict
-from src.ontology.enrichment import (
-    PROVIDER_NAMES,
-    LookupCandidate,
-    batch_lookup as batch_provider_lookup,
-    fetch_rows,
-    serialise_candidates,
-    upsert_external_ref,
-    write_candidates,
-)
-from src.graph.inference import (
-    PREDICTION_VERSION,
-    PredictionSet,
-    build_prediction_set,
-    get_case_identifiers,
-    get_provision_identifiers,
-    legal_graph_to_triples,
-    load_predictions_json,
-    load_predictions_sqlite,
-    persist_predictions_json,
-    persist_predictions_sqlite,
-    rank_predictions,
-    score_applies_predictions,
-    train_complex,
-    train_distmult,
-    train_mure,
-    train_rotate,
-    train_transe,
-)
-from src.graph.models import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType
-from src.activation import (
-    ACTIVATION_VERSION,
-    FACT_ENVELOPE_VERSION,
-    Fact,
-    FactEnvelope,
-    activation_to_payload,
-    simulate_activation,
-)
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence
+
+if TYPE_CHECKING:
+    from src.activation import FactEnvelope
+    from src.graph.inference import PredictionSet
+    from src.graph.models import EdgeType, LegalGraph, NodeType
+    from src.ontology.enrichment import LookupCandidate
+
+from src.ontology.provider_names import PROVIDER_NAMES as _ONTOLOGY_PROVIDER_NAMES
 
 from . import receipts as receipts_cli
 from . import code_observer as code_observer_cli
 
+# Handlers import their heavy dependencies on dispatch so that ``--help`` and
+# light commands such as ``get`` do not pay for spaCy, PyKEEN or ``requests``.
+# Names that used to be imported here stay reachable as module attributes.
+_LAZY_ATTRIBUTES: Dict[str, tuple[str, Optional[str]]] = {
+    "requests": ("requests", None),
+    **{
+        name: (module, name)
+        for module, names in {
+            "src.activation": (
+                "ACTIVATION_VERSION",
+                "FACT_ENVELOPE_VERSION",
+                "Fact",
+                "FactEnvelope",
+                "activation_to_payload",
+                "simulate_activation",
+            ),
+            "src.graph.inference": (
+                "PREDICTION_VERSION",
+                "PredictionSet",
+                "build_prediction_set",
+                "legal_graph_to_triples",
+                "load_predictions_json",
+                "load_predictions_sqlite",
+                "persist_predictions_json",
+                "persist_predictions_sqlite",
+                "rank_predictions",
+                "score_applies_predictions",
+            ),
+            "src.graph.models": ("EdgeType", "GraphEdge", "GraphNode", "LegalGraph", "NodeType"),
+            "src.obligation_alignment": ("align_obligations", "alignment_to_payload"),
+            "src.obligation_views": ("build_explanations", "explanations_to_payload"),
+            "src.obligations": ("extract_obligations_from_text", "obligation_to_dict"),
+            "src.ontology.enrichment": (
+                "PROVIDER_NAMES",
+                "LookupCandidate",
+                "fetch_rows",
+                "serialise_candidates",
+                "upsert_external_ref",
+                "write_candidates",
+            ),
+        }.items()
+        for name in names
+    },
+}
+
+_DEFAULT_INFERENCE_RELATION = "applies"
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+
+    module = importlib.import_module(module_name)
+    return module if attribute is None else getattr(module, attribute)
+
 
 def _print_json(data: object, *, sort_keys: bool = False) -> None:
     """Serialise ``data`` to JSON and print it to stdout."""
@@ -85,6 +97,8 @@ def _load_text_arg(text: Optional[str], text_file: Optional[Path], *, label: str
 
 
 def _load_facts(path: Optional[Path]) -> FactEnvelope:
+    from src.activation import FACT_ENVELOPE_VERSION, Fact, FactEnvelope
+
     if not path:
         raise SystemExit("--facts is required when simulating activation")
     data = json.loads(path.read_text(encoding="utf-8"))
@@ -130,16 +144,19 @@ def _subgraph_from_data(data: Mapping[str, Sequence[Mapping[str, object]]], seed
         selected_ids = set(node_map.keys())
     else:
         selected_ids = set(seeds) & set(node_map.keys())
+        neighbours: dict[object, set[object]] = {}
+        for edge in edges:
+            source = edge.get("source")
+            target = edge.get("target")
+            if target in node_map:
+                neighbours.setdefault(source, set()).add(target)
+            if source in node_map:
+                neighbours.setdefault(target, set()).add(source)
         frontier = set(selected_ids)
         for _ in range(max(hops, 0)):
             next_frontier: set[str] = set()
-            for edge in edges:
-                source = edge.get("source")
-                target = edge.get("target")
-                if source in frontier and target in node_map:
-                    next_frontier.add(target)
-                if target in frontier and source in node_map:
-                    next_frontier.add(source)
+            for node_id in frontier:
+                next_frontier.update(neighbours.get(node_id, ()))
             next_frontier -= selected_ids
             if not next_frontier:
                 break
@@ -173,6 +190,8 @@ def _subgraph_to_dot(data: Mapping[str, Sequence[Mapping[str, object]]], *, id_k
 
 
 def _coerce_node_type(value: object) -> NodeType:
+    from src.graph.models import NodeType
+
     if isinstance(value, NodeType):
         return value
     if value is None:
@@ -185,6 +204,8 @@ def _coerce_node_type(value: object) -> NodeType:
 
 
 def _coerce_edge_type(value: object) -> EdgeType:
+    from src.graph.models import EdgeType
+
     if isinstance(value, EdgeType):
         return value
     if value is None:
@@ -197,6 +218,8 @@ def _coerce_edge_type(value: object) -> EdgeType:
 
 
 def _normalise_relation(value: Optional[str]) -> str:
+    from src.graph.models import EdgeType
+
     if not value:
         return EdgeType.APPLIES.value
     for edge_type in EdgeType:
@@ -206,6 +229,8 @@ def _normalise_relation(value: Optional[str]) -> str:
 
 
 def _graph_from_payload(data: Mapping[str, Sequence[Mapping[str, object]]]) -> LegalGraph:
+    from src.graph.models import GraphEdge, GraphNode, LegalGraph
+
     graph = LegalGraph()
     for node in data.get("nodes", []):
         identifier = node.get("id") or node.get("identifier")
@@ -263,6 +288,8 @@ def _graph_from_payload(data: Mapping[str, Sequence[Mapping[str, object]]]) -> L
 
 
 def _prediction_payload(predictions: PredictionSet) -> Dict[str, object]:
+    from src.graph.inference import PREDICTION_VERSION
+
     return {
         "version": PREDICTION_VERSION,
         "relation": predictions.relation,
@@ -343,6 +370,14 @@ def _handle_extract_rules(args: argparse.Namespace) -> None:
 
 
 def _projection_payload(view: str, obligations) -> dict:
+    from src.obligation_projections import (
+        PROJECTION_SCHEMA_VERSION,
+        action_view,
+        actor_view,
+        clause_view,
+        timeline_view,
+    )
+
     handlers = {
         "actor": actor_view,
         "action": action_view,
@@ -362,6 +397,11 @@ def _projection_payload(view: str, obligations) -> dict:
 def _handle_obligations(args: argparse.Namespace) -> None:
     """Extract obligations and optionally emit projections/explanations/alignment."""
 
+    from src.activation import activation_to_payload, simulate_activation
+    from src.obligation_alignment import align_obligations, alignment_to_payload
+    from src.obligation_views import build_explanations, explanations_to_payload
+    from src.obligations import extract_obligations_from_text, obligation_to_dict
+
     text = _load_text_arg(args.text, args.text_file, label="--text or --text-file is required")
     obligations = extract_obligations_from_text(
         text,
@@ -409,6 +449,8 @@ def _handle_obligations(args: argparse.Namespace) -> None:
 
 
 def _handle_ontology_lookup(args: argparse.Namespace) -> None:
+    import requests
+
     from src.ontology.search import filter_candidates
 
     response = requests.get(args.url, params={"q": args.term})
@@ -1920,6 +1962,7 @@ def _handle_check(args: argparse.Namespace) -> None:
 
 
 def _handle_pdf_fetch(args: argparse.Namespace) -> None:
+    from src.ingestion.pdf_page_cache import PdfPageCache
     from src.pdf_ingest import process_pdf
 
     doc, stored_id = process_pdf(
@@ -1931,6 +1974,8 @@ def _handle_pdf_fetch(args: argparse.Namespace) -> None:
         cultural_flags=args.cultural_flags,
         db_path=args.db,
         doc_id=args.doc_id,
+        extraction_workers=args.workers,
+        page_cache=PdfPageCache(args.page_cache) if args.page_cache else None,
     )
     source_id = (
         args.logic_tree_source_id
@@ -2110,7 +2155,7 @@ def _handle_distinguish(args: argparse.Namespace) -> None:
 
 
 def _handle_concepts_match(args: argparse.Namespace) -> None:
-    from src.concepts.matcher import ConceptMatcher
+    from src.concepts.matcher import MATCHER
 
     text = args.text or args.text_arg
     if not text:
@@ -2118,9 +2163,10 @@ def _handle_concepts_match(args: argparse.Namespace) -> None:
         if parser is not None:
             parser.error("invalid choice: text is required")
         raise SystemExit("text is required")
-    matcher = ConceptMatcher()
-    hits = matcher.match(text)
-    payload = [{"concept_id": hit.concept_id, "start": hit.start, "end": hit.end} for hit in hits]
+    payload = [
+        {"concept_id": concept_id, "start": start, "end": end}
+        for concept_id, start, end in MATCHER.iter_matches(text)
+    ]
     _print_json(payload)
 
 
@@ -2244,6 +2290,8 @@ def _handle_graph_query(args: argparse.Namespace) -> None:
 
 
 def _handle_graph_export(args: argparse.Namespace) -> None:
+    from src.graph.inference import legal_graph_to_triples
+
     data = _load_graph_data(args.graph, flag="--graph")
     graph = _graph_from_payload(data)
     triples_pack = legal_graph_to_triples(
@@ -2253,6 +2301,22 @@ def _handle_graph_export(args: argparse.Namespace) -> None:
 
 
 def _handle_graph_inference_train(args: argparse.Namespace) -> None:
+    from src.graph.inference import (
+        build_prediction_set,
+        get_case_identifiers,
+        get_provision_identifiers,
+        legal_graph_to_triples,
+        persist_predictions_json,
+        persist_predictions_sqlite,
+        rank_predictions,
+        score_applies_predictions,
+        train_complex,
+        train_distmult,
+        train_mure,
+        train_rotate,
+        train_transe,
+    )
+
     relation = _normalise_relation(args.relation)
     data = _load_graph_data(args.graph)
     graph = _graph_from_payload(data)
@@ -2301,6 +2365,8 @@ def _handle_graph_inference_train(args: argparse.Namespace) -> None:
         cases=cases,
         provisions=provisions,
         relation=relation,
+        top_k=args.top_k,
+        head_batch_size=args.score_batch_size or None,
     )
 
     ranked_predictions = rank_predictions(
@@ -2318,12 +2384,70 @@ def _handle_graph_inference_train(args: argparse.Namespace) -> None:
         persist_predictions_json(prediction_set, Path(args.json_out))
     if args.sqlite_out:
         persist_predictions_sqlite(prediction_set, Path(args.sqlite_out))
+    if args.embeddings_store:
+        from src.graph.embedding_store import build_embedding_store, pykeen_entity_vectors
+
+        build_embedding_store(
+            pykeen_entity_vectors(artifacts.pipeline_result, artifacts.triples_factory),
+            Path(args.embeddings_store),
+        )
 
     payload = _prediction_payload(prediction_set)
     _print_json(payload)
 
 
+def _handle_graph_neighbours(args: argparse.Namespace) -> None:
+    from src.graph.embedding_store import (
+        EmbeddingStore,
+        build_embedding_store,
+        iter_neighbour_rows,
+    )
+
+    if args.embeddings:
+        from src.graph.rgcn import load_embeddings
+
+        try:
+            store = build_embedding_store(
+                load_embeddings(Path(args.embeddings)),
+                Path(args.store),
+                ivf_lists=args.ivf_lists,
+            )
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+    elif (Path(args.store) / "manifest.json").exists():
+        store = EmbeddingStore.load(Path(args.store))
+    else:
+        raise SystemExit(f"No embedding store at {args.store}; pass --embeddings to build one")
+
+    options = {"exact": args.exact, "nprobe": args.nprobe}
+    neighbours: List[Dict[str, object]] = list(
+        iter_neighbour_rows(store, args.node or [], args.k, **options)
+    )
+    if args.vector:
+        try:
+            vector = json.loads(args.vector)
+            results = store.nearest(vector, args.k, **options)
+        except (json.JSONDecodeError, TypeError, ValueError) as exc:
+            raise SystemExit(f"Invalid --vector: {exc}") from exc
+        neighbours.extend(
+            {"query": None, "rank": rank, "identifier": identifier, "distance": distance}
+            for rank, (identifier, distance) in enumerate(results, start=1)
+        )
+    _print_json(
+        {
+            "store": str(args.store),
+            "count": len(store),
+            "dim": store.dim,
+            "index": "exact" if args.exact or not store.has_ivf else "ivf",
+            "missing": [node for node in args.node or [] if node not in store],
+            "neighbours": neighbours,
+        }
+    )
+
+
 def _handle_graph_inference_rank(args: argparse.Namespace) -> None:
+    from src.graph.inference import load_predictions_json, load_predictions_sqlite
+
     relation = _normalise_relation(args.relation)
     prediction_set: Optional[PredictionSet] = None
 
@@ -2709,6 +2833,27 @@ def _handle_austlii_case_fetch(args: argparse.Namespace) -> None:
         print(f"Saved content to {args.out}")
 
 
+def _handle_austlii_backfill(args: argparse.Namespace) -> None:
+    """Stream a list of AustLII PDF URLs into the normalized ontology tables."""
+    from src.ingestion.austlii_pipeline import backfill_pdfs
+    from src.runtime.progress import PhaseRecorder
+    from src.sources.austlii_fetch import AustLiiFetchAdapter
+
+    lines = args.urls_file.read_text(encoding="utf-8").splitlines()
+    urls = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    summary = backfill_pdfs(
+        urls,
+        db_path=args.db,
+        fetch_adapter=AustLiiFetchAdapter(progress_enabled=False),
+        default_category=args.category,
+        fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers,
+        resume=args.resume,
+        recorder=PhaseRecorder(stream=sys.stderr),
+    )
+    _print_json(summary.to_dict())
+
+
 def _handle_jade_fetch(args: argparse.Namespace) -> None:
     import hashlib
     import json
@@ -2962,9 +3107,26 @@ def _handle_search(args: argparse.Namespace) -> None:
         index.close()
 
 
+def _handle_search_index(args: argparse.Namespace) -> None:
+    from src.storage import TextIndex
+
+    index = TextIndex(args.db)
+    try:
+        if args.search_index_command == "rebuild":
+            report = index.rebuild()
+        elif args.search_index_command == "optimize":
+            report = index.optimize()
+        else:
+            report = index.merge(args.pages)
+        _print_json(report)
+    finally:
+        index.close()
+
+
 def _handle_proof_tree(args: argparse.Namespace) -> None:
     from datetime import date as date_cls
 
+    from src.graph.models import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType
     from src.graph.proof_tree import expand_proof_tree
 
     data = _load_graph_data(args.graph, flag="--graph")
@@ -3110,6 +3272,8 @@ def _interactive_upsert(
     entity: Mapping[str, object],
     candidates: Mapping[str, list[LookupCandidate]],
 ) -> None:
+    from src.ontology.enrichment import upsert_external_ref
+
     label = str(entity.get("label") or entity.get("code") or entity.get("id"))
     for provider, provider_candidates in candidates.items():
         selected = _prompt_candidate_choices(label, provider, provider_candidates)
@@ -3131,6 +3295,14 @@ def _enrich_table(
     table: str,
     columns: Sequence[str],
 ) -> None:
+    from src.ontology.enrichment import (
+        PROVIDER_NAMES,
+        batch_lookup as batch_provider_lookup,
+        fetch_rows,
+        serialise_candidates,
+        write_candidates,
+    )
+
     providers = args.providers or list(PROVIDER_NAMES)
     with sqlite3.connect(args.db) as connection:
         connection.row_factory = sqlite3.Row
@@ -3290,8 +3462,8 @@ def build_parser() -> argparse.ArgumentParser:
     concepts_enrich.add_argument(
         "--providers",
         nargs="+",
-        choices=PROVIDER_NAMES,
-        default=list(PROVIDER_NAMES),
+        choices=_ONTOLOGY_PROVIDER_NAMES,
+        default=list(_ONTOLOGY_PROVIDER_NAMES),
         help="External providers to query",
     )
     concepts_enrich.add_argument("--limit", type=int, default=5, help="Max candidates per provider")
@@ -3311,8 +3483,8 @@ def build_parser() -> argparse.ArgumentParser:
     actors_enrich.add_argument(
         "--providers",
         nargs="+",
-        choices=PROVIDER_NAMES,
-        default=list(PROVIDER_NAMES),
+        choices=_ONTOLOGY_PROVIDER_NAMES,
+        default=list(_ONTOLOGY_PROVIDER_NAMES),
         help="External providers to query",
     )
     actors_enrich.add_argument("--limit", type=int, default=5, help="Max candidates per provider")
@@ -4333,6 +4505,16 @@ def build_parser() -> argparse.ArgumentParser:
     pdf_fetch.add_argument("--cultural-flags", nargs="*")
     pdf_fetch.add_argument("--db", type=Path)
     pdf_fetch.add_argument("--doc-id", type=int)
+    pdf_fetch.add_argument(
+        "--workers",
+        type=int,
+        help="Lay out PDF pages with this many worker processes (default: serial)",
+    )
+    pdf_fetch.add_argument(
+        "--page-cache",
+        type=Path,
+        help="Directory for the persistent extracted-page cache (default: disabled)",
+    )
     pdf_fetch.add_argument(
         "--logic-tree-artifacts",
         type=Path,
@@ -4460,6 +4642,28 @@ def build_parser() -> argparse.ArgumentParser:
     )
     graph_export.set_defaults(func=_handle_graph_export)
 
+    graph_neighbours = graph_sub.add_parser(
+        "neighbours", help="Nearest neighbours from a persisted embedding store"
+    )
+    graph_neighbours.add_argument("--store", type=Path, required=True, help="Embedding store directory")
+    graph_neighbours.add_argument(
+        "--embeddings",
+        type=Path,
+        help="Embedding JSON export to (re)build the store from before querying",
+    )
+    graph_neighbours.add_argument(
+        "--ivf-lists",
+        type=int,
+        default=0,
+        help="Build an IVF index with this many lists when building (0: exact search only)",
+    )
+    graph_neighbours.add_argument("--node", action="append", help="Node identifier to query")
+    graph_neighbours.add_argument("--vector", help="Query vector as a JSON list")
+    graph_neighbours.add_argument("--k", type=int, default=10, help="Neighbours per query")
+    graph_neighbours.add_argument("--exact", action="store_true", help="Ignore the IVF index")
+    graph_neighbours.add_argument("--nprobe", type=int, help="IVF lists probed per query")
+    graph_neighbours.set_defaults(func=_handle_graph_neighbours)
+
     inference = graph_sub.add_parser("inference", help="Knowledge graph inference utilities")
     inference_sub = inference.add_subparsers(dest="inference_command")
 
@@ -4479,7 +4683,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     inference_train.add_argument(
         "--relation",
-        default=EdgeType.APPLIES.value,
+        default=_DEFAULT_INFERENCE_RELATION,
         help="Relation label to score (default: applies)",
     )
     inference_train.add_argument("--case", action="append", help="Limit scoring to specific case ids")
@@ -4489,9 +4693,24 @@ def build_parser() -> argparse.ArgumentParser:
         help="Limit scoring to specific provision identifiers",
     )
     inference_train.add_argument("--top-k", type=int, help="Maximum recommendations per case")
+    inference_train.add_argument(
+        "--score-batch-size",
+        type=int,
+        default=256,
+        help=(
+            "Maximum cases per scoring block; blocks are also capped by the score budget "
+            "and may take several model calls (0 removes the cap, and without --top-k "
+            "scores each case/provision pair separately)"
+        ),
+    )
     inference_train.add_argument("--random-seed", type=int, help="Deterministic seed for PyKEEN")
     inference_train.add_argument("--json-out", type=Path, help="Write predictions to a JSON file")
     inference_train.add_argument("--sqlite-out", type=Path, help="Write predictions to a SQLite database")
+    inference_train.add_argument(
+        "--embeddings-store",
+        type=Path,
+        help="Persist entity embeddings as an embedding store for 'graph neighbours'",
+    )
     inference_train.set_defaults(func=_handle_graph_inference_train)
 
     inference_rank = inference_sub.add_parser(
@@ -4499,7 +4718,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     inference_rank.add_argument("--case", required=True, help="Case identifier to rank against")
     inference_rank.add_argument("--top-k", type=int, help="Limit the number of rows returned")
-    inference_rank.add_argument("--relation", default=EdgeType.APPLIES.value)
+    inference_rank.add_argument("--relation", default=_DEFAULT_INFERENCE_RELATION)
     inference_rank.add_argument("--json", type=Path, help="Prediction JSON file")
     inference_rank.add_argument("--sqlite", type=Path, help="Prediction SQLite database")
     inference_rank.set_defaults(func=_handle_graph_inference_rank)
@@ -4602,6 +4821,22 @@ def build_parser() -> argparse.ArgumentParser:
     austlii_case_fetch.add_argument("--db-path", type=Path, help="Optional sqlite path to persist a bounded authority ingest receipt")
     austlii_case_fetch.set_defaults(func=_handle_austlii_case_fetch)
 
+    austlii_backfill = sub.add_parser(
+        "austlii-backfill",
+        help="Fetch, parse and persist AustLII PDFs into the ontology tables with overlapping stages",
+    )
+    austlii_backfill.add_argument("--db", type=Path, required=True, help="Ontology sqlite database")
+    austlii_backfill.add_argument("--urls-file", type=Path, required=True, help="File with one PDF URL per line")
+    austlii_backfill.add_argument("--category", help="Default legal source category for new sources")
+    austlii_backfill.add_argument("--fetch-workers", type=int, default=4, help="Concurrent fetch threads")
+    austlii_backfill.add_argument("--parse-workers", type=int, default=2, help="Concurrent parse threads")
+    austlii_backfill.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip URLs that already have a successful checkpoint",
+    )
+    austlii_backfill.set_defaults(func=_handle_austlii_backfill)
+
     jade_fetch = sub.add_parser("jade-fetch", help="Fetch a JADE authority by citation or URL")
     jade_fetch.add_argument("--citation", required=True, help="Neutral citation or explicit JADE URL")
     jade_fetch.add_argument(
@@ -4685,6 +4920,25 @@ def build_parser() -> argparse.ArgumentParser:
     search.add_argument("--db", required=True)
     search.set_defaults(func=_handle_search)
 
+    # Maintenance lives beside ``search`` rather than under it: ``search``
+    # takes a positional query, so ``search rebuild`` would already mean a
+    # query for "rebuild".
+    search_index = sub.add_parser(
+        "search-index", help="Maintain the text index searched by `search`"
+    )
+    search_index_sub = search_index.add_subparsers(dest="search_index_command")
+    search_index_sub.required = True
+    search_rebuild = search_index_sub.add_parser("rebuild", help="Rebuild the FTS5 index from stored text")
+    search_rebuild.add_argument("--db", required=True)
+    search_rebuild.set_defaults(func=_handle_search_index)
+    search_optimize = search_index_sub.add_parser("optimize", help="Merge all FTS5 segments into one")
+    search_optimize.add_argument("--db", required=True)
+    search_optimize.set_defaults(func=_handle_search_index)
+    search_merge = search_index_sub.add_parser("merge", help="Run incremental FTS5 segment merging")
+    search_merge.add_argument("--db", required=True)
+    search_merge.add_argument("--pages", type=int, default=500, help="Maximum pages to merge")
+    search_merge.set_defaults(func=_handle_search_index)
+
     proof_tree = sub.add_parser("proof-tree", help="Expand a proof tree from a graph")
     proof_tree.add_argument("--graph", type=Path, required=True)
     proof_tree.add_argument("--seed", required=True)
@@ -7,13 +7,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-from src.sensiblaw.interfaces import (
-    build_classification_discovery_lattice,
-    render_classification_discovery_lattice_png,
-)
-from src.receipts.build import build_receipt
-from src.receipts.verify import verify_receipt
-
 
 def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     """Register the ``receipts`` command."""
@@ -48,12 +41,16 @@ def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) ->
 
 
 def _handle_build(args: argparse.Namespace) -> None:
+    from src.receipts.build import build_receipt
+
     data: Dict[str, Any] = json.loads(args.data)
     receipt = build_receipt(data)
     print(json.dumps(receipt))
 
 
 def _handle_verify(args: argparse.Namespace) -> None:
+    from src.receipts.verify import verify_receipt
+
     receipt: Dict[str, Any] = json.loads(args.receipt)
     ok = verify_receipt(receipt)
     print("valid" if ok else "invalid")
@@ -71,6 +68,11 @@ def _handle_diff(args: argparse.Namespace) -> None:
 
 
 def _handle_classification_discovery_lattice(args: argparse.Namespace) -> None:
+    from src.sensiblaw.interfaces import (
+        build_classification_discovery_lattice,
+        render_classification_discovery_lattice_png,
+    )
+
     payload = json.loads(args.story_pnf_payload.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
         raise SystemExit("story_pnf_payload must be a JSON object")
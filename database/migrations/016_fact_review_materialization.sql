@@ -0,0 +1,18 @@
+CREATE TABLE IF NOT EXISTS fact_review_generations (
+    run_id TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,
+    changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS fact_review_materializations (
+    run_id TEXT NOT NULL,
+    payload_kind TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    payload_version TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    payload_sha256 TEXT NOT NULL,
+    payload_bytes INTEGER NOT NULL,
+    build_seconds REAL NOT NULL,
+    built_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, payload_kind)
+);
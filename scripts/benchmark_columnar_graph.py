@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Compare memory and lookup cost of ``LegalGraph`` and ``ColumnarLegalGraph``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.graph.columnar import ColumnarGraphBuilder, ColumnarLegalGraph  # noqa: E402
+from src.graph.models import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType  # noqa: E402
+
+_EDGE_TYPES = (EdgeType.CITES, EdgeType.FOLLOWS, EdgeType.DISTINGUISHES, EdgeType.APPLIES)
+
+
+def _elements(nodes: int, edges: int, seed: int):
+    rng = random.Random(seed)
+    node_objects = (
+        GraphNode(type=NodeType.CASE, identifier=f"case:{index}") for index in range(nodes)
+    )
+    edge_objects = (
+        GraphEdge(
+            type=rng.choice(_EDGE_TYPES),
+            source=f"case:{rng.randrange(nodes)}",
+            target=f"case:{rng.randrange(nodes)}",
+            weight=rng.random(),
+        )
+        for _ in range(edges)
+    )
+    return node_objects, edge_objects
+
+
+def _measure(build):
+    # Build times include tracemalloc overhead and are only comparable
+    # between the two backends, not with untraced runs.
+    tracemalloc.start()
+    started = time.perf_counter()
+    graph = build()
+    elapsed = time.perf_counter() - started
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return graph, current, elapsed
+
+
+def _build_legal(args):
+    nodes, edges = _elements(args.nodes, args.edges, args.seed)
+    graph = LegalGraph()
+    for node in nodes:
+        graph.add_node(node)
+    for edge in edges:
+        graph.add_edge(edge)
+    return graph
+
+
+def _build_columnar(args):
+    nodes, edges = _elements(args.nodes, args.edges, args.seed)
+    builder = ColumnarGraphBuilder()
+    for node in nodes:
+        builder.add_node(node)
+    for edge in edges:
+        builder.add_edge(edge)
+    return builder.build()
+
+
+def _lookup_ms(graph, probes) -> float:
+    started = time.perf_counter()
+    for probe in probes:
+        graph.find_edges(target=probe, type=EdgeType.FOLLOWS)
+        graph.out_edges(probe)
+    return (time.perf_counter() - started) * 1000 / len(probes)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--edges", type=int, default=500_000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    probes = [f"case:{rng.randrange(args.nodes)}" for _ in range(args.lookups)]
+
+    legal, legal_bytes, legal_seconds = _measure(lambda: _build_legal(args))
+    legal_lookup = _lookup_ms(legal, probes)
+    del legal
+
+    # Columnar bytes are what remains resident after the builder is dropped.
+    columnar, columnar_bytes, columnar_seconds = _measure(lambda: _build_columnar(args))
+    columnar_lookup = _lookup_ms(columnar, probes)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        columnar.save(Path(tmp))
+        on_disk = sum(path.stat().st_size for path in Path(tmp).iterdir())
+        started = time.perf_counter()
+        mapped = ColumnarLegalGraph.load(Path(tmp))
+        load_seconds = time.perf_counter() - started
+        mapped_lookup = _lookup_ms(mapped, probes)
+        mapped.close()
+
+    report = {
+        "nodes": args.nodes,
+        "edges": args.edges,
+        "legal_graph": {
+            "heap_mb": round(legal_bytes / 2**20, 1),
+            "build_seconds": round(legal_seconds, 2),
+            "lookup_ms": round(legal_lookup, 4),
+        },
+        "columnar": {
+            "heap_mb": round(columnar_bytes / 2**20, 1),
+            "build_seconds": round(columnar_seconds, 2),
+            "lookup_ms": round(columnar_lookup, 4),
+        },
+        "mmap": {
+            "file_mb": round(on_disk / 2**20, 1),
+            "load_seconds": round(load_seconds, 4),
+            "lookup_ms": round(mapped_lookup, 4),
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
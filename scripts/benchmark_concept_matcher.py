@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark concept matching: dict-of-nodes trie vs compiled, memory-mapped automaton.
+
+Matching is measured over the shipped concept trigger set and over a synthetic
+trigger set of ``--synthetic-triggers`` phrases.  Startup is measured in fresh
+interpreters importing ``src.concepts.matcher`` and matching one text, with a
+cold and a warm automaton cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+import json
+import os
+from pathlib import Path
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.concepts.automaton import CompiledAutomaton, load_triggers  # noqa: E402
+
+
+class _LegacyNode:
+    __slots__ = ("children", "fail", "outputs")
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.fail = None
+        self.outputs = []
+
+
+def _legacy_build(triggers):
+    # The pre-compilation matcher: per-character dict walk with failure links.
+    root = _LegacyNode()
+    for trigger, concept_id in triggers:
+        node = root
+        for ch in trigger:
+            node = node.children.setdefault(ch, _LegacyNode())
+        node.outputs.append((concept_id, len(trigger)))
+    queue = deque()
+    root.fail = root
+    for child in root.children.values():
+        child.fail = root
+        queue.append(child)
+    while queue:
+        current = queue.popleft()
+        for ch, child in current.children.items():
+            queue.append(child)
+            fail = current.fail
+            while fail is not root and ch not in fail.children:
+                fail = fail.fail
+            child.fail = fail.children.get(ch, root)
+            child.outputs.extend(child.fail.outputs)
+    return root
+
+
+def _legacy_match(root, text):
+    hits = []
+    node = root
+    for i, ch in enumerate(text.lower()):
+        while ch not in node.children and node is not root:
+            node = node.fail
+        node = node.children.get(ch, root)
+        for concept_id, length in node.outputs:
+            hits.append((concept_id, i - length + 1, i + 1))
+    return hits
+
+
+def _timed(fn, repeats: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def _startup_seconds(cache_dir: str, repeats: int) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT), str(ROOT / "src")])
+    env["SENSIBLAW_CACHE"] = cache_dir
+    code = "from src.concepts.matcher import MATCHER; MATCHER.match('permanent stay')"
+    _, seconds = _timed(
+        lambda: subprocess.run([sys.executable, "-c", code], env=env, check=True), repeats
+    )
+    return seconds
+
+
+def _compare(triggers, texts, repeats: int) -> dict:
+    legacy_root, legacy_build_s = _timed(lambda: _legacy_build(triggers))
+    automaton, compile_s = _timed(lambda: CompiledAutomaton.from_triggers(triggers))
+    expected, legacy_match_s = _timed(
+        lambda: [_legacy_match(legacy_root, text) for text in texts], repeats
+    )
+    actual, compiled_match_s = _timed(lambda: automaton.match_many(texts), repeats)
+    return {
+        "triggers": len(triggers),
+        "states": automaton.num_states,
+        "build_seconds": {"legacy": round(legacy_build_s, 4), "compiled": round(compile_s, 4)},
+        "match_seconds": {
+            "legacy": round(legacy_match_s, 4),
+            "compiled": round(compiled_match_s, 4),
+        },
+        "hits": sum(len(hits) for hits in actual),
+        "identical": actual == expected,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2_000)
+    parser.add_argument("--synthetic-triggers", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    shipped = load_triggers(ROOT / "data" / "concepts")
+    filler = ["the", "court", "ordered", "a", "hearing", "and", "costs", "appeal"]
+    words = [trigger for trigger, _ in shipped] + filler * 4
+    shipped_texts = [
+        " ".join(rng.choice(words) for _ in range(rng.randrange(20, 80)))
+        for _ in range(args.texts)
+    ]
+
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = [
+        "".join(rng.choice(letters) for _ in range(rng.randrange(3, 10))) for _ in range(20_000)
+    ]
+    # Triggers are phrases over the first fifth of the vocabulary, so texts mix
+    # trigger words with words the automaton never accepts.
+    synthetic = [
+        (" ".join(rng.choice(vocabulary[:4_000]) for _ in range(rng.randrange(1, 4))), f"C{n}")
+        for n in range(args.synthetic_triggers)
+    ]
+    synthetic_texts = [
+        " ".join(rng.choice(vocabulary) for _ in range(120)) for _ in range(args.texts // 4)
+    ]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold_s = _startup_seconds(cache_dir, 1)
+        warm_s = _startup_seconds(cache_dir, args.repeats)
+
+    report = {
+        "shipped": _compare(shipped, shipped_texts, args.repeats),
+        "synthetic": _compare(synthetic, synthetic_texts, args.repeats),
+        "startup_seconds": {"cold_cache": round(cold_s, 3), "warm_cache": round(warm_s, 3)},
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
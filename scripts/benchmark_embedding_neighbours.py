@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark nearest-neighbour lookups over synthetic graph embeddings.
+
+Compares the knowledge-graph explorer's previous lookup (JSON load, list
+``index``, full distance vector and ``argsort`` per query) with a persisted
+:class:`~src.graph.embedding_store.EmbeddingStore` queried exactly (blocked
+top-k) and through its IVF index.  Embeddings are drawn around
+``--clusters`` random centres, as node embeddings of communities are.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.graph.embedding_store import EmbeddingStore, build_embedding_store  # noqa: E402
+
+
+def _timed(fn, repeats: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def _legacy_nearest(matrix, identifiers, query, count):
+    query_index = identifiers.index(query)
+    distances = np.linalg.norm(matrix - matrix[query_index], axis=1)
+    order = np.argsort(distances)
+    return [identifiers[i] for i in order if i != query_index][:count]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200_000, help="Synthetic embedding rows")
+    parser.add_argument("--dim", type=int, default=64, help="Embedding dimensionality")
+    parser.add_argument("--clusters", type=int, default=500, help="Synthetic communities")
+    parser.add_argument("--queries", type=int, default=50, help="Query nodes")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query")
+    parser.add_argument("--ivf-lists", type=int, help="IVF lists (default sqrt(nodes))")
+    parser.add_argument("--nprobe", type=int, default=8, help="IVF lists probed per query")
+    parser.add_argument("--json-load-rows", type=int, default=20_000, help="Rows in the JSON load comparison")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    centres = rng.normal(scale=4.0, size=(args.clusters, args.dim))
+    matrix = (centres[rng.integers(0, args.clusters, args.nodes)] + rng.normal(size=(args.nodes, args.dim))).astype(
+        np.float32
+    )
+    identifiers = [f"Node#{i}" for i in range(args.nodes)]
+    queries = [identifiers[i] for i in rng.choice(args.nodes, size=args.queries, replace=False)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        sample = {identifiers[i]: matrix[i].tolist() for i in range(min(args.json_load_rows, args.nodes))}
+        (directory / "embeddings.json").write_text(json.dumps(sample), encoding="utf-8")
+
+        def load_json():
+            payload = json.loads((directory / "embeddings.json").read_text(encoding="utf-8"))
+            return np.array(list(payload.values()), dtype=np.float32)
+
+        _, json_load_s = _timed(load_json, 3)
+
+        _, build_s = _timed(
+            lambda: build_embedding_store(
+                (identifiers, matrix),
+                directory / "store",
+                ivf_lists=args.ivf_lists or int(round(args.nodes ** 0.5)),
+                ivf_nprobe=args.nprobe,
+            )
+        )
+        store, open_s = _timed(lambda: EmbeddingStore.load(directory / "store"), 3)
+
+        legacy, legacy_s = _timed(lambda: [_legacy_nearest(matrix, identifiers, q, args.k) for q in queries])
+        exact, exact_s = _timed(lambda: [store.nearest(q, args.k, exact=True) for q in queries], 3)
+        approximate, ivf_s = _timed(lambda: [store.nearest(q, args.k) for q in queries], 3)
+
+    exact_ids = [[identifier for identifier, _ in row] for row in exact]
+    recall = np.mean(
+        [len({i for i, _ in a} & set(e)) / args.k for a, e in zip(approximate, exact_ids)]
+    )
+    report = {
+        "nodes": args.nodes,
+        "dim": args.dim,
+        "ivf_lists": store.ivf_lists,
+        "nprobe": args.nprobe,
+        "load_seconds": {
+            f"json_{len(sample)}_rows": round(json_load_s, 3),
+            "store_open_all_rows": round(open_s, 4),
+            "store_build": round(build_s, 2),
+        },
+        "ms_per_query": {
+            "legacy_argsort": round(1000 * legacy_s / args.queries, 2),
+            "exact_blocked": round(1000 * exact_s / args.queries, 2),
+            "ivf": round(1000 * ivf_s / args.queries, 3),
+        },
+        "exact_matches_legacy": exact_ids == legacy,
+        "ivf_recall_at_k": round(float(recall), 3),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
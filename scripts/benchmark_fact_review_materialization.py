@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark materialized fact-review workbench payloads against rebuilding them.
+
+Persists a synthetic run, then times the review UI's access pattern: repeated
+workbench reads of the same run, each rebuilt by ``build_fact_review_workbench_payload``
+or served by ``load_materialized_fact_review_payload`` after one cold build.  It
+also times the write-side cost the generation triggers add to
+``persist_fact_intake_payload`` (against a connection with the triggers
+dropped) and a review write followed by the read that rebuilds the stale row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.fact_intake import (  # noqa: E402
+    build_fact_intake_payload_from_text_units,
+    build_fact_review_workbench_payload,
+    load_materialized_fact_review_payload,
+    persist_fact_intake_payload,
+)
+from src.reporting.structure_report import TextUnit  # noqa: E402
+
+_SAMPLES = (
+    "On 2024-01-{day:02d} the tenant reported the leak to the agent.",
+    "The landlord denied receiving report {index} and appealed the order.",
+    "Support worker note {index}: maybe follow up next week about the repair.",
+)
+
+
+def _timed(fn, repeats: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def _units(count: int) -> list[TextUnit]:
+    return [
+        TextUnit(
+            unit_id=f"unit:{index}",
+            source_id=f"source:{index % 7}",
+            source_type="context_file",
+            text=_SAMPLES[index % len(_SAMPLES)].format(day=index % 28 + 1, index=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _persist_seconds(payload, *, with_triggers: bool) -> float:
+    conn = sqlite3.connect(":memory:")
+    persist_fact_intake_payload(conn, payload, deferred_refresh=True)
+    if not with_triggers:
+        names = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_fact_review_generation_%'"
+        ).fetchall()
+        for (name,) in names:
+            conn.execute(f"DROP TRIGGER {name}")
+    _, seconds = _timed(lambda: persist_fact_intake_payload(conn, payload, deferred_refresh=True), 3)
+    return seconds
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, default=300, help="Synthetic text units in the run")
+    parser.add_argument("--reads", type=int, default=10, help="Workbench reads of the same run")
+    args = parser.parse_args(argv)
+
+    payload = build_fact_intake_payload_from_text_units(_units(args.units), source_label="materialization_bench")
+    run_id = payload["run"]["run_id"]
+    persist_s = _persist_seconds(payload, with_triggers=True)
+    untracked_persist_s = _persist_seconds(payload, with_triggers=False)
+
+    conn = sqlite3.connect(":memory:")
+    persist_fact_intake_payload(conn, payload)
+    generation = conn.execute(
+        "SELECT generation FROM fact_review_generations WHERE run_id = ?", (run_id,)
+    ).fetchone()[0]
+
+    def rebuild_reads():
+        return [build_fact_review_workbench_payload(conn, run_id=run_id) for _ in range(args.reads)]
+
+    def materialized_reads():
+        return [load_materialized_fact_review_payload(conn, run_id=run_id) for _ in range(args.reads)]
+
+    rebuilt, rebuild_s = _timed(rebuild_reads)
+    cold, cold_s = _timed(lambda: load_materialized_fact_review_payload(conn, run_id=run_id))
+    served, materialized_s = _timed(materialized_reads)
+
+    def review_then_read():
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO fact_reviews(review_id, fact_id, review_status, reviewer, note, provenance_json)
+            VALUES ('review:bench', ?, 'accepted', 'bench', NULL, '{}')
+            """,
+            (payload["fact_candidates"][0]["fact_id"],),
+        )
+        conn.commit()
+        return load_materialized_fact_review_payload(conn, run_id=run_id)
+
+    after_review, review_read_s = _timed(review_then_read)
+
+    report = {
+        "units": args.units,
+        "facts": len(payload["fact_candidates"]),
+        "reads": args.reads,
+        "generation_bumps_per_persist": generation,
+        "deferred_persist_seconds": {
+            "with_triggers": round(persist_s, 3),
+            "without_triggers": round(untracked_persist_s, 3),
+        },
+        "ms_per_read": {
+            "rebuild": round(1000 * rebuild_s / args.reads, 2),
+            "materialized_cold": round(1000 * cold_s, 2),
+            "materialized_hit": round(1000 * materialized_s / args.reads, 2),
+        },
+        "speedup": round(rebuild_s / materialized_s, 1),
+        "statuses": [cold["materialization"]["status"], *sorted({item["materialization"]["status"] for item in served})],
+        "payload_bytes": served[-1]["materialization"]["payload_bytes"],
+        "identical": served[-1]["payload"] == json.loads(json.dumps(rebuilt[-1])),
+        "review_write_then_read": {
+            "status": after_review["materialization"]["status"],
+            "seconds": round(review_read_s, 3),
+            "build_seconds": after_review["materialization"]["build_seconds"],
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark indexed ``LegalGraph`` lookups and traversal on a synthetic graph."""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.graph.models import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType  # noqa: E402
+
+_EDGE_TYPES = (EdgeType.CITES, EdgeType.FOLLOWS, EdgeType.DISTINGUISHES, EdgeType.APPLIES)
+
+
+def _build(nodes: int, edges: int, seed: int) -> LegalGraph:
+    rng = random.Random(seed)
+    graph = LegalGraph()
+    for index in range(nodes):
+        graph.add_node(GraphNode(type=NodeType.CASE, identifier=f"case:{index}"))
+    for _ in range(edges):
+        graph.add_edge(
+            GraphEdge(
+                type=rng.choice(_EDGE_TYPES),
+                source=f"case:{rng.randrange(nodes)}",
+                target=f"case:{rng.randrange(nodes)}",
+                weight=rng.random(),
+            )
+        )
+    return graph
+
+
+def _scan_find(graph: LegalGraph, *, source=None, target=None, type=None):
+    # The pre-index behaviour: one pass over the flat edge list per filter.
+    results = list(graph.edges)
+    if source is not None:
+        results = [e for e in results if e.source == source]
+    if target is not None:
+        results = [e for e in results if e.target == target]
+    if type is not None:
+        results = [e for e in results if e.type == type]
+    return results
+
+
+def _subgraph(graph: LegalGraph, seed: str, hops: int, lookup) -> int:
+    visited = {seed}
+    frontier = deque([(seed, 0)])
+    edge_count = 0
+    while frontier:
+        current, depth = frontier.popleft()
+        if depth >= hops:
+            continue
+        for edge in lookup(current):
+            edge_count += 1
+            if edge.target not in visited:
+                visited.add(edge.target)
+                frontier.append((edge.target, depth + 1))
+    return edge_count
+
+
+def _timed(fn, repeats: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - started) / repeats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--hops", type=int, default=2)
+    parser.add_argument("--scan-lookups", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph = _build(args.nodes, args.edges, args.seed)
+    build_seconds = time.perf_counter() - started
+
+    rng = random.Random(args.seed + 1)
+    probes = [f"case:{rng.randrange(args.nodes)}" for _ in range(args.lookups)]
+    probe_iter = iter(probes * 2)
+
+    indexed_find = _timed(
+        lambda: graph.find_edges(target=next(probe_iter), type=EdgeType.FOLLOWS),
+        args.lookups,
+    )
+    scan_find = _timed(
+        lambda: _scan_find(graph, target=probes[0], type=EdgeType.FOLLOWS),
+        args.scan_lookups,
+    )
+    indexed_subgraph = _timed(
+        lambda: _subgraph(graph, probes[1], args.hops, graph.out_edges),
+        args.scan_lookups,
+    )
+    scan_subgraph = _timed(
+        lambda: _subgraph(
+            graph, probes[1], 1, lambda node: _scan_find(graph, source=node)
+        ),
+        1,
+    )
+
+    report = {
+        "nodes": args.nodes,
+        "edges": args.edges,
+        "build_seconds": round(build_seconds, 3),
+        "find_edges_ms": {
+            "indexed": round(indexed_find * 1000, 4),
+            "linear_scan": round(scan_find * 1000, 2),
+        },
+        "subgraph_ms": {
+            "indexed_hops": args.hops,
+            "indexed": round(indexed_subgraph * 1000, 3),
+            # A full-scan traversal is only measured for one hop; deeper hops
+            # multiply its cost by the frontier size.
+            "linear_scan_one_hop": round(scan_subgraph * 1000, 2),
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark judicial behaviour aggregates on a synthetic multi-slice corpus.
+
+Compares the pure-Python and NumPy backends of ``aggregate_ridge_logistic_map``
+(hundreds of court/posture predicate features per slice), and a multi-slice
+report run from observation lists against the same report run from
+``ObservationColumns`` built once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.judicial_behavior import (  # noqa: E402
+    CaseObservation,
+    ObservationColumns,
+    aggregate_beta_binomial,
+    aggregate_gamma_poisson,
+    aggregate_outcomes,
+    aggregate_ridge_logistic_map,
+)
+
+_GROUPINGS = (
+    ("jurisdiction_id",),
+    ("jurisdiction_id", "court_id", "court_level"),
+    ("court_level", "decision_year"),
+    ("jurisdiction_id", "wrong_type_id"),
+)
+
+
+def _timed(fn, repeats: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def _corpus(cases: int, features: int, seed: int) -> list[CaseObservation]:
+    rng = random.Random(seed)
+    courts = [(f"J{j}", f"J{j}-C{c}", level) for j in range(4) for c in range(3) for level in ("trial", "appeal")]
+    keys = [f"pred.{n:03d}" for n in range(features)]
+    outcomes = ("plaintiff", "defendant", "mixed", "remitted")
+    rows = []
+    for n in range(cases):
+        jurisdiction, court, level = rng.choice(courts)
+        rows.append(
+            CaseObservation(
+                case_id=f"case-{n}",
+                jurisdiction_id=jurisdiction,
+                court_id=court,
+                court_level=level,
+                decision_date=f"{rng.randrange(2000, 2024)}-01-01",
+                wrong_type_id=rng.choice(("negligence", "defamation", "nuisance")),
+                predicate_keys=tuple(rng.sample(keys, rng.randrange(2, 12))),
+                outcome=rng.choice(outcomes),
+            )
+        )
+    return rows
+
+
+def _report(observations) -> list:
+    out = []
+    for group_by in _GROUPINGS:
+        slice_decl = {"filters": {}, "group_by": list(group_by), "time_bounds_declared": {"start": None, "end": None}}
+        out.append(aggregate_outcomes(observations, group_by=group_by, slice=slice_decl))
+        out.append(aggregate_beta_binomial(observations, group_by=group_by, slice=slice_decl))
+        out.append(aggregate_gamma_poisson(observations, event_key="pred.000", group_by=group_by, slice=slice_decl))
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=20_000, help="Synthetic case observations")
+    parser.add_argument("--features", type=int, default=300, help="Distinct predicate keys")
+    parser.add_argument("--repeats", type=int, default=3, help="Best-of repeats for the fast paths")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = _corpus(args.cases, args.features, args.seed)
+    slice_decl = {"filters": {}, "group_by": ["jurisdiction_id"], "time_bounds_declared": {"start": None, "end": None}}
+
+    def ridge(backend: str):
+        return aggregate_ridge_logistic_map(
+            rows, group_by=("jurisdiction_id",), max_features=args.features, slice=slice_decl, backend=backend
+        )
+
+    python_fit, python_s = _timed(lambda: ridge("python"))
+    numpy_fit, numpy_s = _timed(lambda: ridge("numpy"), args.repeats)
+    max_coef_diff = max(
+        abs(a - b)
+        for slow, fast in zip(python_fit["groups"], numpy_fit["groups"])
+        for a, b in zip(slow["fit"]["coef"], fast["fit"]["coef"])
+    )
+
+    from_rows, rows_s = _timed(lambda: _report(rows), args.repeats)
+
+    def columnar():
+        return _report(ObservationColumns.from_observations(rows))
+
+    from_columns, columns_s = _timed(columnar, args.repeats)
+
+    report = {
+        "cases": args.cases,
+        "features": args.features,
+        "ridge_logistic": {
+            "slices": len(numpy_fit["groups"]),
+            "python_seconds": round(python_s, 3),
+            "numpy_seconds": round(numpy_s, 3),
+            "speedup": round(python_s / numpy_s, 1),
+            "max_coef_diff": max_coef_diff,
+        },
+        "multi_slice_report": {
+            "reports": len(from_rows),
+            "observation_seconds": round(rows_s, 3),
+            "columns_seconds": round(columns_s, 3),
+            "speedup": round(rows_s / columns_s, 1),
+            "identical": from_rows == from_columns,
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate detection: MD5 SimHash + all pairs vs batched FNV-1a + LSH.
+
+Synthetic drafts share a pool of paragraphs, a fraction of which are lightly
+edited between drafts.  Recall is measured against those planted duplicates
+for both paths, and the banded index is checked against an all-pairs scan over
+the same fingerprints.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.text.fingerprints import SimHashIndex, minhash_many, simhash_many  # noqa: E402
+from src.text.reading_fatigue import DuplicateDetector, Paragraph  # noqa: E402
+from src.text.similarity import minhash, simhash  # noqa: E402
+
+
+def _drafts(paragraphs: int, drafts: int, edit_rate: float, seed: int):
+    rng = random.Random(seed)
+    vocabulary = [f"term{n}" for n in range(5_000)]
+    base = [
+        [rng.choice(vocabulary) for _ in range(rng.randrange(40, 90))]
+        for _ in range(paragraphs)
+    ]
+    result = []
+    for draft in range(drafts):
+        paras = []
+        for index, words in enumerate(base):
+            words = list(words)
+            if rng.random() < edit_rate:
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            paras.append(Paragraph(pid=f"{index}", text=" ".join(words)))
+        result.append(paras)
+    return result
+
+
+def _legacy_groups(drafts, threshold: int):
+    # The pre-index behaviour: MD5 SimHash per paragraph, then all pairs.
+    flat = [(d, p) for d, draft in enumerate(drafts) for p in draft]
+    fps = [int(simhash(p.text), 16) for _, p in flat]
+    consumed = set()
+    groups = []
+    for i, (draft, para) in enumerate(flat):
+        if i in consumed:
+            continue
+        hits = [para]
+        for j in range(i + 1, len(flat)):
+            if j in consumed or flat[j][0] == draft:
+                continue
+            if (fps[i] ^ fps[j]).bit_count() <= threshold:
+                hits.append(flat[j][1])
+                consumed.add(j)
+        if len(hits) > 1:
+            consumed.add(i)
+            groups.append(hits)
+    return groups
+
+
+def _recall(groups, paragraphs: int, drafts: int) -> float:
+    # Planted duplicates: the same paragraph index across every draft.
+    found = 0
+    for group in groups:
+        pids = {para.pid for para in group}
+        if len(pids) == 1:
+            found += len(group) - 1
+    return round(found / (paragraphs * (drafts - 1)), 4)
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=4_000)
+    parser.add_argument("--drafts", type=int, default=3)
+    parser.add_argument("--edit-rate", type=float, default=0.3)
+    parser.add_argument("--threshold", type=int, default=3)
+    parser.add_argument("--num-perm", type=int, default=64)
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    drafts = _drafts(args.paragraphs, args.drafts, args.edit_rate, args.seed)
+    texts = [para.text for draft in drafts for para in draft]
+    sample = texts[: min(len(texts), 2_000)]
+
+    batch_fps, batch_simhash_s = _timed(lambda: simhash_many(texts))
+    _, batch_minhash_s = _timed(lambda: minhash_many(texts, num_perm=args.num_perm))
+    _, legacy_simhash_s = _timed(lambda: [simhash(text) for text in sample])
+    _, legacy_minhash_s = _timed(lambda: [minhash(text, args.num_perm) for text in sample[:200]])
+    scale = len(texts) / len(sample)
+
+    detector = DuplicateDetector(threshold=args.threshold, engine="batch")
+    batch_groups, batch_detect_s = _timed(lambda: detector.find_duplicates(drafts))
+    batch_groups = [[hit.paragraph for hit in group.hits] for group in batch_groups]
+
+    # Exactness of the banded index against an all-pairs scan on a sample.
+    values = batch_fps.tolist()[: min(len(texts), 3_000)]
+    index = SimHashIndex(args.threshold)
+    index.add_many(enumerate(values))
+    index_pairs = sum(len(index.query(value)) for value in values)
+    scan_pairs = sum(
+        1 for a in values for b in values if (a ^ b).bit_count() <= args.threshold
+    )
+
+    report = {
+        "paragraphs": len(texts),
+        "threshold": args.threshold,
+        "fingerprint_seconds": {
+            "simhash_batch": round(batch_simhash_s, 3),
+            "simhash_md5_estimated": round(legacy_simhash_s * scale, 3),
+            "minhash_batch": round(batch_minhash_s, 3),
+            "minhash_sha1_estimated": round(legacy_minhash_s * len(texts) / 200, 3),
+        },
+        "detect_seconds": {"batch_lsh": round(batch_detect_s, 3)},
+        "recall": {"batch_lsh": _recall(batch_groups, args.paragraphs, args.drafts)},
+        "index_matches_linear_scan": index_pairs == scan_pairs,
+    }
+    if not args.skip_legacy:
+        legacy_groups, legacy_detect_s = _timed(lambda: _legacy_groups(drafts, args.threshold))
+        report["detect_seconds"]["md5_all_pairs"] = round(legacy_detect_s, 3)
+        report["recall"]["md5_all_pairs"] = _recall(legacy_groups, args.paragraphs, args.drafts)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark serial against page-sharded parallel PDF text extraction."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT / "src", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from src.pdf_ingest import _DEFAULT_PAGE_SHARD_SIZE, extract_pdf_text  # noqa: E402
+
+
+def _sample_pdfs() -> tuple[Path, ...]:
+    return tuple(sorted(ROOT.glob("*.pdf"), key=lambda value: value.name))
+
+
+def _timed_pages(pdf: Path, *, workers: int | None, shard_size: int) -> tuple[list[dict], float]:
+    started = time.perf_counter()
+    pages = list(extract_pdf_text(pdf, workers=workers, shard_size=shard_size))
+    return pages, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        type=Path,
+        help="PDFs to benchmark (default: the sample PDFs in the repo root)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--shard-size", type=int, default=_DEFAULT_PAGE_SHARD_SIZE)
+    args = parser.parse_args()
+
+    rows = []
+    serial_total = 0.0
+    parallel_total = 0.0
+    for pdf in args.pdfs or _sample_pdfs():
+        serial_pages, serial_seconds = _timed_pages(pdf, workers=None, shard_size=args.shard_size)
+        parallel_pages, parallel_seconds = _timed_pages(
+            pdf, workers=args.workers, shard_size=args.shard_size
+        )
+        serial_total += serial_seconds
+        parallel_total += parallel_seconds
+        rows.append(
+            {
+                "pdf": pdf.name,
+                "pages": len(serial_pages),
+                "serial_seconds": round(serial_seconds, 4),
+                "parallel_seconds": round(parallel_seconds, 4),
+                "speedup": round(serial_seconds / parallel_seconds, 3) if parallel_seconds else None,
+                "parity": parallel_pages == serial_pages,
+            }
+        )
+    report = {
+        "workers": args.workers,
+        "shard_size": args.shard_size,
+        "documents": rows,
+        "serial_seconds": round(serial_total, 4),
+        "parallel_seconds": round(parallel_total, 4),
+        "speedup": round(serial_total / parallel_total, 3) if parallel_total else None,
+        "parity": all(row["parity"] for row in rows),
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if report["parity"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
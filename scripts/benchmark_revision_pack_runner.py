@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark the wiki revision pack runner against a local stub of the MediaWiki API.
+
+The threaded HTTP server in ``tests/factories/wiki_api.py`` answers the three
+queries ``wiki_pull_api.py`` makes (latest snapshot, revision snapshot, revision
+history) for ``--articles`` synthetic articles, with ``--latency-ms`` of simulated network delay.  The same
+pack is run with subprocess execution, in-process execution, and in-process
+execution on ``--workers`` threads, each against a fresh state DB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+# The repo root goes first so ``tests`` is not shadowed by ``src/tests``.
+for candidate in (ROOT / "src", ROOT):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.sources.rate_limit import RateLimit  # noqa: E402
+from src.wiki_timeline.revision_pack_runner import run  # noqa: E402
+from tests.factories.wiki_api import REVISIONS_PER_ARTICLE, stub_wiki_api  # noqa: E402
+
+
+def _write_pack(path: Path, titles: list[str]) -> None:
+    pack = {
+        "pack_id": "benchmark_pack",
+        "history_defaults": {"max_revisions": REVISIONS_PER_ARTICLE, "window_days": 0, "max_candidate_pairs": 1},
+        "articles": [
+            {"article_id": f"article_{index}", "wiki": "enwiki", "title": title}
+            for index, title in enumerate(titles)
+        ],
+    }
+    path.write_text(json.dumps(pack), encoding="utf-8")
+
+
+def _timed_run(work_dir: Path, pack_path: Path, name: str, **options) -> dict:
+    started = time.perf_counter()
+    summary = run(
+        pack_path=pack_path,
+        out_dir=work_dir / name / "out",
+        state_db_path=work_dir / name / "state.sqlite",
+        bridge_db_path=work_dir / "missing_bridge.sqlite",
+        auto_review_context_fn=lambda **_: {},
+        **options,
+    )
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "counts": summary.get("counts"),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--wiki-rps", type=float, default=200.0, help="Per-wiki politeness limit")
+    parser.add_argument("--skip-subprocess", action="store_true", help="Skip the subprocess baseline")
+    args = parser.parse_args()
+
+    titles = [f"Benchmark Article {index}" for index in range(args.articles)]
+    limits = {"enwiki": RateLimit(rps=args.wiki_rps, burst=max(1, int(args.wiki_rps)))}
+    report: dict[str, object] = {"articles": args.articles, "latency_ms": args.latency_ms}
+    with tempfile.TemporaryDirectory() as tmp, stub_wiki_api(titles, latency_s=args.latency_ms / 1000) as api:
+        work_dir = Path(tmp)
+        pack_path = work_dir / "pack.json"
+        _write_pack(pack_path, titles)
+        os.environ["WIKI_PULL_API_BASE"] = api
+        if not args.skip_subprocess:
+            report["subprocess"] = _timed_run(work_dir, pack_path, "subprocess")
+        report["in_process"] = _timed_run(
+            work_dir, pack_path, "in_process", execution="in_process", wiki_rate_limits=limits
+        )
+        report["in_process_concurrent"] = _timed_run(
+            work_dir,
+            pack_path,
+            "in_process_concurrent",
+            execution="in_process",
+            max_workers=args.workers,
+            wiki_rate_limits=limits,
+        )
+    report["workers"] = args.workers
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
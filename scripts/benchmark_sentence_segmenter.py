@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark sentence segmentation: spaCy ``Doc`` path vs offset-based rules.
+
+Throughput is measured over the fixture corpora and over ``--texts`` synthetic
+legal-style paragraphs.  The streaming iterator is measured over one large text
+(the synthetic paragraphs joined, fed in ``--block-size`` pieces).  Every run
+also checks that both engines return identical sentences.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.text.sentence_segmenter import (  # noqa: E402
+    iter_sentences,
+    segment,
+    segment_with_spacy,
+)
+
+
+def _timed(fn, repeats: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def _rows(sentences):
+    return [(s.text, s.start_char, s.end_char, s.index) for s in sentences]
+
+
+def _compare(texts, repeats: int) -> dict:
+    chars = sum(len(text) for text in texts)
+    expected, spacy_s = _timed(
+        lambda: [_rows(segment_with_spacy(text)) for text in texts], repeats
+    )
+    actual, rules_s = _timed(
+        lambda: [_rows(segment(text)) for text in texts], repeats
+    )
+    return {
+        "texts": len(texts),
+        "chars": chars,
+        "sentences": sum(len(rows) for rows in actual),
+        "seconds": {"spacy": round(spacy_s, 4), "rules": round(rules_s, 4)},
+        "mb_per_second": {
+            "spacy": round(chars / spacy_s / 1e6, 2),
+            "rules": round(chars / rules_s / 1e6, 2),
+        },
+        "identical": actual == expected,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2_000)
+    parser.add_argument("--block-size", type=int, default=1 << 16)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    fixtures = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((ROOT / "tests" / "fixtures" / "corpora").rglob("*.txt"))
+    ]
+    words = ["the", "court", "held", "that", "duty", "of", "care", "applies", "appeal", "costs"]
+    tails = [".", ".", "?", "!", " s. 5(1).", " (e.g. Mr. Smith).", ' "ordered."', "..."]
+    synthetic = []
+    for _ in range(args.texts):
+        sentences = [
+            " ".join(rng.choice(words) for _ in range(rng.randrange(5, 25))).capitalize()
+            + rng.choice(tails)
+            for _ in range(rng.randrange(2, 8))
+        ]
+        synthetic.append("  ".join(sentences) + rng.choice(["", "\n\nHeading"]))
+
+    large = "\n\n".join(synthetic)
+    blocks = [large[i : i + args.block_size] for i in range(0, len(large), args.block_size)]
+    whole, whole_s = _timed(lambda: _rows(segment(large)), args.repeats)
+    streamed, stream_s = _timed(lambda: _rows(iter_sentences(blocks)), args.repeats)
+
+    report = {
+        "fixtures": _compare(fixtures, args.repeats),
+        "synthetic": _compare(synthetic, args.repeats),
+        "stream": {
+            "chars": len(large),
+            "blocks": len(blocks),
+            "seconds": {"whole_text": round(whole_s, 4), "streamed": round(stream_s, 4)},
+            "identical": streamed == whole,
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
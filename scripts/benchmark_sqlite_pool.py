@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent SQLite reads/writes: one shared connection vs the WAL pool."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.storage.sqlite_pool import SQLitePool  # noqa: E402
+
+
+def _seed(path: Path, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("CREATE TABLE docs(id INTEGER PRIMARY KEY, body TEXT NOT NULL)")
+        conn.executemany(
+            "INSERT INTO docs(body) VALUES (?)",
+            ((f"provision text {index} " * 8,) for index in range(rows)),
+        )
+    conn.close()
+
+
+def _run(
+    execute_read,
+    execute_write,
+    *,
+    readers: int,
+    seconds: float,
+    rows: int,
+) -> dict[str, float]:
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    lock = threading.Lock()
+
+    def reader(offset: int) -> None:
+        local = 0
+        key = offset
+        while not stop.is_set():
+            execute_read((key % rows) + 1)
+            key += 7919
+            local += 1
+        with lock:
+            counts["reads"] += local
+
+    def writer() -> None:
+        local = 0
+        while not stop.is_set():
+            execute_write(f"new provision {local}")
+            local += 1
+        with lock:
+            counts["writes"] += local
+
+    threads = [threading.Thread(target=reader, args=(index,)) for index in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "reads_per_second": round(counts["reads"] / elapsed, 1),
+        "writes_per_second": round(counts["writes"] / elapsed, 1),
+    }
+
+
+def _shared_connection(path: Path, args: argparse.Namespace) -> dict[str, float]:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    lock = threading.Lock()
+
+    def read(key: int) -> None:
+        with lock:
+            conn.execute("SELECT body FROM docs WHERE id = ?", (key,)).fetchone()
+
+    def write(body: str) -> None:
+        with lock, conn:
+            conn.execute("INSERT INTO docs(body) VALUES (?)", (body,))
+
+    try:
+        return _run(read, write, readers=args.readers, seconds=args.seconds, rows=args.rows)
+    finally:
+        conn.close()
+
+
+def _pooled(path: Path, args: argparse.Namespace) -> dict[str, float]:
+    pool = SQLitePool(path, mmap_size=args.mmap_size, wal=True)
+    conn = pool.proxy()
+
+    def read(key: int) -> None:
+        conn.execute("SELECT body FROM docs WHERE id = ?", (key,)).fetchone()
+
+    def write(body: str) -> None:
+        with conn:
+            conn.execute("INSERT INTO docs(body) VALUES (?)", (body,))
+
+    try:
+        return _run(read, write, readers=args.readers, seconds=args.seconds, rows=args.rows)
+    finally:
+        pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--mmap-size", type=int, default=256 * 1024 * 1024)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shared_path = Path(tmp) / "shared.sqlite"
+        pooled_path = Path(tmp) / "pooled.sqlite"
+        _seed(shared_path, args.rows)
+        _seed(pooled_path, args.rows)
+        report = {
+            "readers": args.readers,
+            "seconds": args.seconds,
+            "shared_connection": _shared_connection(shared_path, args),
+            "wal_pool": _pooled(pooled_path, args),
+        }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import json
+import time
 from collections import Counter
 from pathlib import Path
 from typing import Callable
@@ -11,17 +13,23 @@ ROOT = Path(__file__).resolve().parents[2]
 SENSIBLAW_ROOT = Path(__file__).resolve().parents[1]
 
 
-def _load_json(path: Path) -> dict:
+def _load_json(path: Path, missing: list[str] | None = None) -> dict:
+    # Cached corpora only exist in a full workspace checkout.  Callers that
+    # pass ``missing`` get an empty corpus and the path recorded so the report
+    # says what was not compared; everyone else gets the read error.
+    if missing is not None and not path.exists():
+        missing.append(str(path))
+        return {}
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _gwb_timeline_texts() -> list[str]:
-    payload = _load_json(ROOT / "SensibLaw" / ".cache_local" / "wiki_timeline_gwb.json")
+def _gwb_timeline_texts(missing: list[str] | None = None) -> list[str]:
+    payload = _load_json(ROOT / "SensibLaw" / ".cache_local" / "wiki_timeline_gwb.json", missing)
     return [str(ev.get("text") or "").strip() for ev in payload.get("events", []) if str(ev.get("text") or "").strip()]
 
 
-def _gwb_reference_texts() -> list[str]:
-    payload = _load_json(ROOT / "SensibLaw" / ".cache_local" / "wiki_timeline_gwb.json")
+def _gwb_reference_texts(missing: list[str] | None = None) -> list[str]:
+    payload = _load_json(ROOT / "SensibLaw" / ".cache_local" / "wiki_timeline_gwb.json", missing)
     markers = (
         "Act",
         "Court of Appeals",
@@ -42,32 +50,28 @@ def _gwb_reference_texts() -> list[str]:
     return out
 
 
-def _legal_fixture_texts() -> list[str]:
+def _legal_fixture_texts(missing: list[str] | None = None) -> list[str]:
     files = [
         ROOT / "data" / "pdfs" / "Mabo [No 2] - [1992] HCA 23.json",
         ROOT / "data" / "pdfs" / "Plaintiff S157_2002 v Commonwealth - [2003] HCA 2.json",
     ]
     out: list[str] = []
     for path in files:
-        if not path.exists():
-            continue
-        payload = _load_json(path)
+        payload = _load_json(path, missing)
         body = str(payload.get("body") or "").strip()
         if body:
             out.append(body)
     return out
 
 
-def _legal_principles_texts() -> list[str]:
+def _legal_principles_texts(missing: list[str] | None = None) -> list[str]:
     files = [
         ROOT / "SensibLaw" / "demo" / "ingest" / "legal_principles_au_v1" / "wiki_timeline_legal_principles_au_v1.json",
         ROOT / "SensibLaw" / "demo" / "ingest" / "legal_principles_au_v1" / "follow" / "wiki_timeline_legal_principles_au_v1_follow.json",
     ]
     out: list[str] = []
     for path in files:
-        if not path.exists():
-            continue
-        payload = _load_json(path)
+        payload = _load_json(path, missing)
         out.extend(str(ev.get("text") or "").strip() for ev in payload.get("events", []) if str(ev.get("text") or "").strip())
     return out
 
@@ -288,19 +292,52 @@ def _summarize(
     }
 
 
+def _throughput(texts: list[str], tokenize: Callable[[str], list[str]], repeats: int) -> dict:
+    total_chars = sum(len(t) for t in texts)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for text in texts:
+            tokenize(text)
+    seconds = (time.perf_counter() - started) / repeats
+    return {
+        "seconds": round(seconds, 4),
+        "chars_per_second": round(total_chars / seconds) if seconds else None,
+    }
+
+
 def main() -> None:
     import sys
 
+    parser = argparse.ArgumentParser(description="Compare lexeme tokenizers across corpora.")
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Add per-tokenizer throughput; timings vary between runs, so omit for parity diffs.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--require-corpora",
+        action="store_true",
+        help="Exit non-zero when any corpus input file is missing.",
+    )
+    args = parser.parse_args()
+
     if str(SENSIBLAW_ROOT) not in sys.path:
         sys.path.insert(0, str(SENSIBLAW_ROOT))
 
+    missing: list[str] = []
     corpora = {
-        "1_gwb_timeline_prose": _gwb_timeline_texts(),
-        "2_legal_fixture_bodies": _legal_fixture_texts(),
-        "3_legal_principles_timelines": _legal_principles_texts(),
+        "1_gwb_timeline_prose": _gwb_timeline_texts(missing),
+        "2_legal_fixture_bodies": _legal_fixture_texts(missing),
+        "3_legal_principles_timelines": _legal_principles_texts(missing),
         "4_mixed_general_and_legal_refs": _mixed_texts(),
-        "5_gwb_reference_texts": _gwb_reference_texts(),
+        "5_gwb_reference_texts": _gwb_reference_texts(missing),
     }
+    missing = sorted(set(missing))
+    for path in missing:
+        print(f"warning: corpus input not found: {path}", file=sys.stderr)
+    if missing and args.require_corpora:
+        raise SystemExit(f"{len(missing)} corpus input file(s) missing")
 
     tokenizers: dict[str, Callable[[str], list[str]]] = {
         "deterministic_legal": _deterministic_tokenizer(),
@@ -323,8 +360,12 @@ def main() -> None:
         for tok_name, tok_fn in tokenizers.items():
             linked_fn = linked_det if tok_name == "deterministic_legal" else None
             out[corpus_name][tok_name] = _summarize(texts, tok_fn, linked_fn)
+            if args.timing:
+                out[corpus_name][tok_name]["throughput"] = _throughput(texts, tok_fn, args.repeats)
 
-    print(json.dumps(out, indent=2, sort_keys=True))
+    # Name the skipped inputs next to the per-corpus results so a comparison
+    # over empty corpora cannot pass for a complete one.
+    print(json.dumps({**out, "missing_inputs": missing}, indent=2, sort_keys=True))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Export a VersionedStore's occurrence tables as memory-mapped columns and report on them.
+
+Writes ``lexeme_occurrences`` and ``structural_atom_occurrences`` to
+``--out`` (see :mod:`src.storage.occurrence_columns`) and prints frequency,
+document-frequency, co-occurrence and concordance reports computed over the
+mapped columns as JSON.  ``--skip-export`` reports on an existing export.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for candidate in (ROOT, ROOT / "src"):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+from src.storage.occurrence_columns import (  # noqa: E402
+    OccurrenceColumns,
+    export_occurrence_columns,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="VersionedStore SQLite database")
+    parser.add_argument("--out", type=Path, required=True, help="Export directory")
+    parser.add_argument("--skip-export", action="store_true", help="Report on an existing export")
+    parser.add_argument("--top", type=int, default=25, help="Entries per frequency report")
+    parser.add_argument(
+        "--cooccur", action="append", default=[], help="Lexeme to report co-occurrences for"
+    )
+    parser.add_argument("--window", type=int, default=5, help="Co-occurrence window in tokens")
+    parser.add_argument(
+        "--concordance", action="append", default=[], help="Lexeme to list occurrences of"
+    )
+    parser.add_argument("--limit", type=int, default=50, help="Concordance rows per lexeme")
+    args = parser.parse_args(argv)
+
+    report: dict[str, object] = {}
+    if not args.skip_export:
+        if args.db is None:
+            parser.error("--db is required unless --skip-export is given")
+        from src.storage.versioned_store import VersionedStore
+
+        store = VersionedStore(args.db, snapshot_cache_size=0)
+        started = time.perf_counter()
+        try:
+            exported = export_occurrence_columns(store, args.out)
+        finally:
+            store.close()
+        report["export"] = {
+            "revisions": exported.revisions,
+            "rows": exported.rows,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    started = time.perf_counter()
+    columns = OccurrenceColumns(args.out)
+    report["lexeme_frequencies"] = columns.lexemes.frequencies(top=args.top)
+    report["lexeme_document_frequencies"] = columns.lexemes.document_frequencies(top=args.top)
+    report["structural_atom_frequencies"] = columns.structural_atoms.frequencies(top=args.top)
+    report["cooccurrences"] = {
+        lexeme: columns.lexemes.cooccurrences(lexeme, window=args.window, top=args.top)
+        for lexeme in args.cooccur
+    }
+    report["concordance"] = {
+        lexeme: columns.lexemes.concordance(lexeme, limit=args.limit)
+        for lexeme in args.concordance
+    }
+    report["report_seconds"] = round(time.perf_counter() - started, 3)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,6 +22,7 @@ from src.fact_intake import (
     build_feedback_receipt_summary,
     build_fact_agent_feedback_payload,
     build_fact_review_acceptance_report,
+    build_fact_review_materialization_status,
     build_fact_review_operator_views,
     build_fact_intake_report,
     build_fact_review_run_summary,
@@ -35,7 +36,9 @@ from src.fact_intake import (
     list_authority_ingest_runs,
     list_feedback_receipts,
     list_semantic_refresh_runs,
+    load_materialized_fact_review_payload,
     persist_feedback_receipt,
+    refresh_fact_review_materializations,
     resolve_fact_run_id,
     resolve_fact_run_link,
 )
@@ -87,6 +90,29 @@ def _add_interrogative_flag(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_materialized_flag(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--materialized",
+        action="store_true",
+        help="Serve the payload from its materialized row, rebuilding it only when the run changed since it was built.",
+    )
+    parser.add_argument(
+        "--allow-stale",
+        action="store_true",
+        help="With --materialized, serve an out-of-date row as-is and report its staleness instead of rebuilding.",
+    )
+
+
+def _load_materialized(conn, args: argparse.Namespace, *, run_id: str, payload_kind: str) -> tuple[dict, dict]:
+    loaded = load_materialized_fact_review_payload(
+        conn,
+        run_id=run_id,
+        payload_kind=payload_kind,
+        allow_stale=bool(getattr(args, "allow_stale", False)),
+    )
+    return loaded["payload"], loaded["materialization"]
+
+
 def _attach_interrogatives(record: object) -> object:
     if not isinstance(record, dict):
         return record
@@ -224,9 +250,11 @@ def main(argv: list[str] | None = None) -> int:
         required=True,
         choices=["intake_triage", "chronology_prep", "procedural_posture", "contested_items"],
     )
+    _add_materialized_flag(view_p)
 
     workbench_p = sub.add_parser("workbench", help="Show the bounded read-only fact-review workbench payload")
     _add_run_selector_args(workbench_p)
+    _add_materialized_flag(workbench_p)
 
     acceptance_p = sub.add_parser("acceptance", help="Show story-driven acceptance results for a persisted run")
     _add_run_selector_args(acceptance_p)
@@ -248,6 +276,15 @@ def main(argv: list[str] | None = None) -> int:
 
     report_p = sub.add_parser("report", help="Show the full persisted fact-intake report")
     _add_run_selector_args(report_p)
+    _add_materialized_flag(report_p)
+
+    materialization_p = sub.add_parser(
+        "materialization",
+        help="Show generation and staleness of a run's materialized review payloads",
+    )
+    _add_run_selector_args(materialization_p)
+    materialization_p.add_argument("--refresh", action="store_true", help="Rebuild stale materialized payloads")
+    materialization_p.add_argument("--force", action="store_true", help="With --refresh, rebuild fresh payloads too")
 
     contested_runs_p = sub.add_parser("contested-runs", help="List persisted contested affidavit review runs")
     contested_runs_p.add_argument("--limit", type=int, default=20)
@@ -622,15 +659,45 @@ def main(argv: list[str] | None = None) -> int:
                 workflow_run_id=getattr(args, "workflow_run_id", None),
                 source_label=getattr(args, "source_label", None),
             )
-            operator_views = build_fact_review_operator_views(conn, run_id=resolved_run_id)
+            if args.materialized:
+                operator_views, materialization = _load_materialized(
+                    conn, args, run_id=resolved_run_id, payload_kind="operator_views"
+                )
+                run_summary, _ = _load_materialized(conn, args, run_id=resolved_run_id, payload_kind="run_summary")
+            else:
+                operator_views = build_fact_review_operator_views(conn, run_id=resolved_run_id)
+                run_summary = build_fact_review_run_summary(conn, run_id=resolved_run_id)
             payload = {
                 "ok": True,
                 "dbPath": str(db_path),
-                "run": build_fact_review_run_summary(conn, run_id=resolved_run_id)["run"],
+                "run": run_summary["run"],
                 "view_kind": args.view_kind,
                 "view": operator_views[args.view_kind],
             }
+            if args.materialized:
+                payload["materialization"] = materialization
         elif args.command == "workbench":
+            resolved_run_id = resolve_fact_run_id(
+                conn,
+                run_id=getattr(args, "run_id", None),
+                workflow_kind=getattr(args, "workflow_kind", None),
+                workflow_run_id=getattr(args, "workflow_run_id", None),
+                source_label=getattr(args, "source_label", None),
+            )
+            if args.materialized:
+                workbench, materialization = _load_materialized(
+                    conn, args, run_id=resolved_run_id, payload_kind="workbench"
+                )
+            else:
+                workbench = build_fact_review_workbench_payload(conn, run_id=resolved_run_id)
+            payload = {
+                "ok": True,
+                "dbPath": str(db_path),
+                "workbench": workbench,
+            }
+            if args.materialized:
+                payload["materialization"] = materialization
+        elif args.command == "materialization":
             resolved_run_id = resolve_fact_run_id(
                 conn,
                 run_id=getattr(args, "run_id", None),
@@ -641,7 +708,11 @@ def main(argv: list[str] | None = None) -> int:
             payload = {
                 "ok": True,
                 "dbPath": str(db_path),
-                "workbench": build_fact_review_workbench_payload(conn, run_id=resolved_run_id),
+                "materialization": (
+                    refresh_fact_review_materializations(conn, run_id=resolved_run_id, force=args.force)
+                    if args.refresh
+                    else build_fact_review_materialization_status(conn, run_id=resolved_run_id)
+                ),
             }
         elif args.command == "acceptance":
             resolved_run_id = resolve_fact_run_id(
@@ -767,11 +838,17 @@ def main(argv: list[str] | None = None) -> int:
                 workflow_run_id=getattr(args, "workflow_run_id", None),
                 source_label=getattr(args, "source_label", None),
             )
+            if getattr(args, "materialized", False):
+                report, materialization = _load_materialized(conn, args, run_id=resolved_run_id, payload_kind="report")
+            else:
+                report = build_fact_intake_report(conn, run_id=resolved_run_id)
             payload = {
                 "ok": True,
                 "dbPath": str(db_path),
-                "report": build_fact_intake_report(conn, run_id=resolved_run_id),
+                "report": report,
             }
+            if getattr(args, "materialized", False):
+                payload["materialization"] = materialization
     print(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True))
     return 0
 
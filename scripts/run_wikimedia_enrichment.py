@@ -19,6 +19,10 @@ from src.ontology.external_enrichment import (  # noqa: E402
     EnrichmentResult,
     ExternalLookupDemand,
 )
+from src.ontology.wikimedia_lookup_cache import (  # noqa: E402
+    LOOKUP_CACHE_ENV,
+    SQLiteLookupCache,
+)
 from src.ontology.wikimedia_providers import (  # noqa: E402
     WikidataProvider,
     WikimediaMicrobatchRunner,
@@ -53,6 +57,13 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--microbatch-size", type=int, default=16)
     parser.add_argument("--request-budget-per-provider", type=int, default=64)
     parser.add_argument("--candidate-limit", type=int, default=5)
+    parser.add_argument(
+        "--lookup-cache",
+        type=Path,
+        default=os.environ.get(LOOKUP_CACHE_ENV) or None,
+        help="SQLite lookup cache reused across runs (default: $%s)" % LOOKUP_CACHE_ENV,
+    )
+    parser.add_argument("--lookup-cache-max-entries", type=int, default=200_000)
     return parser.parse_args()
 
 
@@ -102,6 +113,7 @@ def main() -> int:
     args = _parse_args()
     include_wiktionary = not args.no_wiktionary
     store: PostgresCompilerStore | None = None
+    lookup_cache: SQLiteLookupCache | None = None
     try:
         if args.corpus_ref:
             if not args.database_url:
@@ -140,8 +152,14 @@ def main() -> int:
             ]
             if include_wiktionary:
                 providers.append(WiktionaryProvider())
+            if args.lookup_cache is not None:
+                lookup_cache = SQLiteLookupCache(
+                    args.lookup_cache,
+                    max_entries=args.lookup_cache_max_entries,
+                )
             runner = WikimediaMicrobatchRunner(
                 providers,
+                cache=lookup_cache,
                 microbatch_size=args.microbatch_size,
                 request_budget_per_provider=args.request_budget_per_provider,
             )
@@ -169,6 +187,10 @@ def main() -> int:
                     for receipt in row.pressure_receipts
                 ),
                 "identity_closure_count": 0,
+                "lookup_cache": {
+                    "backend": "sqlite" if lookup_cache is not None else "memory",
+                    **runner.last_cache_stats,
+                },
             }
             if args.database_url:
                 if store is None:
@@ -185,6 +207,8 @@ def main() -> int:
     finally:
         if store is not None:
             store.close()
+        if lookup_cache is not None:
+            lookup_cache.close()
 
 
 if __name__ == "__main__":
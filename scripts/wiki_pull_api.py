@@ -18,6 +18,7 @@ import argparse
 import datetime as dt
 import hashlib
 import json
+import os
 import sys
 import time
 import urllib.error
@@ -34,6 +35,11 @@ WIKIS: dict[str, str] = {
 }
 
 
+def _api_base(wiki: str) -> str:
+    # WIKI_PULL_API_BASE points every wiki at one endpoint, e.g. a local stub.
+    return os.environ.get("WIKI_PULL_API_BASE") or WIKIS[wiki]
+
+
 class _RequestPacer:
     def __init__(self, *, wiki_rps: float) -> None:
         self._interval = 1.0 / max(0.01, float(wiki_rps))
@@ -160,7 +166,7 @@ def _fetch_latest_wikitext(
 ) -> PageSnapshot:
     if wiki not in WIKIS:
         raise SystemExit(f"unknown wiki '{wiki}' (choices: {', '.join(sorted(WIKIS))})")
-    base = WIKIS[wiki]
+    base = _api_base(wiki)
 
     # We intentionally keep link/category pulls capped. Full link graphs can be
     # huge; discovery traversal is a separate opt-in step.
@@ -275,7 +281,7 @@ def _fetch_revision_wikitext(
 ) -> PageSnapshot:
     if wiki not in WIKIS:
         raise SystemExit(f"unknown wiki '{wiki}' (choices: {', '.join(sorted(WIKIS))})")
-    base = WIKIS[wiki]
+    base = _api_base(wiki)
     params = {
         "action": "query",
         "format": "json",
@@ -360,7 +366,7 @@ def _fetch_revision_history(
 ) -> dict[str, Any]:
     if wiki not in WIKIS:
         raise SystemExit(f"unknown wiki '{wiki}' (choices: {', '.join(sorted(WIKIS))})")
-    base = WIKIS[wiki]
+    base = _api_base(wiki)
     rvend, rvstart = _history_bounds(window_days)
     params: dict[str, str | int] = {
         "action": "query",
@@ -522,7 +528,7 @@ def _fetch_category_members(
 ) -> List[str]:
     if wiki not in WIKIS:
         raise SystemExit(f"unknown wiki '{wiki}' (choices: {', '.join(sorted(WIKIS))})")
-    base = WIKIS[wiki]
+    base = _api_base(wiki)
     members: List[str] = []
     cmcontinue: Optional[str] = None
     while True:
@@ -14,9 +14,18 @@ if str(_SENSIBLAW_ROOT) not in sys.path:
     sys.path.insert(0, str(_SENSIBLAW_ROOT))
 
 from cli_runtime import build_progress_callback, configure_cli_logging
+from src.sources.rate_limit import RateLimit
 from src.wiki_timeline.revision_pack_runner import default_out_dir_for_pack, human_summary, run
 
 
+def _wiki_rate_limits(pack_path: Path, wiki_rps: float | None) -> dict[str, RateLimit] | None:
+    if wiki_rps is None:
+        return None
+    pack = json.loads(pack_path.read_text(encoding="utf-8"))
+    wikis = {str(article.get("wiki") or "enwiki") for article in pack.get("articles") or [] if isinstance(article, dict)}
+    return {wiki: RateLimit(rps=wiki_rps, burst=max(1, int(wiki_rps))) for wiki in wikis}
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Bounded rolling Wikipedia revision pack runner.")
     parser.add_argument(
@@ -49,6 +58,19 @@ def main(argv: list[str] | None = None) -> int:
         default="json",
         help="stdout summary format (default: %(default)s)",
     )
+    parser.add_argument(
+        "--execution",
+        choices=("subprocess", "in_process"),
+        default="subprocess",
+        help="Run wiki pulls as subprocesses or call the entry points in-process (default: %(default)s)",
+    )
+    parser.add_argument("--max-workers", type=int, default=1, help="Articles processed concurrently (default: %(default)s)")
+    parser.add_argument(
+        "--wiki-rps",
+        type=float,
+        default=None,
+        help="Per-wiki request rate shared by all workers (default: 1.0)",
+    )
     parser.add_argument("--progress", action="store_true", help="Emit progress to stderr.")
     parser.add_argument("--progress-format", choices=("human", "json", "bar"), default="human", help="Progress renderer for stderr output.")
     parser.add_argument("--log-level", default="INFO", help="stderr logging level (default: %(default)s).")
@@ -71,6 +93,9 @@ def main(argv: list[str] | None = None) -> int:
         state_db_path=args.state_db,
         bridge_db_path=args.bridge_db,
         progress_callback=progress_callback,
+        execution=args.execution,
+        max_workers=max(1, int(args.max_workers)),
+        wiki_rate_limits=_wiki_rate_limits(args.pack, args.wiki_rps),
     )
     if callable(progress_callback):
         results = list(payload.get("articles", [])) if isinstance(payload.get("articles"), list) else []
@@ -40,6 +40,7 @@ from src.api.routes import (
     fetch_provision_atoms,
     generate_subgraph,
 )
+from src.graph.embedding_store import EmbeddingStore
 from src.graph.inference import load_predictions_json, load_predictions_sqlite
 from src.graph.models import EdgeType, GraphEdge, GraphNode, NodeType
 from src.tests.templates import TEMPLATE_REGISTRY
@@ -312,45 +313,35 @@ def _reduce_embeddings(matrix: np.ndarray) -> np.ndarray:
     return projection[:, :2]
 
 
+# Larger stores plot a sample and take the query node as free text.
+_EXPLORER_PLOT_ROWS = 5000
+_EXPLORER_SELECT_ROWS = 5000
+
+
 def _compute_nearest_neighbours(
-    matrix: np.ndarray,
-    identifiers: List[str],
+    store: EmbeddingStore,
     query: str,
     count: int,
 ) -> List[Tuple[str, float]]:
     """Return the ``count`` closest nodes to ``query`` measured by Euclidean distance."""
 
-    if query not in identifiers or matrix.size == 0:
-        return []
-
-    query_index = identifiers.index(query)
-    query_vector = matrix[query_index]
-    distances = np.linalg.norm(matrix - query_vector, axis=1)
-    order = np.argsort(distances)
-
-    neighbours: List[Tuple[str, float]] = []
-    for idx in order:
-        if idx == query_index:
-            continue
-        neighbours.append((identifiers[idx], float(distances[idx])))
-        if len(neighbours) >= count:
-            break
-    return neighbours
+    return store.nearest(query, count)
 
 
-def _render_embedding_explorer(
-    embeddings: Dict[str, List[float]], metadata_key: str
-) -> None:
+def _render_embedding_explorer(store: EmbeddingStore, source_label: str) -> None:
     """Visualise embeddings and display nearest-neighbour recommendations."""
 
-    identifiers = list(embeddings.keys())
-    matrix = np.array(
-        [embeddings[identifier] for identifier in identifiers], dtype=np.float32
-    )
-    if matrix.size == 0:
+    if len(store) == 0 or store.dim == 0:
         st.info("No numeric embeddings are available yet.")
         return
 
+    if len(store) <= _EXPLORER_PLOT_ROWS:
+        plot_rows = np.arange(len(store))
+    else:
+        plot_rows = np.linspace(0, len(store) - 1, _EXPLORER_PLOT_ROWS).astype(np.int64)
+    identifiers = [store.identifier(int(row)) for row in plot_rows]
+    matrix = np.asarray(store.vectors[plot_rows], dtype=np.float32)
+
     projection = _reduce_embeddings(matrix)
     node_types: List[str] = []
     node_titles: List[Optional[str]] = []
@@ -372,10 +363,13 @@ def _render_embedding_explorer(
         }
     )
 
-    st.caption(
-        f"Loaded {len(identifiers)} embedding vectors (dimension {matrix.shape[1]}) "
-        f"via '{metadata_key}'."
+    caption = (
+        f"Loaded {len(store)} embedding vectors (dimension {store.dim}) "
+        f"via '{source_label}'."
     )
+    if len(plot_rows) < len(store):
+        caption += f" The projection shows {len(plot_rows)} evenly spaced nodes."
+    st.caption(caption)
 
     chart = (
         alt.Chart(viz_df)
@@ -390,21 +384,28 @@ def _render_embedding_explorer(
     )
     st.altair_chart(chart, use_container_width=True)
 
-    if len(identifiers) < 2:
+    if len(store) < 2:
         st.info("At least two embeddings are required to compute nearest neighbours.")
         return
 
-    default_query = st.session_state.get("kg_embeddings_query", identifiers[0])
-    if default_query not in identifiers:
-        default_query = identifiers[0]
+    default_query = st.session_state.get("kg_embeddings_query", store.identifier(0))
+    if default_query not in store:
+        default_query = store.identifier(0)
 
-    query = st.selectbox(
-        "Node for nearest-neighbour recommendations",
-        options=identifiers,
-        index=identifiers.index(default_query),
-        key="kg_embeddings_query",
-    )
-    max_neighbours = min(10, len(identifiers) - 1)
+    if len(store) <= _EXPLORER_SELECT_ROWS:
+        query = st.selectbox(
+            "Node for nearest-neighbour recommendations",
+            options=store.identifiers(),
+            index=store.index_of(default_query),
+            key="kg_embeddings_query",
+        )
+    else:
+        query = st.text_input(
+            "Node for nearest-neighbour recommendations",
+            value=default_query,
+            key="kg_embeddings_query",
+        )
+    max_neighbours = min(10, len(store) - 1)
     neighbour_count = st.slider(
         "Number of neighbours",
         min_value=1,
@@ -413,9 +414,7 @@ def _render_embedding_explorer(
         key="kg_neighbour_count",
     )
 
-    neighbours = _compute_nearest_neighbours(
-        matrix, identifiers, query, neighbour_count
-    )
+    neighbours = _compute_nearest_neighbours(store, query, neighbour_count)
     if not neighbours:
         st.warning("No neighbours found for the selected node.")
         return
@@ -806,6 +805,7 @@ def render() -> None:
             embeddings = _collect_graph_embeddings(metadata_key)
             if embeddings:
                 st.session_state["kg_embeddings"] = embeddings
+                st.session_state["kg_embedding_store"] = None
                 st.success(
                     f"Loaded {len(embeddings)} embeddings from the current graph."
                 )
@@ -829,6 +829,7 @@ def render() -> None:
                 parsed = _normalise_embedding_payload(payload)
                 if parsed:
                     st.session_state["kg_embeddings"] = parsed
+                    st.session_state["kg_embedding_store"] = None
                     st.success(
                         f"Loaded {len(parsed)} embeddings from the uploaded file."
                     )
@@ -837,9 +838,40 @@ def render() -> None:
                         "The uploaded file did not contain compatible numeric vectors."
                     )
 
+    store_dir = st.text_input(
+        "Embedding store directory",
+        value=st.session_state.get("kg_embedding_store_dir", ""),
+        help=(
+            "Directory written by `graph neighbours --embeddings` or "
+            "`graph inference train --embeddings-store`; vectors are memory-mapped."
+        ),
+    )
+    if st.button("Open embedding store", key="kg_embedding_store_open") and store_dir:
+        try:
+            opened = EmbeddingStore.load(Path(store_dir))
+        except (OSError, ValueError, KeyError) as exc:
+            st.error(f"Could not open embedding store: {exc}")
+        else:
+            st.session_state["kg_embedding_store"] = opened
+            st.session_state["kg_embedding_store_dir"] = store_dir
+            st.session_state["kg_embeddings"] = {}
+            st.success(f"Opened an embedding store with {len(opened)} vectors.")
+
+    # The store is built once per loaded mapping and reused across reruns.
     embeddings_state: Dict[str, List[float]] = st.session_state.get("kg_embeddings", {})
-    if embeddings_state:
-        _render_embedding_explorer(embeddings_state, metadata_key)
+    store: Optional[EmbeddingStore] = st.session_state.get("kg_embedding_store")
+    source_label = st.session_state.get("kg_embedding_store_dir", "") or metadata_key
+    if store is None and embeddings_state:
+        source_label = metadata_key
+        try:
+            store = EmbeddingStore.from_mapping(embeddings_state)
+        except ValueError as exc:
+            st.warning(f"Embeddings could not be indexed: {exc}")
+        else:
+            st.session_state["kg_embedding_store"] = store
+            st.session_state["kg_embedding_store_dir"] = ""
+    if store is not None:
+        _render_embedding_explorer(store, source_label)
     else:
         st.caption(
             "Load embeddings from metadata or upload a JSON export to unlock clustering and neighbour tools."
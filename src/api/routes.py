@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+from collections import deque
 from dataclasses import asdict
 from datetime import date
 from math import exp
@@ -38,10 +39,12 @@ except Exception:  # pragma: no cover
 
 if __package__ and __package__.startswith("src."):
     from src.graph.models import EdgeType, LegalGraph, GraphEdge, GraphNode, NodeType
+    from src.graph.subgraph_cache import SubgraphCache
     from src.policy.engine import PolicyEngine
     from src.tests.templates import TEMPLATE_REGISTRY
 else:
     from graph.models import EdgeType, LegalGraph, GraphEdge, GraphNode, NodeType
+    from graph.subgraph_cache import SubgraphCache
     from policy.engine import PolicyEngine
     from tests.templates import TEMPLATE_REGISTRY
 
@@ -116,21 +119,32 @@ POSTURE_MISMATCH_FACTOR = 0.8
 
 _graph = LegalGraph()
 _policy = PolicyEngine({"if": "SACRED_DATA", "then": "require", "else": "allow"})
+_subgraph_cache = SubgraphCache(_graph)
 
 
 def generate_subgraph(seed: str, hops: int, consent: bool = False) -> Dict[str, Any]:
-    """Return a subgraph around ``seed`` up to ``hops`` hops."""
+    """Return a subgraph around ``seed`` up to ``hops`` hops.
+
+    Results are served from :data:`_subgraph_cache` until the TTL lapses or a
+    node/edge inside the neighbourhood changes.
+    """
     if seed not in _graph.nodes:
         raise HTTPException(status_code=404, detail="Seed node not found")
+    return _subgraph_cache.get_or_build(
+        seed, hops, consent, lambda: _build_subgraph(seed, hops, consent)
+    )
+
+
+def _build_subgraph(seed: str, hops: int, consent: bool) -> Tuple[Dict[str, Any], List[str]]:
     visited = {seed}
     nodes = {seed: _graph.nodes[seed]}
     edges: List[GraphEdge] = []
-    frontier = [(seed, 0)]
+    frontier = deque([(seed, 0)])
     while frontier:
-        current, depth = frontier.pop(0)
+        current, depth = frontier.popleft()
         if depth >= hops:
             continue
-        for edge in _graph.find_edges(source=current):
+        for edge in _graph.out_edges(current):
             edges.append(edge)
             tgt = edge.target
             if tgt not in visited:
@@ -142,7 +156,8 @@ def generate_subgraph(seed: str, hops: int, consent: bool = False) -> Dict[str,
         enforced = _policy.enforce(n, consent=consent)
         if enforced:
             result_nodes.append(asdict(enforced))
-    return {"nodes": result_nodes, "edges": [asdict(e) for e in edges]}
+    payload = {"nodes": result_nodes, "edges": [asdict(e) for e in edges]}
+    return payload, list(visited)
 
 
 class TestRunRequest(BaseModel):
@@ -550,9 +565,16 @@ def provision_atoms_endpoint(provision_id: str) -> Dict[str, Any]:
     return fetch_provision_atoms(provision_id)
 
 
+@router.get("/subgraph/cache")
+def subgraph_cache_endpoint() -> Dict[str, Any]:
+    """Return hit/miss counters for the subgraph cache."""
+    return _subgraph_cache.stats()
+
+
 __all__ = [
     "router",
     "generate_subgraph",
+    "subgraph_cache_endpoint",
     "execute_tests",
     "fetch_case_treatment",
     "ensure_sample_treatment_graph",
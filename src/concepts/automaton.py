@@ -0,0 +1,342 @@
+"""Compiled Aho-Corasick automaton for concept triggers.
+
+Triggers are compiled once into a flat, fully-resolved transition table and
+written to a small binary file that is memory-mapped on load, so processes
+that match concepts neither parse the trigger JSON nor rebuild failure links.
+
+File layout (native byte order, all integers ``int32`` unless noted)::
+
+    header   magic, version, byte order, source digest, section sizes
+    alphabet UTF-8 string; character ``alphabet[k]`` has class ``k + 1``
+    concepts UTF-8, NUL separated concept identifiers
+    delta    num_states * num_classes transitions
+    offsets  num_states + 1 output offsets
+    concept  num_outputs concept indexes
+    length   num_outputs trigger lengths
+
+Transitions are stored pre-multiplied by ``num_classes`` (a row offset), and
+negated when the target state has outputs, so the match loop is one table
+lookup per character plus a sign test.  Class ``0`` covers every character
+that does not occur in any trigger.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+MAGIC = b"SLCAUT\x00\x01"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIc3x64s6I")
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+class _Node:
+    __slots__ = ("children", "fail", "outputs", "state")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.fail: _Node | None = None
+        self.outputs: list[tuple[str, int]] = []
+        self.state = 0
+
+
+def load_triggers(data_dir: Path) -> list[tuple[str, str]]:
+    """Return ``(trigger, concept_id)`` pairs from the JSON files in ``data_dir``."""
+
+    triggers: list[tuple[str, str]] = []
+    for path in sorted(data_dir.glob("*.json")):
+        data = json.loads(path.read_text())
+        if "id" in data and "phrases" in data:
+            concept_id = str(data["id"])
+            for phrase in data.get("phrases", []):
+                triggers.append((str(phrase).lower(), concept_id))
+        else:  # mapping of trigger -> concept_id
+            for trigger, concept_id in data.items():
+                triggers.append((str(trigger).lower(), str(concept_id)))
+    return triggers
+
+
+def source_digest(data_dir: Path) -> str:
+    """Return a digest of the trigger files in ``data_dir`` (names, sizes, mtimes)."""
+
+    digest = hashlib.sha256(str(data_dir.resolve()).encode("utf-8"))
+    for path in sorted(data_dir.glob("*.json")):
+        stat = path.stat()
+        digest.update(f"\0{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _build_trie(triggers: Iterable[tuple[str, str]]) -> list[_Node]:
+    root = _Node()
+    for trigger, concept_id in triggers:
+        if not trigger:
+            continue
+        node = root
+        for ch in trigger:
+            node = node.children.setdefault(ch, _Node())
+        node.outputs.append((concept_id, len(trigger)))
+
+    # Breadth-first order doubles as the state numbering.
+    nodes = [root]
+    queue = deque()
+    root.fail = root
+    for child in root.children.values():
+        child.fail = root
+        queue.append(child)
+    while queue:
+        current = queue.popleft()
+        current.state = len(nodes)
+        nodes.append(current)
+        for ch, child in current.children.items():
+            queue.append(child)
+            fail = current.fail
+            while fail is not root and ch not in fail.children:
+                fail = fail.fail
+            child.fail = fail.children.get(ch, root)
+            child.outputs.extend(child.fail.outputs)
+    return nodes
+
+
+def compile_triggers(triggers: Iterable[tuple[str, str]], *, digest: str = "") -> bytes:
+    """Compile ``(trigger, concept_id)`` pairs into the automaton file format."""
+
+    nodes = _build_trie(triggers)
+    root = nodes[0]
+    alphabet = sorted({ch for node in nodes for ch in node.children})
+    classes = {ch: index for index, ch in enumerate(alphabet, start=1)}
+    num_classes = len(alphabet) + 1
+
+    concept_index: dict[str, int] = {}
+    offsets = array("i", [0])
+    out_concepts = array("i")
+    out_lengths = array("i")
+    for node in nodes:
+        for concept_id, length in node.outputs:
+            out_concepts.append(concept_index.setdefault(concept_id, len(concept_index)))
+            out_lengths.append(length)
+        offsets.append(len(out_concepts))
+
+    def encode(target: _Node) -> int:
+        row = target.state * num_classes
+        return -row if target.outputs else row
+
+    # Breadth-first order means a state's failure target already has its row:
+    # start from that row and overwrite the state's own children.
+    delta = array("i", bytes(4 * len(nodes) * num_classes))
+    for node in nodes:
+        base = node.state * num_classes
+        if node is not root:
+            fail_base = node.fail.state * num_classes
+            delta[base : base + num_classes] = delta[fail_base : fail_base + num_classes]
+        for ch, child in node.children.items():
+            delta[base + classes[ch]] = encode(child)
+
+    alphabet_bytes = _pad("".join(alphabet).encode("utf-8"))
+    concept_bytes = _pad("\0".join(concept_index).encode("utf-8"))
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        sys.byteorder[0].encode("ascii"),
+        digest.encode("ascii").ljust(64, b"\0"),
+        len(nodes),
+        num_classes,
+        len(out_concepts),
+        len(concept_index),
+        len(alphabet_bytes),
+        len(concept_bytes),
+    )
+    return b"".join(
+        (
+            header,
+            alphabet_bytes,
+            concept_bytes,
+            delta.tobytes(),
+            offsets.tobytes(),
+            out_concepts.tobytes(),
+            out_lengths.tobytes(),
+        )
+    )
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+class _ClassTable(dict):
+    """``str.translate`` table mapping unknown characters to class 0."""
+
+    def __missing__(self, key: int) -> int:
+        return 0
+
+
+class _OutputTable(dict):
+    """Outputs keyed by row offset, decoded from the file on first use."""
+
+    def __init__(self, concept_ids, num_classes, offsets, out_concepts, out_lengths) -> None:
+        super().__init__()
+        self._concept_ids = concept_ids
+        self._num_classes = num_classes
+        self._offsets = offsets
+        self._out_concepts = out_concepts
+        self._out_lengths = out_lengths
+
+    def __missing__(self, row: int) -> tuple[tuple[str, int], ...]:
+        state = row // self._num_classes
+        outputs = tuple(
+            (self._concept_ids[self._out_concepts[k]], self._out_lengths[k])
+            for k in range(self._offsets[state], self._offsets[state + 1])
+        )
+        self[row] = outputs
+        return outputs
+
+
+class CompiledAutomaton:
+    """Read-only view over a compiled automaton buffer."""
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("concept automaton is truncated")
+        (
+            magic,
+            version,
+            byteorder,
+            digest,
+            num_states,
+            num_classes,
+            num_outputs,
+            num_concepts,
+            alphabet_size,
+            concepts_size,
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a concept automaton file")
+        if byteorder != sys.byteorder[0].encode("ascii"):
+            raise ValueError("concept automaton was compiled for another byte order")
+        self.digest = digest.rstrip(b"\0").decode("ascii")
+        self._buffer = buffer
+        view = memoryview(buffer)
+        offset = _HEADER.size
+        alphabet = bytes(view[offset : offset + alphabet_size]).rstrip(b"\0").decode("utf-8")
+        offset += alphabet_size
+        concepts = bytes(view[offset : offset + concepts_size]).rstrip(b"\0").decode("utf-8")
+        offset += concepts_size
+        self.concept_ids: tuple[str, ...] = tuple(concepts.split("\0")) if num_concepts else ()
+
+        sections = []
+        for count in (num_states * num_classes, num_states + 1, num_outputs, num_outputs):
+            sections.append(view[offset : offset + 4 * count].cast("i"))
+            offset += 4 * count
+        if offset > len(buffer):
+            raise ValueError("concept automaton is truncated")
+        self._delta, offsets, out_concepts, out_lengths = sections
+        self.num_states = num_states
+        self.num_classes = num_classes
+        self._classes = _ClassTable({ord(ch): index for index, ch in enumerate(alphabet, 1)})
+        self._outputs = _OutputTable(self.concept_ids, num_classes, offsets, out_concepts, out_lengths)
+
+    @classmethod
+    def from_triggers(cls, triggers: Iterable[tuple[str, str]]) -> "CompiledAutomaton":
+        return cls(compile_triggers(triggers))
+
+    @classmethod
+    def open(cls, path: Path | str) -> "CompiledAutomaton":
+        """Memory-map the automaton stored at ``path``."""
+
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped)
+
+    def matches(self, text: str) -> list[tuple[str, int, int]]:
+        """Return ``(concept_id, start, end)`` for every trigger occurrence in ``text``.
+
+        Offsets refer to ``text.lower()``, matching :meth:`ConceptMatcher.match`.
+        """
+
+        delta = self._delta
+        row = 0
+        accepted: list[tuple[int, int]] = []
+        append = accepted.append
+        for end, cls in enumerate(self._class_codes(text), 1):
+            row = delta[row + cls]
+            if row < 0:
+                row = -row
+                append((end, row))
+        outputs = self._outputs
+        return [
+            (concept_id, end - length, end)
+            for end, row in accepted
+            for concept_id, length in outputs[row]
+        ]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[str, int, int]]:
+        return iter(self.matches(text))
+
+    def _class_codes(self, text: str) -> Sequence[int]:
+        translated = text.lower().translate(self._classes)
+        if self.num_classes <= 256:
+            return translated.encode("latin-1")
+        return memoryview(translated.encode(_UTF32)).cast("I")
+
+    def match_many(self, texts: Sequence[str]) -> list[list[tuple[str, int, int]]]:
+        return [self.matches(text) for text in texts]
+
+
+def write_automaton(path: Path, data: bytes) -> None:
+    """Atomically write compiled automaton ``data`` to ``path``."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_or_compile(data_dir: Path, cache_dir: Path | None) -> CompiledAutomaton:
+    """Return the automaton for ``data_dir``, compiling and caching it when stale.
+
+    When ``cache_dir`` is ``None`` or not writable the automaton is compiled in
+    memory.
+    """
+
+    if not data_dir.exists():
+        return CompiledAutomaton(compile_triggers(()))
+    digest = source_digest(data_dir)
+    path = cache_dir / f"concepts-{digest[:16]}.automaton" if cache_dir is not None else None
+    if path is not None and path.exists():
+        try:
+            automaton = CompiledAutomaton.open(path)
+        except (OSError, ValueError):
+            automaton = None
+        if automaton is not None and automaton.digest == digest:
+            return automaton
+    data = compile_triggers(load_triggers(data_dir), digest=digest)
+    if path is not None:
+        try:
+            write_automaton(path, data)
+        except OSError:
+            pass
+    return CompiledAutomaton(data)
+
+
+__all__ = [
+    "CompiledAutomaton",
+    "compile_triggers",
+    "load_or_compile",
+    "load_triggers",
+    "source_digest",
+    "write_automaton",
+]
@@ -6,17 +6,29 @@ Provides an Aho-Corasick-based :class:`ConceptMatcher` for concept hit
 detection and lightweight helpers for matching arbitrary patterns.
 """
 
-import json
-from collections import deque
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from threading import Lock
+from typing import Iterable, Iterator, Optional, Sequence
+
+from .automaton import CompiledAutomaton, load_or_compile
 
 try:  # pragma: no cover - optional dependency
     import ahocorasick  # type: ignore
 except Exception:  # pragma: no cover - library is optional
     ahocorasick = None
 
+_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "concepts"
+_DEFAULT_CACHE_DIR: object = object()
+
+
+def default_automaton_cache_dir() -> Path:
+    """Directory holding compiled automata (``$SENSIBLAW_CACHE/concepts``)."""
+
+    base = os.environ.get("SENSIBLAW_CACHE") or _DATA_DIR.parent / "cache"
+    return Path(base) / "concepts"
+
 
 @dataclass
 class ConceptHit:
@@ -27,79 +39,56 @@ class ConceptHit:
     end: int
 
 
-class _Node:
-    __slots__ = ("children", "fail", "outputs")
-
-    def __init__(self) -> None:
-        self.children: dict[str, _Node] = {}
-        self.fail: _Node | None = None
-        self.outputs: list[tuple[str, int]] = []
-
-
 class ConceptMatcher:
-    """Match concepts using an Aho-Corasick automaton."""
-
-    def __init__(self, data_dir: Path | str | None = None) -> None:
-        if data_dir is None:
-            data_dir = Path(__file__).resolve().parents[2] / "data" / "concepts"
-        else:
-            data_dir = Path(data_dir)
-        self.root = _Node()
-        if data_dir.exists():
-            self._load_triggers(data_dir)
-            self._build_failure_links()
-
-    def _add(self, trigger: str, concept_id: str) -> None:
-        node = self.root
-        for ch in trigger:
-            node = node.children.setdefault(ch, _Node())
-        node.outputs.append((concept_id, len(trigger)))
-
-    def _load_triggers(self, data_dir: Path) -> None:
-        for path in sorted(data_dir.glob("*.json")):
-            data = json.loads(path.read_text())
-            if "id" in data and "phrases" in data:
-                concept_id = str(data["id"])
-                for phrase in data.get("phrases", []):
-                    self._add(str(phrase).lower(), concept_id)
-            else:  # mapping of trigger -> concept_id
-                for trigger, concept_id in data.items():
-                    self._add(str(trigger).lower(), str(concept_id))
-
-    def _build_failure_links(self) -> None:
-        queue = deque()
-        self.root.fail = self.root
-        for child in self.root.children.values():
-            child.fail = self.root
-            queue.append(child)
-        while queue:
-            current = queue.popleft()
-            for ch, child in current.children.items():
-                queue.append(child)
-                fail = current.fail
-                while fail is not self.root and ch not in fail.children:
-                    fail = fail.fail
-                child.fail = fail.children.get(ch, self.root)
-                child.outputs.extend(child.fail.outputs)
+    """Match concepts using a compiled Aho-Corasick automaton.
+
+    The automaton is compiled from ``data_dir`` on first use and cached under
+    ``cache_dir`` (default :func:`default_automaton_cache_dir`; ``None``
+    compiles in memory only), so later processes memory-map it instead of
+    rebuilding it.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | str | None = None,
+        *,
+        cache_dir: Path | str | None | object = _DEFAULT_CACHE_DIR,
+    ) -> None:
+        self.data_dir = _DATA_DIR if data_dir is None else Path(data_dir)
+        if cache_dir is _DEFAULT_CACHE_DIR:
+            cache_dir = default_automaton_cache_dir()
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self._automaton: CompiledAutomaton | None = None
+        self._lock = Lock()
+
+    @property
+    def automaton(self) -> CompiledAutomaton:
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = load_or_compile(self.data_dir, self.cache_dir)
+                automaton = self._automaton
+        return automaton
+
+    def iter_matches(self, text: str) -> Iterator[tuple[str, int, int]]:
+        """Yield ``(concept_id, start, end)`` tuples without building hits."""
+
+        return self.automaton.iter_matches(text)
 
     def match(self, text: str) -> list[ConceptHit]:
         """Return concept hits within the text."""
 
-        hits: list[ConceptHit] = []
-        node = self.root
-        text = text.lower()
-        for i, ch in enumerate(text):
-            while ch not in node.children and node is not self.root:
-                node = node.fail
-            node = node.children.get(ch, self.root)
-            for concept_id, length in node.outputs:
-                start = i - length + 1
-                end = i + 1
-                hits.append(ConceptHit(concept_id, start, end))
-        return hits
-
-
-# Load triggers at module import
+        return [ConceptHit(*hit) for hit in self.automaton.matches(text)]
+
+    def match_many(self, texts: Sequence[str]) -> list[list[ConceptHit]]:
+        """Return :meth:`match` results for each of ``texts``."""
+
+        matches = self.automaton.matches
+        return [[ConceptHit(*hit) for hit in matches(text)] for text in texts]
+
+
+# Triggers are compiled (or memory-mapped) on first use.
 MATCHER = ConceptMatcher()
 
 
@@ -167,6 +156,7 @@ __all__ = [
     "ConceptHit",
     "MATCHER",
     "Match",
+    "default_automaton_cache_dir",
     "MatchResult",
     "match",
 ]
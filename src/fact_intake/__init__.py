@@ -3,6 +3,8 @@ from .read_model import (
     FACT_INTAKE_CONTRACT_VERSION,
     AUTHORITY_INGEST_VERSION,
     FEEDBACK_RECEIPT_VERSION,
+    FACT_REVIEW_MATERIALIZATION_VERSION,
+    FACT_REVIEW_MATERIALIZED_KINDS,
     FACT_REVIEW_OPERATOR_VIEW_KINDS,
     FACT_REVIEW_WORKBENCH_VERSION,
     FACT_REVIEW_ZELPH_RULESET_VERSION,
@@ -16,6 +18,7 @@ from .read_model import (
     STATEMENT_STATUS_VALUES,
     build_fact_intake_payload_from_text_units,
     build_fact_intake_report,
+    build_fact_review_materialization_status,
     build_fact_review_operator_views,
     build_fact_review_run_summary,
     build_interrogative_view,
@@ -33,6 +36,7 @@ from .read_model import (
     list_contested_affidavit_review_runs,
     list_semantic_refresh_runs,
     list_fact_intake_runs,
+    load_materialized_fact_review_payload,
     find_latest_fact_workflow_link,
     persist_fact_intake_payload,
     persist_authority_ingest_receipt,
@@ -40,6 +44,7 @@ from .read_model import (
     persist_contested_affidavit_review,
     persist_fact_semantic_materialization,
     record_fact_workflow_link,
+    refresh_fact_review_materializations,
     resolve_fact_run_link,
     resolve_fact_run_id,
 )
@@ -127,6 +132,8 @@ __all__ = [
     "FACT_REVIEW_ACCEPTANCE_VERSION",
     "FACT_REVIEW_ACCEPTANCE_BATCH_VERSION",
     "FACT_REVIEW_ACCEPTANCE_FIXTURE_MANIFEST_VERSION",
+    "FACT_REVIEW_MATERIALIZATION_VERSION",
+    "FACT_REVIEW_MATERIALIZED_KINDS",
     "FACT_REVIEW_OPERATOR_VIEW_KINDS",
     "FACT_REVIEW_BUNDLE_VERSION",
     "FACT_REVIEW_WORKBENCH_VERSION",
@@ -154,6 +161,7 @@ __all__ = [
     "build_fact_intake_report",
     "build_fact_extraction_probe",
     "build_fact_review_operator_views",
+    "build_fact_review_materialization_status",
     "build_fact_review_run_summary",
     "build_interrogative_view",
     "build_contested_affidavit_proving_slice",
@@ -198,6 +206,7 @@ __all__ = [
     "list_contested_affidavit_review_runs",
     "list_semantic_refresh_runs",
     "list_fact_intake_runs",
+    "load_materialized_fact_review_payload",
     "load_fact_review_acceptance_fixture_manifest",
     "persist_fact_intake_payload",
     "persist_authority_ingest_receipt",
@@ -205,6 +214,7 @@ __all__ = [
     "persist_contested_affidavit_review",
     "persist_fact_semantic_materialization",
     "record_fact_workflow_link",
+    "refresh_fact_review_materializations",
     "resolve_fact_run_link",
     "resolve_fact_run_id",
     "STORY_WAVES",
@@ -101,6 +101,7 @@ _FACT_INTAKE_MIGRATION_FILES = (
     "013_authority_ingest.sql",
     "014_feedback_receipts.sql",
     "015_contested_affidavit_relation_fields.sql",
+    "016_fact_review_materialization.sql",
 )
 
 REVIEW_REASON_LABELS: dict[str, str] = {
@@ -136,6 +137,8 @@ FACT_REVIEW_OPERATOR_VIEW_KINDS = (
 FACT_REVIEW_WORKBENCH_VERSION = "fact.review.workbench.v1"
 FACT_REVIEW_ZELPH_RULESET_VERSION = "fact.review.workbench.zelph.v2"
 FACT_SEMANTIC_LAYER_VERSION = "fact.semantic.layer.v1"
+FACT_REVIEW_MATERIALIZATION_VERSION = "fact.review.materialization.v1"
+FACT_REVIEW_MATERIALIZED_KINDS = ("report", "run_summary", "operator_views", "workbench")
 _ASSERTION_PREDICATES = {"claimed", "denied", "admitted", "alleged"}
 _PROCEDURAL_OUTCOME_PREDICATES = {"ordered", "ruled", "decided_by", "held_that"}
 _PROCEDURAL_CONTEXT_PREDICATES = {"appealed", "challenged", "heard_by", "applied", "followed", "distinguished"}
@@ -417,6 +420,29 @@ FACT_INT_ROLLBACK_TABLES = [
 ]
 
 
+# Rows whose writes invalidate a run's materialized review payloads, mapped to
+# the SQL expression resolving the affected run_id from the trigger row.
+_FACT_REVIEW_GENERATION_SOURCES = {
+    "fact_intake_runs": "{row}.run_id",
+    "fact_sources": "{row}.run_id",
+    "fact_excerpts": "{row}.run_id",
+    "fact_statements": "{row}.run_id",
+    "fact_observations": "{row}.run_id",
+    "fact_candidates": "{row}.run_id",
+    "fact_candidate_statements": "(SELECT run_id FROM fact_candidates WHERE fact_id = {row}.fact_id)",
+    "fact_contestations": "(SELECT run_id FROM fact_candidates WHERE fact_id = {row}.fact_id)",
+    "fact_reviews": "(SELECT run_id FROM fact_candidates WHERE fact_id = {row}.fact_id)",
+    "event_candidates": "{row}.run_id",
+    "event_attributes": "(SELECT run_id FROM event_candidates WHERE event_id = {row}.event_id)",
+    "event_evidence": "(SELECT run_id FROM event_candidates WHERE event_id = {row}.event_id)",
+    "fact_workflow_links": "{row}.fact_run_id",
+    "entity_class_assertions": "{row}.run_id",
+    "entity_relations": "{row}.run_id",
+    "policy_outcomes": "{row}.run_id",
+    "semantic_refresh_runs": "{row}.run_id",
+}
+
+
 def _delete_run(conn: sqlite3.Connection, run_id: str) -> None:
     fact_ids = [
         str(row[0])
@@ -479,16 +505,56 @@ def _ensure_fact_intake_tables(conn: sqlite3.Connection) -> None:
     }
     if required <= existing:
         _ensure_semantic_refresh_progress_columns(conn)
+        _ensure_fact_review_materialization_tables(conn)
         _seed_fact_semantic_vocab(conn)
         return
     migrations_dir = Path(__file__).resolve().parents[2] / "database" / "migrations"
     for filename in _FACT_INTAKE_MIGRATION_FILES:
         conn.executescript((migrations_dir / filename).read_text(encoding="utf-8"))
     _ensure_semantic_refresh_progress_columns(conn)
+    _ensure_fact_review_materialization_tables(conn)
     _seed_fact_semantic_vocab(conn)
     conn.commit()
 
 
+def _ensure_fact_review_materialization_tables(conn: sqlite3.Connection) -> None:
+    expected = {
+        f"trg_fact_review_generation_{table}_{event.lower()}"
+        for table in _FACT_REVIEW_GENERATION_SOURCES
+        for event in ("INSERT", "UPDATE", "DELETE")
+    }
+    existing = {
+        str(row[0])
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE '%fact_review_%'"
+        ).fetchall()
+        if row and row[0]
+    }
+    if expected | {"fact_review_generations", "fact_review_materializations"} <= existing:
+        return
+    migrations_dir = Path(__file__).resolve().parents[2] / "database" / "migrations"
+    conn.executescript((migrations_dir / "016_fact_review_materialization.sql").read_text(encoding="utf-8"))
+    # Triggers bump a per-run generation on every write to a source table, so
+    # materialized payloads are invalidated by any writer, not only this module.
+    for table, run_id_expr in _FACT_REVIEW_GENERATION_SOURCES.items():
+        for event, row_alias in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_fact_review_generation_{table}_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                  INSERT INTO fact_review_generations(run_id, generation, changed_at)
+                  SELECT run_id, 1, CURRENT_TIMESTAMP
+                  FROM (SELECT {run_id_expr.format(row=row_alias)} AS run_id)
+                  WHERE run_id IS NOT NULL
+                  ON CONFLICT(run_id) DO UPDATE SET
+                    generation = generation + 1,
+                    changed_at = excluded.changed_at;
+                END
+                """
+            )
+
+
 def _ensure_semantic_refresh_progress_columns(conn: sqlite3.Connection) -> None:
     columns = {
         str(row[1])
@@ -4877,6 +4943,22 @@ def persist_fact_semantic_materialization(
         )
         raise
 
+    # Re-prime only the payloads a reader has already materialized, so a
+    # deferred background refresh leaves the review UI with warm rows.
+    materialized_kinds = [
+        str(row[0])
+        for row in conn.execute(
+            "SELECT payload_kind FROM fact_review_materializations WHERE run_id = ? ORDER BY payload_kind",
+            (run_id,),
+        ).fetchall()
+        if row and row[0] in FACT_REVIEW_MATERIALIZED_KINDS
+    ]
+    materialization = (
+        refresh_fact_review_materializations(conn, run_id=run_id, payload_kinds=materialized_kinds)
+        if materialized_kinds
+        else None
+    )
+
     return {
         "refresh_id": refresh_id,
         "run_id": run_id,
@@ -4885,6 +4967,7 @@ def persist_fact_semantic_materialization(
         "policy_count": policy_count,
         "refresh_kind": refresh_kind,
         "refresh_status": "ok",
+        "materialization": materialization,
     }
 
 
@@ -5260,3 +5343,282 @@ def build_fact_review_workbench_payload(
     if not include_zelph:
         return workbench
     return enrich_workbench_with_zelph(workbench, rules=_fact_review_zelph_rules())
+
+
+_FACT_REVIEW_MATERIALIZED_BUILDERS = {
+    "report": build_fact_intake_report,
+    "run_summary": build_fact_review_run_summary,
+    "operator_views": build_fact_review_operator_views,
+    "workbench": build_fact_review_workbench_payload,
+}
+_FACT_REVIEW_MATERIALIZED_PAYLOAD_VERSION = "|".join(
+    (
+        FACT_REVIEW_MATERIALIZATION_VERSION,
+        FACT_REVIEW_WORKBENCH_VERSION,
+        FACT_REVIEW_ZELPH_RULESET_VERSION,
+        FACT_SEMANTIC_LAYER_VERSION,
+    )
+)
+
+
+def _normalize_materialized_kinds(payload_kinds: Iterable[str] | None) -> list[str]:
+    if payload_kinds is None:
+        return list(FACT_REVIEW_MATERIALIZED_KINDS)
+    kinds = [str(kind).strip() for kind in payload_kinds]
+    unknown = sorted(set(kinds) - set(FACT_REVIEW_MATERIALIZED_KINDS))
+    if unknown:
+        raise ValueError(f"Unsupported materialized payload kind(s): {', '.join(unknown)}")
+    return list(dict.fromkeys(kinds))
+
+
+def _fact_review_generation(conn: sqlite3.Connection, *, run_id: str) -> tuple[int, str | None]:
+    row = conn.execute(
+        "SELECT generation, changed_at FROM fact_review_generations WHERE run_id = ?",
+        (run_id,),
+    ).fetchone()
+    if row is None:
+        return 0, None
+    return int(row[0]), (str(row[1]) if row[1] is not None else None)
+
+
+def _load_materialization_row(
+    conn: sqlite3.Connection,
+    *,
+    run_id: str,
+    payload_kind: str,
+    include_payload: bool,
+) -> sqlite3.Row | None:
+    columns = "generation, payload_version, payload_sha256, payload_bytes, build_seconds, built_at"
+    if include_payload:
+        columns += ", payload_json"
+    return conn.execute(
+        f"SELECT {columns} FROM fact_review_materializations WHERE run_id = ? AND payload_kind = ?",
+        (run_id, payload_kind),
+    ).fetchone()
+
+
+def _materialization_is_fresh(row: Mapping[str, Any] | None, *, generation: int) -> bool:
+    return (
+        row is not None
+        and int(row["generation"]) == generation
+        and str(row["payload_version"]) == _FACT_REVIEW_MATERIALIZED_PAYLOAD_VERSION
+    )
+
+
+def _materialization_report(
+    *,
+    run_id: str,
+    payload_kind: str,
+    status: str,
+    row: Mapping[str, Any] | None,
+    generation: int,
+    changed_at: str | None,
+    previous_generation: int | None = None,
+) -> dict[str, Any]:
+    built_at = str(row["built_at"]) if row is not None else None
+    age_seconds = None
+    if built_at:
+        age_seconds = round(
+            max((datetime.now(timezone.utc) - datetime.fromisoformat(built_at)).total_seconds(), 0.0),
+            3,
+        )
+    cached_generation = int(row["generation"]) if row is not None else None
+    return {
+        "run_id": run_id,
+        "payload_kind": payload_kind,
+        "status": status,
+        "generation": generation,
+        "cached_generation": cached_generation,
+        "stale_generations": None if cached_generation is None else max(generation - cached_generation, 0),
+        "previous_generation": previous_generation,
+        "version_matches": row is not None and str(row["payload_version"]) == _FACT_REVIEW_MATERIALIZED_PAYLOAD_VERSION,
+        "changed_at": changed_at,
+        "built_at": built_at,
+        "age_seconds": age_seconds,
+        "build_seconds": float(row["build_seconds"]) if row is not None else None,
+        "payload_bytes": int(row["payload_bytes"]) if row is not None else None,
+        "payload_sha256": str(row["payload_sha256"]) if row is not None else None,
+    }
+
+
+def _rebuild_fact_review_materialization(
+    conn: sqlite3.Connection,
+    *,
+    run_id: str,
+    payload_kind: str,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    # Read the generation before building: a write landing mid-build leaves the
+    # stored row one generation behind, so it is rebuilt on the next read.
+    generation, changed_at = _fact_review_generation(conn, run_id=run_id)
+    started_at = time.perf_counter()
+    payload = _FACT_REVIEW_MATERIALIZED_BUILDERS[payload_kind](conn, run_id=run_id)
+    build_seconds = time.perf_counter() - started_at
+    payload_json = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    row = {
+        "generation": generation,
+        "payload_version": _FACT_REVIEW_MATERIALIZED_PAYLOAD_VERSION,
+        "payload_sha256": _sha256_text(payload_json),
+        "payload_bytes": len(payload_json.encode("utf-8")),
+        "build_seconds": round(build_seconds, 6),
+        "built_at": datetime.now(timezone.utc).isoformat(),
+    }
+    conn.execute(
+        """
+        INSERT INTO fact_review_materializations(
+          run_id, payload_kind, generation, payload_version, payload_json,
+          payload_sha256, payload_bytes, build_seconds, built_at
+        ) VALUES (?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(run_id, payload_kind) DO UPDATE SET
+          generation = excluded.generation,
+          payload_version = excluded.payload_version,
+          payload_json = excluded.payload_json,
+          payload_sha256 = excluded.payload_sha256,
+          payload_bytes = excluded.payload_bytes,
+          build_seconds = excluded.build_seconds,
+          built_at = excluded.built_at
+        """,
+        (
+            run_id,
+            payload_kind,
+            row["generation"],
+            row["payload_version"],
+            payload_json,
+            row["payload_sha256"],
+            row["payload_bytes"],
+            row["build_seconds"],
+            row["built_at"],
+        ),
+    )
+    return payload, {**row, "changed_at": changed_at}
+
+
+def build_fact_review_materialization_status(conn: sqlite3.Connection, *, run_id: str) -> dict[str, Any]:
+    ensure_database(conn)
+    _ensure_fact_intake_tables(conn)
+    conn.row_factory = sqlite3.Row
+    generation, changed_at = _fact_review_generation(conn, run_id=run_id)
+    materializations = []
+    for payload_kind in FACT_REVIEW_MATERIALIZED_KINDS:
+        row = _load_materialization_row(conn, run_id=run_id, payload_kind=payload_kind, include_payload=False)
+        if row is None:
+            status = "missing"
+        else:
+            status = "fresh" if _materialization_is_fresh(row, generation=generation) else "stale"
+        materializations.append(
+            _materialization_report(
+                run_id=run_id,
+                payload_kind=payload_kind,
+                status=status,
+                row=row,
+                generation=generation,
+                changed_at=changed_at,
+            )
+        )
+    return {
+        "version": FACT_REVIEW_MATERIALIZATION_VERSION,
+        "run_id": run_id,
+        "generation": generation,
+        "changed_at": changed_at,
+        "materializations": materializations,
+    }
+
+
+def refresh_fact_review_materializations(
+    conn: sqlite3.Connection,
+    *,
+    run_id: str,
+    payload_kinds: Iterable[str] | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Rebuild stale materialized payloads for ``run_id`` and report the cost.
+
+    Fresh rows are left alone unless ``force`` is set.  ``rule_atoms`` rows are
+    owned by the rule extractor and are not tracked by the generation
+    triggers; force a refresh after re-extracting rules for a run's sources.
+    """
+    ensure_database(conn)
+    _ensure_fact_intake_tables(conn)
+    conn.row_factory = sqlite3.Row
+    kinds = _normalize_materialized_kinds(payload_kinds)
+    started_at = time.perf_counter()
+    materializations = []
+    for payload_kind in kinds:
+        generation, changed_at = _fact_review_generation(conn, run_id=run_id)
+        row = _load_materialization_row(conn, run_id=run_id, payload_kind=payload_kind, include_payload=False)
+        previous_generation = int(row["generation"]) if row is not None else None
+        if not force and _materialization_is_fresh(row, generation=generation):
+            status = "fresh"
+        else:
+            status = "built" if row is None else "refreshed"
+            _, row = _rebuild_fact_review_materialization(conn, run_id=run_id, payload_kind=payload_kind)
+        materializations.append(
+            _materialization_report(
+                run_id=run_id,
+                payload_kind=payload_kind,
+                status=status,
+                row=row,
+                generation=generation,
+                changed_at=changed_at,
+                previous_generation=previous_generation,
+            )
+        )
+    conn.commit()
+    return {
+        "version": FACT_REVIEW_MATERIALIZATION_VERSION,
+        "run_id": run_id,
+        "refreshed_count": sum(1 for row in materializations if row["status"] != "fresh"),
+        "refresh_seconds": round(time.perf_counter() - started_at, 6),
+        "materializations": materializations,
+    }
+
+
+def load_materialized_fact_review_payload(
+    conn: sqlite3.Connection,
+    *,
+    run_id: str,
+    payload_kind: str = "workbench",
+    allow_stale: bool = False,
+) -> dict[str, Any]:
+    """Serve a review payload from its materialized row, rebuilding it when stale.
+
+    With ``allow_stale`` an out-of-date row is served as-is (status ``stale``)
+    so a UI can render immediately and refresh in the background.  The
+    workbench's ``reopen_navigation`` lists sources across runs, so it is
+    recomputed on every read rather than cached.
+    """
+    ensure_database(conn)
+    _ensure_fact_intake_tables(conn)
+    conn.row_factory = sqlite3.Row
+    payload_kind = _normalize_materialized_kinds([payload_kind])[0]
+    generation, changed_at = _fact_review_generation(conn, run_id=run_id)
+    row = _load_materialization_row(conn, run_id=run_id, payload_kind=payload_kind, include_payload=True)
+    previous_generation = int(row["generation"]) if row is not None else None
+    if row is not None and (allow_stale or _materialization_is_fresh(row, generation=generation)):
+        status = "hit" if _materialization_is_fresh(row, generation=generation) else "stale"
+        payload = json.loads(row["payload_json"])
+    else:
+        status = "miss" if row is None else "refreshed"
+        payload, row = _rebuild_fact_review_materialization(conn, run_id=run_id, payload_kind=payload_kind)
+        conn.commit()
+    if payload_kind == "workbench" and isinstance(payload.get("run"), Mapping):
+        workflow_link = payload["run"].get("workflow_link") if isinstance(payload["run"].get("workflow_link"), Mapping) else {}
+        payload["reopen_navigation"] = _build_reopen_navigation(
+            payload["run"],
+            list_fact_review_sources(
+                conn,
+                workflow_kind=_normalize_opt_text(workflow_link.get("workflow_kind")),
+                limit=20,
+            ),
+        )
+    return {
+        "payload": payload,
+        "materialization": _materialization_report(
+            run_id=run_id,
+            payload_kind=payload_kind,
+            status=status,
+            row=row,
+            generation=generation,
+            changed_at=changed_at,
+            previous_generation=previous_generation,
+        ),
+    }
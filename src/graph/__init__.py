@@ -23,6 +23,8 @@ from .inference import (
     train_rotate,
     train_transe,
 )
+from .columnar import ColumnarGraphBuilder, ColumnarLegalGraph
+from .embedding_store import EmbeddingStore, build_embedding_store
 from .models import (
     CaseNode,
     EdgeType,
@@ -77,6 +79,10 @@ __all__ = [
     "GraphEdge",
     "GraphNode",
     "LegalGraph",
+    "ColumnarLegalGraph",
+    "ColumnarGraphBuilder",
+    "EmbeddingStore",
+    "build_embedding_store",
     "NodeType",
     "ProofTree",
     "ProofTreeEdge",
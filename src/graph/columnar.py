@@ -0,0 +1,598 @@
+"""Compact columnar backend for large read-mostly legal graphs.
+
+:class:`~src.graph.models.LegalGraph` keeps one dataclass (and one metadata
+dict) per node and edge, which is convenient for building graphs but costs
+several hundred bytes per edge.  :class:`ColumnarLegalGraph` stores the same
+graph as flat typed columns:
+
+* node identifiers are interned to integer ids in sorted order, so lookups are
+  a binary search over one string blob rather than a per-process dict;
+* edges are kept in CSR form (``out_offsets``/``edge_targets`` grouped by
+  source, plus an ``in_offsets``/``in_edges`` index grouped by target);
+* edge types, weights and dates are typed columns; node and edge metadata is
+  JSON encoded into a blob and only decoded when an object is materialised.
+
+:meth:`ColumnarLegalGraph.save` writes each column to its own file and
+:meth:`ColumnarLegalGraph.load` maps them read-only, so several API workers
+share one copy of the graph through the page cache.  The query surface mirrors
+``LegalGraph``: ``nodes``, ``edges``, ``get_node``, ``find_edges``,
+``out_edges``, ``in_edges`` and ``degree`` return ordinary
+:class:`GraphNode`/:class:`GraphEdge` objects built on demand.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import fields
+from datetime import date
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from .models import (
+    CaseNode,
+    EdgeType,
+    ExtrinsicNode,
+    GraphEdge,
+    GraphNode,
+    IssueNode,
+    JudgeOpinionNode,
+    LegalGraph,
+    NodeType,
+    OrderNode,
+    PrincipleNode,
+    StatuteSectionNode,
+    TestElementNode,
+)
+
+COLUMNAR_GRAPH_FORMAT = "sensiblaw.columnar-graph.v1"
+_MANIFEST_NAME = "manifest.json"
+
+_NODE_TYPES: Tuple[NodeType, ...] = tuple(NodeType)
+_EDGE_TYPES: Tuple[EdgeType, ...] = tuple(EdgeType)
+_NODE_TYPE_CODES = {member: index for index, member in enumerate(_NODE_TYPES)}
+_EDGE_TYPE_CODES = {member: index for index, member in enumerate(_EDGE_TYPES)}
+_NODE_CLASSES: Dict[str, Type[GraphNode]] = {
+    cls.__name__: cls
+    for cls in (
+        GraphNode,
+        ExtrinsicNode,
+        JudgeOpinionNode,
+        PrincipleNode,
+        TestElementNode,
+        StatuteSectionNode,
+        IssueNode,
+        OrderNode,
+        CaseNode,
+    )
+}
+_NO_DATE = 0
+
+# name -> typecode for every persisted column.
+_COLUMNS: Dict[str, str] = {
+    "node_id_offsets": "q",
+    "node_id_blob": "B",
+    "node_types": "B",
+    "node_dates": "i",
+    "node_record_offsets": "q",
+    "node_record_blob": "B",
+    "out_offsets": "q",
+    "edge_sources": "i",
+    "edge_targets": "i",
+    "edge_types": "B",
+    "edge_weights": "d",
+    "edge_dates": "i",
+    "edge_record_offsets": "q",
+    "edge_record_blob": "B",
+    "edge_positions": "i",
+    "in_offsets": "q",
+    "in_edges": "i",
+}
+
+
+def _date_to_ordinal(value: Optional[date]) -> int:
+    return value.toordinal() if value is not None else _NO_DATE
+
+
+def _ordinal_to_date(value: int) -> Optional[date]:
+    return date.fromordinal(value) if value != _NO_DATE else None
+
+
+def _encode_record(record: Mapping[str, Any]) -> bytes:
+    compact = {key: value for key, value in record.items() if value}
+    if not compact:
+        return b""
+    return json.dumps(compact, sort_keys=True, default=str).encode("utf-8")
+
+
+def _node_record(node: GraphNode) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "metadata": node.metadata,
+        "cultural_flags": node.cultural_flags,
+        "consent_required": node.consent_required,
+    }
+    if type(node) is not GraphNode:
+        record["class"] = type(node).__name__
+        base = {f.name for f in fields(GraphNode)}
+        extra = {
+            f.name: getattr(node, f.name)
+            for f in fields(node)
+            if f.init and f.name not in base
+        }
+        if extra:
+            record["fields"] = extra
+    return record
+
+
+class _StringColumn(Sequence[str]):
+    """UTF-8 strings stored back to back in one blob, addressed by offsets."""
+
+    def __init__(self, offsets: Sequence[int], blob: Sequence[int]) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return bytes(self._blob[self._offsets[index] : self._offsets[index + 1]]).decode("utf-8")
+
+
+class ColumnarGraphBuilder:
+    """Accumulate nodes and edges into compact columns without dataclasses."""
+
+    def __init__(self) -> None:
+        self._node_index: Dict[str, int] = {}
+        self._node_ids: List[str] = []
+        self._node_types = array("B")
+        self._node_dates = array("i")
+        self._node_records: List[bytes] = []
+        self._edge_sources = array("i")
+        self._edge_targets = array("i")
+        self._edge_types = array("B")
+        self._edge_weights = array("d")
+        self._edge_dates = array("i")
+        self._edge_records: List[bytes] = []
+
+    def add_node(self, node: GraphNode) -> None:
+        """Add or replace a node."""
+
+        record = _encode_record(_node_record(node))
+        index = self._node_index.get(node.identifier)
+        if index is None:
+            self._node_index[node.identifier] = len(self._node_ids)
+            self._node_ids.append(node.identifier)
+            self._node_types.append(_NODE_TYPE_CODES[node.type])
+            self._node_dates.append(_date_to_ordinal(node.date))
+            self._node_records.append(record)
+        else:
+            self._node_types[index] = _NODE_TYPE_CODES[node.type]
+            self._node_dates[index] = _date_to_ordinal(node.date)
+            self._node_records[index] = record
+
+    def add_edge(self, edge: GraphEdge) -> None:
+        """Add an edge; both endpoints must already have been added."""
+
+        source = self._node_index.get(edge.source)
+        target = self._node_index.get(edge.target)
+        if source is None or target is None:
+            raise ValueError("Both source and target nodes must exist in the graph")
+        self._edge_sources.append(source)
+        self._edge_targets.append(target)
+        self._edge_types.append(_EDGE_TYPE_CODES[edge.type])
+        self._edge_weights.append(float(edge.weight))
+        self._edge_dates.append(_date_to_ordinal(edge.date))
+        self._edge_records.append(
+            _encode_record({"identifier": edge.identifier, "metadata": edge.metadata})
+        )
+
+    def build(self) -> "ColumnarLegalGraph":
+        node_count = len(self._node_ids)
+        edge_count = len(self._edge_sources)
+
+        # Intern identifiers in sorted order so lookup is a binary search.
+        order = sorted(range(node_count), key=self._node_ids.__getitem__)
+        remap = array("i", bytes(4 * node_count)) if node_count else array("i")
+        for final, provisional in enumerate(order):
+            remap[provisional] = final
+
+        columns: Dict[str, array] = {}
+        id_offsets = array("q", [0])
+        id_blob = bytearray()
+        record_offsets = array("q", [0])
+        record_blob = bytearray()
+        node_types = array("B")
+        node_dates = array("i")
+        for provisional in order:
+            id_blob += self._node_ids[provisional].encode("utf-8")
+            id_offsets.append(len(id_blob))
+            record_blob += self._node_records[provisional]
+            record_offsets.append(len(record_blob))
+            node_types.append(self._node_types[provisional])
+            node_dates.append(self._node_dates[provisional])
+        columns["node_id_offsets"] = id_offsets
+        columns["node_id_blob"] = array("B", id_blob)
+        columns["node_types"] = node_types
+        columns["node_dates"] = node_dates
+        columns["node_record_offsets"] = record_offsets
+        columns["node_record_blob"] = array("B", record_blob)
+
+        sources = [remap[s] for s in self._edge_sources]
+        targets = [remap[t] for t in self._edge_targets]
+
+        # Counting sort into CSR; stable, so edges from one source keep their
+        # insertion order.
+        out_offsets = array("q", bytes(8 * (node_count + 1)))
+        for source in sources:
+            out_offsets[source + 1] += 1
+        for index in range(node_count):
+            out_offsets[index + 1] += out_offsets[index]
+        cursor = array("q", out_offsets[:-1]) if node_count else array("q")
+        positions = array("i", bytes(4 * edge_count))
+        for sequence, source in enumerate(sources):
+            positions[sequence] = cursor[source]
+            cursor[source] += 1
+
+        edge_sources = array("i", bytes(4 * edge_count))
+        edge_targets = array("i", bytes(4 * edge_count))
+        edge_types = array("B", bytes(edge_count))
+        edge_weights = array("d", bytes(8 * edge_count))
+        edge_dates = array("i", bytes(4 * edge_count))
+        records: List[bytes] = [b""] * edge_count
+        for sequence in range(edge_count):
+            position = positions[sequence]
+            edge_sources[position] = sources[sequence]
+            edge_targets[position] = targets[sequence]
+            edge_types[position] = self._edge_types[sequence]
+            edge_weights[position] = self._edge_weights[sequence]
+            edge_dates[position] = self._edge_dates[sequence]
+            records[position] = self._edge_records[sequence]
+        edge_record_offsets = array("q", [0])
+        edge_record_blob = bytearray()
+        for record in records:
+            edge_record_blob += record
+            edge_record_offsets.append(len(edge_record_blob))
+
+        # Reverse index: edge positions grouped by target, in insertion order.
+        in_offsets = array("q", bytes(8 * (node_count + 1)))
+        for target in targets:
+            in_offsets[target + 1] += 1
+        for index in range(node_count):
+            in_offsets[index + 1] += in_offsets[index]
+        cursor = array("q", in_offsets[:-1]) if node_count else array("q")
+        in_edges = array("i", bytes(4 * edge_count))
+        for sequence, target in enumerate(targets):
+            in_edges[cursor[target]] = positions[sequence]
+            cursor[target] += 1
+
+        columns.update(
+            out_offsets=out_offsets,
+            edge_sources=edge_sources,
+            edge_targets=edge_targets,
+            edge_types=edge_types,
+            edge_weights=edge_weights,
+            edge_dates=edge_dates,
+            edge_record_offsets=edge_record_offsets,
+            edge_record_blob=array("B", edge_record_blob),
+            edge_positions=positions,
+            in_offsets=in_offsets,
+            in_edges=in_edges,
+        )
+        return ColumnarLegalGraph(columns)
+
+
+class _NodeView(Mapping[str, GraphNode]):
+    def __init__(self, graph: "ColumnarLegalGraph") -> None:
+        self._graph = graph
+
+    def __getitem__(self, identifier: str) -> GraphNode:
+        node = self._graph.get_node(identifier)
+        if node is None:
+            raise KeyError(identifier)
+        return node
+
+    def __contains__(self, identifier: object) -> bool:
+        return isinstance(identifier, str) and self._graph.node_index(identifier) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph._node_ids)
+
+    def __len__(self) -> int:
+        return len(self._graph._node_ids)
+
+
+class _EdgeView(Sequence[GraphEdge]):
+    def __init__(self, graph: "ColumnarLegalGraph") -> None:
+        self._graph = graph
+
+    def __len__(self) -> int:
+        return len(self._graph._columns["edge_positions"])
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._graph._edge_at(self._graph._columns["edge_positions"][index])
+
+
+class ColumnarLegalGraph:
+    """Read-only ``LegalGraph`` equivalent backed by typed CSR columns."""
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        *,
+        _mappings: Optional[List[mmap.mmap]] = None,
+    ) -> None:
+        self._columns: Dict[str, Sequence[Any]] = dict(columns)
+        self._mappings = list(_mappings or [])
+        self._node_ids = _StringColumn(
+            self._columns["node_id_offsets"], self._columns["node_id_blob"]
+        )
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_legal_graph(cls, graph: LegalGraph) -> "ColumnarLegalGraph":
+        return cls.from_elements(graph.nodes.values(), graph.edges)
+
+    @classmethod
+    def from_elements(
+        cls, nodes: Iterable[GraphNode], edges: Iterable[GraphEdge]
+    ) -> "ColumnarLegalGraph":
+        builder = ColumnarGraphBuilder()
+        for node in nodes:
+            builder.add_node(node)
+        for edge in edges:
+            builder.add_edge(edge)
+        return builder.build()
+
+    def to_legal_graph(self) -> LegalGraph:
+        return LegalGraph(dict(self.nodes.items()), list(self.edges))
+
+    # ------------------------------------------------------------------
+    def save(self, directory: Path) -> Path:
+        """Write every column to ``directory`` and return the manifest path."""
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest: Dict[str, Any] = {
+            "format": COLUMNAR_GRAPH_FORMAT,
+            "byteorder": sys.byteorder,
+            "node_types": [member.value for member in _NODE_TYPES],
+            "edge_types": [member.value for member in _EDGE_TYPES],
+            "node_count": len(self._node_ids),
+            "edge_count": len(self.edges),
+            "columns": {},
+        }
+        for name, typecode in _COLUMNS.items():
+            column = self._columns[name]
+            data = column.tobytes() if isinstance(column, (array, memoryview)) else array(typecode, column).tobytes()
+            (directory / f"{name}.bin").write_bytes(data)
+            manifest["columns"][name] = {
+                "typecode": typecode,
+                "itemsize": array(typecode).itemsize,
+                "length": len(column),
+            }
+        manifest_path = directory / _MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        return manifest_path
+
+    @classmethod
+    def load(cls, directory: Path, *, use_mmap: bool = True) -> "ColumnarLegalGraph":
+        """Open a graph written by :meth:`save`.
+
+        With ``use_mmap`` (the default) columns are read-only memory maps, so
+        processes loading the same directory share the physical pages.
+        """
+
+        directory = Path(directory)
+        manifest = json.loads((directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("format") != COLUMNAR_GRAPH_FORMAT:
+            raise ValueError(f"Unsupported columnar graph format: {manifest.get('format')!r}")
+        if manifest.get("byteorder") != sys.byteorder:
+            raise ValueError("Columnar graph was written on a machine with a different byte order")
+        if manifest.get("node_types") != [m.value for m in _NODE_TYPES] or manifest.get(
+            "edge_types"
+        ) != [m.value for m in _EDGE_TYPES]:
+            raise ValueError("Columnar graph was written with a different NodeType/EdgeType set")
+
+        columns: Dict[str, Sequence[Any]] = {}
+        mappings: List[mmap.mmap] = []
+        for name, typecode in _COLUMNS.items():
+            spec = manifest["columns"][name]
+            if spec["typecode"] != typecode or spec["itemsize"] != array(typecode).itemsize:
+                raise ValueError(f"Column {name!r} has an incompatible layout")
+            path = directory / f"{name}.bin"
+            if not use_mmap or spec["length"] == 0:
+                column = array(typecode)
+                column.frombytes(path.read_bytes())
+                columns[name] = column
+                continue
+            with path.open("rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            mappings.append(mapping)
+            columns[name] = memoryview(mapping).cast(typecode)
+        return cls(columns, _mappings=mappings)
+
+    def close(self) -> None:
+        """Release memory maps opened by :meth:`load`."""
+
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        for mapping in self._mappings:
+            mapping.close()
+        self._mappings = []
+
+    def __enter__(self) -> "ColumnarLegalGraph":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    @property
+    def nodes(self) -> Mapping[str, GraphNode]:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> Sequence[GraphEdge]:
+        """Edges in their original insertion order."""
+        return _EdgeView(self)
+
+    def node_index(self, identifier: str) -> Optional[int]:
+        """Return the interned integer id of ``identifier``."""
+
+        index = bisect_left(self._node_ids, identifier)
+        if index < len(self._node_ids) and self._node_ids[index] == identifier:
+            return index
+        return None
+
+    def get_node(self, identifier: str) -> Optional[GraphNode]:
+        """Materialise the node ``identifier`` or return ``None``."""
+
+        index = self.node_index(identifier)
+        if index is None:
+            return None
+        record = self._record("node", index)
+        cls = _NODE_CLASSES.get(record.get("class", "GraphNode"), GraphNode)
+        kwargs: Dict[str, Any] = {
+            "identifier": identifier,
+            "metadata": record.get("metadata", {}),
+            "date": _ordinal_to_date(self._columns["node_dates"][index]),
+            "cultural_flags": record.get("cultural_flags"),
+            "consent_required": record.get("consent_required", False),
+            **record.get("fields", {}),
+        }
+        if any(f.name == "type" and f.init for f in fields(cls)):
+            kwargs["type"] = _NODE_TYPES[self._columns["node_types"][index]]
+        return cls(**kwargs)
+
+    def _record(self, kind: str, index: int) -> Dict[str, Any]:
+        offsets = self._columns[f"{kind}_record_offsets"]
+        start, end = offsets[index], offsets[index + 1]
+        if start == end:
+            return {}
+        return json.loads(bytes(self._columns[f"{kind}_record_blob"][start:end]))
+
+    def _edge_at(self, position: int) -> GraphEdge:
+        columns = self._columns
+        record = self._record("edge", position)
+        return GraphEdge(
+            type=_EDGE_TYPES[columns["edge_types"][position]],
+            source=self._node_ids[columns["edge_sources"][position]],
+            target=self._node_ids[columns["edge_targets"][position]],
+            identifier=record.get("identifier"),
+            metadata=record.get("metadata", {}),
+            date=_ordinal_to_date(columns["edge_dates"][position]),
+            weight=columns["edge_weights"][position],
+        )
+
+    def _out_positions(self, index: int) -> range:
+        offsets = self._columns["out_offsets"]
+        return range(offsets[index], offsets[index + 1])
+
+    def _in_positions(self, index: int) -> Sequence[int]:
+        offsets = self._columns["in_offsets"]
+        return self._columns["in_edges"][offsets[index] : offsets[index + 1]]
+
+    # ------------------------------------------------------------------
+    def out_edges(self, identifier: str) -> List[GraphEdge]:
+        """Return edges whose source is ``identifier``, in insertion order."""
+
+        index = self.node_index(identifier)
+        if index is None:
+            return []
+        return [self._edge_at(position) for position in self._out_positions(index)]
+
+    def in_edges(self, identifier: str) -> List[GraphEdge]:
+        """Return edges whose target is ``identifier``, in insertion order."""
+
+        index = self.node_index(identifier)
+        if index is None:
+            return []
+        return [self._edge_at(position) for position in self._in_positions(index)]
+
+    def degree(self, identifier: str) -> int:
+        """Return the number of edges incident to ``identifier``."""
+
+        index = self.node_index(identifier)
+        if index is None:
+            return 0
+        out_offsets = self._columns["out_offsets"]
+        in_offsets = self._columns["in_offsets"]
+        return (out_offsets[index + 1] - out_offsets[index]) + (
+            in_offsets[index + 1] - in_offsets[index]
+        )
+
+    def find_edges(
+        self,
+        *,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        type: Optional[EdgeType] = None,
+        min_weight: Optional[float] = None,
+    ) -> List[GraphEdge]:
+        """Find edges matching the provided criteria, in insertion order.
+
+        Source and target filters read one CSR slice; type and weight filters
+        are checked against the typed columns before any edge is
+        materialised.
+        """
+
+        columns = self._columns
+        candidates: List[Sequence[int]] = []
+        if source is not None:
+            source_index = self.node_index(source)
+            if source_index is None:
+                return []
+            candidates.append(self._out_positions(source_index))
+        if target is not None:
+            target_index = self.node_index(target)
+            if target_index is None:
+                return []
+            candidates.append(self._in_positions(target_index))
+        positions: Iterable[int] = (
+            min(candidates, key=len) if candidates else columns["edge_positions"]
+        )
+
+        type_code = _EDGE_TYPE_CODES[type] if type is not None else None
+        edge_sources = columns["edge_sources"]
+        edge_targets = columns["edge_targets"]
+        edge_types = columns["edge_types"]
+        edge_weights = columns["edge_weights"]
+        matched = [
+            position
+            for position in positions
+            if (source is None or edge_sources[position] == source_index)
+            and (target is None or edge_targets[position] == target_index)
+            and (type_code is None or edge_types[position] == type_code)
+            and (min_weight is None or edge_weights[position] >= min_weight)
+        ]
+        return [self._edge_at(position) for position in matched]
+
+
+__all__ = [
+    "COLUMNAR_GRAPH_FORMAT",
+    "ColumnarGraphBuilder",
+    "ColumnarLegalGraph",
+]
@@ -0,0 +1,414 @@
+"""Persisted node embeddings with exact and approximate nearest-neighbour search.
+
+Embeddings produced by :func:`src.graph.rgcn.export_embeddings` or the PyKEEN
+trainers are JSON mappings of identifier to vector, which have to be parsed and
+scanned in full for every similarity lookup.  :class:`EmbeddingStore` keeps them
+as files that are memory-mapped on :meth:`EmbeddingStore.load`:
+
+* ``vectors.npy`` - the ``(count, dim)`` float32 matrix, one row per node;
+* ``identifiers.npy``/``sorted_identifiers.npy``/``sorted_rows.npy`` - UTF-8
+  identifiers in row order and in sorted order, so identifier lookups are a
+  binary search rather than a list scan or a per-process dict;
+* optionally ``ivf_centroids.npy``/``ivf_offsets.npy``/``ivf_rows.npy`` - an
+  inverted-file (IVF) index: k-means centroids and the rows assigned to each.
+
+:meth:`EmbeddingStore.nearest` scans the matrix in blocks keeping a running
+top-k (exact), or, when an IVF index is present, only the rows of the
+``nprobe`` lists whose centroids are closest to the query (approximate).  In
+both cases the final candidates are re-ranked by their exact Euclidean
+distance, ties broken by row order.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+EMBEDDING_STORE_FORMAT = "sensiblaw.embedding-store.v1"
+_MANIFEST_NAME = "manifest.json"
+_ARRAYS = ("vectors", "identifiers", "sorted_identifiers", "sorted_rows")
+_IVF_ARRAYS = ("ivf_centroids", "ivf_offsets", "ivf_rows")
+
+#: Rows scored per block by exact search and by IVF assignment.
+DEFAULT_BLOCK_ROWS = 65536
+#: Rows differenced at a time within a block; keeps the temporary in cache.
+_DIFFERENCE_ROWS = 4096
+#: Inverted lists probed per approximate query.
+DEFAULT_NPROBE = 8
+
+
+def _require_numpy() -> Any:
+    if np is None:
+        raise RuntimeError("NumPy is required for embedding stores")
+    return np
+
+
+def _top_k(distances: Any, rows: Any, k: int) -> Tuple[Any, Any]:
+    """Return the ``k`` smallest ``distances`` (and their rows), ordered by distance then row."""
+
+    if len(distances) > k:
+        keep = np.argpartition(distances, k - 1)[:k]
+        # Widen to every tie of the cut-off so row order decides between them.
+        keep = np.flatnonzero(distances <= distances[keep].max())
+        distances, rows = distances[keep], rows[keep]
+    order = np.lexsort((rows, distances))[:k]
+    return distances[order], rows[order]
+
+
+def _block_sq_distances(block: Any, query: Any) -> Any:
+    # Direct differences: expanding ||x||^2 - 2 x.q + ||q||^2 cancels
+    # catastrophically in float32 when embeddings sit far from the origin.
+    distances = np.empty(len(block), dtype=np.float32)
+    for start in range(0, len(block), _DIFFERENCE_ROWS):
+        difference = block[start : start + _DIFFERENCE_ROWS] - query
+        distances[start : start + len(difference)] = np.einsum("ij,ij->i", difference, difference)
+    return distances
+
+
+class EmbeddingStore:
+    """Float32 embedding matrix with an identifier map and optional IVF index."""
+
+    def __init__(self, arrays: Mapping[str, Any], *, ivf_nprobe: int = DEFAULT_NPROBE) -> None:
+        _require_numpy()
+        self._arrays: Dict[str, Any] = dict(arrays)
+        self.ivf_nprobe = int(ivf_nprobe)
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_vectors(cls, identifiers: Sequence[str], vectors: Any) -> "EmbeddingStore":
+        """Build an in-memory store; ``identifiers[i]`` names ``vectors[i]``."""
+
+        numpy = _require_numpy()
+        matrix = numpy.ascontiguousarray(numpy.asarray(vectors, dtype=numpy.float32))
+        if matrix.ndim != 2:
+            raise ValueError("Embedding vectors must form a two-dimensional matrix")
+        identifiers = [str(identifier) for identifier in identifiers]
+        if len(identifiers) != matrix.shape[0]:
+            raise ValueError("Every embedding row needs exactly one identifier")
+        if len(set(identifiers)) != len(identifiers):
+            raise ValueError("Embedding identifiers must be unique")
+        encoded = numpy.array([identifier.encode("utf-8") for identifier in identifiers], dtype=bytes)
+        if encoded.dtype.itemsize == 0:
+            encoded = encoded.astype("S1")
+        sorted_rows = numpy.argsort(encoded, kind="stable").astype(numpy.int64)
+        return cls(
+            {
+                "vectors": matrix,
+                "identifiers": encoded,
+                "sorted_identifiers": encoded[sorted_rows],
+                "sorted_rows": sorted_rows,
+            }
+        )
+
+    @classmethod
+    def from_mapping(cls, embeddings: Mapping[str, Sequence[float]]) -> "EmbeddingStore":
+        """Build from ``{identifier: vector}`` as written by ``export_embeddings``."""
+
+        identifiers = list(embeddings)
+        lengths = {len(embeddings[identifier]) for identifier in identifiers}
+        if len(lengths) > 1:
+            raise ValueError("Embedding vectors must share one dimension")
+        vectors = [embeddings[identifier] for identifier in identifiers]
+        if not vectors:
+            return cls.from_vectors([], np.zeros((0, 0), dtype=np.float32))
+        return cls.from_vectors(identifiers, vectors)
+
+    # ------------------------------------------------------------------
+    def save(self, directory: Path) -> Path:
+        """Write the store to ``directory`` and return the manifest path."""
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        names = _ARRAYS + (_IVF_ARRAYS if self.has_ivf else ())
+        for name in names:
+            np.save(directory / f"{name}.npy", self._arrays[name], allow_pickle=False)
+        for name in _IVF_ARRAYS:
+            if not self.has_ivf and (directory / f"{name}.npy").exists():
+                (directory / f"{name}.npy").unlink()
+        manifest = {
+            "format": EMBEDDING_STORE_FORMAT,
+            "byteorder": sys.byteorder,
+            "count": len(self),
+            "dim": self.dim,
+            "ivf_lists": self.ivf_lists,
+            "ivf_nprobe": self.ivf_nprobe,
+        }
+        manifest_path = directory / _MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        return manifest_path
+
+    @classmethod
+    def load(cls, directory: Path, *, use_mmap: bool = True) -> "EmbeddingStore":
+        """Open a store written by :meth:`save`, memory-mapping its arrays by default."""
+
+        numpy = _require_numpy()
+        directory = Path(directory)
+        manifest = json.loads((directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("format") != EMBEDDING_STORE_FORMAT:
+            raise ValueError(f"Unsupported embedding store format: {manifest.get('format')!r}")
+        if manifest.get("byteorder") != sys.byteorder:
+            raise ValueError("Embedding store was written on a machine with a different byte order")
+        names = _ARRAYS + (_IVF_ARRAYS if manifest.get("ivf_lists") else ())
+        mode = "r" if use_mmap else None
+        arrays = {
+            name: numpy.load(directory / f"{name}.npy", mmap_mode=mode, allow_pickle=False)
+            for name in names
+        }
+        if arrays["vectors"].shape != (manifest["count"], manifest["dim"]):
+            raise ValueError("Embedding store vectors do not match the manifest")
+        return cls(arrays, ivf_nprobe=manifest.get("ivf_nprobe", DEFAULT_NPROBE))
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return int(self._arrays["vectors"].shape[0])
+
+    def __contains__(self, identifier: object) -> bool:
+        return isinstance(identifier, str) and self.index_of(identifier) is not None
+
+    @property
+    def dim(self) -> int:
+        return int(self._arrays["vectors"].shape[1])
+
+    @property
+    def vectors(self) -> Any:
+        return self._arrays["vectors"]
+
+    @property
+    def has_ivf(self) -> bool:
+        return "ivf_centroids" in self._arrays
+
+    @property
+    def ivf_lists(self) -> int:
+        return int(self._arrays["ivf_centroids"].shape[0]) if self.has_ivf else 0
+
+    def identifier(self, row: int) -> str:
+        return bytes(self._arrays["identifiers"][row]).decode("utf-8")
+
+    def identifiers(self) -> List[str]:
+        return [bytes(value).decode("utf-8") for value in self._arrays["identifiers"]]
+
+    def index_of(self, identifier: str) -> Optional[int]:
+        """Return the row of ``identifier``, or ``None`` when it is not stored."""
+
+        key = identifier.encode("utf-8")
+        sorted_ids = self._arrays["sorted_identifiers"]
+        if not len(sorted_ids) or len(key) > sorted_ids.dtype.itemsize or not key:
+            return None
+        position = int(np.searchsorted(sorted_ids, key))
+        if position < len(sorted_ids) and bytes(sorted_ids[position]) == key:
+            return int(self._arrays["sorted_rows"][position])
+        return None
+
+    def vector(self, identifier: str) -> Optional[Any]:
+        row = self.index_of(identifier)
+        return None if row is None else np.array(self.vectors[row])
+
+    # ------------------------------------------------------------------
+    def build_ivf(
+        self,
+        n_lists: Optional[int] = None,
+        *,
+        iterations: int = 10,
+        sample_size: int = 65536,
+        seed: int = 0,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> None:
+        """Cluster rows into ``n_lists`` inverted lists (default ``sqrt(count)``).
+
+        Centroids come from Lloyd's k-means on a seeded sample of at most
+        ``sample_size`` rows; every row is then assigned to its closest
+        centroid.  The index is kept in memory until :meth:`save`.
+        """
+
+        count = len(self)
+        if count == 0:
+            raise ValueError("Cannot index an empty embedding store")
+        if n_lists is None:
+            n_lists = int(round(count ** 0.5))
+        n_lists = max(1, min(int(n_lists), count))
+        rng = np.random.default_rng(seed)
+        sample_rows = np.sort(rng.choice(count, size=min(count, max(sample_size, n_lists)), replace=False))
+        sample = np.asarray(self.vectors[sample_rows], dtype=np.float32)
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(max(0, iterations)):
+            labels = self._assign(sample, centroids, block_rows)
+            sums = np.zeros_like(centroids, dtype=np.float64)
+            np.add.at(sums, labels, sample)
+            sizes = np.bincount(labels, minlength=n_lists)
+            filled = sizes > 0
+            # Empty lists keep their previous centroid.
+            centroids[filled] = (sums[filled] / sizes[filled, None]).astype(np.float32)
+
+        labels = np.concatenate(
+            [
+                self._assign(np.asarray(self.vectors[start : start + block_rows]), centroids, block_rows)
+                for start in range(0, count, block_rows)
+            ]
+        )
+        rows = np.argsort(labels, kind="stable").astype(np.int64)
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_lists), out=offsets[1:])
+        self._arrays.update({"ivf_centroids": centroids, "ivf_offsets": offsets, "ivf_rows": rows})
+        self.ivf_nprobe = min(self.ivf_nprobe, n_lists) or 1
+
+    @staticmethod
+    def _assign(block: Any, centroids: Any, block_rows: int) -> Any:
+        # Distances are translation invariant; centring on the centroids keeps
+        # the expansion below from cancelling for embeddings far from the origin.
+        origin = centroids.mean(axis=0, dtype=np.float64).astype(np.float32)
+        centroids = centroids - origin
+        centroid_sq = np.einsum("ij,ij->i", centroids, centroids)
+        labels = np.empty(len(block), dtype=np.int64)
+        for start in range(0, len(block), block_rows):
+            part = block[start : start + block_rows] - origin
+            # argmin ||x - c||^2 == argmin ||c||^2 - 2 x.c
+            labels[start : start + len(part)] = np.argmin(centroid_sq[None, :] - 2.0 * (part @ centroids.T), axis=1)
+        return labels
+
+    # ------------------------------------------------------------------
+    def nearest(
+        self,
+        query: Union[str, Sequence[float], Any],
+        k: int = 10,
+        *,
+        exact: Optional[bool] = None,
+        nprobe: Optional[int] = None,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(identifier, euclidean_distance)`` pairs closest to ``query``.
+
+        ``query`` is a stored identifier (which is excluded from its own
+        results) or a vector.  The IVF index is used when present unless
+        ``exact`` is true; ``nprobe`` overrides the number of lists probed.
+        Unknown identifiers return an empty list.
+        """
+
+        if k <= 0 or len(self) == 0:
+            return []
+        exclude: Optional[int] = None
+        if isinstance(query, str):
+            exclude = self.index_of(query)
+            if exclude is None:
+                return []
+            query_vector = np.asarray(self.vectors[exclude], dtype=np.float32)
+        else:
+            query_vector = np.asarray(query, dtype=np.float32).reshape(-1)
+            if query_vector.shape[0] != self.dim:
+                raise ValueError(f"Query vector has dimension {query_vector.shape[0]}, expected {self.dim}")
+        wanted = k + (exclude is not None)
+
+        if self.has_ivf and not exact:
+            candidates = self._ivf_candidates(query_vector, nprobe or self.ivf_nprobe)
+        else:
+            candidates = self._exact_candidates(query_vector, wanted, block_rows)
+        if exclude is not None:
+            candidates = candidates[candidates != exclude]
+        if not len(candidates):
+            return []
+
+        # Exact re-rank of the candidates in float64.
+        difference = np.asarray(self.vectors[candidates], dtype=np.float64) - query_vector.astype(np.float64)
+        distances = np.sqrt(np.einsum("ij,ij->i", difference, difference))
+        distances, rows = _top_k(distances, candidates, k)
+        return [(self.identifier(int(row)), float(distance)) for distance, row in zip(distances, rows)]
+
+    def _exact_candidates(self, query: Any, k: int, block_rows: int) -> Any:
+        best_distances = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        vectors = self.vectors
+        for start in range(0, len(self), block_rows):
+            stop = min(start + block_rows, len(self))
+            distances = _block_sq_distances(vectors[start:stop], query)
+            block_distances, block_rows_top = _top_k(distances, np.arange(start, stop, dtype=np.int64), k)
+            best_distances, best_rows = _top_k(
+                np.concatenate([best_distances, block_distances]),
+                np.concatenate([best_rows, block_rows_top]),
+                k,
+            )
+        return best_rows
+
+    def _ivf_candidates(self, query: Any, nprobe: int) -> Any:
+        centroids = self._arrays["ivf_centroids"]
+        offsets = self._arrays["ivf_offsets"]
+        difference = centroids - query
+        centroid_distances = np.einsum("ij,ij->i", difference, difference)
+        _, lists = _top_k(centroid_distances, np.arange(len(centroids), dtype=np.int64), max(1, nprobe))
+        rows = self._arrays["ivf_rows"]
+        return np.concatenate([np.asarray(rows[offsets[i] : offsets[i + 1]]) for i in lists.tolist()])
+
+
+def pykeen_entity_vectors(pipeline_result: Any, triples_factory: Any) -> Tuple[List[str], Any]:
+    """Return ``(identifiers, vectors)`` for the entity embeddings of a PyKEEN model.
+
+    Complex-valued representations (ComplEx, RotatE) are flattened to their
+    real and imaginary parts.
+    """
+
+    numpy = _require_numpy()
+    model = pipeline_result.model
+    representation = model.entity_representations[0]
+    values = representation(indices=None)
+    if hasattr(values, "detach"):
+        values = values.detach().cpu().numpy()
+    values = numpy.asarray(values)
+    if numpy.iscomplexobj(values):
+        values = numpy.concatenate([values.real, values.imag], axis=-1)
+    values = values.reshape(values.shape[0], -1)
+    entity_to_id: Mapping[str, int] = triples_factory.entity_to_id
+    identifiers = sorted(entity_to_id, key=entity_to_id.__getitem__)
+    return identifiers, values[[entity_to_id[identifier] for identifier in identifiers]]
+
+
+def build_embedding_store(
+    embeddings: Union[Mapping[str, Sequence[float]], Tuple[Sequence[str], Any]],
+    directory: Path,
+    *,
+    ivf_lists: Optional[int] = None,
+    ivf_nprobe: int = DEFAULT_NPROBE,
+    seed: int = 0,
+) -> EmbeddingStore:
+    """Persist ``embeddings`` to ``directory`` and return the memory-mapped store.
+
+    ``embeddings`` is a ``{identifier: vector}`` mapping or an
+    ``(identifiers, vectors)`` pair.  ``ivf_lists`` > 0 also builds an IVF
+    index with that many lists.
+    """
+
+    if isinstance(embeddings, Mapping):
+        store = EmbeddingStore.from_mapping(embeddings)
+    else:
+        identifiers, vectors = embeddings
+        store = EmbeddingStore.from_vectors(identifiers, vectors)
+    store.ivf_nprobe = ivf_nprobe
+    if ivf_lists and len(store):
+        store.build_ivf(ivf_lists, seed=seed)
+    store.save(directory)
+    return EmbeddingStore.load(directory)
+
+
+def iter_neighbour_rows(
+    store: EmbeddingStore, queries: Iterable[str], k: int, **options: Any
+) -> Iterable[Dict[str, Any]]:
+    """Yield JSON-ready neighbour rows for each query identifier."""
+
+    for query in queries:
+        for rank, (identifier, distance) in enumerate(store.nearest(query, k, **options), start=1):
+            yield {"query": query, "rank": rank, "identifier": identifier, "distance": distance}
+
+
+__all__ = [
+    "DEFAULT_BLOCK_ROWS",
+    "DEFAULT_NPROBE",
+    "EMBEDDING_STORE_FORMAT",
+    "EmbeddingStore",
+    "build_embedding_store",
+    "iter_neighbour_rows",
+    "pykeen_entity_vectors",
+]
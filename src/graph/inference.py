@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import re
 import sqlite3
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .models import EdgeType, LegalGraph, NodeType
 
+try:  # pragma: no cover - numpy ships with PyKEEN's torch stack
+    import numpy as np
+except ImportError:  # pragma: no cover - block scoring falls back to per-pair calls
+    np = None  # type: ignore[assignment]
+
+#: Upper bound on scores held per block in batched link-prediction scoring
+#: (about 32 MB of float64 scores plus indices for ``score_hrt`` blocks).
+DEFAULT_MAX_BLOCK_SCORES = 1 << 22
+
 
 @dataclass(frozen=True)
 class TriplePack:
@@ -434,8 +445,21 @@ def score_applies_predictions(
     cases: Sequence[str],
     provisions: Sequence[str],
     relation: str = EdgeType.APPLIES.value,
+    top_k: Optional[int] = None,
+    head_batch_size: Optional[int] = None,
+    max_block_scores: int = DEFAULT_MAX_BLOCK_SCORES,
 ) -> List[RawPrediction]:
-    """Score all ``(case, relation, provision)`` triples using the trained model."""
+    """Score all ``(case, relation, provision)`` triples using the trained model.
+
+    Without ``top_k`` or ``head_batch_size`` every pair is scored with its own
+    ``score_hrt`` call.  Either option switches to block scoring: blocks of
+    cases are scored against the provisions in one model call per block
+    (``score_t`` over all tails when the model has it, otherwise one batched
+    ``score_hrt``), holding at most ``max_block_scores`` scores at a time, and
+    only the ``top_k`` best provisions per case are kept as the blocks stream
+    past.  Block results are returned case by case in rank order, with ties in
+    ``provisions`` order as :func:`rank_predictions` would leave them.
+    """
 
     if not hasattr(pipeline_result, "model"):
         raise ValueError("The pipeline result does not expose a model for scoring")
@@ -448,15 +472,27 @@ def score_applies_predictions(
         return []
 
     relation_id = relation_to_id[relation]
+    known_cases = [case_id for case_id in cases if case_id in entity_to_id]
+    known_provisions = [provision_id for provision_id in provisions if provision_id in entity_to_id]
+
+    if (top_k is not None or head_batch_size is not None) and np is not None and (
+        hasattr(model, "score_t") or hasattr(model, "score_hrt")
+    ):
+        return _score_blocks(
+            model,
+            entity_to_id,
+            relation_id,
+            cases=known_cases,
+            provisions=known_provisions,
+            top_k=top_k,
+            head_batch_size=head_batch_size,
+            max_block_scores=max_block_scores,
+        )
 
     predictions: List[RawPrediction] = []
-    for case_id in cases:
-        if case_id not in entity_to_id:
-            continue
+    for case_id in known_cases:
         head_id = entity_to_id[case_id]
-        for provision_id in provisions:
-            if provision_id not in entity_to_id:
-                continue
+        for provision_id in known_provisions:
             tail_id = entity_to_id[provision_id]
             if hasattr(model, "score_hrt"):
                 try:
@@ -480,6 +516,126 @@ def score_applies_predictions(
     return predictions
 
 
+def _index_batch(rows: Any, model: Any) -> Any:
+    """Return ``rows`` (an int64 array) as the model's index tensor."""
+
+    try:
+        import torch
+    except ImportError:  # pragma: no cover - torch is a PyKEEN dependency
+        return rows
+    device = getattr(model, "device", None)  # pragma: no cover - executed when torch present
+    return torch.as_tensor(rows, dtype=torch.long, device=device)  # pragma: no cover
+
+
+def _no_grad() -> ContextManager[Any]:
+    """Return ``torch.no_grad()`` so scoring does not record autograd graphs."""
+
+    try:
+        import torch
+    except ImportError:  # pragma: no cover - torch is a PyKEEN dependency
+        return nullcontext()
+    return torch.no_grad()  # pragma: no cover - executed when torch present
+
+
+def _to_numpy(value: Any) -> Any:
+    if hasattr(value, "detach"):
+        value = value.detach()
+        if hasattr(value, "cpu"):
+            value = value.cpu()
+        value = value.numpy()
+    return np.asarray(value, dtype=np.float64)
+
+
+def _merge_top_k(
+    best_scores: Any,
+    best_columns: Any,
+    scores: Any,
+    columns: Any,
+    top_k: Optional[int],
+) -> Tuple[Any, Any]:
+    """Merge a ``(heads, tails)`` score block into the running per-head top-k.
+
+    Rows stay sorted by score descending, ties by provision position.
+    """
+
+    merged_scores = np.concatenate([best_scores, scores], axis=1)
+    merged_columns = np.concatenate([best_columns, np.broadcast_to(columns, scores.shape)], axis=1)
+    keep = merged_scores.shape[1] if top_k is None else min(top_k, merged_scores.shape[1])
+    if keep < merged_scores.shape[1]:
+        # Partition on score alone, then widen to every tie of the cut-off
+        # score so the stable ordering below sees all of them.
+        cutoff = -np.partition(-merged_scores, keep - 1, axis=1)[:, keep - 1 : keep]
+        merged_scores = np.where(merged_scores >= cutoff, merged_scores, -np.inf)
+    order = np.lexsort((merged_columns, -merged_scores), axis=1)[:, :keep]
+    return (
+        np.take_along_axis(merged_scores, order, axis=1),
+        np.take_along_axis(merged_columns, order, axis=1),
+    )
+
+
+def _score_blocks(
+    model: Any,
+    entity_to_id: Mapping[str, int],
+    relation_id: int,
+    *,
+    cases: Sequence[str],
+    provisions: Sequence[str],
+    top_k: Optional[int],
+    head_batch_size: Optional[int],
+    max_block_scores: int,
+) -> List[RawPrediction]:
+    if not cases or not provisions or (top_k is not None and top_k <= 0):
+        return []
+    head_ids = np.fromiter((entity_to_id[case_id] for case_id in cases), dtype=np.int64, count=len(cases))
+    tail_ids = np.fromiter(
+        (entity_to_id[provision_id] for provision_id in provisions), dtype=np.int64, count=len(provisions)
+    )
+    max_block_scores = max(1, int(max_block_scores))
+    use_score_t = hasattr(model, "score_t")
+    if use_score_t:
+        # score_t scores every entity, so a row costs num_entities scores.
+        row_width = max(len(entity_to_id), int(tail_ids.max()) + 1)
+        tail_chunk = len(tail_ids)
+    else:
+        row_width = tail_chunk = min(len(tail_ids), max_block_scores)
+    heads_per_block = max(1, max_block_scores // row_width)
+    if head_batch_size is not None:
+        heads_per_block = min(heads_per_block, max(1, int(head_batch_size)))
+
+    predictions: List[RawPrediction] = []
+    with _no_grad():
+        for head_start in range(0, len(head_ids), heads_per_block):
+            heads = head_ids[head_start : head_start + heads_per_block]
+            best_scores = np.empty((len(heads), 0), dtype=np.float64)
+            best_columns = np.empty((len(heads), 0), dtype=np.int64)
+            if use_score_t:
+                hr_batch = np.stack([heads, np.full_like(heads, relation_id)], axis=1)
+                all_scores = _to_numpy(model.score_t(_index_batch(hr_batch, model)))
+                best_scores, best_columns = _merge_top_k(
+                    best_scores, best_columns, all_scores[:, tail_ids], np.arange(len(tail_ids)), top_k
+                )
+            else:
+                for tail_start in range(0, len(tail_ids), tail_chunk):
+                    tails = tail_ids[tail_start : tail_start + tail_chunk]
+                    hrt_batch = np.empty((len(heads), len(tails), 3), dtype=np.int64)
+                    hrt_batch[:, :, 0] = heads[:, None]
+                    hrt_batch[:, :, 1] = relation_id
+                    hrt_batch[:, :, 2] = tails[None, :]
+                    block = _to_numpy(model.score_hrt(_index_batch(hrt_batch.reshape(-1, 3), model)))
+                    best_scores, best_columns = _merge_top_k(
+                        best_scores,
+                        best_columns,
+                        block.reshape(len(heads), len(tails)),
+                        np.arange(tail_start, tail_start + len(tails)),
+                        top_k,
+                    )
+            for row, head_index in enumerate(range(head_start, head_start + len(heads))):
+                case_id = cases[head_index]
+                for score, column in zip(best_scores[row].tolist(), best_columns[row].tolist()):
+                    predictions.append(RawPrediction(case_id=case_id, provision_id=provisions[column], score=score))
+    return predictions
+
+
 def rank_predictions(
     predictions: Iterable[RawPrediction],
     *,
@@ -495,10 +651,12 @@ def rank_predictions(
     ranked: List[PredictionRecord] = []
     for case_id in sorted(per_case.keys()):
         items = per_case[case_id]
-        items.sort(key=lambda pred: pred.score, reverse=True)
+        if top_k is None:
+            items.sort(key=lambda pred: pred.score, reverse=True)
+        else:
+            # Same order as the full sort, without sorting every candidate.
+            items = heapq.nlargest(max(top_k, 0), items, key=lambda pred: pred.score)
         for index, prediction in enumerate(items, start=1):
-            if top_k is not None and index > top_k:
-                break
             ranked.append(
                 PredictionRecord(
                     case_id=prediction.case_id,
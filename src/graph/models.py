@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 
 class NodeType(Enum):
@@ -157,8 +157,64 @@ class GraphEdge:
     weight: float = 1.0
 
 
+class _IndexedEdgeList(list):
+    """Edge list that keeps its owning graph's adjacency indexes in sync.
+
+    Appends update the indexes incrementally; any other in-place mutation
+    (``clear``, ``remove``, slice assignment, ``sort``...) rebuilds them, so
+    callers that manipulate ``graph.edges`` directly keep working.
+    """
+
+    def __init__(self, graph: "LegalGraph") -> None:
+        super().__init__()
+        self._graph = graph
+
+    def append(self, edge: GraphEdge) -> None:
+        super().append(edge)
+        self._graph._index_edge(edge)
+        self._graph._notify_changed((edge.source, edge.target))
+
+    def extend(self, edges) -> None:
+        for edge in edges:
+            self.append(edge)
+
+    def __iadd__(self, edges):
+        self.extend(edges)
+        return self
+
+    def _mutated(name: str):
+        def method(self, *args, **kwargs):
+            result = getattr(super(_IndexedEdgeList, self), name)(*args, **kwargs)
+            self._graph._rebuild_indexes()
+            self._graph._notify_changed(None)
+            return result
+
+        method.__name__ = name
+        return method
+
+    insert = _mutated("insert")
+    remove = _mutated("remove")
+    pop = _mutated("pop")
+    clear = _mutated("clear")
+    sort = _mutated("sort")
+    reverse = _mutated("reverse")
+    __setitem__ = _mutated("__setitem__")
+    __delitem__ = _mutated("__delitem__")
+    __imul__ = _mutated("__imul__")
+    del _mutated
+
+
 class LegalGraph:
-    """In-memory manager for a simple legal graph."""
+    """In-memory manager for a simple legal graph.
+
+    Edges are kept in insertion order in :attr:`edges` and additionally
+    indexed by source, target and type so :meth:`find_edges` and traversals
+    touch only the adjacent edges instead of scanning the whole list.
+
+    Listeners registered with :meth:`add_listener` are told which node
+    identifiers a mutation touched, or ``None`` when the edge list was
+    rewritten wholesale; the latter also bumps :attr:`generation`.
+    """
 
     def __init__(
         self,
@@ -166,15 +222,67 @@ class LegalGraph:
         edges: Optional[List[GraphEdge]] = None,
     ) -> None:
         self.nodes: Dict[str, GraphNode] = dict(nodes or {})
-        self.edges: List[GraphEdge] = []
+        self.generation = 0
+        self._listeners: List[Callable[[Optional[Iterable[str]]], None]] = []
+        self._by_source: Dict[str, List[GraphEdge]] = {}
+        self._by_target: Dict[str, List[GraphEdge]] = {}
+        self._by_type: Dict[EdgeType, List[GraphEdge]] = {}
+        self._edges = _IndexedEdgeList(self)
         for edge in edges or []:
             if edge.source not in self.nodes or edge.target not in self.nodes:
                 raise ValueError("Both source and target nodes must exist in the graph")
-            self.edges.append(edge)
+            self._edges.append(edge)
+
+    @property
+    def edges(self) -> List[GraphEdge]:
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: List[GraphEdge]) -> None:
+        self._edges = _IndexedEdgeList(self)
+        self._rebuild_indexes()
+        self._edges.extend(edges)
+        self._notify_changed(None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"nodes": self.nodes, "edges": list(self._edges)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.nodes = state["nodes"]
+        self.generation = 0
+        self._listeners = []
+        self.edges = state["edges"]
+
+    def add_listener(self, listener: Callable[[Optional[Iterable[str]]], None]) -> None:
+        """Call ``listener`` with the identifiers touched by each mutation."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Optional[Iterable[str]]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_changed(self, identifiers: Optional[Iterable[str]]) -> None:
+        if identifiers is None:
+            self.generation += 1
+        for listener in list(self._listeners):
+            listener(identifiers)
+
+    def _index_edge(self, edge: GraphEdge) -> None:
+        self._by_source.setdefault(edge.source, []).append(edge)
+        self._by_target.setdefault(edge.target, []).append(edge)
+        self._by_type.setdefault(edge.type, []).append(edge)
+
+    def _rebuild_indexes(self) -> None:
+        self._by_source = {}
+        self._by_target = {}
+        self._by_type = {}
+        for edge in self._edges:
+            self._index_edge(edge)
 
     def add_node(self, node: GraphNode) -> None:
         """Add or replace a node in the graph."""
         self.nodes[node.identifier] = node
+        self._notify_changed((node.identifier,))
 
     def add_edge(self, edge: GraphEdge) -> None:
         """Add an edge to the graph.
@@ -183,12 +291,26 @@ class LegalGraph:
         """
         if edge.source not in self.nodes or edge.target not in self.nodes:
             raise ValueError("Both source and target nodes must exist in the graph")
-        self.edges.append(edge)
+        self._edges.append(edge)
 
     def get_node(self, identifier: str) -> Optional[GraphNode]:
         """Retrieve a node by its identifier."""
         return self.nodes.get(identifier)
 
+    def out_edges(self, identifier: str) -> List[GraphEdge]:
+        """Return edges whose source is ``identifier``, in insertion order."""
+        return list(self._by_source.get(identifier, ()))
+
+    def in_edges(self, identifier: str) -> List[GraphEdge]:
+        """Return edges whose target is ``identifier``, in insertion order."""
+        return list(self._by_target.get(identifier, ()))
+
+    def degree(self, identifier: str) -> int:
+        """Return the number of edges incident to ``identifier``."""
+        return len(self._by_source.get(identifier, ())) + len(
+            self._by_target.get(identifier, ())
+        )
+
     def find_edges(
         self,
         *,
@@ -197,17 +319,33 @@ class LegalGraph:
         type: Optional[EdgeType] = None,
         min_weight: Optional[float] = None,
     ) -> List[GraphEdge]:
-        """Find edges matching the provided criteria."""
-        results = self.edges
+        """Find edges matching the provided criteria.
+
+        The most selective of the source/target/type indexes seeds the
+        candidate set; the remaining criteria are applied as filters.  Results
+        preserve insertion order.
+        """
+        candidates: List[List[GraphEdge]] = []
         if source is not None:
-            results = [e for e in results if e.source == source]
+            candidates.append(self._by_source.get(source, []))
         if target is not None:
-            results = [e for e in results if e.target == target]
+            candidates.append(self._by_target.get(target, []))
         if type is not None:
-            results = [e for e in results if e.type == type]
-        if min_weight is not None:
-            results = [e for e in results if e.weight >= min_weight]
-        return results
+            candidates.append(self._by_type.get(type, []))
+        if not candidates:
+            results = self._edges
+            if min_weight is not None:
+                results = [e for e in results if e.weight >= min_weight]
+            return results
+        results = min(candidates, key=len)
+        return [
+            e
+            for e in results
+            if (source is None or e.source == source)
+            and (target is None or e.target == target)
+            and (type is None or e.type == type)
+            and (min_weight is None or e.weight >= min_weight)
+        ]
 
 
 __all__ = [
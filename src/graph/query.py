@@ -1,4 +1,5 @@
 import json
+from collections import deque
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -100,21 +101,28 @@ def traverse_edges(
     since: Optional[date] = None,
     min_weight: Optional[float] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Breadth-first traversal from ``start`` with optional edge filters."""
+    """Breadth-first traversal from ``start`` with optional edge filters.
+
+    Incident edges are indexed once up front so each dequeued node only
+    visits its own edges rather than rescanning the whole edge list.
+    """
     graph = _normalise_graph(graph)
     nodes_index = {n["id"]: n for n in graph["nodes"]}
+    incident: Dict[str, List[Dict[str, Any]]] = {}
+    for edge in graph["edges"]:
+        incident.setdefault(edge["source"], []).append(edge)
+        if edge["target"] != edge["source"]:
+            incident.setdefault(edge["target"], []).append(edge)
     visited = {start}
     result_edges: List[Dict[str, Any]] = []
-    queue: List[tuple[str, int]] = [(start, 0)]
+    queue: deque[tuple[str, int]] = deque([(start, 0)])
     seen_edges: set[tuple[str, str]] = set()
 
     while queue:
-        current, d = queue.pop(0)
+        current, d = queue.popleft()
         if d >= depth:
             continue
-        for edge in graph["edges"]:
-            if edge["source"] != current and edge["target"] != current:
-                continue
+        for edge in incident.get(current, ()):
             edge_date = date.fromisoformat(edge["date"]) if edge.get("date") else None
             if since and edge_date and edge_date < since:
                 continue
@@ -0,0 +1,184 @@
+"""LRU + TTL cache for hop-limited subgraph payloads.
+
+Popular seeds are expanded again and again by the API and the search index.
+:class:`SubgraphCache` memoises the serialised payload per ``(seed, hops,
+consent, graph generation)`` and remembers which node identifiers each entry
+was built from.  The cache subscribes to its :class:`LegalGraph`, so adding a
+node or an edge evicts only the entries whose neighbourhood it touches, while a
+wholesale rewrite of the edge list (a new generation) drops everything.
+
+Cached payloads are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 300.0
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class SubgraphCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _Entry:
+    payload: Any
+    dependencies: FrozenSet[str]
+    expires_at: float
+
+
+class SubgraphCache:
+    """Memoise subgraph payloads around seeds of one graph."""
+
+    def __init__(
+        self,
+        graph: Any,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.graph = graph
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._dependents: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.RLock()
+        self._stats = SubgraphCacheStats()
+        # Read-only backends such as ColumnarLegalGraph have no listeners and
+        # rely on the TTL alone.
+        add_listener = getattr(graph, "add_listener", None)
+        if add_listener is not None:
+            add_listener(self._on_graph_changed)
+
+    # ------------------------------------------------------------------
+    def key(self, seed: str, hops: int, consent: bool = False) -> CacheKey:
+        return (seed, int(hops), bool(consent), getattr(self.graph, "generation", 0))
+
+    def get_or_build(
+        self,
+        seed: str,
+        hops: int,
+        consent: bool,
+        build: Callable[[], Tuple[Any, Iterable[str]]],
+    ) -> Any:
+        """Return the cached payload or call ``build`` and cache its result.
+
+        ``build`` returns ``(payload, dependencies)`` where ``dependencies``
+        are the node identifiers whose nodes or incident edges the payload was
+        derived from.
+        """
+
+        key = self.key(seed, hops, consent)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry.payload
+                self._discard(key)
+                self._stats.expirations += 1
+            self._stats.misses += 1
+
+        payload, dependencies = build()
+        with self._lock:
+            if key != self.key(seed, hops, consent):
+                # The graph was rewritten while building; do not cache.
+                return payload
+            self._discard(key)
+            deps = frozenset(dependencies) | {seed}
+            self._entries[key] = _Entry(payload, deps, self._clock() + self.ttl_seconds)
+            for identifier in deps:
+                self._dependents.setdefault(identifier, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._stats.evictions += 1
+        return payload
+
+    def invalidate(self, identifiers: Optional[Iterable[str]] = None) -> int:
+        """Drop entries depending on ``identifiers`` (or every entry)."""
+
+        with self._lock:
+            if identifiers is None:
+                keys: Set[CacheKey] = set(self._entries)
+            else:
+                keys = set()
+                for identifier in identifiers:
+                    keys.update(self._dependents.get(identifier, ()))
+            for key in keys:
+                self._discard(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dependents.clear()
+
+    def close(self) -> None:
+        """Detach from the graph's listeners and drop every entry."""
+
+        remove_listener = getattr(self.graph, "remove_listener", None)
+        if remove_listener is not None:
+            remove_listener(self._on_graph_changed)
+        self.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = self._stats.to_dict()
+            payload.update(
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+            )
+            lookups = self._stats.hits + self._stats.misses
+            payload["hit_rate"] = round(self._stats.hits / lookups, 4) if lookups else 0.0
+            return payload
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    def _on_graph_changed(self, identifiers: Optional[Iterable[str]]) -> None:
+        self.invalidate(identifiers)
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for identifier in entry.dependencies:
+            keys = self._dependents.get(identifier)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._dependents[identifier]
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_TTL_SECONDS",
+    "SubgraphCache",
+    "SubgraphCacheStats",
+]
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
-from typing import Callable, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
 from src.sources.austlii_sino import SinoQuery
 from src.sources.austlii_sino_parse import AustLiiSearchHit, parse_sino_search_html
 from src.sources.base import FetchResult
 from src.sources.search_selection import select_search_hit
 from src.pdf_ingest import process_pdf
+from src.ingestion.backfill import StreamingBackfillSummary, stream_backfill
+from src.runtime.progress import PhaseRecorder
 
 
 def _select_hit(
@@ -28,6 +30,12 @@ def _select_hit(
     )
 
 
+def _require_pdf(fetched: FetchResult) -> None:
+    content_type = (fetched.content_type or "").lower()
+    if "pdf" not in content_type and not fetched.url.lower().endswith(".pdf"):
+        raise ValueError("Fetched content is not a PDF")
+
+
 def search_and_fetch(
     *,
     query: str,
@@ -84,9 +92,7 @@ def ingest_pdf_from_search(
         index=index,
         path_contains=path_contains,
     )
-    content_type = (fetched.content_type or "").lower()
-    if "pdf" not in content_type and not fetched.url.lower().endswith(".pdf"):
-        raise ValueError("Fetched content is not a PDF")
+    _require_pdf(fetched)
 
     with tempfile.NamedTemporaryFile(
         suffix=".pdf", dir=temp_dir, delete=False
@@ -96,3 +102,47 @@ def ingest_pdf_from_search(
 
     doc, stored_id = process_pdf(pdf_path, db_path=db_path)
     return doc, stored_id
+
+
+def backfill_pdfs(
+    urls: Iterable[str],
+    *,
+    db_path: Path,
+    fetch_adapter,
+    temp_dir: Path | None = None,
+    default_category: Optional[str] = None,
+    fetch_workers: int = 4,
+    parse_workers: int = 2,
+    queue_size: int = 32,
+    resume: bool = False,
+    recorder: Optional[PhaseRecorder] = None,
+) -> StreamingBackfillSummary:
+    """Fetch → ingest a list of PDF URLs through the streaming backfill.
+
+    Fetching, PDF parsing and persistence overlap via :func:`stream_backfill`,
+    which also checkpoints each URL so ``resume=True`` skips settled ones.
+    Each PDF is parsed in its own temporary directory; nothing is written
+    under ``data/pdfs``.
+    """
+
+    def parse(url: str, fetched: FetchResult):
+        _require_pdf(fetched)
+        with tempfile.TemporaryDirectory(dir=temp_dir) as work:
+            pdf_path = Path(work) / "source.pdf"
+            pdf_path.write_bytes(fetched.content)
+            doc, _stored = process_pdf(pdf_path, output=Path(work) / "document.json")
+        return doc
+
+    return stream_backfill(
+        urls,
+        fetch=fetch_adapter.fetch,
+        parse=parse,
+        db_path=db_path,
+        source_kind="austlii.pdf",
+        default_category=default_category,
+        fetch_workers=fetch_workers,
+        parse_workers=parse_workers,
+        queue_size=queue_size,
+        resume=resume,
+        recorder=recorder,
+    )
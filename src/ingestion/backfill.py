@@ -1,12 +1,27 @@
+"""Backfill legacy documents into the normalized ontology tables.
+
+:func:`backfill_documents` migrates an in-memory batch.  :func:`stream_backfill`
+ingests large AustLII/JADE collections item by item: fetching, parsing and
+persisting run as bounded, overlapping stages, every item leaves a durable
+checkpoint row next to the ontology tables, and an item whose fetched content
+digest matches its last checkpoint is not parsed again.
+"""
+
 from __future__ import annotations
 
+import hashlib
+import queue
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Sized, Tuple
 
 from src.ingestion.anchors import AnchorResult, NormalizedOntologyStore
 from src.models.document import Document
 from src.models.provision import Provision, RuleAtom
+from src.runtime.progress import PhaseRecorder
 
 
 @dataclass(frozen=True)
@@ -29,6 +44,24 @@ def _extract_rule_atoms(document: Document) -> List[RuleAtom]:
     return atoms
 
 
+def _persist_document(
+    store: NormalizedOntologyStore,
+    document: Document,
+    *,
+    default_category: Optional[str],
+) -> Tuple[int, int]:
+    """Anchor ``document``'s rule atoms; return ``(legal_sources, rules)`` written."""
+
+    atoms = _extract_rule_atoms(document)
+    if not atoms:
+        return 0, 0
+    store.upsert_legal_source(document, category=default_category)
+    results: List[AnchorResult] = store.anchor_rule_atoms(
+        document, atoms, category=default_category
+    )
+    return 1, len(results)
+
+
 def backfill_documents(
     documents: Sequence[Document],
     *,
@@ -41,15 +74,11 @@ def backfill_documents(
     rule_count = 0
     with NormalizedOntologyStore(db_path) as store:
         for document in documents:
-            atoms = _extract_rule_atoms(document)
-            if not atoms:
-                continue
-            store.upsert_legal_source(document, category=default_category)
-            legal_source_count += 1
-            results: List[AnchorResult] = store.anchor_rule_atoms(
-                document, atoms, category=default_category
+            sources, rules = _persist_document(
+                store, document, default_category=default_category
             )
-            rule_count += len(results)
+            legal_source_count += sources
+            rule_count += rules
     return BackfillSummary(
         documents_processed=len(documents),
         rules_migrated=rule_count,
@@ -57,4 +86,376 @@ def backfill_documents(
     )
 
 
-__all__ = ["BackfillSummary", "backfill_documents"]
+# ---------------------------------------------------------------------------
+# Streaming, resumable backfill
+# ---------------------------------------------------------------------------
+
+#: Checkpoint states whose content digest lets an unchanged item be skipped.
+_SETTLED_STATES = frozenset({"persisted", "no_rules"})
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class StreamingBackfillSummary:
+    """Counters for one :func:`stream_backfill` run."""
+
+    items_seen: int
+    fetched: int
+    parsed: int
+    unchanged: int
+    resumed: int
+    persisted: int
+    failed: int
+    rules_migrated: int
+    legal_sources_created: int
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+class BackfillCheckpoints:
+    """Per-item checkpoint rows stored alongside the ontology tables."""
+
+    def __init__(self, store: NormalizedOntologyStore) -> None:
+        self.connection = store.connection
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                source_kind TEXT NOT NULL,
+                source_ref TEXT NOT NULL,
+                content_digest TEXT,
+                status TEXT NOT NULL,
+                rules_migrated INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (source_kind, source_ref)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def load(self, source_kind: str) -> Dict[str, Tuple[Optional[str], str]]:
+        """Return ``source_ref -> (content_digest, status)`` for ``source_kind``."""
+
+        rows = self.connection.execute(
+            "SELECT source_ref, content_digest, status FROM backfill_checkpoints "
+            "WHERE source_kind = ?",
+            (source_kind,),
+        ).fetchall()
+        return {ref: (digest, status) for ref, digest, status in rows}
+
+    def record(
+        self,
+        source_kind: str,
+        source_ref: str,
+        *,
+        status: str,
+        content_digest: Optional[str] = None,
+        rules_migrated: Optional[int] = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Upsert the checkpoint for ``source_ref``.
+
+        A ``None`` ``content_digest`` or ``rules_migrated`` keeps the stored
+        value, so the digest always names the last content that settled.
+        """
+
+        self.connection.execute(
+            """
+            INSERT INTO backfill_checkpoints
+                (source_kind, source_ref, content_digest, status, rules_migrated, error, updated_at)
+            VALUES (?1, ?2, ?3, ?4, COALESCE(?5, 0), ?6, ?7)
+            ON CONFLICT (source_kind, source_ref) DO UPDATE SET
+                content_digest = COALESCE(excluded.content_digest, backfill_checkpoints.content_digest),
+                status = excluded.status,
+                rules_migrated = COALESCE(?5, backfill_checkpoints.rules_migrated),
+                error = excluded.error,
+                updated_at = excluded.updated_at
+            """,
+            (
+                source_kind,
+                source_ref,
+                content_digest,
+                status,
+                rules_migrated,
+                error,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self.connection.commit()
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    source_ref: str
+    status: str
+    content_digest: Optional[str] = None
+    document: Optional[Document] = None
+    error: Optional[str] = None
+
+
+def _content_bytes(fetched: Any) -> bytes:
+    content = getattr(fetched, "content", fetched)
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    return bytes(content)
+
+
+def _put(target: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: "queue.Queue[Any]", stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return source.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def stream_backfill(
+    source_refs: Iterable[str],
+    *,
+    fetch: Callable[[str], Any],
+    parse: Callable[[str, Any], Optional[Document]],
+    db_path: Path,
+    source_kind: str,
+    default_category: Optional[str] = None,
+    fetch_workers: int = 4,
+    parse_workers: int = 2,
+    queue_size: int = 32,
+    resume: bool = False,
+    recorder: Optional[PhaseRecorder] = None,
+) -> StreamingBackfillSummary:
+    """Fetch, parse and persist ``source_refs`` as overlapping bounded stages.
+
+    ``fetch`` returns the raw item (a :class:`~src.sources.base.FetchResult`
+    from the AustLII/JADE adapters, or bytes) and ``parse`` turns it into a
+    :class:`Document` (``None`` to skip).  Fetching and parsing run on worker
+    threads connected by queues of at most ``queue_size`` items; persistence
+    and checkpointing stay on the calling thread, the store's only writer.
+
+    An item whose content digest equals the one in its last successful
+    checkpoint is reported as ``unchanged`` without being parsed.  With
+    ``resume=True`` items that already have a successful checkpoint are not
+    fetched at all, so an interrupted run picks up where it stopped.  Failed
+    parses are checkpointed as ``failed`` and retried next run.  A failed
+    fetch of an item that already settled only records the error: its digest
+    and status stay, so the next run can still skip it as unchanged.
+
+    Per-item progress and the running counters are emitted through
+    ``recorder`` as a ``backfill_ingest`` phase.  If iterating
+    ``source_refs`` raises, the items already queued are still settled and
+    the error is then re-raised here.
+    """
+
+    if fetch_workers <= 0 or parse_workers <= 0 or queue_size <= 0:
+        raise ValueError("worker counts and queue_size must be positive")
+    total = len(source_refs) if isinstance(source_refs, Sized) else None
+    counters = dict.fromkeys(StreamingBackfillSummary.__dataclass_fields__, 0)
+
+    with NormalizedOntologyStore(db_path) as store:
+        checkpoints = BackfillCheckpoints(store)
+        previous = checkpoints.load(source_kind)
+        stop = threading.Event()
+        ref_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        parse_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        out_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        fetchers_left = [fetch_workers]
+        fetchers_lock = threading.Lock()
+        # Errors raised by a stage itself (not per-item failures); re-raised
+        # on the calling thread once the pipeline has drained.
+        stage_errors: List[BaseException] = []
+
+        def produce() -> None:
+            try:
+                for source_ref in source_refs:
+                    source_ref = str(source_ref)
+                    digest, status = previous.get(source_ref, (None, ""))
+                    if resume and status in _SETTLED_STATES:
+                        item: Any = _Outcome(source_ref, "resumed", digest)
+                        if not _put(out_queue, item, stop):
+                            return
+                    elif not _put(ref_queue, source_ref, stop):
+                        return
+            except BaseException as exc:  # noqa: BLE001 - re-raised by the caller
+                stage_errors.append(exc)
+            finally:
+                # Every fetch worker must see a sentinel or the pipeline
+                # never drains.
+                for _ in range(fetch_workers):
+                    _put(ref_queue, _DONE, stop)
+
+        def fetch_stage() -> None:
+            try:
+                while True:
+                    source_ref = _get(ref_queue, stop)
+                    if source_ref is _DONE:
+                        break
+                    try:
+                        fetched = fetch(source_ref)
+                        digest = hashlib.sha256(_content_bytes(fetched)).hexdigest()
+                    except Exception as exc:  # noqa: BLE001 - checkpointed per item
+                        _put(out_queue, _Outcome(source_ref, "failed", error=repr(exc)), stop)
+                        continue
+                    prior_digest, prior_status = previous.get(source_ref, (None, ""))
+                    if prior_status in _SETTLED_STATES and prior_digest == digest:
+                        _put(out_queue, _Outcome(source_ref, "unchanged", digest), stop)
+                    else:
+                        _put(parse_queue, (source_ref, digest, fetched), stop)
+            except BaseException as exc:  # noqa: BLE001 - re-raised by the caller
+                stage_errors.append(exc)
+            finally:
+                with fetchers_lock:
+                    fetchers_left[0] -= 1
+                    last = fetchers_left[0] == 0
+                if last:
+                    for _ in range(parse_workers):
+                        _put(parse_queue, _DONE, stop)
+
+        def parse_stage() -> None:
+            try:
+                while True:
+                    item = _get(parse_queue, stop)
+                    if item is _DONE:
+                        break
+                    source_ref, digest, fetched = item
+                    try:
+                        outcome = _Outcome(source_ref, "parsed", digest, parse(source_ref, fetched))
+                    except Exception as exc:  # noqa: BLE001 - checkpointed per item
+                        outcome = _Outcome(source_ref, "failed", digest, error=repr(exc))
+                    _put(out_queue, outcome, stop)
+            except BaseException as exc:  # noqa: BLE001 - re-raised by the caller
+                stage_errors.append(exc)
+            finally:
+                _put(out_queue, _DONE, stop)
+
+        threads = [threading.Thread(target=produce, name="backfill-produce", daemon=True)]
+        threads += [
+            threading.Thread(target=fetch_stage, name=f"backfill-fetch-{n}", daemon=True)
+            for n in range(fetch_workers)
+        ]
+        threads += [
+            threading.Thread(target=parse_stage, name=f"backfill-parse-{n}", daemon=True)
+            for n in range(parse_workers)
+        ]
+        phase_context = (
+            recorder.phase(
+                "backfill_ingest",
+                total=total,
+                phase_unit="items",
+                subject_ref=source_kind,
+                details={
+                    "source_kind": source_kind,
+                    "fetch_workers": fetch_workers,
+                    "parse_workers": parse_workers,
+                    "resume": resume,
+                },
+            )
+            if recorder is not None
+            else nullcontext(None)
+        )
+        try:
+            with phase_context as phase:
+                for thread in threads:
+                    thread.start()
+                parsers_left = parse_workers
+                while parsers_left:
+                    try:
+                        outcome = out_queue.get(timeout=_POLL_SECONDS)
+                    except queue.Empty:
+                        continue
+                    if outcome is _DONE:
+                        parsers_left -= 1
+                        continue
+                    status = _settle(
+                        outcome,
+                        store=store,
+                        checkpoints=checkpoints,
+                        previous=previous,
+                        source_kind=source_kind,
+                        default_category=default_category,
+                        counters=counters,
+                    )
+                    if phase is not None:
+                        phase.advance(
+                            subject_ref=outcome.source_ref,
+                            reused=status in {"unchanged", "resumed"},
+                            message=status,
+                            details=dict(counters),
+                        )
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=_POLL_SECONDS)
+    # Raised after the store closes so the settled items stay checkpointed.
+    if stage_errors:
+        raise stage_errors[0]
+    return StreamingBackfillSummary(**counters)
+
+
+def _settle(
+    outcome: _Outcome,
+    *,
+    store: NormalizedOntologyStore,
+    checkpoints: BackfillCheckpoints,
+    previous: Mapping[str, Tuple[Optional[str], str]],
+    source_kind: str,
+    default_category: Optional[str],
+    counters: Dict[str, int],
+) -> str:
+    counters["items_seen"] += 1
+    counters["fetched"] += outcome.status in {"unchanged", "parsed"}
+    if outcome.status in {"unchanged", "resumed"}:
+        counters[outcome.status] += 1
+        return outcome.status
+    if outcome.status == "failed":
+        counters["failed"] += 1
+        # Failures never store a digest: it has to keep naming the content
+        # that last settled.  A fetch failure (no digest at all) also keeps a
+        # settled status, since nothing new was seen.
+        prior_status = previous.get(outcome.source_ref, (None, ""))[1]
+        fetch_failed = outcome.content_digest is None
+        checkpoints.record(
+            source_kind,
+            outcome.source_ref,
+            status=prior_status if fetch_failed and prior_status in _SETTLED_STATES else "failed",
+            rules_migrated=None,
+            error=outcome.error,
+        )
+        return "failed"
+    counters["parsed"] += 1
+    sources = rules = 0
+    if outcome.document is not None:
+        sources, rules = _persist_document(
+            store, outcome.document, default_category=default_category
+        )
+    status = "persisted" if sources else "no_rules"
+    counters["persisted"] += bool(sources)
+    counters["legal_sources_created"] += sources
+    counters["rules_migrated"] += rules
+    checkpoints.record(
+        source_kind,
+        outcome.source_ref,
+        status=status,
+        content_digest=outcome.content_digest,
+        rules_migrated=rules,
+    )
+    return status
+
+
+__all__ = [
+    "BackfillCheckpoints",
+    "BackfillSummary",
+    "StreamingBackfillSummary",
+    "backfill_documents",
+    "stream_backfill",
+]
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import json
-import time
-import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+from .fetch_pool import (
+    DEFAULT_MAX_WORKERS,
+    FetchPool,
+    FetchResult,
+    HostRateLimits,
+    ResponseStore,
+)
 
 try:  # pragma: no cover - requests is optional in some environments
     import requests
@@ -12,6 +20,30 @@ except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
 
+def _clone_session(template: "requests.Session") -> "requests.Session":
+    """Return a new session configured like ``template``.
+
+    ``requests.Session`` is not thread-safe, so each fetch worker gets its own
+    copy carrying the template's headers, auth, cookies, proxies, TLS settings
+    and mounted adapters.
+    """
+
+    session = requests.Session()
+    session.headers.clear()
+    session.headers.update(template.headers)
+    session.auth = template.auth
+    session.proxies = dict(template.proxies)
+    session.params = dict(template.params)
+    session.verify = template.verify
+    session.cert = template.cert
+    session.trust_env = template.trust_env
+    session.max_redirects = template.max_redirects
+    session.cookies.update(template.cookies)
+    for prefix, adapter in template.adapters.items():
+        session.mount(prefix, adapter)
+    return session
+
+
 class HTTPCache:
     """Simple persistent HTTP cache with conditional requests.
 
@@ -20,6 +52,13 @@ class HTTPCache:
     reuse this metadata to send ``If-None-Match`` and ``If-Modified-Since``
     headers.  A configurable delay avoids hitting the network when the cached
     copy is considered fresh.
+
+    Bodies live in a :class:`~src.ingestion.fetch_pool.ResponseStore` under
+    ``cache_dir`` (the same layout as the module-level helpers) and
+    :meth:`fetch_many` fetches a batch concurrently.  Pass ``limits`` to
+    throttle requests per host.  Each fetch worker uses its own clone of
+    ``session``; a ``session`` that is not a ``requests.Session`` (such as a
+    test double) cannot be cloned and is shared by every worker.
     """
 
     def __init__(
@@ -28,9 +67,10 @@ class HTTPCache:
         *,
         delay: float = 0.0,
         session: Optional["requests.Session"] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        limits: Optional[HostRateLimits] = None,
     ) -> None:
         self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.delay = delay
         if session is not None:
             self.session = session
@@ -38,16 +78,26 @@ class HTTPCache:
             if requests is None:  # pragma: no cover - optional dependency
                 raise RuntimeError("requests library required for network operations")
             self.session = requests.Session()
+        self.store = ResponseStore(cache_dir)
+        cloneable = requests is not None and isinstance(self.session, requests.Session)
+        self.pool = FetchPool(
+            self.store,
+            max_workers=max_workers,
+            limits=limits,
+            session=None if cloneable else self.session,
+            session_factory=self._worker_session,
+            fresh_for=delay,
+        )
+
+    def _worker_session(self) -> "requests.Session":
+        return _clone_session(self.session)
 
     # ------------------------------------------------------------------
-    def _key(self, url: str) -> str:
-        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+    def fetch_result(self, url: str) -> FetchResult:
+        """Fetch *url* and return where its body is stored."""
 
-    def _paths(self, url: str) -> tuple[Path, Path]:
-        key = self._key(url)
-        return self.cache_dir / f"{key}.bin", self.cache_dir / f"{key}.json"
+        return self.pool.fetch(url)
 
-    # ------------------------------------------------------------------
     def fetch(self, url: str) -> bytes:
         """Fetch *url* using a persistent cache.
 
@@ -62,37 +112,12 @@ class HTTPCache:
             The body of the response, either from cache or the network.
         """
 
-        body_path, meta_path = self._paths(url)
-        meta = {}
-        headers = {}
-        now = time.time()
-
-        if meta_path.exists() and body_path.exists():
-            meta = json.loads(meta_path.read_text())
-            fetched_at = meta.get("fetched_at", 0)
-            if self.delay and (now - fetched_at) < self.delay:
-                return body_path.read_bytes()
-            if etag := meta.get("etag"):
-                headers["If-None-Match"] = etag
-            if lm := meta.get("last_modified"):
-                headers["If-Modified-Since"] = lm
-
-        response = self.session.get(url, headers=headers)
-        if response.status_code == 304 and body_path.exists():
-            meta["fetched_at"] = now
-            meta_path.write_text(json.dumps(meta))
-            return body_path.read_bytes()
-
-        response.raise_for_status()
-        body = response.content
-        meta = {
-            "etag": response.headers.get("ETag"),
-            "last_modified": response.headers.get("Last-Modified"),
-            "fetched_at": now,
-        }
-        body_path.write_bytes(body)
-        meta_path.write_text(json.dumps(meta))
-        return body
+        return self.pool.fetch(url).read_bytes()
+
+    def fetch_many(self, urls: Sequence[str]) -> List[FetchResult]:
+        """Fetch ``urls`` concurrently; see :meth:`FetchPool.fetch_many`."""
+
+        return self.pool.fetch_many(urls)
 
 
 """HTTP caching utilities with per-host rate limiting.
@@ -105,24 +130,13 @@ Each URL additionally has a metadata file recording the ``ETag`` and
 ``If-None-Match`` and ``If-Modified-Since`` so that servers may respond with
 ``304 Not Modified``.
 
-Network requests are throttled via a token bucket implementation allowing no
-more than 30 requests per minute to any single host. This keeps the project
-polite when it needs to talk to real services but still remains deterministic
-for tests.
+Network requests are throttled via a token bucket per host allowing no more
+than 30 requests per minute to any single host. This keeps the project polite
+when it needs to talk to real services but still remains deterministic for
+tests. :func:`fetch_many` fetches a batch concurrently, so budget on other
+hosts is not wasted waiting on the slowest one.
 """
 
-import hashlib
-import json
-import logging
-import os
-import threading
-import time
-from pathlib import Path
-from typing import Dict, Any
-from urllib.error import HTTPError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-
 # ---------------------------------------------------------------------------
 # Cache directories
 # ---------------------------------------------------------------------------
@@ -136,129 +150,33 @@ CACHE_DIR = Path(
     )
 )
 
-# Store metadata separate from the response bodies.  ``objects`` holds files
-# named by the SHA256 digest of their content while ``meta`` maps each URL to
-# the digest and any caching headers.
-_OBJECT_DIR = CACHE_DIR / "objects"
-_META_DIR = CACHE_DIR / "meta"
-for _d in (_OBJECT_DIR, _META_DIR):
-    _d.mkdir(parents=True, exist_ok=True)
+# ``objects`` holds files named by the SHA256 digest of their content while
+# ``meta`` maps each URL to the digest and any caching headers.
+_STORE = ResponseStore(CACHE_DIR)
 
 
 # ---------------------------------------------------------------------------
-# Token bucket rate limiting
+# Shared fetch pool
 # ---------------------------------------------------------------------------
 
-_REQUESTS_PER_MINUTE = 30
-_REFILL_RATE = _REQUESTS_PER_MINUTE / 60.0  # tokens per second
-_CAPACITY = _REQUESTS_PER_MINUTE
-
+_pool: Optional[FetchPool] = None
+_pool_lock = threading.Lock()
 
-class _TokenBucket:
-    """Simple token bucket for throttling requests per host."""
 
-    def __init__(self) -> None:
-        self.tokens = float(_CAPACITY)
-        self.timestamp = time.monotonic()
+def default_fetch_pool() -> FetchPool:
+    """Return the process-wide pool used by the ``fetch_*`` helpers."""
 
-    def consume(self, tokens: float = 1.0) -> None:
-        while True:
-            with _lock:
-                now = time.monotonic()
-                elapsed = now - self.timestamp
-                # Refill tokens based on time passed since last check
-                self.tokens = min(_CAPACITY, self.tokens + elapsed * _REFILL_RATE)
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    self.timestamp = now
-                    return
-                # Not enough tokens; calculate wait time outside the lock
-                need = tokens - self.tokens
-                wait = need / _REFILL_RATE
-            time.sleep(wait)
-
-
-_buckets: Dict[str, _TokenBucket] = {}
-_lock = threading.Lock()
-
-
-def _get_bucket(host: str) -> _TokenBucket:
-    with _lock:
-        bucket = _buckets.get(host)
-        if bucket is None:
-            bucket = _TokenBucket()
-            _buckets[host] = bucket
-        return bucket
-
-
-# ---------------------------------------------------------------------------
-# Helpers for file paths
-# ---------------------------------------------------------------------------
-
-
-def _meta_path(url: str) -> Path:
-    """Return the on-disk path for ``url``'s metadata file."""
-
-    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
-    return _META_DIR / f"{digest}.json"
-
-
-def _body_path(digest: str) -> Path:
-    """Return the path for a cached response body."""
-
-    return _OBJECT_DIR / digest
-
-
-# ---------------------------------------------------------------------------
-# Fetching logic with cache revalidation
-# ---------------------------------------------------------------------------
-
-
-logger = logging.getLogger(__name__)
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = FetchPool(_STORE, limits=HostRateLimits())
+        return _pool
 
 
 def _fetch(url: str) -> bytes:
     """Fetch ``url`` obeying cache, conditional requests and rate limits."""
 
-    meta_path = _meta_path(url)
-    headers: Dict[str, str] = {}
-    meta: Dict[str, Any] = {}
-
-    if meta_path.exists():
-        meta = json.loads(meta_path.read_text())
-        if etag := meta.get("etag"):
-            headers["If-None-Match"] = etag
-        if last_mod := meta.get("last_modified"):
-            headers["If-Modified-Since"] = last_mod
-
-    host = urlparse(url).netloc
-    _get_bucket(host).consume()
-
-    request = Request(url, headers=headers)
-
-    try:
-        with urlopen(request) as resp:  # pragma: no cover - network
-            data = resp.read()
-            etag = resp.headers.get("ETag")
-            last_mod = resp.headers.get("Last-Modified")
-
-        digest = hashlib.sha256(data).hexdigest()
-        body_path = _body_path(digest)
-        if not body_path.exists():
-            body_path.write_bytes(data)
-
-        meta_path.write_text(
-            json.dumps({"etag": etag, "last_modified": last_mod, "digest": digest})
-        )
-        return data
-
-    except HTTPError as exc:  # pragma: no cover - network
-        if exc.code == 304 and meta:
-            logger.info("304 Not Modified: %s", url)
-            digest = meta.get("digest")
-            if digest:
-                return _body_path(digest).read_bytes()
-        raise
+    return default_fetch_pool().fetch(url).read_bytes()
 
 
 # ---------------------------------------------------------------------------
@@ -286,5 +204,19 @@ def fetch_json(url: str) -> Dict[str, Any]:
     return json.loads(data.decode("utf-8"))
 
 
-__all__ = ["fetch_html", "fetch_pdf", "fetch_json", "CACHE_DIR"]
+def fetch_many(urls: Sequence[str]) -> List[FetchResult]:
+    """Fetch ``urls`` concurrently through the shared pool and cache."""
+
+    return default_fetch_pool().fetch_many(urls)
+
+
+__all__ = [
+    "CACHE_DIR",
+    "HTTPCache",
+    "default_fetch_pool",
+    "fetch_html",
+    "fetch_json",
+    "fetch_many",
+    "fetch_pdf",
+]
 
@@ -0,0 +1,374 @@
+"""Bounded concurrent fetching with per-host politeness.
+
+Source acquisition used to fetch one URL at a time through two caches with
+their own throttling.  This module provides the shared pieces both now use:
+
+* :class:`ResponseStore` keeps response bodies on disk named by the SHA-256 of
+  their content (``objects/``) plus one metadata file per URL (``meta/``)
+  holding the digest, ``ETag``, ``Last-Modified`` and fetch time, so repeat
+  requests revalidate with ``If-None-Match``/``If-Modified-Since``.
+* :class:`HostRateLimits` gives every host its own
+  :class:`~src.sources.rate_limit.TokenBucketRateLimiter`, so a slow or
+  strict host never holds back requests to the others.
+* :class:`FetchPool` runs fetches on a bounded thread pool.  Each worker keeps
+  its own ``requests.Session`` (connection reuse without sharing a session
+  across threads) and bodies are streamed to disk in chunks while hashing,
+  never held whole in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+from src.sources.rate_limit import RateLimit, TokenBucketRateLimiter
+
+try:  # pragma: no cover - requests is optional in some environments
+    import requests
+except Exception:  # pragma: no cover
+    requests = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+#: Thirty requests per minute per host, with a full minute of burst.
+DEFAULT_HOST_RATE_LIMIT = RateLimit(rps=0.5, burst=30)
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+# ---------------------------------------------------------------------------
+# On-disk response store
+# ---------------------------------------------------------------------------
+
+
+class ResponseStore:
+    """Content-addressed response bodies with per-URL revalidation metadata."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.object_dir = self.root / "objects"
+        self.meta_dir = self.root / "meta"
+        for directory in (self.object_dir, self.meta_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def meta_path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.meta_dir / f"{digest}.json"
+
+    def body_path(self, digest: str) -> Path:
+        return self.object_dir / digest
+
+    def meta(self, url: str) -> Dict[str, Any]:
+        """Return the stored metadata for ``url`` (empty when unknown or unreadable)."""
+
+        try:
+            return json.loads(self.meta_path(url).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def cached_body(self, meta: Mapping[str, Any]) -> Optional[Path]:
+        digest = meta.get("digest")
+        if not digest:
+            return None
+        path = self.body_path(str(digest))
+        return path if path.exists() else None
+
+    def write_meta(self, url: str, meta: Mapping[str, Any]) -> None:
+        _atomic_write(self.meta_path(url), json.dumps(dict(meta)).encode("utf-8"))
+
+    def write_body(self, chunks: Iterable[bytes]) -> tuple[str, Path]:
+        """Stream ``chunks`` to disk and return the body's digest and path."""
+
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(prefix=".incoming-", dir=self.object_dir)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in chunks:
+                    if chunk:
+                        digest.update(chunk)
+                        handle.write(chunk)
+            path = self.body_path(digest.hexdigest())
+            if path.exists():
+                os.unlink(tmp_name)
+            else:
+                os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest.hexdigest(), path
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Per-host rate limiting
+# ---------------------------------------------------------------------------
+
+
+class HostRateLimits:
+    """One token bucket per host, created on first request to that host."""
+
+    def __init__(
+        self,
+        default: RateLimit = DEFAULT_HOST_RATE_LIMIT,
+        overrides: Optional[Mapping[str, RateLimit]] = None,
+        *,
+        now: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.default = default
+        self.overrides = dict(overrides or {})
+        self._now = now
+        self._sleep = sleep
+        self._limiters: Dict[str, TokenBucketRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, host: str) -> TokenBucketRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = TokenBucketRateLimiter(
+                    self.overrides.get(host, self.default), now=self._now, sleep=self._sleep
+                )
+                self._limiters[host] = limiter
+            return limiter
+
+    def acquire(self, url: str) -> None:
+        self.limiter(urlparse(url).netloc).acquire()
+
+
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+
+class _UrllibResponse:
+    """``requests.Response`` look-alike over ``urlopen`` results."""
+
+    def __init__(self, raw: Any, error: Optional[HTTPError] = None) -> None:
+        self._raw = raw
+        self._error = error
+        self.status_code = int(getattr(raw, "status", None) or getattr(raw, "code", 200))
+        self.headers = raw.headers
+
+    def raise_for_status(self) -> None:
+        if self._error is not None and self.status_code >= 400:
+            raise self._error
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        while chunk := self._raw.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        self._raw.close()
+
+
+class _UrllibSession:
+    """Minimal session used when ``requests`` is not installed."""
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+    ) -> _UrllibResponse:
+        try:
+            return _UrllibResponse(urlopen(Request(url, headers=dict(headers or {})), timeout=timeout))
+        except HTTPError as exc:
+            return _UrllibResponse(exc, exc)
+
+
+def _default_session() -> Any:
+    if requests is None:
+        return _UrllibSession()
+    return requests.Session()
+
+
+def _iter_body(response: Any, chunk_size: int) -> Iterable[bytes]:
+    if hasattr(response, "iter_content"):
+        return response.iter_content(chunk_size)
+    return (response.content,)
+
+
+# ---------------------------------------------------------------------------
+# Fetch pool
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of fetching one URL.
+
+    ``status`` is ``"fetched"`` (new body downloaded), ``"not_modified"``
+    (server answered 304), ``"fresh"`` (cached copy younger than
+    ``fresh_for``; no request made) or ``"failed"``.
+    """
+
+    url: str
+    status: str
+    digest: Optional[str] = None
+    path: Optional[Path] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+    def read_bytes(self) -> bytes:
+        if self.path is None:
+            raise self.error or FileNotFoundError(self.url)
+        return self.path.read_bytes()
+
+
+class FetchPool:
+    """Fetch URLs concurrently through a :class:`ResponseStore`.
+
+    ``session`` pins one shared session (e.g. one carrying a user agent or a
+    test double); otherwise ``session_factory`` is called once per worker
+    thread.  ``limits=None`` disables throttling.
+    """
+
+    def __init__(
+        self,
+        store: ResponseStore,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        limits: Optional[HostRateLimits] = None,
+        session: Any = None,
+        session_factory: Callable[[], Any] = _default_session,
+        fresh_for: float = 0.0,
+        timeout: Optional[float] = 30.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.store = store
+        self.max_workers = max_workers
+        self.limits = limits
+        self.fresh_for = fresh_for
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self._session = session
+        self._session_factory = session_factory
+        self._clock = clock
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def session(self) -> Any:
+        if self._session is not None:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._session_factory()
+        return session
+
+    def fetch(self, url: str) -> FetchResult:
+        """Fetch ``url`` on the calling thread, raising on HTTP errors."""
+
+        meta = self.store.meta(url)
+        cached = self.store.cached_body(meta)
+        now = self._clock()
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if self.fresh_for and (now - float(meta.get("fetched_at") or 0)) < self.fresh_for:
+                return FetchResult(url, "fresh", meta["digest"], cached)
+            if etag := meta.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_mod := meta.get("last_modified"):
+                headers["If-Modified-Since"] = last_mod
+
+        if self.limits is not None:
+            self.limits.acquire(url)
+        response = self.session().get(url, headers=headers, stream=True, timeout=self.timeout)
+        try:
+            if response.status_code == 304 and cached is not None:
+                logger.info("304 Not Modified: %s", url)
+                self.store.write_meta(url, {**meta, "fetched_at": now})
+                return FetchResult(url, "not_modified", meta["digest"], cached)
+            response.raise_for_status()
+            digest, path = self.store.write_body(_iter_body(response, self.chunk_size))
+            self.store.write_meta(
+                url,
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "digest": digest,
+                    "fetched_at": now,
+                },
+            )
+            return FetchResult(url, "fetched", digest, path)
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+    def _fetch_captured(self, url: str) -> FetchResult:
+        try:
+            return self.fetch(url)
+        except Exception as exc:  # noqa: BLE001 - reported per URL
+            logger.warning("fetch failed: %s (%s)", url, exc)
+            return FetchResult(url, "failed", error=exc)
+
+    def fetch_many(self, urls: Sequence[str]) -> List[FetchResult]:
+        """Fetch ``urls`` concurrently; results are in input order.
+
+        Failures are returned as ``status="failed"`` results instead of
+        aborting the batch.  Duplicate URLs are fetched once.
+        """
+
+        unique = list(dict.fromkeys(urls))
+        if len(unique) <= 1 or self.max_workers == 1:
+            by_url = {url: self._fetch_captured(url) for url in unique}
+        else:
+            by_url = dict(zip(unique, self._pool().map(self._fetch_captured, unique)))
+        return [by_url[url] for url in urls]
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="sensiblaw-fetch"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_HOST_RATE_LIMIT",
+    "DEFAULT_MAX_WORKERS",
+    "FetchPool",
+    "FetchResult",
+    "HostRateLimits",
+    "ResponseStore",
+]
@@ -0,0 +1,165 @@
+"""Persistent page-level cache for PDF text extraction.
+
+Extracted page records are immutable for a given page and extractor version,
+so they are stored as JSON bodies in a :class:`FilesystemContentAddressedStore`
+and located through small key files.  Two kinds of key exist:
+
+* a *page key* derived from the extractor version, a fingerprint of the page's
+  own PDF objects and the page index, so a re-issued PDF only recomputes the
+  pages whose content actually changed; and
+* a *document key* derived from the extractor version and the SHA-256 of the
+  PDF bytes, mapping an unchanged file straight to its ordered page keys so a
+  warm run never opens the PDF parser at all.
+
+Bump :data:`PDF_PAGE_EXTRACTOR_VERSION` whenever the page dict produced by
+:func:`src.pdf_ingest.extract_pdf_text` changes shape or content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from src.runtime.content_addressed_store import (
+    ContentAddressedPayload,
+    FilesystemContentAddressedStore,
+)
+
+PDF_PAGE_EXTRACTOR_VERSION = "sensiblaw.pdf-page-extract.v1"
+_MEDIA_TYPE = "application/json"
+_DIGEST_CHUNK_BYTES = 1024 * 1024
+
+
+def digest_pdf_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of the PDF at ``path``."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as stream:
+        while chunk := stream.read(_DIGEST_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _restore_page_record(record: Mapping[str, Any]) -> Dict[str, Any]:
+    """Undo JSON's tuple-to-list coercion so cached pages equal fresh ones."""
+
+    restored = dict(record)
+    restored["links"] = [
+        {**link, "rect": tuple(link["rect"])} if isinstance(link.get("rect"), list) else dict(link)
+        for link in record.get("links") or []
+    ]
+    return restored
+
+
+class PdfPageCache:
+    """Content-addressed cache of extracted PDF page records."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        extractor_version: str = PDF_PAGE_EXTRACTOR_VERSION,
+    ) -> None:
+        self.root = Path(root)
+        self.extractor_version = extractor_version
+        self.store = FilesystemContentAddressedStore(self.root / "objects")
+        self._key_dir = self.root / "keys"
+        self._key_dir.mkdir(parents=True, exist_ok=True)
+        self.page_hits = 0
+        self.page_misses = 0
+        self.document_hits = 0
+        self.document_misses = 0
+
+    # ------------------------------------------------------------------
+    def _derive_key(self, kind: str, *parts: object) -> str:
+        material = "\x00".join([self.extractor_version, kind, *(str(part) for part in parts)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def page_key(self, page_fingerprint: str, page_number: int) -> str:
+        return self._derive_key("page", page_fingerprint, page_number)
+
+    def document_key(self, pdf_digest: str) -> str:
+        return self._derive_key("document", pdf_digest)
+
+    def _key_path(self, key: str) -> Path:
+        return self._key_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Any]:
+        key_path = self._key_path(key)
+        try:
+            descriptor = json.loads(key_path.read_text(encoding="utf-8"))
+            payload = ContentAddressedPayload(
+                payload_ref=descriptor["payload_ref"],
+                sha256_hex=descriptor["sha256_hex"],
+                byte_count=descriptor["byte_count"],
+                media_type=descriptor["media_type"],
+                storage_kind=descriptor["storage_kind"],
+                locator=descriptor["locator"],
+            )
+            with self.store.open_payload(payload) as stream:
+                return json.loads(stream.read().decode("utf-8"))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, value: Any) -> None:
+        body = json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        payload = self.store.put_stream(BytesIO(body), media_type=_MEDIA_TYPE)
+        key_path = self._key_path(key)
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", dir=key_path.parent, delete=False
+        ) as temporary:
+            json.dump(payload.to_dict(), temporary, sort_keys=True)
+        os.replace(temporary.name, key_path)
+
+    # ------------------------------------------------------------------
+    def load_page(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached envelope ``{"record": page-or-None}`` for ``key``.
+
+        ``None`` means the page has not been extracted yet; an envelope whose
+        record is ``None`` means the page was extracted and had no text.
+        """
+
+        envelope = self._read(key)
+        if not isinstance(envelope, dict) or "record" not in envelope:
+            self.page_misses += 1
+            return None
+        self.page_hits += 1
+        record = envelope["record"]
+        return {"record": _restore_page_record(record) if record is not None else None}
+
+    def store_page(self, key: str, record: Optional[Mapping[str, Any]]) -> None:
+        self._write(key, {"record": dict(record) if record is not None else None})
+
+    def load_document(self, pdf_digest: str) -> Optional[List[str]]:
+        """Return the ordered page keys recorded for an unchanged PDF."""
+
+        page_keys = self._read(self.document_key(pdf_digest))
+        if not isinstance(page_keys, list):
+            self.document_misses += 1
+            return None
+        self.document_hits += 1
+        return [str(key) for key in page_keys]
+
+    def store_document(self, pdf_digest: str, page_keys: Sequence[str]) -> None:
+        self._write(self.document_key(pdf_digest), list(page_keys))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "page_hits": self.page_hits,
+            "page_misses": self.page_misses,
+            "document_hits": self.document_hits,
+            "document_misses": self.document_misses,
+        }
+
+
+__all__ = [
+    "PDF_PAGE_EXTRACTOR_VERSION",
+    "PdfPageCache",
+    "digest_pdf_file",
+]
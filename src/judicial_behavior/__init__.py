@@ -4,7 +4,7 @@ This package intentionally does not perform prediction or scoring. It provides
 deterministic summary statistics over explicit case observations.
 """
 
-from .model import CaseObservation, OutcomeLabel
+from .model import CaseObservation, ObservationColumns, OutcomeLabel
 from .stats import (
     aggregate_outcomes,
     aggregate_beta_binomial,
@@ -17,6 +17,7 @@ from .logistic import build_sparse_binary_design, fit_ridge_logistic_map
 
 __all__ = [
     "CaseObservation",
+    "ObservationColumns",
     "OutcomeLabel",
     "aggregate_outcomes",
     "aggregate_beta_binomial",
@@ -4,6 +4,15 @@ import math
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# "python" is the dependency-free reference implementation and the default;
+# "auto" uses NumPy when it is installed.
+LOGISTIC_BACKENDS = ("auto", "numpy", "python")
+
 
 @dataclass(frozen=True, slots=True)
 class LogisticMapFit:
@@ -30,19 +39,32 @@ def fit_ridge_logistic_map(
     l2: float = 1.0,
     max_iter: int = 50,
     tol: float = 1e-8,
+    backend: str = "python",
 ) -> Tuple[Tuple[float, ...], Tuple[float, ...], bool, int]:
     """
     Deterministic ridge-logistic MAP fit using Newton/IRLS on sparse binary features.
 
     `rows`: list of (y, active_feature_indices) where indices are in [0, n_features).
     This function *does not* emit predictions; it returns coefficients + an uncertainty proxy.
+
+    `backend` is one of LOGISTIC_BACKENDS. The NumPy backend solves the same
+    Newton steps with a sparse design and Cholesky solves; it agrees with the
+    Python backend to floating-point rounding. Those last bits can differ
+    between NumPy builds, so the Python backend stays the default and results
+    only depend on the environment when a caller opts into "numpy" or "auto".
     """
+    if backend not in LOGISTIC_BACKENDS:
+        raise ValueError(f"unknown logistic backend: {backend!r}")
+    if backend == "numpy" and np is None:
+        raise RuntimeError("NumPy is required for the numpy logistic backend")
     lam = float(l2)
     if not math.isfinite(lam) or lam <= 0:
         lam = 1.0
     p = int(n_features)
     if p <= 0:
         return ((), (), True, 0)
+    if backend != "python" and np is not None:
+        return _fit_numpy(rows, p, lam, int(max_iter), float(tol))
 
     beta = [0.0] * p
     converged = False
@@ -107,6 +129,118 @@ def fit_ridge_logistic_map(
     return (tuple(beta), se, converged, it)
 
 
+# Above this many Hessian pair entries per dense design cell, the Hessian is
+# built as a dense product instead of by accumulating active-feature pairs.
+_PAIR_DENSITY_LIMIT = 4
+
+
+def _fit_numpy(
+    rows: Sequence[Tuple[int, Sequence[int]]],
+    p: int,
+    lam: float,
+    max_iter: int,
+    tol: float,
+) -> Tuple[Tuple[float, ...], Tuple[float, ...], bool, int]:
+    # Rows with the same active features share z, pi and w, so the design is
+    # built over distinct patterns; each pattern keeps its row count and y sum.
+    pattern_ids: Dict[Tuple[Tuple[int, int], ...], int] = {}
+    row_count: List[int] = []
+    y_sum: List[float] = []
+    for y, idxs in rows:
+        counts: Dict[int, int] = {}
+        for j in idxs:
+            if 0 <= j < p:
+                counts[int(j)] = counts.get(int(j), 0) + 1
+        key = tuple(sorted(counts.items()))
+        k = pattern_ids.setdefault(key, len(pattern_ids))
+        if k == len(row_count):
+            row_count.append(0)
+            y_sum.append(0.0)
+        row_count[k] += 1
+        y_sum[k] += float(y)
+
+    # COO design over patterns, sorted by (pattern, feature).
+    nnz = [len(key) for key in pattern_ids]
+    pat = np.repeat(np.arange(len(nnz), dtype=np.int64), nnz)
+    col = np.fromiter((j for key in pattern_ids for j, _ in key), dtype=np.int64, count=len(pat))
+    val = np.fromiter((c for key in pattern_ids for _, c in key), dtype=np.float64, count=len(pat))
+    m = np.asarray(row_count, dtype=np.float64)
+    ys = np.asarray(y_sum, dtype=np.float64)
+    n_patterns = len(nnz)
+
+    nnz_arr = np.asarray(nnz, dtype=np.int64)
+    n_pairs = int((nnz_arr * nnz_arr).sum())
+    if n_pairs <= _PAIR_DENSITY_LIMIT * n_patterns * p:
+        # Every (a, b) pair of active features in each pattern, as flat
+        # Hessian cells; _sums accumulates them in a fixed order.
+        starts = np.cumsum(nnz_arr) - nnz_arr
+        pair_counts = nnz_arr * nnz_arr
+        pair_pat = np.repeat(np.arange(n_patterns, dtype=np.int64), pair_counts)
+        local = np.arange(n_pairs, dtype=np.int64) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        width = nnz_arr[pair_pat]
+        left = starts[pair_pat] + local // width
+        right = starts[pair_pat] + local % width
+        pair_cell = col[left] * p + col[right]
+        pair_val = val[left] * val[right]
+        dense = None
+    else:
+        dense = np.zeros((n_patterns, p), dtype=np.float64)
+        dense[pat, col] = val
+
+    def hessian(weights):
+        if dense is None:
+            H = _sums(pair_cell, weights[pair_pat] * pair_val, p * p).reshape(p, p)
+        else:
+            H = dense.T @ (dense * weights[:, None])
+        H[np.diag_indices(p)] += lam
+        return H
+
+    def irls_weights(beta):
+        z = _sums(pat, beta[col] * val, n_patterns)
+        ez = np.exp(-np.abs(z))
+        pi = np.where(z >= 0, 1.0 / (1.0 + ez), ez / (1.0 + ez))
+        return pi, np.maximum(pi * (1.0 - pi), 1e-12)
+
+    beta = np.zeros(p, dtype=np.float64)
+    converged = False
+    it = 0
+    for it in range(1, max_iter + 1):
+        pi, w = irls_weights(beta)
+        # Per-pattern residual sums: sum over rows of (pi - y).
+        r = m * pi - ys
+        g = lam * beta + _sums(col, r[pat] * val, p)
+        step = _cholesky_solve(hessian(m * w), g)
+        if step is None:
+            break
+        beta -= step
+        if float(np.max(np.abs(step))) < tol:
+            converged = True
+            break
+
+    # Same diagonal approximation to inv(H) as _inv_diag_approx.
+    _, w = irls_weights(beta)
+    diag = lam + _sums(col, (m * w)[pat] * val, p)
+    se = tuple(math.sqrt(max(0.0, 1.0 / d)) for d in diag.tolist())
+    return (tuple(beta.tolist()), se, converged, it)
+
+
+def _sums(index, weights, length: int):
+    # np.bincount returns int64 when there is nothing to add, which happens
+    # for empty rows or rows with no in-range features.
+    return np.bincount(index, weights=weights, minlength=length).astype(np.float64, copy=False)
+
+
+def _cholesky_solve(A, b):
+    try:
+        L = np.linalg.cholesky(A)
+    except np.linalg.LinAlgError:
+        return None
+    x = np.linalg.solve(L.T, np.linalg.solve(L, b))
+    if not np.all(np.isfinite(x)):
+        return None
+    return x
+
+
 def _solve_linear(A: List[List[float]], b: List[float]) -> List[float] | None:
     n = len(b)
     # Copy for elimination.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional, Sequence
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
 
 
 class OutcomeLabel:
@@ -79,3 +79,80 @@ def normalize_observations(rows: Iterable[CaseObservation]) -> list[CaseObservat
     out.sort(key=lambda x: (x.jurisdiction_id, x.court_id, x.court_level, x.decision_date or "", x.case_id))
     return out
 
+
+
+_OBSERVATION_FIELDS = (
+    "case_id",
+    "jurisdiction_id",
+    "court_id",
+    "court_level",
+    "decision_date",
+    "wrong_type_id",
+    "predicate_keys",
+    "outcome",
+    "judge_id",
+    "panel_ids",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationColumns:
+    """Normalized observations stored one tuple per field.
+
+    Rows are filtered and ordered exactly as :func:`normalize_observations`
+    leaves them, so aggregations over columns match aggregations over the
+    observation list.  Build the columns once and pass them to several
+    ``aggregate_*`` calls to normalize and sort a corpus only once for a
+    multi-slice report.
+    """
+
+    case_id: Tuple[str, ...] = ()
+    jurisdiction_id: Tuple[str, ...] = ()
+    court_id: Tuple[str, ...] = ()
+    court_level: Tuple[str, ...] = ()
+    decision_date: Tuple[Optional[str], ...] = ()
+    wrong_type_id: Tuple[Optional[str], ...] = ()
+    predicate_keys: Tuple[Tuple[str, ...], ...] = ()
+    outcome: Tuple[str, ...] = ()
+    judge_id: Tuple[Optional[str], ...] = ()
+    panel_ids: Tuple[Tuple[str, ...], ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.case_id)
+
+    @classmethod
+    def from_observations(cls, rows: Iterable[CaseObservation]) -> "ObservationColumns":
+        normalized = normalize_observations(rows)
+        if not normalized:
+            return cls()
+        return cls(*(tuple(getattr(obs, name) for obs in normalized) for name in _OBSERVATION_FIELDS))
+
+    @classmethod
+    def from_mapping(cls, columns: Mapping[str, Sequence[Any]]) -> "ObservationColumns":
+        """Build from ``{field: values}``; absent optional fields take their defaults."""
+
+        unknown = sorted(set(columns) - set(_OBSERVATION_FIELDS))
+        if unknown:
+            raise ValueError(f"unknown observation columns: {unknown}")
+        missing = [name for name in _OBSERVATION_FIELDS[:4] if name not in columns]
+        if missing:
+            raise ValueError(f"missing observation columns: {missing}")
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("observation columns must have equal lengths")
+        names = [name for name in _OBSERVATION_FIELDS if name in columns]
+        rows = (
+            CaseObservation(**dict(zip(names, values)))
+            for values in zip(*(columns[name] for name in names))
+        )
+        return cls.from_observations(rows)
+
+    def key_column(self, field: str) -> Tuple[str, ...]:
+        """Return the grouping key of every row for ``field`` (``""`` when unset)."""
+
+        if field in {"jurisdiction_id", "court_id", "court_level"}:
+            return getattr(self, field)
+        if field in {"wrong_type_id", "judge_id"}:
+            return tuple(value or "" for value in getattr(self, field))
+        if field == "decision_year":
+            return tuple(d[:4] if d and len(d) >= 4 else "" for d in self.decision_date)
+        return ("",) * len(self)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
 
-from .model import CaseObservation, OutcomeLabel, normalize_observations
+from .model import CaseObservation, ObservationColumns, OutcomeLabel
 from .bayes import beta_binomial_posterior, empirical_bayes_prior, beta_credible_interval
 from .gamma import empirical_bayes_gamma_prior, gamma_credible_interval, gamma_poisson_posterior
 from .logistic import build_sparse_binary_design, fit_ridge_logistic_map
@@ -47,6 +47,58 @@ def _group_key(obs: CaseObservation, group_by: Sequence[str]) -> Tuple[str, ...]
     return tuple(key)
 
 
+# Aggregations accept observation objects, prebuilt columns, or a
+# ``{field: values}`` mapping of columns.
+ObservationInput = Union[Iterable[CaseObservation], ObservationColumns, Mapping[str, Sequence[Any]]]
+
+
+def _as_columns(observations: ObservationInput) -> ObservationColumns:
+    if isinstance(observations, ObservationColumns):
+        return observations
+    if isinstance(observations, Mapping):
+        return ObservationColumns.from_mapping(observations)
+    return ObservationColumns.from_observations(observations)
+
+
+def _group_keys(columns: ObservationColumns, group_by: Sequence[str]) -> List[Tuple[str, ...]]:
+    # Same keys as _group_key, built a column at a time.
+    if not group_by:
+        return [()] * len(columns)
+    return list(zip(*(columns.key_column(f) for f in group_by)))
+
+
+def _grouped_counts(
+    slice_keys: Sequence[Tuple[str, ...]],
+    baseline_keys: Sequence[Tuple[str, ...]],
+    hits: Sequence[bool],
+) -> Tuple[Counter, Counter, Counter, Counter, Dict[Tuple[str, ...], Tuple[str, ...]]]:
+    """Count rows and hits per slice and per baseline key in one pass.
+
+    Each slice maps to the baseline key of its first row, as in row order.
+    """
+    slice_n: Counter = Counter()
+    slice_y: Counter = Counter()
+    base_n: Counter = Counter()
+    base_y: Counter = Counter()
+    slice_to_baseline: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    for sk, bk, hit in zip(slice_keys, baseline_keys, hits):
+        slice_n[sk] += 1
+        base_n[bk] += 1
+        if hit:
+            slice_y[sk] += 1
+            base_y[bk] += 1
+        if sk not in slice_to_baseline:
+            slice_to_baseline[sk] = bk
+    return slice_n, slice_y, base_n, base_y, slice_to_baseline
+
+
+def _column_time_bounds(columns: ObservationColumns) -> Tuple[str | None, str | None]:
+    ds = sorted(str(d) for d in columns.decision_date if d)
+    if not ds:
+        return (None, None)
+    return (ds[0], ds[-1])
+
+
 def _normalize_slice_decl(slice_decl: Dict[str, Any]) -> Dict[str, Any]:
     # Ensure deterministic key ordering + stable list content ordering.
     def norm(x: Any) -> Any:
@@ -89,7 +141,7 @@ def _require_slice_decl(slice_decl: Dict[str, Any] | None, *, group_by: Sequence
 
 
 def aggregate_outcomes(
-    observations: Iterable[CaseObservation],
+    observations: ObservationInput,
     *,
     group_by: Sequence[str] = ("jurisdiction_id", "court_id", "court_level"),
     allow_individuals: bool = False,
@@ -98,7 +150,8 @@ def aggregate_outcomes(
     """
     Deterministic descriptive aggregation of observed outcomes.
 
-    Returns a JSON-friendly dict with stable key ordering.
+    Returns a JSON-friendly dict with stable key ordering. `observations` may
+    also be `ObservationColumns` or a `{field: values}` mapping of columns.
 
     Guardrail: grouping by individual identifiers (e.g. judge_id) is disabled
     by default per `panopticon_refusal.md`.
@@ -112,15 +165,12 @@ def aggregate_outcomes(
 
     slice_decl = _require_slice_decl(slice, group_by=gb)
 
-    rows = normalize_observations(observations)
-    counts: Dict[Tuple[str, ...], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    totals: Dict[Tuple[str, ...], int] = defaultdict(int)
-
-    for obs in rows:
-        k = _group_key(obs, gb)
-        out = OutcomeLabel.canonicalize(obs.outcome)
-        counts[k][out] += 1
-        totals[k] += 1
+    cols = _as_columns(observations)
+    keys = _group_keys(cols, gb)
+    totals = Counter(keys)
+    counts: Dict[Tuple[str, ...], Dict[str, int]] = defaultdict(dict)
+    for (k, out), n in Counter(zip(keys, cols.outcome)).items():
+        counts[k][out] = n
 
     # Stable rendering: keys sorted lexicographically.
     groups_out: List[Dict[str, Any]] = []
@@ -149,21 +199,21 @@ def aggregate_outcomes(
             }
         )
 
-    time_min, time_max = _corpus_time_bounds(rows)
+    time_min, time_max = _column_time_bounds(cols)
     return {
         "contract": "judicial_decision_behavior_v0_1",
         "mode": "descriptive_only",
         "interpretation_guard": _INTERPRETATION_GUARD,
         "allow_individuals": bool(allow_individuals),
         "slice": slice_decl,
-        "corpus": {"n_total": int(len(rows)), "time_min": time_min, "time_max": time_max},
+        "corpus": {"n_total": int(len(cols)), "time_min": time_min, "time_max": time_max},
         "group_by": list(gb),
         "groups": groups_out,
     }
 
 
 def aggregate_beta_binomial(
-    observations: Iterable[CaseObservation],
+    observations: ObservationInput,
     *,
     target_outcome: str = OutcomeLabel.PLAINTIFF,
     group_by: Sequence[str] = ("jurisdiction_id", "court_id", "court_level"),
@@ -191,32 +241,14 @@ def aggregate_beta_binomial(
 
     slice_decl = _require_slice_decl(slice, group_by=gb)
 
-    rows = normalize_observations(observations)
+    cols = _as_columns(observations)
     tgt = OutcomeLabel.canonicalize(target_outcome)
 
-    # Baseline pool counts (y,n) keyed by baseline_by.
-    base_y: Dict[Tuple[str, ...], int] = defaultdict(int)
-    base_n: Dict[Tuple[str, ...], int] = defaultdict(int)
-    for obs in rows:
-        bk = _group_key(obs, bb)
-        base_n[bk] += 1
-        if OutcomeLabel.canonicalize(obs.outcome) == tgt:
-            base_y[bk] += 1
-
-    # Slice counts (y,n) keyed by group_by.
-    slice_y: Dict[Tuple[str, ...], int] = defaultdict(int)
-    slice_n: Dict[Tuple[str, ...], int] = defaultdict(int)
-    # Also record mapping slice->baseline deterministically by projecting the slice key
-    # to the baseline key via the original observation fields.
-    slice_to_baseline: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
-
-    for obs in rows:
-        sk = _group_key(obs, gb)
-        slice_n[sk] += 1
-        if OutcomeLabel.canonicalize(obs.outcome) == tgt:
-            slice_y[sk] += 1
-        if sk not in slice_to_baseline:
-            slice_to_baseline[sk] = _group_key(obs, bb)
+    # Slice counts (y,n) keyed by group_by and baseline pool counts keyed by
+    # baseline_by; each slice is projected to the baseline key of its first row.
+    slice_n, slice_y, base_n, base_y, slice_to_baseline = _grouped_counts(
+        _group_keys(cols, gb), _group_keys(cols, bb), [out == tgt for out in cols.outcome]
+    )
 
     q_lo, q_hi = float(quantiles[0]), float(quantiles[1])
     if not (0.0 < q_lo < q_hi < 1.0):
@@ -255,7 +287,7 @@ def aggregate_beta_binomial(
             }
         )
 
-    time_min, time_max = _corpus_time_bounds(rows)
+    time_min, time_max = _column_time_bounds(cols)
     return {
         "contract": "judicial_decision_behavior_v0_1",
         "mode": "descriptive_only",
@@ -263,7 +295,7 @@ def aggregate_beta_binomial(
         "interpretation_guard": _INTERPRETATION_GUARD,
         "allow_individuals": bool(allow_individuals),
         "slice": slice_decl,
-        "corpus": {"n_total": int(len(rows)), "time_min": time_min, "time_max": time_max},
+        "corpus": {"n_total": int(len(cols)), "time_min": time_min, "time_max": time_max},
         "group_by": list(gb),
         "baseline_by": list(bb),
         "target_outcome": tgt,
@@ -274,7 +306,7 @@ def aggregate_beta_binomial(
 
 
 def aggregate_gamma_poisson(
-    observations: Iterable[CaseObservation],
+    observations: ObservationInput,
     *,
     event_key: str,
     group_by: Sequence[str] = ("jurisdiction_id", "court_id", "court_level"),
@@ -315,26 +347,10 @@ def aggregate_gamma_poisson(
             "groups": [],
         }
 
-    rows = normalize_observations(observations)
-
-    base_y: Dict[Tuple[str, ...], int] = defaultdict(int)
-    base_e: Dict[Tuple[str, ...], int] = defaultdict(int)
-    for obs in rows:
-        bk = _group_key(obs, bb)
-        base_e[bk] += 1
-        if ek in set(obs.predicate_keys or ()):
-            base_y[bk] += 1
-
-    slice_y: Dict[Tuple[str, ...], int] = defaultdict(int)
-    slice_e: Dict[Tuple[str, ...], int] = defaultdict(int)
-    slice_to_baseline: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
-    for obs in rows:
-        sk = _group_key(obs, gb)
-        slice_e[sk] += 1
-        if ek in set(obs.predicate_keys or ()):
-            slice_y[sk] += 1
-        if sk not in slice_to_baseline:
-            slice_to_baseline[sk] = _group_key(obs, bb)
+    cols = _as_columns(observations)
+    slice_e, slice_y, base_e, base_y, slice_to_baseline = _grouped_counts(
+        _group_keys(cols, gb), _group_keys(cols, bb), [ek in keys for keys in cols.predicate_keys]
+    )
 
     q_lo, q_hi = float(quantiles[0]), float(quantiles[1])
     if not (0.0 < q_lo < q_hi < 1.0):
@@ -373,7 +389,7 @@ def aggregate_gamma_poisson(
             }
         )
 
-    time_min, time_max = _corpus_time_bounds(rows)
+    time_min, time_max = _column_time_bounds(cols)
     return {
         "contract": "judicial_decision_behavior_v0_1",
         "mode": "descriptive_only",
@@ -381,7 +397,7 @@ def aggregate_gamma_poisson(
         "interpretation_guard": _INTERPRETATION_GUARD,
         "allow_individuals": bool(allow_individuals),
         "slice": slice_decl,
-        "corpus": {"n_total": int(len(rows)), "time_min": time_min, "time_max": time_max},
+        "corpus": {"n_total": int(len(cols)), "time_min": time_min, "time_max": time_max},
         "group_by": list(gb),
         "baseline_by": list(bb),
         "event_key": ek,
@@ -392,7 +408,7 @@ def aggregate_gamma_poisson(
 
 
 def aggregate_ridge_logistic_map(
-    observations: Iterable[CaseObservation],
+    observations: ObservationInput,
     *,
     target_kind: str = "outcome",  # "outcome" | "predicate"
     target_outcome: str = OutcomeLabel.PLAINTIFF,
@@ -404,11 +420,13 @@ def aggregate_ridge_logistic_map(
     tol: float = 1e-8,
     allow_individuals: bool = False,
     slice: Dict[str, Any] | None = None,
+    backend: str = "python",
 ) -> Dict[str, Any]:
     """
     Descriptive ridge-logistic MAP association fit over predicate_keys.
 
     This is not a prediction surface. Outputs are coefficients + uncertainty proxy only.
+    `backend` is passed to `fit_ridge_logistic_map`.
     """
     gb = tuple(str(x) for x in (group_by or ()))
     if not gb:
@@ -419,7 +437,7 @@ def aggregate_ridge_logistic_map(
 
     slice_decl = _require_slice_decl(slice, group_by=gb)
 
-    rows = normalize_observations(observations)
+    cols = _as_columns(observations)
     kind = str(target_kind or "").strip().lower()
     if kind not in {"outcome", "predicate"}:
         kind = "outcome"
@@ -427,24 +445,24 @@ def aggregate_ridge_logistic_map(
     tgt_out = OutcomeLabel.canonicalize(target_outcome)
     ek = str(event_key or "").strip()
 
-    # Group rows deterministically.
-    by_group: Dict[Tuple[str, ...], List[CaseObservation]] = defaultdict(list)
-    for obs in rows:
-        by_group[_group_key(obs, gb)].append(obs)
+    # Group row indices deterministically.
+    by_group: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    for i, k in enumerate(_group_keys(cols, gb)):
+        by_group[k].append(i)
 
     groups: List[Dict[str, Any]] = []
     for gk in sorted(by_group.keys()):
         g_rows = by_group[gk]
         # Build y and predicate matrices.
+        pred = [cols.predicate_keys[i] for i in g_rows]
         if kind == "predicate":
             if not ek:
                 y = [0 for _ in g_rows]
             else:
-                y = [1 if ek in set(r.predicate_keys or ()) else 0 for r in g_rows]
+                y = [1 if ek in keys else 0 for keys in pred]
         else:
-            y = [1 if OutcomeLabel.canonicalize(r.outcome) == tgt_out else 0 for r in g_rows]
+            y = [1 if cols.outcome[i] == tgt_out else 0 for i in g_rows]
 
-        pred = [tuple(r.predicate_keys or ()) for r in g_rows]
         feat_names, sparse_rows = build_sparse_binary_design(y, pred, max_features=int(max_features))
         beta, se, converged, n_iter = fit_ridge_logistic_map(
             sparse_rows,
@@ -452,6 +470,7 @@ def aggregate_ridge_logistic_map(
             l2=float(l2),
             max_iter=int(max_iter),
             tol=float(tol),
+            backend=backend,
         )
 
         groups.append(
@@ -472,7 +491,7 @@ def aggregate_ridge_logistic_map(
             }
         )
 
-    time_min, time_max = _corpus_time_bounds(rows)
+    time_min, time_max = _column_time_bounds(cols)
     return {
         "contract": "judicial_decision_behavior_v0_1",
         "mode": "descriptive_only",
@@ -480,7 +499,7 @@ def aggregate_ridge_logistic_map(
         "interpretation_guard": _INTERPRETATION_GUARD,
         "allow_individuals": bool(allow_individuals),
         "slice": slice_decl,
-        "corpus": {"n_total": int(len(rows)), "time_min": time_min, "time_max": time_max},
+        "corpus": {"n_total": int(len(cols)), "time_min": time_min, "time_max": time_max},
         "group_by": list(gb),
         "groups": groups,
     }
@@ -0,0 +1,199 @@
+"""Persistent DocBin cache for spaCy parses.
+
+Parsing dominates the compatibility parser, the rule dependency extractor and
+the shared reducer, and the same sentences are parsed again on every run.
+:class:`SpacyParseCache` stores parses in a small SQLite database as
+serialised :class:`~spacy.tokens.DocBin` segments of up to
+``SEGMENT_SIZE`` docs (per-doc DocBins spend most of their time in msgpack
+setup), indexed by the SHA-256 of each text and a fingerprint of the pipeline
+(language, model name and version, spaCy version and component names), so a
+model upgrade or a different component set never sees another pipeline's
+parses.
+
+The cache is opt-in: point ``SENSIBLAW_SPACY_PARSE_CACHE`` at a database file
+to enable it for :func:`default_parse_cache`, or pass an instance explicitly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from src.storage.sqlite_pool import SQLitePool, is_memory_database
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+PARSE_CACHE_ENV = "SENSIBLAW_SPACY_PARSE_CACHE"
+SEGMENT_SIZE = 256
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS spacy_parse_segments (
+        segment_id INTEGER PRIMARY KEY,
+        docbin BLOB NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS spacy_parse_cache (
+        pipeline_key TEXT NOT NULL,
+        text_digest TEXT NOT NULL,
+        segment_id INTEGER NOT NULL REFERENCES spacy_parse_segments(segment_id),
+        position INTEGER NOT NULL,
+        PRIMARY KEY (pipeline_key, text_digest)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def text_digest(text: str) -> str:
+    """Return the cache digest for ``text``."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def pipeline_fingerprint(nlp: "Language") -> str:
+    """Return a key identifying the parses ``nlp`` produces."""
+
+    import spacy
+
+    meta = nlp.meta
+    return "|".join(
+        (
+            f"{meta.get('lang') or nlp.lang}_{meta.get('name') or 'unknown'}",
+            str(meta.get("version") or "unknown"),
+            f"spacy-{spacy.__version__}",
+            ",".join(nlp.pipe_names),
+        )
+    )
+
+
+class SpacyParseCache:
+    """SQLite-backed store of spaCy docs in DocBin segments."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not is_memory_database(path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLitePool(str(path))
+        with self._pool.write() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get_many(
+        self, nlp: "Language", texts: Sequence[str], *, pipeline_key: Optional[str] = None
+    ) -> Dict[str, "Doc"]:
+        """Return cached docs for ``texts`` keyed by text; misses are omitted."""
+
+        from spacy.tokens import DocBin
+
+        key = pipeline_key or pipeline_fingerprint(nlp)
+        by_digest: Dict[str, str] = {text_digest(text): text for text in texts}
+        digests = list(by_digest)
+        wanted: Dict[int, List[tuple[int, str]]] = {}
+        conn = self._pool.connection()
+        for offset in range(0, len(digests), _LOOKUP_CHUNK):
+            chunk = digests[offset : offset + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT text_digest, segment_id, position FROM spacy_parse_cache "
+                f"WHERE pipeline_key = ? AND text_digest IN ({placeholders})",
+                (key, *chunk),
+            ).fetchall()
+            for digest, segment_id, position in rows:
+                wanted.setdefault(int(segment_id), []).append((int(position), by_digest[digest]))
+        found: Dict[str, "Doc"] = {}
+        for segment_id, entries in wanted.items():
+            row = conn.execute(
+                "SELECT docbin FROM spacy_parse_segments WHERE segment_id = ?", (segment_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            docs = list(DocBin().from_bytes(row[0]).get_docs(nlp.vocab))
+            for position, text in entries:
+                if position < len(docs) and docs[position].text == text:
+                    found[text] = docs[position]
+        with self._stats_lock:
+            self.hits += len(found)
+            self.misses += len(by_digest) - len(found)
+        return found
+
+    def put_many(
+        self, nlp: "Language", docs: Iterable["Doc"], *, pipeline_key: Optional[str] = None
+    ) -> int:
+        """Store ``docs`` keyed by their text and return how many were written."""
+
+        from spacy.tokens import DocBin
+
+        key = pipeline_key or pipeline_fingerprint(nlp)
+        pending = list(docs)
+        for offset in range(0, len(pending), SEGMENT_SIZE):
+            segment = pending[offset : offset + SEGMENT_SIZE]
+            docbin = DocBin(store_user_data=False, docs=segment)
+            with self._pool.write() as conn:
+                segment_id = conn.execute(
+                    "INSERT INTO spacy_parse_segments (docbin) VALUES (?)",
+                    (docbin.to_bytes(),),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT OR REPLACE INTO spacy_parse_cache "
+                    "(pipeline_key, text_digest, segment_id, position) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, text_digest(doc.text), segment_id, position)
+                        for position, doc in enumerate(segment)
+                    ],
+                )
+        with self._stats_lock:
+            self.writes += len(pending)
+        return len(pending)
+
+    def stats(self) -> Dict[str, int]:
+        (entries,) = (
+            self._pool.connection().execute("SELECT COUNT(*) FROM spacy_parse_cache").fetchone()
+        )
+        with self._stats_lock:
+            return {
+                "entries": int(entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+            }
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+_DEFAULT_CACHES: Dict[str, SpacyParseCache] = {}
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_parse_cache() -> Optional[SpacyParseCache]:
+    """Return the cache configured by ``SENSIBLAW_SPACY_PARSE_CACHE``, if any."""
+
+    path = os.environ.get(PARSE_CACHE_ENV, "").strip()
+    if not path:
+        return None
+    with _DEFAULT_LOCK:
+        cache = _DEFAULT_CACHES.get(path)
+        if cache is None:
+            cache = _DEFAULT_CACHES[path] = SpacyParseCache(path)
+        return cache
+
+
+__all__ = [
+    "PARSE_CACHE_ENV",
+    "SEGMENT_SIZE",
+    "SpacyParseCache",
+    "default_parse_cache",
+    "pipeline_fingerprint",
+    "text_digest",
+]
@@ -8,7 +8,7 @@ import importlib
 import os
 from threading import Lock
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     from spacy.language import Language
@@ -18,9 +18,17 @@ __all__ = [
     "get_default_nlp",
     "get_streaming_nlp",
     "parse",
+    "parse_many",
+    "pipe_docs",
     "release_default_nlp",
 ]
 
+# Aim for roughly this many characters per ``Language.pipe`` batch.
+_PIPE_TARGET_BATCH_CHARS = 65_536
+_PIPE_MAX_BATCH_SIZE = 1_000
+# Sentinel selecting :func:`src.nlp.parse_cache.default_parse_cache`.
+DEFAULT_PARSE_CACHE: Any = object()
+
 _DEFAULT_NLP: Optional["Language"] = None
 _STREAMING_NLP: Optional["Language"] = None
 _NLP_LOCK = Lock()
@@ -164,15 +172,63 @@ def _serialize_token(token: "Token") -> Dict[str, Any]:
     }
 
 
-def parse(text: str, *, nlp: Optional["Language"] = None) -> Dict[str, Any]:
-    """Compatibility parser; strict execution uses the typed streaming path."""
+def _tuned_batch_size(texts: Sequence[str]) -> int:
+    if not texts:
+        return 1
+    average = max(1, sum(len(text) for text in texts) // len(texts))
+    return max(1, min(_PIPE_MAX_BATCH_SIZE, _PIPE_TARGET_BATCH_CHARS // average))
 
-    if not isinstance(text, str):
-        raise TypeError("text must be a string")
-    pipeline = nlp or get_default_nlp()
-    if nlp is not None:
-        _ensure_sentence_boundaries(pipeline)
-    doc = pipeline(text)
+
+def pipe_docs(
+    texts: Iterable[str],
+    *,
+    nlp: "Language",
+    batch_size: Optional[int] = None,
+    n_process: int = 1,
+    cache: Any = DEFAULT_PARSE_CACHE,
+) -> List["Doc"]:
+    """Parse ``texts`` with ``nlp.pipe`` and return one ``Doc`` per input, in order.
+
+    Identical texts are parsed once.  Texts found in ``cache`` (by default the
+    one configured through ``SENSIBLAW_SPACY_PARSE_CACHE``; ``None`` disables
+    caching) are deserialised instead of parsed, and fresh parses are written
+    back.  ``batch_size`` defaults to a value targeting about 64k characters
+    per batch.  ``n_process`` is passed through to ``Language.pipe``.  Cached
+    docs are shared between callers and must be treated as read-only.
+    """
+
+    items = list(texts)
+    for text in items:
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+    if cache is DEFAULT_PARSE_CACHE:
+        from src.nlp.parse_cache import default_parse_cache
+
+        cache = default_parse_cache()
+    unique = list(dict.fromkeys(items))
+    docs: Dict[str, "Doc"] = {}
+    pipeline_key = None
+    if cache is not None and unique:
+        from src.nlp.parse_cache import pipeline_fingerprint
+
+        pipeline_key = pipeline_fingerprint(nlp)
+        docs.update(cache.get_many(nlp, unique, pipeline_key=pipeline_key))
+    missing = [text for text in unique if text not in docs]
+    if missing:
+        parsed = list(
+            nlp.pipe(
+                missing,
+                batch_size=batch_size or _tuned_batch_size(missing),
+                n_process=n_process,
+            )
+        )
+        docs.update(zip(missing, parsed))
+        if cache is not None:
+            cache.put_many(nlp, parsed, pipeline_key=pipeline_key)
+    return [docs[text] for text in items]
+
+
+def _serialize_doc(doc: "Doc", pipeline: "Language") -> Dict[str, Any]:
     sentences: List[Dict[str, Any]] = []
     for span in _iter_sentences(doc):
         sentences.append(
@@ -198,7 +254,7 @@ def parse(text: str, *, nlp: Optional["Language"] = None) -> Dict[str, Any]:
         "coreference_candidates": False,
     }
     return {
-        "text": text,
+        "text": doc.text,
         "sents": sentences,
         "parser_receipt": {
             "backend_ref": "parser:spacy",
@@ -209,3 +265,35 @@ def parse(text: str, *, nlp: Optional["Language"] = None) -> Dict[str, Any]:
             "authority": "compatibility_parser_observation_only",
         },
     }
+
+
+def parse_many(
+    texts: Iterable[str],
+    *,
+    nlp: Optional["Language"] = None,
+    batch_size: Optional[int] = None,
+    n_process: int = 1,
+    cache: Any = DEFAULT_PARSE_CACHE,
+) -> List[Dict[str, Any]]:
+    """Batched :func:`parse`; see :func:`pipe_docs` for batching and caching."""
+
+    pipeline = nlp or get_default_nlp()
+    if nlp is not None:
+        _ensure_sentence_boundaries(pipeline)
+    docs = pipe_docs(
+        texts, nlp=pipeline, batch_size=batch_size, n_process=n_process, cache=cache
+    )
+    return [_serialize_doc(doc, pipeline) for doc in docs]
+
+
+def parse(
+    text: str,
+    *,
+    nlp: Optional["Language"] = None,
+    cache: Any = DEFAULT_PARSE_CACHE,
+) -> Dict[str, Any]:
+    """Compatibility parser; strict execution uses the typed streaming path."""
+
+    if not isinstance(text, str):
+        raise TypeError("text must be a string")
+    return parse_many([text], nlp=nlp, cache=cache)[0]
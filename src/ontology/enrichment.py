@@ -10,7 +10,7 @@ from urllib.parse import quote
 
 import requests
 
-PROVIDER_NAMES = ("wikidata", "dbpedia")
+from .provider_names import PROVIDER_NAMES
 
 
 @dataclass(frozen=True)
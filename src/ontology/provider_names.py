@@ -0,0 +1,11 @@
+"""Names of the external ontology lookup providers.
+
+Kept free of network dependencies so the CLI can offer them as argument
+choices without importing :mod:`src.ontology.enrichment`.
+"""
+
+from __future__ import annotations
+
+PROVIDER_NAMES = ("wikidata", "dbpedia")
+
+__all__ = ["PROVIDER_NAMES"]
@@ -0,0 +1,242 @@
+"""Durable SQLite lookup cache for :class:`WikimediaMicrobatchRunner`.
+
+:class:`MemoryLookupCache` forgets everything when the process exits, so each
+enrichment run starts cold and spends the per-provider request budget on the
+same QIDs and lemmas again.  :class:`SQLiteLookupCache` implements the same
+interface on a local SQLite database: rows carry an absolute expiry (the
+runner's positive/negative TTL), a demand batch is prefetched with one
+``IN (...)`` query per chunk, and the table is capped at ``max_entries`` by
+dropping expired rows first and then the least recently stored ones.
+
+Point ``SENSIBLAW_WIKIMEDIA_LOOKUP_CACHE`` at a database file to enable it for
+:func:`default_lookup_cache`, or pass an instance to the runner explicitly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Iterable, Sequence
+
+from src.ontology.external_enrichment import ExternalCandidate
+from src.ontology.wikimedia_providers import CACHE_STAT_KEYS, ProviderLookup
+from src.storage.sqlite_pool import SQLitePool, is_memory_database
+
+LOOKUP_CACHE_ENV = "SENSIBLAW_WIKIMEDIA_LOOKUP_CACHE"
+DEFAULT_MAX_ENTRIES = 200_000
+_LOOKUP_CHUNK = 500
+_TUPLE_FIELDS = ("aliases", "type_refs", "evidence_refs")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS wikimedia_lookup_cache (
+        provider_ref TEXT NOT NULL,
+        lookup_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (provider_ref, lookup_key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_wikimedia_lookup_cache_expires "
+    "ON wikimedia_lookup_cache(expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_wikimedia_lookup_cache_stored "
+    "ON wikimedia_lookup_cache(stored_at)",
+)
+
+
+def encode_lookup(lookup: ProviderLookup) -> str:
+    """Serialise ``lookup`` to the JSON stored in the cache."""
+
+    return json.dumps(
+        {
+            "candidates": [asdict(candidate) for candidate in lookup.candidates],
+            "snapshot_refs": list(lookup.snapshot_refs),
+            "request_receipts": [dict(receipt) for receipt in lookup.request_receipts],
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+
+
+def decode_lookup(provider_ref: str, lookup_key: str, payload: str) -> ProviderLookup:
+    """Rebuild the :class:`ProviderLookup` serialised by :func:`encode_lookup`."""
+
+    data = json.loads(payload)
+    candidates = []
+    for row in data.get("candidates", ()):
+        fields: dict[str, Any] = dict(row)
+        for name in _TUPLE_FIELDS:
+            fields[name] = tuple(fields.get(name) or ())
+        candidates.append(ExternalCandidate(**fields))
+    return ProviderLookup(
+        lookup_key=lookup_key,
+        provider_ref=provider_ref,
+        candidates=tuple(candidates),
+        snapshot_refs=tuple(data.get("snapshot_refs", ())),
+        request_receipts=tuple(data.get("request_receipts", ())),
+    )
+
+
+class SQLiteLookupCache:
+    """SQLite-backed :class:`~src.ontology.wikimedia_providers.LookupCache`."""
+
+    def __init__(self, path: str | Path, *, max_entries: int | None = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        if not is_memory_database(path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLitePool(str(path))
+        with self._pool.write() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        self._stats_lock = threading.Lock()
+        self._counters = dict.fromkeys(CACHE_STAT_KEYS, 0)
+
+    def get(self, provider_ref: str, lookup_key: str, *, now: datetime) -> ProviderLookup | None:
+        return self.get_many(provider_ref, (lookup_key,), now=now).get(lookup_key)
+
+    def get_many(
+        self,
+        provider_ref: str,
+        lookup_keys: Sequence[str],
+        *,
+        now: datetime,
+    ) -> dict[str, ProviderLookup]:
+        """Return unexpired lookups for ``lookup_keys``; misses are omitted."""
+
+        keys = list(dict.fromkeys(lookup_keys))
+        cutoff = now.timestamp()
+        found: dict[str, ProviderLookup] = {}
+        expired = 0
+        conn = self._pool.connection()
+        for offset in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[offset : offset + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT lookup_key, payload, expires_at FROM wikimedia_lookup_cache "
+                f"WHERE provider_ref = ? AND lookup_key IN ({placeholders})",
+                (provider_ref, *chunk),
+            ).fetchall()
+            for lookup_key, payload, expires_at in rows:
+                if expires_at <= cutoff:
+                    expired += 1
+                    continue
+                found[lookup_key] = decode_lookup(provider_ref, lookup_key, payload)
+        with self._stats_lock:
+            self._counters["hits"] += len(found)
+            self._counters["expired"] += expired
+            self._counters["misses"] += len(keys) - len(found) - expired
+        return found
+
+    def put(self, lookup: ProviderLookup, *, now: datetime, ttl: timedelta) -> None:
+        self.put_many(((lookup, ttl),), now=now)
+
+    def put_many(
+        self,
+        rows: Iterable[tuple[ProviderLookup, timedelta]],
+        *,
+        now: datetime,
+    ) -> int:
+        """Store ``(lookup, ttl)`` rows in one transaction and enforce the size cap."""
+
+        stored_at = now.timestamp()
+        params = [
+            (
+                lookup.provider_ref,
+                lookup.lookup_key,
+                encode_lookup(lookup),
+                stored_at,
+                (now + ttl).timestamp(),
+            )
+            for lookup, ttl in rows
+        ]
+        if not params:
+            return 0
+        with self._pool.write() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO wikimedia_lookup_cache "
+                "(provider_ref, lookup_key, payload, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+            evicted = self._enforce_cap(conn, cutoff=stored_at)
+        with self._stats_lock:
+            self._counters["writes"] += len(params)
+            self._counters["evictions"] += evicted
+        return len(params)
+
+    def _enforce_cap(self, conn: Any, *, cutoff: float) -> int:
+        if self.max_entries is None:
+            return 0
+        (entries,) = conn.execute("SELECT COUNT(*) FROM wikimedia_lookup_cache").fetchone()
+        if entries <= self.max_entries:
+            return 0
+        evicted = conn.execute(
+            "DELETE FROM wikimedia_lookup_cache WHERE expires_at <= ?", (cutoff,)
+        ).rowcount
+        overflow = entries - evicted - self.max_entries
+        if overflow > 0:
+            evicted += conn.execute(
+                "DELETE FROM wikimedia_lookup_cache WHERE (provider_ref, lookup_key) IN ("
+                "SELECT provider_ref, lookup_key FROM wikimedia_lookup_cache "
+                "ORDER BY stored_at, provider_ref, lookup_key LIMIT ?)",
+                (overflow,),
+            ).rowcount
+        return evicted
+
+    def purge_expired(self, *, now: datetime) -> int:
+        """Delete expired rows and return how many were removed."""
+
+        with self._pool.write() as conn:
+            removed = conn.execute(
+                "DELETE FROM wikimedia_lookup_cache WHERE expires_at <= ?", (now.timestamp(),)
+            ).rowcount
+        with self._stats_lock:
+            self._counters["evictions"] += removed
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        (entries,) = (
+            self._pool.connection()
+            .execute("SELECT COUNT(*) FROM wikimedia_lookup_cache")
+            .fetchone()
+        )
+        with self._stats_lock:
+            return {"entries": int(entries), **self._counters}
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+_DEFAULT_CACHES: dict[str, SQLiteLookupCache] = {}
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_lookup_cache() -> SQLiteLookupCache | None:
+    """Return the cache configured by ``SENSIBLAW_WIKIMEDIA_LOOKUP_CACHE``, if any."""
+
+    path = os.environ.get(LOOKUP_CACHE_ENV, "").strip()
+    if not path:
+        return None
+    with _DEFAULT_LOCK:
+        cache = _DEFAULT_CACHES.get(path)
+        if cache is None:
+            cache = _DEFAULT_CACHES[path] = SQLiteLookupCache(path)
+        return cache
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "LOOKUP_CACHE_ENV",
+    "SQLiteLookupCache",
+    "decode_lookup",
+    "default_lookup_cache",
+    "encode_lookup",
+]
@@ -65,15 +65,54 @@ class CacheEntry:
     expires_at: datetime
 
 
+CACHE_STAT_KEYS = ("hits", "misses", "expired", "writes", "evictions")
+
+
+class LookupCache(Protocol):
+    def get_many(
+        self,
+        provider_ref: str,
+        lookup_keys: Sequence[str],
+        *,
+        now: datetime,
+    ) -> Mapping[str, ProviderLookup]: ...
+
+    def put_many(
+        self,
+        rows: Iterable[tuple[ProviderLookup, timedelta]],
+        *,
+        now: datetime,
+    ) -> int: ...
+
+    def stats(self) -> Mapping[str, int]: ...
+
+
 class MemoryLookupCache:
     def __init__(self) -> None:
         self._rows: dict[tuple[str, str], CacheEntry] = {}
+        self._counters = dict.fromkeys(CACHE_STAT_KEYS, 0)
 
     def get(self, provider_ref: str, lookup_key: str, *, now: datetime) -> ProviderLookup | None:
-        row = self._rows.get((provider_ref, lookup_key))
-        if row is None or row.expires_at <= now:
-            return None
-        return row.lookup
+        return self.get_many(provider_ref, (lookup_key,), now=now).get(lookup_key)
+
+    def get_many(
+        self,
+        provider_ref: str,
+        lookup_keys: Sequence[str],
+        *,
+        now: datetime,
+    ) -> dict[str, ProviderLookup]:
+        found: dict[str, ProviderLookup] = {}
+        for lookup_key in dict.fromkeys(lookup_keys):
+            row = self._rows.get((provider_ref, lookup_key))
+            if row is None:
+                self._counters["misses"] += 1
+            elif row.expires_at <= now:
+                self._counters["expired"] += 1
+            else:
+                self._counters["hits"] += 1
+                found[lookup_key] = row.lookup
+        return found
 
     def put(
         self,
@@ -82,10 +121,26 @@ class MemoryLookupCache:
         now: datetime,
         ttl: timedelta,
     ) -> None:
-        self._rows[(lookup.provider_ref, lookup.lookup_key)] = CacheEntry(
-            lookup=lookup,
-            expires_at=now + ttl,
-        )
+        self.put_many(((lookup, ttl),), now=now)
+
+    def put_many(
+        self,
+        rows: Iterable[tuple[ProviderLookup, timedelta]],
+        *,
+        now: datetime,
+    ) -> int:
+        written = 0
+        for lookup, ttl in rows:
+            self._rows[(lookup.provider_ref, lookup.lookup_key)] = CacheEntry(
+                lookup=lookup,
+                expires_at=now + ttl,
+            )
+            written += 1
+        self._counters["writes"] += written
+        return written
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._rows), **self._counters}
 
 
 def _snapshot_ref(provider_ref: str, payload: Any) -> str:
@@ -495,7 +550,7 @@ class WikimediaMicrobatchRunner:
         self,
         providers: Sequence[LookupProvider],
         *,
-        cache: MemoryLookupCache | None = None,
+        cache: LookupCache | None = None,
         microbatch_size: int = 16,
         request_budget_per_provider: int = 64,
         cache_ttl: timedelta = timedelta(days=30),
@@ -513,6 +568,7 @@ class WikimediaMicrobatchRunner:
         self.negative_cache_ttl = negative_cache_ttl
         self.minimum_batch_interval_seconds = minimum_batch_interval_seconds
         self.sleep = sleep
+        self.last_cache_stats: dict[str, int] = dict.fromkeys(CACHE_STAT_KEYS, 0)
 
     def run(
         self,
@@ -528,15 +584,21 @@ class WikimediaMicrobatchRunner:
         representative = {key: rows[0] for key, rows in grouped}
         lookups: dict[tuple[str, str], ProviderLookup] = {}
         cache_states: dict[tuple[str, str], str] = {}
+        stats_before = self.cache.stats()
         for provider in self.providers:
             applicable = [
                 demand
                 for demand in representative.values()
                 if demand.demand_kind == provider.demand_kind
             ]
+            cached_rows = self.cache.get_many(
+                provider.provider_ref,
+                [demand.lookup_key for demand in applicable],
+                now=active_now,
+            )
             misses: list[ExternalLookupDemand] = []
             for demand in applicable:
-                cached = self.cache.get(provider.provider_ref, demand.lookup_key, now=active_now)
+                cached = cached_rows.get(demand.lookup_key)
                 key = (provider.provider_ref, demand.lookup_key)
                 if cached is not None:
                     lookups[key] = cached
@@ -558,6 +620,7 @@ class WikimediaMicrobatchRunner:
                     if receipt.get("status") in {"completed", "failed"}
                 )
                 remaining_budget = max(remaining_budget - used, 0)
+                fetched: list[tuple[ProviderLookup, timedelta]] = []
                 for demand in batch:
                     lookup = batch_rows.get(
                         demand.lookup_key,
@@ -579,13 +642,19 @@ class WikimediaMicrobatchRunner:
                     key = (provider.provider_ref, demand.lookup_key)
                     lookups[key] = lookup
                     cache_states[key] = "fresh"
-                    self.cache.put(
-                        lookup,
-                        now=active_now,
-                        ttl=(self.cache_ttl if lookup.candidates else self.negative_cache_ttl),
+                    fetched.append(
+                        (lookup, self.cache_ttl if lookup.candidates else self.negative_cache_ttl)
                     )
+                self.cache.put_many(fetched, now=active_now)
                 if self.minimum_batch_interval_seconds > 0 and start + self.microbatch_size < len(misses):
                     self.sleep(self.minimum_batch_interval_seconds)
+        stats_after = self.cache.stats()
+        self.last_cache_stats = {
+            key: int(stats_after.get(key, 0)) - int(stats_before.get(key, 0))
+            for key in CACHE_STAT_KEYS
+        }
+        if "entries" in stats_after:
+            self.last_cache_stats["entries"] = int(stats_after["entries"])
 
         results: list[EnrichmentResult] = []
         for demand in demand_rows:
@@ -622,7 +691,9 @@ class WikimediaMicrobatchRunner:
 
 
 __all__ = [
+    "CACHE_STAT_KEYS",
     "CacheEntry",
+    "LookupCache",
     "LookupProvider",
     "MemoryLookupCache",
     "ProviderLookup",
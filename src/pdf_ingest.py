@@ -7,27 +7,46 @@ import calendar
 import hashlib
 import json
 import logging
+import mmap
+import os
 import re
+import shutil
 import sys
 from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
-from io import BytesIO
+from io import BytesIO, RawIOBase
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+from pdfminer.converter import PDFPageAggregator
 from pdfminer.high_level import extract_pages
-from pdfminer.layout import LTAnno, LTChar, LTTextContainer
+from pdfminer.layout import LAParams, LTAnno, LTChar, LTTextContainer
 from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfparser import PDFParser
-from pdfminer.pdftypes import resolve1
+from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
 from urllib.parse import parse_qs, unquote, urlparse
 
 from src.culture.overlay import get_default_overlay
 from src.glossary.linker import GlossaryLinker
 from src.glossary.service import lookup as lookup_gloss
 from src.ingestion.cache import HTTPCache
+from src.ingestion.pdf_page_cache import PdfPageCache, digest_pdf_file
 from src.ingestion.media_adapter import (
     CanonicalText,
     PdfPageMediaAdapter,
@@ -61,6 +80,10 @@ _CULTURAL_OVERLAY = get_default_overlay()
 # Default SQLite target when callers do not provide one. Kept relative so it
 # stays inside the repo unless explicitly overridden.
 _DEFAULT_DB_PATH = Path("data/corpus/ingest.sqlite")
+# Pages handed to a single worker per task in parallel extraction mode.  Large
+# enough to amortise pdfminer's per-call document parse, small enough that the
+# first pages of a long compilation are yielded promptly.
+_DEFAULT_PAGE_SHARD_SIZE = 16
 
 
 _QUOTE_CHARS = "\"'“”‘’"
@@ -498,43 +521,49 @@ def _clean_page_line(line: str) -> Optional[str]:
 def _extract_pdf_links(data: bytes) -> Dict[int, List[PdfLink]]:
     """Extract hyperlink annotations keyed by page number."""
 
+    with BytesIO(data) as buffer:
+        return _extract_pdf_links_from_stream(buffer)
+
+
+def _extract_pdf_links_from_stream(stream: BinaryIO) -> Dict[int, List[PdfLink]]:
+    """Extract hyperlink annotations keyed by page number from an open PDF stream."""
+
     links: Dict[int, List[PdfLink]] = {}
     try:
-        with BytesIO(data) as buffer:
-            parser = PDFParser(buffer)
-            document = PDFDocument(parser)
-            parser.set_document(document)
-            for page_number, page in enumerate(PDFPage.create_pages(document), start=1):
-                annotations = getattr(page, "annots", None)
-                if not annotations:
+        parser = PDFParser(stream)
+        document = PDFDocument(parser)
+        parser.set_document(document)
+        for page_number, page in enumerate(PDFPage.create_pages(document), start=1):
+            annotations = getattr(page, "annots", None)
+            if not annotations:
+                continue
+            resolved = resolve1(annotations)
+            if not resolved:
+                continue
+            for annotation_ref in resolved:
+                annotation = resolve1(annotation_ref)
+                if not isinstance(annotation, dict):
                     continue
-                resolved = resolve1(annotations)
-                if not resolved:
+                subtype = annotation.get("Subtype")
+                if subtype is not None and str(subtype) != "/Link":
                     continue
-                for annotation_ref in resolved:
-                    annotation = resolve1(annotation_ref)
-                    if not isinstance(annotation, dict):
-                        continue
-                    subtype = annotation.get("Subtype")
-                    if subtype is not None and str(subtype) != "/Link":
-                        continue
-                    rect = resolve1(annotation.get("Rect"))
-                    if not rect or len(rect) != 4:
-                        continue
-                    action = annotation.get("A") or annotation.get("PA")
-                    uri: Optional[str] = None
-                    if action:
-                        resolved_action = resolve1(action)
-                        if isinstance(resolved_action, dict):
-                            uri_obj = resolved_action.get("URI") or resolved_action.get("uri")
-                            if uri_obj:
-                                uri = str(resolve1(uri_obj))
-                    if not uri:
-                        continue
-                    x0, y0, x1, y1 = [float(v) for v in rect]
-                    links.setdefault(page_number, []).append(
-                        PdfLink(page=page_number, rect=(x0, y0, x1, y1), uri=uri)
-                    )
+                rect = resolve1(annotation.get("Rect"))
+                if not rect or len(rect) != 4:
+                    continue
+                action = annotation.get("A") or annotation.get("PA")
+                uri: Optional[str] = None
+                if action:
+                    resolved_action = resolve1(action)
+                    if isinstance(resolved_action, dict):
+                        uri_obj = resolved_action.get("URI") or resolved_action.get("uri")
+                        if uri_obj:
+                            uri = str(resolve1(uri_obj))
+                if not uri:
+                    continue
+                x0, y0, x1, y1 = [float(v) for v in rect]
+                links.setdefault(page_number, []).append(
+                    PdfLink(page=page_number, rect=(x0, y0, x1, y1), uri=uri)
+                )
     except Exception:
         return {}
     return links
@@ -654,45 +683,419 @@ def _collect_layout_text_blocks(layout) -> List[tuple[float, float, str]]:
     return blocks
 
 
-def extract_pdf_text(pdf_path: Path) -> Iterator[dict]:
-    """Yield text and headings from ``pdf_path`` one page at a time."""
+class _MappedPdfFile(RawIOBase):
+    """Read-only, seekable file object over a memory-mapped PDF.
+
+    pdfminer only accepts :class:`io.IOBase` inputs, so this adapter lets the
+    parser read straight from the page cache instead of a private ``bytes``
+    copy of the whole file.
+    """
+
+    def __init__(self, buffer: mmap.mmap) -> None:
+        super().__init__()
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = end
+        return bytes(self._view[start:end])
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def _build_page_record(
+    page_number: int, layout, page_links: Sequence[PdfLink]
+) -> Optional[dict]:
+    """Project one pdfminer page layout onto the extracted-page dict contract."""
+
+    glyphs = _collect_glyphs_from_layout(layout)
+    lines: List[str] = []
+    for _, _, text in _collect_layout_text_blocks(layout):
+        for raw_line in text.splitlines():
+            cleaned_line = _clean_page_line(raw_line)
+            if cleaned_line:
+                lines.append(cleaned_line)
+
+    if not lines:
+        return None
+
+    heading = lines[0]
+    body_lines = lines[1:]
+    body = " ".join(body_lines) if body_lines else ""
+    rendered_links = []
+    for link in page_links:
+        link_text = _extract_link_text(link.rect, glyphs)
+        rendered_links.append(
+            {
+                "uri": link.uri,
+                "rect": link.rect,
+                "text": link_text,
+                "page": link.page,
+            }
+        )
+    return {
+        "page": page_number,
+        "heading": heading,
+        "text": body,
+        "lines": lines,
+        "links": rendered_links,
+    }
+
+
+_FINGERPRINT_SKIP_KEYS = frozenset({"Parent", "P"})
+
+
+def _feed_pdf_object(digest, value, memo: Dict[int, str], active: Set[int]) -> bool:
+    """Feed a canonical serialisation of a PDF object graph into ``digest``.
+
+    Indirect objects are identified by content, not object number, so a page
+    keeps its fingerprint when an unrelated edit renumbers the file.  Back
+    references to parents are skipped to keep each fingerprint page-local.
+    The whole graph is hashed; only objects whose subgraph closed without
+    meeting a cycle are memoised, so a memo entry never depends on the path
+    the object was first reached by.  Returns ``False`` when a cycle was cut.
+    """
+
+    if isinstance(value, PDFObjRef):
+        objid = value.objid
+        if objid in memo:
+            digest.update(b"<ref:" + memo[objid].encode("ascii") + b">")
+            return True
+        if objid in active:
+            digest.update(b"<cycle>")
+            return False
+        active.add(objid)
+        try:
+            child = hashlib.sha256()
+            closed = _feed_pdf_object(child, value.resolve(), memo, active)
+        finally:
+            active.discard(objid)
+        child_hex = child.hexdigest()
+        if closed:
+            memo[objid] = child_hex
+        digest.update(b"<ref:" + child_hex.encode("ascii") + b">")
+        return closed
+    if isinstance(value, PDFStream):
+        closed = _feed_pdf_object(digest, value.attrs, memo, active)
+        raw = value.get_rawdata()
+        if raw is None:
+            raw = value.get_data()
+        digest.update(b"<stream:" + hashlib.sha256(raw or b"").hexdigest().encode("ascii") + b">")
+        return closed
+    if isinstance(value, dict):
+        closed = True
+        digest.update(b"{")
+        for key in sorted(value, key=str):
+            if str(key) in _FINGERPRINT_SKIP_KEYS:
+                continue
+            digest.update(repr(str(key)).encode("utf-8") + b":")
+            closed = _feed_pdf_object(digest, value[key], memo, active) and closed
+            digest.update(b",")
+        digest.update(b"}")
+        return closed
+    if isinstance(value, (list, tuple)):
+        closed = True
+        digest.update(b"[")
+        for item in value:
+            closed = _feed_pdf_object(digest, item, memo, active) and closed
+            digest.update(b",")
+        digest.update(b"]")
+        return closed
+    if isinstance(value, bytes):
+        digest.update(b"b" + repr(value).encode("utf-8"))
+        return True
+    digest.update(repr(value).encode("utf-8"))
+    return True
+
+
+def _pdf_page_fingerprints(stream: BinaryIO) -> List[str]:
+    """Return one content fingerprint per page without running layout analysis."""
+
+    parser = PDFParser(stream)
+    document = PDFDocument(parser)
+    parser.set_document(document)
+    memo: Dict[int, str] = {}
+    fingerprints: List[str] = []
+    for page in PDFPage.create_pages(document):
+        digest = hashlib.sha256()
+        _feed_pdf_object(digest, page.attrs, memo, set())
+        fingerprints.append(digest.hexdigest())
+    return fingerprints
+
+
+def _iter_page_records_serial(
+    stream: BinaryIO,
+    page_numbers: Sequence[int],
+    links_by_page: Mapping[int, Sequence[PdfLink]],
+) -> Iterator[Tuple[int, Optional[dict]]]:
+    """Lay out the given 1-based ``page_numbers`` in order on this process."""
+
+    layouts = extract_pages(stream, page_numbers={number - 1 for number in page_numbers})
+    for page_number, layout in zip(sorted(page_numbers), layouts):
+        yield page_number, _build_page_record(
+            page_number, layout, links_by_page.get(page_number, ())
+        )
+
+
+# Per-process state for shard workers: the open mapping, parsed page tree and
+# layout pipeline of the PDF most recently handed to this worker.
+_SHARD_DOCUMENT: Dict[str, Any] = {}
+
+
+def _close_shard_document() -> None:
+    stream = _SHARD_DOCUMENT.pop("stream", None)
+    mapped = _SHARD_DOCUMENT.pop("mapped", None)
+    handle = _SHARD_DOCUMENT.pop("handle", None)
+    for resource in (stream, mapped, handle):
+        if resource is not None:
+            resource.close()
+    _SHARD_DOCUMENT.clear()
+
+
+def _shard_document(pdf_path: str) -> Dict[str, Any]:
+    """Return this worker's parsed view of ``pdf_path``, parsing it once per process.
+
+    Each worker maps the file independently so shards share the OS page cache
+    rather than pickled copies of the bytes, and later shards reuse the xref,
+    page tree and font cache built for the first one.
+    """
+
+    stat = os.stat(pdf_path)
+    key = (pdf_path, stat.st_mtime_ns, stat.st_size)
+    if _SHARD_DOCUMENT.get("key") != key:
+        _close_shard_document()
+        handle = open(pdf_path, "rb")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        stream = _MappedPdfFile(mapped)
+        _SHARD_DOCUMENT.update(handle=handle, mapped=mapped, stream=stream)
+        parser = PDFParser(stream)
+        document = PDFDocument(parser)
+        parser.set_document(document)
+        resource_manager = PDFResourceManager(caching=True)
+        device = PDFPageAggregator(resource_manager, laparams=LAParams())
+        _SHARD_DOCUMENT.update(
+            key=key,
+            pages=list(PDFPage.create_pages(document)),
+            device=device,
+            interpreter=PDFPageInterpreter(resource_manager, device),
+        )
+    return _SHARD_DOCUMENT
+
+
+def _extract_pdf_shard(
+    pdf_path: str,
+    page_numbers: Sequence[int],
+    links_by_page: Mapping[int, Sequence[PdfLink]],
+) -> List[Tuple[int, Optional[dict]]]:
+    """Lay out the 1-based ``page_numbers`` of ``pdf_path`` in a worker process."""
+
+    shard = _shard_document(pdf_path)
+    device = shard["device"]
+    records: List[Tuple[int, Optional[dict]]] = []
+    for page_number in sorted(page_numbers):
+        # Number layouts by document page, as a serial extract_pages run does.
+        device.pageno = page_number
+        shard["interpreter"].process_page(shard["pages"][page_number - 1])
+        records.append(
+            (
+                page_number,
+                _build_page_record(page_number, device.get_result(), links_by_page.get(page_number, ())),
+            )
+        )
+    return records
+
+
+def _iter_page_records_parallel(
+    pdf_path: Path,
+    workers: int,
+    shard_size: int,
+    page_numbers: Sequence[int],
+    links_by_page: Mapping[int, Sequence[PdfLink]],
+) -> Iterator[Tuple[int, Optional[dict]]]:
+    """Lay out ``page_numbers`` with a process pool, yielding in page order."""
+
+    ordered = sorted(page_numbers)
+    shard_size = max(1, int(shard_size))
+    shards = deque(ordered[start : start + shard_size] for start in range(0, len(ordered), shard_size))
+    pending: deque[Future] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def _submit_next() -> None:
+        shard = shards.popleft()
+        shard_links = {
+            page_number: links_by_page[page_number]
+            for page_number in shard
+            if page_number in links_by_page
+        }
+        pending.append(executor.submit(_extract_pdf_shard, str(pdf_path), shard, shard_links))
+
+    try:
+        # Keep a bounded window of shards in flight so memory stays flat on
+        # very long documents while every worker stays busy.
+        while shards and len(pending) < workers * 2:
+            _submit_next()
+        while pending:
+            records = pending.popleft().result()
+            if shards:
+                _submit_next()
+            yield from records
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pdf_text_parallel(
+    pdf_path: Path, workers: int, shard_size: int
+) -> Iterator[dict]:
+    """Extract every page with a process pool while preserving document order."""
+
+    with pdf_path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, _MappedPdfFile(mapped) as stream:
+        links_by_page = _extract_pdf_links_from_stream(stream)
+    total_pages = _count_pdf_pages(pdf_path)
+    if total_pages is None:
+        logger.warning("Could not count %s pages; extracting serially", pdf_path)
+        yield from extract_pdf_text(pdf_path)
+        return
+    for _, record in _iter_page_records_parallel(
+        pdf_path, workers, shard_size, range(1, total_pages + 1), links_by_page
+    ):
+        if record is not None:
+            yield record
+
+
+def _extract_pdf_text_cached(
+    pdf_path: Path,
+    page_cache: PdfPageCache,
+    workers: Optional[int],
+    shard_size: int,
+) -> Iterator[dict]:
+    """Serve pages from ``page_cache`` and lay out only the pages it lacks."""
+
+    pdf_digest = digest_pdf_file(pdf_path)
+    page_keys = page_cache.load_document(pdf_digest)
+    envelopes: Optional[List[Optional[dict]]] = None
+    if page_keys is not None:
+        envelopes = [page_cache.load_page(key) for key in page_keys]
+        if all(envelope is not None for envelope in envelopes):
+            for envelope in envelopes:
+                if envelope["record"] is not None:
+                    yield envelope["record"]
+            return
+
+    with pdf_path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, _MappedPdfFile(mapped) as stream:
+        if page_keys is None:
+            try:
+                fingerprints = _pdf_page_fingerprints(stream)
+            except Exception:
+                logger.warning("Could not fingerprint %s pages; extracting without cache", pdf_path)
+            else:
+                page_keys = [
+                    page_cache.page_key(fingerprint, page_number)
+                    for page_number, fingerprint in enumerate(fingerprints, start=1)
+                ]
+                envelopes = [page_cache.load_page(key) for key in page_keys]
+        if page_keys is not None and envelopes is not None:
+            missing = [
+                page_number
+                for page_number, envelope in enumerate(envelopes, start=1)
+                if envelope is None
+            ]
+            fresh: Iterator[Tuple[int, Optional[dict]]] = iter(())
+            if missing:
+                links_by_page = _extract_pdf_links_from_stream(stream)
+                if workers is not None and workers > 1:
+                    fresh = _iter_page_records_parallel(
+                        pdf_path, workers, shard_size, missing, links_by_page
+                    )
+                else:
+                    fresh = _iter_page_records_serial(stream, missing, links_by_page)
+            for page_number, (key, envelope) in enumerate(zip(page_keys, envelopes), start=1):
+                if envelope is None:
+                    fresh_number, record = next(fresh)
+                    if fresh_number != page_number:
+                        raise RuntimeError(
+                            f"PDF page extraction out of order: expected {page_number}, got {fresh_number}"
+                        )
+                    page_cache.store_page(key, record)
+                else:
+                    record = envelope["record"]
+                if record is not None:
+                    yield record
+            page_cache.store_document(pdf_digest, page_keys)
+            return
+    yield from extract_pdf_text(pdf_path, workers=workers, shard_size=shard_size)
+
+
+def extract_pdf_text(
+    pdf_path: Path,
+    *,
+    workers: Optional[int] = None,
+    shard_size: int = _DEFAULT_PAGE_SHARD_SIZE,
+    page_cache: Optional[PdfPageCache] = None,
+) -> Iterator[dict]:
+    """Yield text and headings from ``pdf_path`` one page at a time.
+
+    With ``workers`` greater than one, page ranges of ``shard_size`` pages are
+    laid out concurrently by a process pool over a memory-mapped view of the
+    file.  Pages are still yielded in document order with the same dict shape
+    as the serial path.
+
+    When ``page_cache`` is supplied, an unchanged PDF is served entirely from
+    the cache and a modified one only lays out the pages whose PDF objects
+    changed.
+    """
+
+    if page_cache is not None:
+        yield from _extract_pdf_text_cached(pdf_path, page_cache, workers, shard_size)
+        return
+
+    if workers is not None and workers > 1 and pdf_path.stat().st_size > 0:
+        yield from _extract_pdf_text_parallel(pdf_path, workers, shard_size)
+        return
 
     data = pdf_path.read_bytes()
     links_by_page = _extract_pdf_links(data)
     with BytesIO(data) as pdf_file:
         for page_number, layout in enumerate(extract_pages(pdf_file), start=1):
-            glyphs = _collect_glyphs_from_layout(layout)
-            lines: List[str] = []
-            for _, _, text in _collect_layout_text_blocks(layout):
-                for raw_line in text.splitlines():
-                    cleaned_line = _clean_page_line(raw_line)
-                    if cleaned_line:
-                        lines.append(cleaned_line)
-
-            if not lines:
-                continue
-
-            heading = lines[0]
-            body_lines = lines[1:]
-            body = " ".join(body_lines) if body_lines else ""
-            page_links = []
-            for link in links_by_page.get(page_number, []):
-                link_text = _extract_link_text(link.rect, glyphs)
-                page_links.append(
-                    {
-                        "uri": link.uri,
-                        "rect": link.rect,
-                        "text": link_text,
-                        "page": link.page,
-                    }
-                )
-            yield {
-                "page": page_number,
-                "heading": heading,
-                "text": body,
-                "lines": lines,
-                "links": page_links,
-            }
+            record = _build_page_record(page_number, layout, links_by_page.get(page_number, ()))
+            if record is not None:
+                yield record
 
 
 def build_pdf_canonical_text(pages: Sequence[Mapping[str, Any]], source: Path) -> CanonicalText:
@@ -1422,7 +1825,7 @@ def save_json(pages: List[dict], output_path: Path, source: Path) -> None:
 def download_pdf(url: str, cache: HTTPCache, dest: Path) -> Path:
     """Download a PDF using :class:`HTTPCache` and save to ``dest``."""
 
-    dest.write_bytes(cache.fetch(url))
+    shutil.copyfile(cache.fetch_result(url).path, dest)
     return dest
 
 
@@ -3460,12 +3863,15 @@ def iter_process_pdf(
     doc_id: Optional[int] = None,
     context_overlays: Optional[List[dict]] = None,
     break_after_chars: Optional[int] = None,
+    extraction_workers: Optional[int] = None,
+    page_cache: Optional[PdfPageCache] = None,
 ) -> Iterator[Tuple[str, Dict[str, Any]]]:
     """Yield progress updates for :func:`process_pdf` steps.
 
     Each iteration yields a ``(stage, payload)`` tuple describing the work that has
     just completed. Callers can advance the generator manually to "step" through the
-    ingestion pipeline.
+    ingestion pipeline. ``extraction_workers`` and ``page_cache`` are forwarded to
+    :func:`extract_pdf_text`.
     """
 
     if doc_id is not None and db_path is None:
@@ -3485,7 +3891,7 @@ def iter_process_pdf(
         words_seen = 0
         char_count = 0
         breakpoint_triggered = False
-        for page in extract_pdf_text(pdf):
+        for page in extract_pdf_text(pdf, workers=extraction_workers, page_cache=page_cache):
             pages.append(page)
             body_text = str(page.get("text") or "")
             heading_text = str(page.get("heading") or "")
@@ -3619,6 +4025,8 @@ def process_pdf(
     db_path: Optional[Path] = None,
     doc_id: Optional[int] = None,
     context_overlays: Optional[List[dict]] = None,
+    extraction_workers: Optional[int] = None,
+    page_cache: Optional[PdfPageCache] = None,
 ) -> Tuple[Document, Optional[int]]:
     """Extract text, parse sections, run rule extraction and persist."""
 
@@ -3635,6 +4043,8 @@ def process_pdf(
         db_path=db_path,
         doc_id=doc_id,
         context_overlays=context_overlays,
+        extraction_workers=extraction_workers,
+        page_cache=page_cache,
     ):
         if stage == "build":
             result_doc = payload.get("document")
@@ -3690,6 +4100,16 @@ def main() -> None:
         type=Path,
         help="Optional JSON file containing context overlay records to store.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Lay out pages with this many worker processes (default: serial).",
+    )
+    parser.add_argument(
+        "--page-cache",
+        type=Path,
+        help="Directory for the persistent extracted-page cache (default: disabled).",
+    )
     args = parser.parse_args()
 
     context_overlays = None
@@ -3705,6 +4125,8 @@ def main() -> None:
         cultural_flags=args.cultural_flags,
         db_path=args.db_path,
         context_overlays=context_overlays,
+        extraction_workers=args.workers,
+        page_cache=PdfPageCache(args.page_cache) if args.page_cache else None,
     )
     print(doc.to_json())
 
@@ -307,7 +307,7 @@ def match_concepts(text: str) -> List[str]:
     Uses an Aho-Corasick automaton to locate concept triggers and returns
     the matched concept IDs.
     """
-    return [hit.concept_id for hit in MATCHER.match(text)]
+    return [concept_id for concept_id, _start, _end in MATCHER.iter_matches(text)]
 
 
 def build_cloud(concepts: List[str]) -> Dict[str, int]:
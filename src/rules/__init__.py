@@ -7,7 +7,12 @@ from typing import Dict, List, Optional, Tuple
 
 import yaml
 
-from .dependencies import DependencyCandidate, SentenceDependencies, get_dependencies
+from .dependencies import (
+    DependencyCandidate,
+    SentenceDependencies,
+    get_dependencies,
+    get_dependencies_many,
+)
 
 
 @dataclass(frozen=True)
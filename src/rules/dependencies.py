@@ -20,6 +20,7 @@ __all__ = [
     "DependencyCandidate",
     "SentenceDependencies",
     "get_dependencies",
+    "get_dependencies_many",
 ]
 
 
@@ -123,10 +124,7 @@ def _load_pipeline() -> Language:
     )
 
 
-@lru_cache(maxsize=16384)
-def _get_dependencies_cached(text: str) -> tuple[SentenceDependencies, ...]:
-    parser = _load_pipeline()
-    doc = parser(text)
+def _sentence_dependencies(doc: Doc) -> tuple[SentenceDependencies, ...]:
     sentences: List[SentenceDependencies] = []
 
     for sentence in _iterate_sentences(doc):
@@ -141,6 +139,14 @@ def _get_dependencies_cached(text: str) -> tuple[SentenceDependencies, ...]:
     return tuple(sentences)
 
 
+@lru_cache(maxsize=16384)
+def _get_dependencies_cached(text: str) -> tuple[SentenceDependencies, ...]:
+    from src.nlp.spacy_adapter import pipe_docs
+
+    (doc,) = pipe_docs([text], nlp=_load_pipeline())
+    return _sentence_dependencies(doc)
+
+
 def _extract_span(token: Token) -> Span:
     """Return the span covering ``token`` and its modifiers."""
 
@@ -199,3 +205,14 @@ def get_dependencies(text: str) -> List[SentenceDependencies]:
     if not text.strip():
         return []
     return list(_get_dependencies_cached(text))
+
+
+def get_dependencies_many(texts: Sequence[str]) -> List[List[SentenceDependencies]]:
+    """Batched :func:`get_dependencies` parsing all texts in one ``nlp.pipe`` pass."""
+
+    from src.nlp.spacy_adapter import pipe_docs
+
+    pending = [text for text in dict.fromkeys(texts) if text.strip()]
+    docs = pipe_docs(pending, nlp=_load_pipeline()) if pending else []
+    parsed = {text: _sentence_dependencies(doc) for text, doc in zip(pending, docs)}
+    return [list(parsed[text]) if text.strip() else [] for text in texts]
@@ -9,7 +9,7 @@ import hashlib
 import re
 import time
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping
 
 from ._compat import install_src_package_aliases
 
@@ -132,6 +132,7 @@ except ModuleNotFoundError:  # pragma: no cover - cross-product import path
 _YEAR_RE = re.compile(r"^\d{4}$")
 _RELATIONAL_BUNDLE_BATCH_MAX_SENTENCES = 32
 _RELATIONAL_BUNDLE_BATCH_MAX_CHARS = 8192
+_RELATIONAL_BUNDLE_PARSE_CHUNK_BATCHES = 8
 _NEGATION_LEXEMES = {"not", "never", "no"}
 _AUXILIARY_LEXEMES = {
     "am",
@@ -505,10 +506,9 @@ def collect_canonical_relational_bundle(
     words_done = 0
     total_batches = len(sentence_batches)
 
-    for batch_index, batch in enumerate(sentence_batches, start=1):
+    for batch_index, (batch, parsed) in enumerate(_iter_batch_parses(sentence_batches), start=1):
         batch_text = str(batch["text"])
         batch_start_char = int(batch["start_char"])
-        parsed = batch.get("parsed") or _parse_with_spacy_or_fallback(batch_text)
         sent_tokens: list[dict[str, Any]] = []
         for sentence in parsed.get("sents", ()):
             for token in sentence.get("tokens", ()):
@@ -789,6 +789,38 @@ def _parse_with_spacy_or_fallback(text: str) -> dict[str, Any]:
     return parsed
 
 
+def _parse_many_with_spacy_or_fallback(texts: list[str]) -> list[dict[str, Any]]:
+    if not texts:
+        return []
+    try:
+        from src.nlp.spacy_adapter import parse_many as parse_many_with_spacy
+
+        parsed_many = parse_many_with_spacy(texts)
+    except ModuleNotFoundError:
+        return [_fallback_parse(text) for text in texts]
+    return [
+        parsed if _parsed_has_predicate_signal(parsed) else _fallback_parse(text)
+        for text, parsed in zip(texts, parsed_many)
+    ]
+
+
+def _iter_batch_parses(
+    sentence_batches: list[dict[str, Any]],
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Yield ``(batch, parsed)`` pairs, parsing a bounded chunk of batches at a time.
+
+    A batch carrying a non-empty ``parsed`` payload is used as-is; the rest of
+    each chunk goes through one pipelined parse call.
+    """
+
+    for chunk_start in range(0, len(sentence_batches), _RELATIONAL_BUNDLE_PARSE_CHUNK_BATCHES):
+        chunk = sentence_batches[chunk_start : chunk_start + _RELATIONAL_BUNDLE_PARSE_CHUNK_BATCHES]
+        pending = [batch for batch in chunk if not batch.get("parsed")]
+        fresh = iter(_parse_many_with_spacy_or_fallback([str(batch["text"]) for batch in pending]))
+        for batch in chunk:
+            yield batch, batch.get("parsed") or next(fresh)
+
+
 def _parsed_has_predicate_signal(parsed: dict[str, Any]) -> bool:
     for sentence in parsed.get("sents", ()):
         for token in sentence.get("tokens", ()):
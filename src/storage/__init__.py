@@ -1,6 +1,31 @@
-from .versioned_store import VersionedStore
-from .fts import TextIndex
-from .postgres_compiler import PostgresCompilerStore
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .fts import TextIndex
+    from .postgres_compiler import PostgresCompilerStore
+    from .versioned_store import VersionedStore
+
+# The stores pull in very different dependency trees (the Postgres compiler
+# alone imports most of ``src.policy``), so each is imported on first access
+# rather than when the package is imported.
+_EXPORTS = {
+    "PostgresCompilerStore": ".postgres_compiler",
+    "TextIndex": ".fts",
+    "VersionedStore": ".versioned_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Public objects re-exported when ``from src.storage import *`` is used. Having a
 # single ``__all__`` definition avoids accidental overwrites and makes the
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 import sys
 import types
 from dataclasses import dataclass
@@ -10,6 +9,8 @@ from typing import Any, Dict, Optional
 
 from text.similarity import minhash as compute_minhash, simhash as compute_simhash
 
+from .sqlite_pool import DEFAULT_MMAP_SIZE, SQLitePool
+
 
 def _normalise_sys_modules() -> None:
     """Ensure stubbed modules are proper module instances."""
@@ -90,11 +91,17 @@ class Receipt:
 class Storage:
     """SQLite backed storage with simple CRUD helpers."""
 
-    def __init__(self, path: str | Path):
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+        wal: bool = False,
+    ):
         _normalise_sys_modules()
         self.path = str(path)
-        self.conn = sqlite3.connect(self.path)
-        self.conn.row_factory = sqlite3.Row
+        self._pool = SQLitePool(self.path, mmap_size=mmap_size, wal=wal)
+        self.conn = self._pool.proxy()
         self._init_schema()
 
     # ------------------------------------------------------------------
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from src.concepts.cloud import build_cloud
 from src.graph.models import GraphNode, LegalGraph, NodeType
+from src.graph.subgraph_cache import SubgraphCache
+from src.storage.sqlite_pool import DEFAULT_MMAP_SIZE, SQLitePool
+
+DEFAULT_INDEX_BATCH_SIZE = 10_000
+DEFAULT_MERGE_PAGES = 500
+
+IndexRecord = Union[Mapping[str, Any], Sequence[Any]]
+
+
+def _coerce_record(
+    record: IndexRecord,
+) -> Tuple[str, str, str, Optional[Mapping[str, Any]]]:
+    if isinstance(record, Mapping):
+        node_type = record.get("type", record.get("node_type"))
+        if node_type is None:
+            raise ValueError("Index records require a 'type' or 'node_type'")
+        return (
+            str(record["identifier"]),
+            str(node_type),
+            str(record["text"]),
+            record.get("metadata"),
+        )
+    if len(record) not in (3, 4):
+        raise ValueError("Index record tuples must be (identifier, node_type, text[, metadata])")
+    metadata = record[3] if len(record) == 4 else None
+    return str(record[0]), str(record[1]), str(record[2]), metadata
 
 
 class TextIndex:
@@ -15,18 +42,32 @@ class TextIndex:
     items. Each entry records a node identifier, its type and the associated
     text. Queries return typed results along with a minimal subgraph centred on
     the hit node.
+
+    A small ``node_fts_ids`` side table maps identifiers to FTS rowids so that
+    replacing an entry deletes by rowid instead of scanning the FTS table, and
+    so graph nodes can be hydrated one at a time when a search hits them
+    rather than loading the whole table on startup.
     """
 
-    def __init__(self, path: str | Path, graph: Optional[LegalGraph] = None) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        graph: Optional[LegalGraph] = None,
+        *,
+        mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+        wal: bool = False,
+    ) -> None:
         self.path = str(path)
-        self.conn = sqlite3.connect(self.path)
-        self.conn.row_factory = sqlite3.Row
+        self._pool = SQLitePool(self.path, mmap_size=mmap_size, wal=wal)
+        self.conn = self._pool.proxy()
         # ``graph`` allows callers to associate additional relational
         # information with nodes so that minimal subgraphs can be produced on
         # search results. A fresh ``LegalGraph`` is created if none is provided.
         self.graph = graph or LegalGraph()
+        # Hit neighbourhoods are memoised per node and dropped when the graph
+        # around the node changes.
+        self.subgraph_cache = SubgraphCache(self.graph)
         self._init_schema()
-        self._load_graph()
 
     # ------------------------------------------------------------------
     # Schema initialisation
@@ -51,16 +92,61 @@ class TextIndex:
                     "SQLite build does not support FTS5; install the extension or use a compatible SQLite build."
                 ) from exc
             raise
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS node_fts_ids (
+                    identifier TEXT PRIMARY KEY,
+                    fts_rowid INTEGER NOT NULL,
+                    type TEXT NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            # Indexes written before the side table existed are backfilled
+            # once; afterwards every write keeps it in step.
+            if self.conn.execute("SELECT 1 FROM node_fts_ids LIMIT 1").fetchone() is None:
+                self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO node_fts_ids(identifier, fts_rowid, type)
+                    SELECT identifier, rowid, type FROM node_fts ORDER BY rowid
+                    """
+                )
 
-    def _load_graph(self) -> None:
-        cur = self.conn.execute("SELECT identifier, type FROM node_fts")
-        for row in cur.fetchall():
-            try:
-                enum_type = NodeType[row["type"].upper()]
-            except KeyError:
-                enum_type = NodeType.DOCUMENT
-            node = GraphNode(type=enum_type, identifier=row["identifier"])
-            self.graph.add_node(node)
+    @staticmethod
+    def _node_type(node_type: str) -> NodeType:
+        try:
+            return NodeType[node_type.upper()]
+        except KeyError:
+            return NodeType.DOCUMENT
+
+    def hydrate_node(self, identifier: str) -> Optional[GraphNode]:
+        """Return the graph node for ``identifier``, loading it from the index if needed."""
+
+        node = self.graph.get_node(identifier)
+        if node is not None:
+            return node
+        row = self.conn.execute(
+            "SELECT type FROM node_fts_ids WHERE identifier = ?", (identifier,)
+        ).fetchone()
+        if row is None:
+            return None
+        node = GraphNode(type=self._node_type(row["type"]), identifier=identifier)
+        self.graph.add_node(node)
+        return node
+
+    def hydrate_graph(self) -> int:
+        """Eagerly add every indexed node to :attr:`graph`; return how many were added."""
+
+        added = 0
+        cur = self.conn.execute("SELECT identifier, type FROM node_fts_ids")
+        for row in cur:
+            if row["identifier"] in self.graph.nodes:
+                continue
+            self.graph.add_node(
+                GraphNode(type=self._node_type(row["type"]), identifier=row["identifier"])
+            )
+            added += 1
+        return added
 
     # ------------------------------------------------------------------
     # Index management
@@ -85,20 +171,130 @@ class TextIndex:
         """
 
         with self.conn:
-            # Remove any existing entry to keep identifiers unique
-            self.conn.execute("DELETE FROM node_fts WHERE identifier = ?", (identifier,))
-            self.conn.execute(
-                "INSERT INTO node_fts(identifier, type, text) VALUES (?, ?, ?)",
-                (identifier, node_type, text),
-            )
+            self._write_batch([(identifier, node_type, text)])
 
-        try:
-            enum_type = NodeType[node_type.upper()]
-        except KeyError:
-            enum_type = NodeType.DOCUMENT
-        node = GraphNode(type=enum_type, identifier=identifier, metadata=metadata or {})
+        node = GraphNode(
+            type=self._node_type(node_type), identifier=identifier, metadata=metadata or {}
+        )
         self.graph.add_node(node)
 
+    def index_many(
+        self,
+        records: Iterable[IndexRecord],
+        *,
+        batch_size: int = DEFAULT_INDEX_BATCH_SIZE,
+    ) -> int:
+        """Stream ``records`` into the index in large transactions.
+
+        Each record is either a mapping with ``identifier``, ``type`` (or
+        ``node_type``), ``text`` and optional ``metadata`` keys, or an
+        ``(identifier, node_type, text[, metadata])`` tuple. Records are
+        consumed lazily and committed every ``batch_size`` rows; later records
+        replace earlier ones with the same identifier.
+
+        Unlike :meth:`index_node` the graph is only updated for records that
+        carry metadata or whose node is already hydrated, so bulk rebuilds do
+        not materialise millions of nodes. Returns the number of records
+        written.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        written = 0
+        batch: Dict[str, Tuple[str, str, str]] = {}
+        graph_updates: Dict[str, GraphNode] = {}
+        for record in records:
+            identifier, node_type, text, metadata = _coerce_record(record)
+            batch.pop(identifier, None)
+            batch[identifier] = (identifier, node_type, text)
+            if metadata is not None or identifier in self.graph.nodes:
+                graph_updates[identifier] = GraphNode(
+                    type=self._node_type(node_type),
+                    identifier=identifier,
+                    metadata=dict(metadata or {}),
+                )
+            else:
+                graph_updates.pop(identifier, None)
+            if len(batch) >= batch_size:
+                written += self._flush(batch, graph_updates)
+        if batch:
+            written += self._flush(batch, graph_updates)
+        return written
+
+    def _flush(
+        self, batch: Dict[str, Tuple[str, str, str]], graph_updates: Dict[str, GraphNode]
+    ) -> int:
+        with self.conn:
+            self._write_batch(list(batch.values()))
+        for node in graph_updates.values():
+            self.graph.add_node(node)
+        count = len(batch)
+        batch.clear()
+        graph_updates.clear()
+        return count
+
+    def _write_batch(self, rows: List[Tuple[str, str, str]]) -> None:
+        """Replace ``rows`` inside the caller's transaction."""
+
+        # Remove any existing entry to keep identifiers unique; the side table
+        # turns this into rowid deletes instead of full FTS scans.
+        self.conn.executemany(
+            """
+            DELETE FROM node_fts
+            WHERE rowid = (SELECT fts_rowid FROM node_fts_ids WHERE identifier = ?)
+            """,
+            [(row[0],) for row in rows],
+        )
+        last = self.conn.execute(
+            "SELECT rowid FROM node_fts ORDER BY rowid DESC LIMIT 1"
+        ).fetchone()
+        self.conn.executemany(
+            "INSERT INTO node_fts(identifier, type, text) VALUES (?, ?, ?)", rows
+        )
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO node_fts_ids(identifier, fts_rowid, type)
+            SELECT identifier, rowid, type FROM node_fts WHERE rowid > ?
+            """,
+            (last[0] if last is not None else 0,),
+        )
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self) -> Dict[str, Any]:
+        """Rebuild the FTS5 index from its stored content."""
+
+        return self._maintenance("rebuild", "INSERT INTO node_fts(node_fts) VALUES ('rebuild')")
+
+    def optimize(self) -> Dict[str, Any]:
+        """Merge every FTS5 b-tree segment into one."""
+
+        return self._maintenance("optimize", "INSERT INTO node_fts(node_fts) VALUES ('optimize')")
+
+    def merge(self, pages: int = DEFAULT_MERGE_PAGES) -> Dict[str, Any]:
+        """Perform up to ``pages`` pages of incremental segment merging."""
+
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        return self._maintenance(
+            "merge", "INSERT INTO node_fts(node_fts, rank) VALUES ('merge', ?)", (pages,)
+        )
+
+    def _maintenance(self, action: str, sql: str, params: Tuple[Any, ...] = ()) -> Dict[str, Any]:
+        started = time.perf_counter()
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.execute(sql, params)
+            changes = self.conn.total_changes - before
+        rows = self.conn.execute("SELECT COUNT(*) FROM node_fts_ids").fetchone()[0]
+        return {
+            "action": action,
+            "rows": rows,
+            "changes": changes,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+
     # ------------------------------------------------------------------
     # Search API
     # ------------------------------------------------------------------
@@ -139,10 +335,10 @@ class TextIndex:
         for row in rows:
             node_id = row["identifier"]
             node_type = row["type"]
-            # Build a minimal subgraph around the hit node. ``build_cloud``
-            # conveniently returns the node and any directly connected edges
-            # present in ``self.graph``.
-            subgraph = build_cloud([(node_id, {})], self.graph, limit=1)
+            self.hydrate_node(node_id)
+            subgraph = self.subgraph_cache.get_or_build(
+                node_id, 1, False, lambda: self._hit_subgraph(node_id)
+            )
             results.append(
                 {
                     "id": node_id,
@@ -154,8 +350,17 @@ class TextIndex:
             )
         return results
 
+    def _hit_subgraph(self, node_id: str) -> tuple[Dict[str, Any], List[str]]:
+        # Build a minimal subgraph around the hit node. ``build_cloud``
+        # conveniently returns the node and any directly connected edges
+        # present in ``self.graph``.
+        subgraph = build_cloud([(node_id, {})], self.graph, limit=1)
+        return subgraph, [node["id"] for node in subgraph["nodes"]]
+
     def close(self) -> None:
+        # The graph may be shared and outlive this index.
+        self.subgraph_cache.close()
         self.conn.close()
 
 
-__all__ = ["TextIndex"]
+__all__ = ["DEFAULT_INDEX_BATCH_SIZE", "DEFAULT_MERGE_PAGES", "TextIndex"]
@@ -0,0 +1,359 @@
+"""Columnar, memory-mapped exports of lexeme and structural atom occurrences.
+
+``lexeme_occurrences`` and ``structural_atom_occurrences`` can only be read
+row by row through SQLite, so corpus reports used to materialise every
+occurrence as a Python tuple.  :func:`export_occurrence_columns` writes both
+tables as plain NumPy ``.npy`` columns (``lexeme_id``/``atom_id``,
+``start_char``, ``end_char`` and ``flags``) ordered by revision, plus a
+``revisions.npy`` index of ``(doc_id, rev_id, start, stop)`` row ranges and
+the lexeme/atom vocabularies.  :class:`OccurrenceColumns` opens an export with
+``mmap_mode="r"``: per-revision streams are zero-copy slices of the mapped
+columns and frequency, co-occurrence and concordance reports run as vectorised
+NumPy operations.
+
+Fixed-width columns are what make the mapping zero-copy; the varint codecs in
+:mod:`src.storage.postgres.token_codec` remain the compact form for PostgreSQL
+``bytea`` storage.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - exercised implicitly when NumPy is present
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+_FETCH_SIZE = 1 << 16
+# Revisions per ``IN (VALUES ...)`` filter; two bound parameters each keeps a
+# chunk under SQLite's historical 999-parameter limit.
+_REVISION_CHUNK = 250
+
+# Exported tables: directory name, id column, vocabulary table and the
+# vocabulary columns written alongside the occurrence columns.
+_TABLES: Dict[str, Dict[str, Any]] = {
+    "lexeme_occurrences": {
+        "id_column": "lexeme_id",
+        "columns": ("lexeme_id", "start_char", "end_char", "flags"),
+        "vocabulary": "SELECT lexeme_id, norm_text, norm_kind FROM lexemes ORDER BY lexeme_id",
+    },
+    "structural_atom_occurrences": {
+        "id_column": "atom_id",
+        "columns": ("atom_id", "start_char", "end_char"),
+        "vocabulary": (
+            "SELECT atom_id, norm_text, norm_kind FROM structural_atoms ORDER BY atom_id"
+        ),
+    },
+}
+_DTYPES = {
+    "lexeme_id": "<i8",
+    "atom_id": "<i8",
+    "start_char": "<i8",
+    "end_char": "<i8",
+    "flags": "<u4",
+}
+_REVISION_DTYPE = [("doc_id", "<i8"), ("rev_id", "<i8"), ("start", "<i8"), ("stop", "<i8")]
+
+
+def _require_numpy() -> Any:
+    if np is None:
+        raise RuntimeError("NumPy is required for columnar occurrence exports")
+    return np
+
+
+def _connection(source: Any) -> sqlite3.Connection:
+    # VersionedStore exposes a per-thread connection proxy as ``conn``.
+    return getattr(source, "conn", source)
+
+
+def _revision_filters(
+    revisions: Optional[Sequence[Tuple[int, int]]],
+) -> Iterator[Tuple[str, List[int]]]:
+    """Yield ``WHERE`` clauses covering ``revisions`` in ascending key order.
+
+    Each clause binds at most :data:`_REVISION_CHUNK` revisions, and the
+    chunks are contiguous runs of the sorted keys, so concatenating the
+    per-chunk results ordered by ``(doc_id, rev_id)`` keeps the global order.
+    """
+
+    if revisions is None:
+        yield "", []
+        return
+    if not revisions:
+        yield " WHERE 0", []
+        return
+    ordered = sorted(revisions)
+    for offset in range(0, len(ordered), _REVISION_CHUNK):
+        chunk = ordered[offset : offset + _REVISION_CHUNK]
+        values = ", ".join("(?, ?)" for _ in chunk)
+        params = [value for key in chunk for value in key]
+        yield f" WHERE (doc_id, rev_id) IN (VALUES {values})", params
+
+
+def _fetch_chunks(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Sequence[str],
+    filters: Sequence[Tuple[str, List[int]]],
+) -> Iterator[List[Any]]:
+    for where, params in filters:
+        cursor = conn.execute(
+            f"SELECT doc_id, rev_id, {', '.join(columns)} FROM {table}{where} "
+            "ORDER BY doc_id, rev_id, occ_id",
+            params,
+        )
+        while chunk := cursor.fetchmany(_FETCH_SIZE):
+            yield chunk
+
+
+@dataclass(frozen=True)
+class ColumnarExportReport:
+    """Row counts written by :func:`export_occurrence_columns`."""
+
+    path: Path
+    revisions: int
+    rows: Dict[str, int]
+
+
+def export_occurrence_columns(
+    source: Any,
+    out_dir: str | Path,
+    *,
+    revisions: Optional[Iterable[Tuple[int, int]]] = None,
+) -> ColumnarExportReport:
+    """Write occurrence columns for ``source`` to ``out_dir``.
+
+    ``source`` is a :class:`~src.storage.versioned_store.VersionedStore` or
+    its SQLite connection.  ``revisions`` limits the export to the given
+    ``(doc_id, rev_id)`` pairs.  Columns are filled in ``fetchmany`` chunks
+    straight into memory-mapped files, and the manifest is written last so a
+    partial export is never opened.
+    """
+
+    numpy = _require_numpy()
+    conn = _connection(source)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    (out / MANIFEST_NAME).unlink(missing_ok=True)
+    selected = None if revisions is None else list(dict.fromkeys(revisions))
+    filters = list(_revision_filters(selected))
+
+    rows: Dict[str, int] = {}
+    revision_keys: set[Tuple[int, int]] = set()
+    for table, spec in _TABLES.items():
+        table_dir = out / table
+        if table_dir.exists():
+            shutil.rmtree(table_dir)
+        table_dir.mkdir()
+        total = sum(
+            conn.execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()[0]
+            for where, params in filters
+        )
+        columns = spec["columns"]
+        arrays = {
+            name: numpy.lib.format.open_memmap(
+                table_dir / f"{name}.npy", mode="w+", dtype=_DTYPES[name], shape=(total,)
+            )
+            for name in columns
+        }
+        ranges: List[Tuple[int, int, int, int]] = []
+        offset = 0
+        for chunk in _fetch_chunks(conn, table, columns, filters):
+            block = numpy.array([tuple(row) for row in chunk], dtype="<i8")
+            for index, name in enumerate(columns, start=2):
+                arrays[name][offset : offset + len(block)] = block[:, index]
+            keys = block[:, :2]
+            boundaries = numpy.flatnonzero((keys[1:] != keys[:-1]).any(axis=1)) + 1
+            for start, stop in zip(
+                numpy.concatenate(([0], boundaries)),
+                numpy.concatenate((boundaries, [len(block)])),
+            ):
+                doc_id, rev_id = int(keys[start, 0]), int(keys[start, 1])
+                if ranges and ranges[-1][:2] == (doc_id, rev_id):
+                    ranges[-1] = (doc_id, rev_id, ranges[-1][2], offset + int(stop))
+                else:
+                    ranges.append((doc_id, rev_id, offset + int(start), offset + int(stop)))
+            offset += len(block)
+        for array in arrays.values():
+            array.flush()
+        numpy.save(table_dir / "revisions.npy", numpy.array(ranges, dtype=_REVISION_DTYPE))
+        vocabulary = conn.execute(spec["vocabulary"]).fetchall()
+        (table_dir / "vocabulary.json").write_text(
+            json.dumps(
+                {
+                    "id": [row[0] for row in vocabulary],
+                    "norm_text": [row[1] for row in vocabulary],
+                    "norm_kind": [row[2] for row in vocabulary],
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        rows[table] = int(total)
+        revision_keys.update((doc_id, rev_id) for doc_id, rev_id, _, _ in ranges)
+
+    (out / MANIFEST_NAME).write_text(
+        json.dumps({"format_version": FORMAT_VERSION, "rows": rows}, sort_keys=True),
+        encoding="utf-8",
+    )
+    return ColumnarExportReport(path=out, revisions=len(revision_keys), rows=rows)
+
+
+class OccurrenceTable:
+    """Memory-mapped columns of one exported occurrence table."""
+
+    def __init__(self, path: Path, id_column: str, columns: Sequence[str]) -> None:
+        numpy = _require_numpy()
+        self.path = path
+        self.id_column = id_column
+        self.columns = {
+            name: numpy.load(path / f"{name}.npy", mmap_mode="r") for name in columns
+        }
+        self.revisions = numpy.load(path / "revisions.npy")
+        self._revision_index = {
+            (int(doc_id), int(rev_id)): (int(start), int(stop))
+            for doc_id, rev_id, start, stop in self.revisions
+        }
+        vocabulary = json.loads((path / "vocabulary.json").read_text(encoding="utf-8"))
+        self.norm_text: Dict[int, str] = dict(zip(vocabulary["id"], vocabulary["norm_text"]))
+        self.norm_kind: Dict[int, str] = dict(zip(vocabulary["id"], vocabulary["norm_kind"]))
+        self._by_text = {text: ident for ident, text in self.norm_text.items()}
+
+    @property
+    def ids(self) -> Any:
+        return self.columns[self.id_column]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def revision(self, doc_id: int, rev_id: int) -> Dict[str, Any]:
+        """Return zero-copy column slices for one revision (empty when absent)."""
+
+        start, stop = self._revision_index.get((doc_id, rev_id), (0, 0))
+        return {name: column[start:stop] for name, column in self.columns.items()}
+
+    def lookup(self, norm_text: str) -> Optional[int]:
+        return self._by_text.get(norm_text)
+
+    def _ranked(self, counts: Any, top: Optional[int]) -> List[Tuple[str, int]]:
+        """Return non-zero ``counts`` as ``(norm_text, count)``, highest first, ties by id."""
+
+        numpy = _require_numpy()
+        present = numpy.flatnonzero(counts)
+        order = present[numpy.lexsort((present, -counts[present]))]
+        if top is not None:
+            order = order[:top]
+        return [(self.norm_text.get(int(ident), str(ident)), int(counts[ident])) for ident in order]
+
+    def frequencies(self, *, top: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return ``(norm_text, count)`` pairs, most frequent first."""
+
+        numpy = _require_numpy()
+        if not len(self):
+            return []
+        counts = numpy.bincount(self.ids)
+        return self._ranked(counts, top)
+
+    def document_frequencies(self, *, top: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return ``(norm_text, revisions containing it)`` pairs."""
+
+        numpy = _require_numpy()
+        if not len(self):
+            return []
+        revision_of_row = numpy.repeat(
+            numpy.arange(len(self.revisions)),
+            self.revisions["stop"] - self.revisions["start"],
+        )
+        pairs = numpy.unique(numpy.stack((revision_of_row, numpy.asarray(self.ids))), axis=1)
+        counts = numpy.bincount(pairs[1])
+        return self._ranked(counts, top)
+
+    def cooccurrences(
+        self, norm_text: str, *, window: int = 5, top: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """Count entries within ``window`` occurrences of ``norm_text``.
+
+        Windows never cross revision boundaries.
+        """
+
+        numpy = _require_numpy()
+        target = self.lookup(norm_text)
+        if target is None or window <= 0:
+            return []
+        ids = numpy.asarray(self.ids)
+        hits = numpy.flatnonzero(ids == target)
+        if not len(hits):
+            return []
+        stops = self.revisions["stop"]
+        revision = numpy.searchsorted(stops, hits, side="right")
+        lower = self.revisions["start"][revision]
+        upper = stops[revision]
+        offsets = numpy.concatenate((numpy.arange(-window, 0), numpy.arange(1, window + 1)))
+        neighbours = hits[:, None] + offsets[None, :]
+        valid = (neighbours >= lower[:, None]) & (neighbours < upper[:, None])
+        counts = numpy.bincount(ids[neighbours[valid]], minlength=int(ids.max()) + 1)
+        counts[target] = 0
+        return self._ranked(counts, top)
+
+    def concordance(self, norm_text: str, *, limit: Optional[int] = None) -> List[Tuple[int, int, int, int]]:
+        """Return ``(doc_id, rev_id, start_char, end_char)`` for each occurrence."""
+
+        numpy = _require_numpy()
+        target = self.lookup(norm_text)
+        if target is None:
+            return []
+        hits = numpy.flatnonzero(numpy.asarray(self.ids) == target)
+        if limit is not None:
+            hits = hits[:limit]
+        revision = numpy.searchsorted(self.revisions["stop"], hits, side="right")
+        return list(
+            zip(
+                self.revisions["doc_id"][revision].tolist(),
+                self.revisions["rev_id"][revision].tolist(),
+                self.columns["start_char"][hits].tolist(),
+                self.columns["end_char"][hits].tolist(),
+            )
+        )
+
+
+class OccurrenceColumns:
+    """Reader for a directory written by :func:`export_occurrence_columns`."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        manifest_path = self.path / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"no occurrence export at {self.path}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported occurrence export format {manifest.get('format_version')!r}"
+            )
+        self.rows: Dict[str, int] = dict(manifest.get("rows", {}))
+        self.lexemes = OccurrenceTable(
+            self.path / "lexeme_occurrences",
+            _TABLES["lexeme_occurrences"]["id_column"],
+            _TABLES["lexeme_occurrences"]["columns"],
+        )
+        self.structural_atoms = OccurrenceTable(
+            self.path / "structural_atom_occurrences",
+            _TABLES["structural_atom_occurrences"]["id_column"],
+            _TABLES["structural_atom_occurrences"]["columns"],
+        )
+
+
+__all__ = [
+    "ColumnarExportReport",
+    "FORMAT_VERSION",
+    "OccurrenceColumns",
+    "OccurrenceTable",
+    "export_occurrence_columns",
+]
@@ -0,0 +1,111 @@
+"""Bounded LRU of materialised revisions for :class:`VersionedStore`.
+
+Rebuilding a :class:`~src.models.document.Document` from the store runs a
+dozen queries per revision (provisions, TOC, rule atoms, subjects, elements,
+references, lints), and "law as at date X" lookups ask for the same acts and
+dates again and again.  :class:`SnapshotCache` keeps the most recently used
+documents keyed by ``(doc_id, rev_id)``.  A stored revision never changes, so
+entries only need dropping when a document gains a revision, which
+:meth:`VersionedStore.add_revision` does through :meth:`invalidate`.
+
+Cached documents are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from src.models.document import Document
+
+DEFAULT_MAX_ENTRIES = 128
+
+RevisionKey = Tuple[int, int]
+
+
+@dataclass
+class SnapshotCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class SnapshotCache:
+    """Memoise documents per ``(doc_id, rev_id)`` with LRU eviction."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[RevisionKey, Document]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = SnapshotCacheStats()
+
+    def get_many(self, keys: Iterable[RevisionKey]) -> Dict[RevisionKey, "Document"]:
+        """Return cached documents for ``keys``; misses are omitted."""
+
+        found: Dict[RevisionKey, "Document"] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                document = self._entries.get(key)
+                if document is None:
+                    self._stats.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                found[key] = document
+        return found
+
+    def get(self, doc_id: int, rev_id: int) -> Optional["Document"]:
+        return self.get_many(((doc_id, rev_id),)).get((doc_id, rev_id))
+
+    def put_many(self, documents: Mapping[RevisionKey, "Document"]) -> None:
+        with self._lock:
+            for key, document in documents.items():
+                self._entries[key] = document
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, doc_id: Optional[int] = None) -> int:
+        """Drop the entries of ``doc_id`` (or every entry)."""
+
+        with self._lock:
+            if doc_id is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if key[0] == doc_id]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = self._stats.to_dict()
+            payload.update(entries=len(self._entries), max_entries=self.max_entries)
+            lookups = self._stats.hits + self._stats.misses
+            payload["hit_rate"] = round(self._stats.hits / lookups, 4) if lookups else 0.0
+            return payload
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "SnapshotCache",
+    "SnapshotCacheStats",
+]
@@ -0,0 +1,315 @@
+"""Thread-aware SQLite connection pooling for the local stores.
+
+``sqlite3`` connections are bound to the thread that created them and a single
+shared connection serialises every reader behind whichever thread is writing.
+:class:`SQLitePool` instead hands each thread its own connection to the same
+database file and serialises writers in-process behind one lock so concurrent
+write transactions queue instead of failing with ``database is locked``.  WAL
+journaling, which also stops readers waiting for the writer, is opt-in
+because it changes durability for every client of the file.
+
+:class:`PooledConnection` is a drop-in stand-in for ``sqlite3.Connection``:
+attribute access is forwarded to the calling thread's connection.  Any
+statement that writes takes the writer lock and holds it until the thread's
+transaction commits or rolls back, whether it runs inside ``with conn:``, as a
+bare ``conn.execute`` or between an explicit ``BEGIN`` and ``conn.commit()``.
+The stores keep using ``self.conn`` unchanged.  A thread's connection is
+closed when the thread exits.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional
+
+DEFAULT_BUSY_TIMEOUT_MS = 30_000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+
+_READ_KEYWORDS = frozenset({"SELECT", "VALUES", "EXPLAIN"})
+_WRITE_KEYWORD_RE = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+def is_memory_database(path: str | Path) -> bool:
+    text = str(path)
+    return text == ":memory:" or text == "" or text.startswith("file::memory:")
+
+
+def is_write_statement(sql: str) -> bool:
+    """Return whether ``sql`` may write and so needs the writer lock."""
+
+    words = sql.lstrip().split(None, 1)
+    if not words:
+        return False
+    keyword = words[0].upper()
+    if keyword in _READ_KEYWORDS:
+        return False
+    if keyword == "PRAGMA":
+        return "=" in sql
+    if keyword == "WITH":
+        return _WRITE_KEYWORD_RE.search(sql) is not None
+    return True
+
+
+def configure_connection(
+    conn: sqlite3.Connection,
+    *,
+    wal: bool = False,
+    synchronous: Optional[str] = None,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    """Apply the shared concurrency PRAGMAs to ``conn`` and return it.
+
+    Journal mode and ``synchronous`` are left at SQLite's defaults unless
+    ``wal`` or ``synchronous`` ask otherwise.
+    """
+
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    if mmap_size is not None:
+        conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+    if readonly:
+        return conn
+    try:
+        if wal:
+            conn.execute("PRAGMA journal_mode=WAL")
+        if synchronous is not None:
+            conn.execute(f"PRAGMA synchronous={synchronous}")
+    except sqlite3.OperationalError:
+        # Another connection holds the database mid-transaction; keep the
+        # existing journal mode rather than failing the open.
+        pass
+    return conn
+
+
+class _ThreadConnection:
+    """Thread-local holder whose collection closes the thread's connection."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _close_thread_connection(pool_ref: "weakref.ref[SQLitePool]", conn: sqlite3.Connection) -> None:
+    pool = pool_ref()
+    if pool is not None:
+        pool._forget(conn)
+    conn.close()
+
+
+class SQLitePool:
+    """Per-thread SQLite connections with a single serialised writer."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        wal: bool = False,
+        synchronous: Optional[str] = None,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+        row_factory: Optional[Callable[..., Any]] = sqlite3.Row,
+    ) -> None:
+        self.path = str(path)
+        self.wal = wal
+        self.synchronous = synchronous
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.row_factory = row_factory
+        self.write_lock = threading.RLock()
+        self._local = threading.local()
+        # Per-thread flag: the thread's open transaction owns one hold on
+        # ``write_lock`` until it commits or rolls back.
+        self._writer = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._registry_lock = threading.Lock()
+        self._closed = False
+        # Private in-memory databases exist per connection, so every thread
+        # must share the one connection to see the same data.
+        self._shared: Optional[_ThreadConnection] = None
+        if is_memory_database(self.path):
+            self._shared = _ThreadConnection(self._open())
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        conn.row_factory = self.row_factory
+        configure_connection(
+            conn,
+            wal=self.wal and not is_memory_database(self.path),
+            synchronous=self.synchronous,
+            busy_timeout_ms=self.busy_timeout_ms,
+            mmap_size=self.mmap_size,
+        )
+        with self._registry_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _forget(self, conn: sqlite3.Connection) -> None:
+        with self._registry_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+
+    def _thread_connection(self) -> _ThreadConnection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        if self._shared is not None:
+            return self._shared
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnection(self._open())
+            # The thread-local slot is cleared when the thread exits, which
+            # collects the holder and closes the connection it owns.
+            weakref.finalize(holder, _close_thread_connection, weakref.ref(self), holder.conn)
+            self._local.holder = holder
+        return holder
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+
+        return self._thread_connection().conn
+
+    def set_row_factory(self, row_factory: Optional[Callable[..., Any]]) -> None:
+        self.row_factory = row_factory
+        with self._registry_lock:
+            for conn in self._connections:
+                conn.row_factory = row_factory
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Run one write transaction on this thread's connection under the writer lock."""
+
+        with self.write_lock:
+            conn = self.connection()
+            with conn:
+                yield conn
+
+    def proxy(self) -> "PooledConnection":
+        return PooledConnection(self)
+
+    def close(self) -> None:
+        with self._registry_lock:
+            connections, self._connections = self._connections, []
+            self._closed = True
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        self._writer = threading.local()
+        self._shared = None
+
+
+class PooledConnection:
+    """``sqlite3.Connection`` look-alike routing each thread to its own connection."""
+
+    def __init__(self, pool: SQLitePool) -> None:
+        object.__setattr__(self, "pool", pool)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool.connection(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "row_factory":
+            self.pool.set_row_factory(value)
+            return
+        setattr(self.pool.connection(), name, value)
+
+    def _hold_writer(self) -> None:
+        writer = self.pool._writer
+        if not getattr(writer, "held", False):
+            self.pool.write_lock.acquire()
+            writer.held = True
+
+    def _settle_writer(self) -> None:
+        writer = self.pool._writer
+        if not getattr(writer, "held", False):
+            return
+        if not self.pool._closed and self.pool.connection().in_transaction:
+            return
+        writer.held = False
+        self.pool.write_lock.release()
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        if not is_write_statement(sql):
+            return self.pool.connection().execute(sql, parameters)
+        self._hold_writer()
+        try:
+            return self.pool.connection().execute(sql, parameters)
+        finally:
+            self._settle_writer()
+
+    def executemany(self, sql: str, parameters: Any, /) -> sqlite3.Cursor:
+        self._hold_writer()
+        try:
+            return self.pool.connection().executemany(sql, parameters)
+        finally:
+            self._settle_writer()
+
+    def executescript(self, script: str, /) -> sqlite3.Cursor:
+        self._hold_writer()
+        try:
+            return self.pool.connection().executescript(script)
+        finally:
+            self._settle_writer()
+
+    def commit(self) -> None:
+        try:
+            self.pool.connection().commit()
+        finally:
+            self._settle_writer()
+
+    def rollback(self) -> None:
+        try:
+            self.pool.connection().rollback()
+        finally:
+            self._settle_writer()
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.pool.write_lock.acquire()
+        try:
+            return self.pool.connection().__enter__()
+        except BaseException:
+            self.pool.write_lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            return bool(self.pool.connection().__exit__(exc_type, exc, tb))
+        finally:
+            self.pool.write_lock.release()
+            self._settle_writer()
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def open_pooled_connection(
+    path: str | Path,
+    *,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+) -> PooledConnection:
+    """Open a pooled connection for a store at ``path``."""
+
+    return SQLitePool(path, busy_timeout_ms=busy_timeout_ms, mmap_size=mmap_size).proxy()
+
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_MS",
+    "DEFAULT_MMAP_SIZE",
+    "PooledConnection",
+    "SQLitePool",
+    "configure_connection",
+    "is_memory_database",
+    "is_write_statement",
+    "open_pooled_connection",
+]
@@ -3,7 +3,9 @@ from __future__ import annotations
 import os
 import sqlite3
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
+
+from .sqlite_pool import DEFAULT_BUSY_TIMEOUT_MS, DEFAULT_MMAP_SIZE, configure_connection
 
 
 def resolve_sqlite_db_path(
@@ -30,6 +32,9 @@ def connect_sqlite(
     *,
     readonly: bool = False,
     immutable: bool = False,
+    wal: bool = False,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
 ) -> sqlite3.Connection:
     resolved = Path(db_path).expanduser().resolve()
     if readonly:
@@ -40,4 +45,10 @@ def connect_sqlite(
     else:
         conn = sqlite3.connect(str(resolved))
     conn.row_factory = sqlite3.Row
-    return conn
+    return configure_connection(
+        conn,
+        wal=wal,
+        busy_timeout_ms=busy_timeout_ms,
+        mmap_size=mmap_size,
+        readonly=readonly,
+    )
@@ -6,11 +6,14 @@ import difflib
 from collections import defaultdict
 import hashlib
 import re
+import time
+import threading
 from textwrap import dedent
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from src.models.document import Document, DocumentMetadata, DocumentTOCEntry
 from src.models.provision import (
@@ -28,13 +31,104 @@ from src.models.span_role_hypothesis import SpanRoleHypothesis
 from src.models.span_signal_hypothesis import SpanSignalHypothesis
 from src.text.lexeme_index import LexemeOccurrence, collect_lexeme_occurrences_with_profile
 
+from .snapshot_cache import SnapshotCache
+from .sqlite_pool import DEFAULT_MMAP_SIZE, SQLitePool
+
 
 class PayloadTooLargeError(ValueError):
     """Raised when a payload exceeds the configured storage limits."""
 
 
+# Tables whose row growth is reported by :meth:`VersionedStore.bulk_load`.
+_BULK_REPORTED_TABLES = (
+    "revisions",
+    "toc",
+    "provisions",
+    "provision_text_fts",
+    "lexemes",
+    "lexeme_occurrences",
+    "structural_atoms",
+    "structural_atom_occurrences",
+    "rule_atoms",
+    "rule_elements",
+    "rule_atom_text_fts",
+)
+# Append-only occurrence tables whose non-unique secondary indexes are dropped
+# for the duration of a bulk load and rebuilt once at the end.
+_BULK_DEFERRED_INDEX_TABLES = (
+    "lexeme_occurrences",
+    "structural_atom_occurrences",
+    "phrase_occurrences",
+)
+_BULK_FTS_TABLES = ("provision_text_fts", "rule_atom_text_fts")
+# Indexes dropped by an active bulk load, so a reopen after a crash can put
+# them back.
+_BULK_DEFERRED_INDEX_LOG = "bulk_load_deferred_indexes"
+_FTS5_DEFAULT_AUTOMERGE = 4
+# Payload and revision lookups are chunked to stay under SQLite's
+# bound-parameter limit.
+_DELTA_LOOKUP_CHUNK = 500
+_REVISION_LOOKUP_CHUNK = 250
+
+
+@dataclass
+class BulkLoadReport:
+    """Throughput summary for a :meth:`VersionedStore.bulk_load` session."""
+
+    batch_size: int
+    revisions: int = 0
+    commits: int = 0
+    elapsed_seconds: float = 0.0
+    finalize_seconds: float = 0.0
+    rows: dict[str, int] = field(default_factory=dict)
+
+    def rows_per_second(self) -> dict[str, float]:
+        if self.elapsed_seconds <= 0:
+            return {table: 0.0 for table in self.rows}
+        return {
+            table: count / self.elapsed_seconds for table, count in self.rows.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "revisions": self.revisions,
+            "batch_size": self.batch_size,
+            "commits": self.commits,
+            "elapsed_seconds": self.elapsed_seconds,
+            "finalize_seconds": self.finalize_seconds,
+            "rows": dict(self.rows),
+            "rows_per_second": self.rows_per_second(),
+        }
+
+
+@dataclass(frozen=True)
+class ProvisionChange:
+    """One provision-level change between two revisions of a document.
+
+    ``change`` is ``"added"``, ``"removed"``, ``"modified"`` (content hash
+    differs) or ``"moved"`` (same content under a new parent or position).
+    """
+
+    provision_key: str
+    change: str
+    old_hash: Optional[str] = None
+    new_hash: Optional[str] = None
+
+
 class VersionedStore:
-    """SQLite-backed store maintaining versioned documents using FTS5."""
+    """SQLite-backed store maintaining versioned documents using FTS5.
+
+    With ``delta_provisions=True`` new revisions store their provision tree as
+    a structural delta: each provision node is kept once in
+    ``provision_payloads`` under a hash of its content, and a revision records
+    only the nodes whose hash, parent or position changed since the previous
+    revision, plus a full manifest every ``keyframe_interval`` revisions.
+    :meth:`snapshot` rebuilds such revisions from the nearest keyframe and the
+    provision-level change set of every revision is precomputed for
+    :meth:`provision_changes` and :meth:`diff_provisions`.  The ``toc`` table
+    keeps one row per stable id and document, so only the first revision of a
+    delta chain populates the relational provision, rule and FTS tables.
+    """
 
     def __init__(
         self,
@@ -43,16 +137,38 @@ class VersionedStore:
         max_body_size: int | None = None,
         max_metadata_size: int | None = None,
         max_document_size: int | None = None,
+        mmap_size: int | None = DEFAULT_MMAP_SIZE,
+        delta_provisions: bool = False,
+        keyframe_interval: int = 16,
+        snapshot_cache_size: int = 0,
+        wal: bool = False,
     ):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
         self.path = str(path)
-        self.conn = sqlite3.connect(self.path)
-        self.conn.row_factory = sqlite3.Row
+        # Each thread gets its own connection; write transactions are
+        # serialised through the pool's writer lock.  ``wal`` opts the file
+        # into WAL journaling so readers do not wait for the writer.
+        self._pool = SQLitePool(self.path, mmap_size=mmap_size, wal=wal)
+        self.conn = self._pool.proxy()
         self._max_body_size = max_body_size
         self._max_metadata_size = max_metadata_size
         self._max_document_size = max_document_size
+        self._bulk: Optional[BulkLoadReport] = None
+        self._bulk_thread: Optional[int] = None
+        self.delta_provisions = delta_provisions
+        self.keyframe_interval = keyframe_interval
+        # Opt-in LRU of materialised revisions for ``snapshot``/``snapshots``.
+        # Cached documents are shared between callers, so it stays off unless
+        # the caller promises to treat snapshots as read-only.
+        self._snapshot_cache = (
+            SnapshotCache(snapshot_cache_size) if snapshot_cache_size > 0 else None
+        )
         self._init_schema()
         self._ensure_toc_page_number_column()
         self._ensure_revisions_effective_index()
+        self._ensure_delta_tables()
+        self._recover_bulk_load()
 
     # ------------------------------------------------------------------
     # Payload validation helpers
@@ -578,6 +694,65 @@ class VersionedStore:
         self._backfill_glossary_ids()
         self._backfill_text_indexes()
 
+    def _ensure_delta_tables(self) -> None:
+        with self.conn:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS provision_payloads (
+                    payload_hash TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS revision_deltas (
+                    doc_id INTEGER NOT NULL,
+                    rev_id INTEGER NOT NULL,
+                    keyframe INTEGER NOT NULL,
+                    delta TEXT NOT NULL,
+                    PRIMARY KEY (doc_id, rev_id),
+                    FOREIGN KEY (doc_id, rev_id) REFERENCES revisions(doc_id, rev_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS revision_changes (
+                    doc_id INTEGER NOT NULL,
+                    rev_id INTEGER NOT NULL,
+                    from_rev_id INTEGER,
+                    provision_key TEXT NOT NULL,
+                    change TEXT NOT NULL,
+                    old_hash TEXT,
+                    new_hash TEXT,
+                    PRIMARY KEY (doc_id, rev_id, provision_key)
+                ) WITHOUT ROWID;
+                """
+            )
+
+    def _recover_bulk_load(self) -> None:
+        """Rebuild indexes left dropped by a bulk load that never finished."""
+
+        with self.conn:
+            self.conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {_BULK_DEFERRED_INDEX_LOG} (
+                    name TEXT PRIMARY KEY,
+                    sql TEXT NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            pending = self.conn.execute(
+                f"SELECT name, sql FROM {_BULK_DEFERRED_INDEX_LOG} ORDER BY name"
+            ).fetchall()
+            if not pending:
+                return
+            for row in pending:
+                if self._object_type(row["name"]) is None:
+                    self.conn.execute(row["sql"])
+            for table in _BULK_FTS_TABLES:
+                if self._object_type(table):
+                    self.conn.execute(
+                        f"INSERT INTO {table}({table}, rank) VALUES ('automerge', ?)",
+                        (_FTS5_DEFAULT_AUTOMERGE,),
+                    )
+            self.conn.execute(f"DELETE FROM {_BULK_DEFERRED_INDEX_LOG}")
+
     def _ensure_toc_page_number_column(self) -> None:
         cur = self.conn.execute("PRAGMA table_info(toc)")
         existing = {row["name"] for row in cur.fetchall()}
@@ -1849,6 +2024,159 @@ class VersionedStore:
                     rule_update_values,
                 )
 
+    # Bulk loading
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        """Commit per call normally; inside :meth:`bulk_load`, join the open batch.
+
+        Bulk writes run under a savepoint so a failing revision is rolled back
+        on its own without discarding the rest of the uncommitted batch.
+        """
+
+        if self._bulk is None or self._bulk_thread != threading.get_ident():
+            # Writers on other threads queue behind the bulk load's lock.
+            with self.conn:
+                yield
+            return
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT versioned_store_write")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK TO versioned_store_write")
+            self.conn.execute("RELEASE versioned_store_write")
+            raise
+        self.conn.execute("RELEASE versioned_store_write")
+
+    def _count_rows(self, tables: Iterable[str]) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for table in tables:
+            if self._object_type(table) is None:
+                continue
+            counts[table] = self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return counts
+
+    @contextmanager
+    def bulk_load(
+        self,
+        *,
+        batch_size: int = 250,
+        cache_size_kib: int = 262_144,
+    ) -> Iterator[BulkLoadReport]:
+        """Batch many :meth:`add_revision` calls into large transactions.
+
+        While active, revisions are committed every ``batch_size`` calls, the
+        connection runs with WAL journaling, ``synchronous=NORMAL`` and a
+        ``cache_size_kib`` page cache, FTS5 automerge is paused and the
+        secondary indexes of the occurrence tables are dropped.  The dropped
+        index definitions are recorded in the database, so reopening the
+        store after a crash rebuilds them.  On exit the indexes are rebuilt,
+        the journal mode and pragmas are restored, the FTS tables are
+        optimised and the yielded
+        :class:`BulkLoadReport` is filled in with per-table row counts and
+        throughput.  Revisions added during a bulk load must be new; stale
+        rows for their ``rev_id`` are not cleared first.  If the block raises,
+        only the uncommitted batch is rolled back.
+        """
+
+        if self._bulk is not None:
+            raise RuntimeError("bulk_load is already active on this store")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        # Hold the pool writer lock for the whole load so other threads queue
+        # behind the batch instead of interleaving with it.
+        with self._pool.write_lock:
+            self.conn.commit()
+            previous_synchronous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+            previous_cache_size = self.conn.execute("PRAGMA cache_size").fetchone()[0]
+            previous_journal_mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(f"PRAGMA cache_size=-{int(cache_size_kib)}")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+
+            report = BulkLoadReport(batch_size=batch_size)
+            started = time.perf_counter()
+            rows_before = self._count_rows(_BULK_REPORTED_TABLES)
+            placeholders = ",".join("?" for _ in _BULK_DEFERRED_INDEX_TABLES)
+            deferred_indexes = [
+                (row["name"], row["sql"])
+                for row in self.conn.execute(
+                    f"""
+                    SELECT name, sql FROM sqlite_master
+                    WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+                    """,
+                    _BULK_DEFERRED_INDEX_TABLES,
+                )
+                if not row["sql"].lstrip().upper().startswith("CREATE UNIQUE")
+            ]
+            fts_tables = [table for table in _BULK_FTS_TABLES if self._object_type(table)]
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {_BULK_DEFERRED_INDEX_LOG}(name, sql) VALUES (?, ?)",
+                    deferred_indexes,
+                )
+                for name, _ in deferred_indexes:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+                for table in fts_tables:
+                    self.conn.execute(
+                        f"INSERT INTO {table}({table}, rank) VALUES ('automerge', 0)"
+                    )
+
+            self._bulk = report
+            self._bulk_thread = threading.get_ident()
+            succeeded = False
+            try:
+                yield report
+                succeeded = True
+            finally:
+                self._bulk = None
+                self._bulk_thread = None
+                if succeeded:
+                    self.conn.commit()
+                    report.commits += 1
+                else:
+                    self.conn.rollback()
+                finalize_started = time.perf_counter()
+                with self.conn:
+                    for name, sql in deferred_indexes:
+                        # Another store opened on this file may already have
+                        # recovered it.
+                        if self._object_type(name) is None:
+                            self.conn.execute(sql)
+                    self.conn.execute(f"DELETE FROM {_BULK_DEFERRED_INDEX_LOG}")
+                    for table in fts_tables:
+                        self.conn.execute(
+                            f"INSERT INTO {table}({table}, rank) VALUES ('automerge', ?)",
+                            (_FTS5_DEFAULT_AUTOMERGE,),
+                        )
+                        self.conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+                self.conn.execute(f"PRAGMA synchronous={int(previous_synchronous)}")
+                self.conn.execute(f"PRAGMA cache_size={int(previous_cache_size)}")
+                # journal_mode is persistent; leave the file as we found it.
+                if previous_journal_mode != "wal":
+                    self.conn.execute(f"PRAGMA journal_mode={previous_journal_mode}")
+                finished = time.perf_counter()
+                report.finalize_seconds = finished - finalize_started
+                report.elapsed_seconds = finished - started
+                rows_after = self._count_rows(_BULK_REPORTED_TABLES)
+                report.rows = {
+                    table: rows_after[table] - rows_before.get(table, 0) for table in rows_after
+                }
+
+    def _note_bulk_revision(self) -> None:
+        bulk = self._bulk
+        if bulk is None:
+            return
+        bulk.revisions += 1
+        if bulk.revisions % bulk.batch_size == 0:
+            self.conn.commit()
+            bulk.commits += 1
+
+    # ------------------------------------------------------------------
     # ID generation and revision storage
     # ------------------------------------------------------------------
     def generate_id(self) -> int:
@@ -1903,7 +2231,7 @@ class VersionedStore:
             metadata_json=metadata_json,
             document_json=document_json,
         )
-        with self.conn:
+        with self._write_transaction():
             cur = self.conn.execute(
                 "SELECT COALESCE(MAX(rev_id), 0) + 1 FROM revisions WHERE doc_id = ?",
                 (doc_id,),
@@ -1929,10 +2257,22 @@ class VersionedStore:
                     document.metadata.licence,
                 ),
             )
-            self._store_provisions(
-                doc_id, rev_id, document.provisions, toc_entries, document.metadata
-            )
+            chain_start = True
+            if self.delta_provisions:
+                # Hash the caller's provisions before ``_store_provisions``
+                # normalises their rule atoms in place.
+                chain_start = not self._has_delta(doc_id, rev_id - 1)
+                self._store_provision_delta(
+                    doc_id, rev_id, document.provisions, toc_entries
+                )
+            if chain_start:
+                self._store_provisions(
+                    doc_id, rev_id, document.provisions, toc_entries, document.metadata
+                )
             self._store_lexeme_occurrences(doc_id, rev_id, occurrences)
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.invalidate(doc_id)
+        self._note_bulk_revision()
         return rev_id
 
     # ------------------------------------------------------------------
@@ -2185,24 +2525,102 @@ class VersionedStore:
             doc_id: Document identifier.
             as_at: Date for which the snapshot should be taken.
         """
-        row = self.conn.execute(
-            """
-            SELECT rev_id, metadata, body
-            FROM revisions
-            WHERE doc_id = ? AND effective_date <= ?
-            ORDER BY effective_date DESC
-            LIMIT 1
-            """,
-            (doc_id, as_at.isoformat()),
-        ).fetchone()
-        if row is None:
-            return None
-        return self._load_document(
-            doc_id,
-            row["rev_id"],
-            row["metadata"],
-            row["body"],
+        return self.snapshots([(doc_id, as_at)])[0]
+
+    def snapshots(
+        self, requests: Iterable[Tuple[int, date]]
+    ) -> List[Optional[Document]]:
+        """Return the document state for many ``(doc_id, as_at)`` pairs.
+
+        Effective revisions are resolved and uncached revisions are loaded
+        with one query per table for the whole batch rather than per
+        document.  Results follow the order of ``requests`` and are ``None``
+        where a document has no revision in effect on that date.  Documents
+        come from the snapshot cache when enabled and must be treated as
+        read-only.
+        """
+
+        requests = list(requests)
+        pairs = list(dict.fromkeys((doc_id, as_at.isoformat()) for doc_id, as_at in requests))
+        effective: dict[Tuple[int, str], Tuple[int, int]] = {}
+        for offset in range(0, len(pairs), _REVISION_LOOKUP_CHUNK):
+            chunk = pairs[offset : offset + _REVISION_LOOKUP_CHUNK]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            rows = self.conn.execute(
+                f"""
+                WITH wanted(doc_id, as_at) AS (VALUES {values})
+                SELECT wanted.doc_id, wanted.as_at, (
+                    SELECT r.rev_id FROM revisions r
+                    WHERE r.doc_id = wanted.doc_id AND r.effective_date <= wanted.as_at
+                    ORDER BY r.effective_date DESC, r.rev_id DESC
+                    LIMIT 1
+                ) AS rev_id
+                FROM wanted
+                """,
+                [value for pair in chunk for value in pair],
+            )
+            for row in rows:
+                if row["rev_id"] is not None:
+                    effective[(row["doc_id"], row["as_at"])] = (
+                        row["doc_id"],
+                        row["rev_id"],
+                    )
+
+        documents = self._load_documents(effective.values())
+        return [
+            documents.get(effective.get((doc_id, as_at.isoformat()), (doc_id, -1)))
+            for doc_id, as_at in requests
+        ]
+
+    def _load_documents(
+        self, keys: Iterable[Tuple[int, int]]
+    ) -> dict[Tuple[int, int], Document]:
+        """Return documents for ``(doc_id, rev_id)`` keys via the snapshot cache."""
+
+        keys = list(dict.fromkeys(keys))
+        cache = self._snapshot_cache
+        documents = cache.get_many(keys) if cache is not None else {}
+        missing = [key for key in keys if key not in documents]
+        if not missing:
+            return documents
+
+        rows = self._select_revisions(
+            "SELECT doc_id, rev_id, metadata, body FROM revisions WHERE {revisions}",
+            missing,
         )
+        delta_keys = {
+            (row["doc_id"], row["rev_id"])
+            for row in self._select_revisions(
+                "SELECT doc_id, rev_id FROM revision_deltas WHERE {revisions}", missing
+            )
+        }
+        relational = [key for key in missing if key not in delta_keys]
+        toc_entries = self._load_toc_entries_many(relational)
+        provisions = self._load_provisions_many(relational)
+        loaded: dict[Tuple[int, int], Document] = {}
+        for row in rows:
+            key = (row["doc_id"], row["rev_id"])
+            if key in delta_keys:
+                document = self._load_document(*key, row["metadata"], row["body"])
+            else:
+                document = Document(
+                    metadata=DocumentMetadata.from_dict(json.loads(row["metadata"])),
+                    body=row["body"],
+                    provisions=provisions.get(key, []),
+                    toc_entries=toc_entries.get(key, []),
+                )
+            loaded[key] = document
+        if cache is not None:
+            cache.put_many(loaded)
+        documents.update(loaded)
+        return documents
+
+    def snapshot_cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters of the snapshot cache."""
+
+        if self._snapshot_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._snapshot_cache.stats()}
 
     def get_by_canonical_id(self, canonical_id: str) -> Optional[Document]:
         """Return the latest revision for a document by its canonical ID."""
@@ -2267,8 +2685,12 @@ class VersionedStore:
         """Reconstruct a :class:`Document` from stored state."""
 
         metadata = DocumentMetadata.from_dict(json.loads(metadata_json))
-        toc_entries = self._load_toc_entries(doc_id, rev_id)
-        provisions = self._load_provisions(doc_id, rev_id)
+        delta_document = self._load_delta_provisions(doc_id, rev_id)
+        if delta_document is not None:
+            provisions, toc_entries = delta_document
+        else:
+            toc_entries = self._load_toc_entries(doc_id, rev_id)
+            provisions = self._load_provisions(doc_id, rev_id)
         return Document(
             metadata=metadata,
             body=body,
@@ -2427,17 +2849,29 @@ class VersionedStore:
         ]
 
     def _load_toc_entries(self, doc_id: int, rev_id: int) -> List[DocumentTOCEntry]:
-        rows = self.conn.execute(
+        return self._load_toc_entries_many([(doc_id, rev_id)]).get((doc_id, rev_id), [])
+
+    def _load_toc_entries_many(
+        self, keys: Iterable[Tuple[int, int]]
+    ) -> dict[Tuple[int, int], List[DocumentTOCEntry]]:
+        rows = self._select_revisions(
             """
-            SELECT toc_id, parent_id, node_type, identifier, title, position, page_number
+            SELECT doc_id, rev_id, toc_id, parent_id, node_type, identifier, title,
+                   position, page_number
             FROM toc
-            WHERE doc_id = ? AND rev_id = ?
-            ORDER BY toc_id
+            WHERE {revisions}
+            ORDER BY doc_id, rev_id, toc_id
             """,
-            (doc_id, rev_id),
-        ).fetchall()
-        if not rows:
-            return []
+            list(dict.fromkeys(keys)),
+        )
+        by_revision: defaultdict[Tuple[int, int], List[sqlite3.Row]] = defaultdict(list)
+        for row in rows:
+            by_revision[(row["doc_id"], row["rev_id"])].append(row)
+        return {key: self._toc_tree(group) for key, group in by_revision.items()}
+
+    @staticmethod
+    def _toc_tree(rows: Iterable[Mapping[str, Any]]) -> List[DocumentTOCEntry]:
+        """Nest flat TOC rows (keyed like the ``toc`` table) into entries."""
 
         nodes: dict[int, DocumentTOCEntry] = {}
         children: defaultdict[Optional[int], List[Tuple[int, int]]] = defaultdict(list)
@@ -2466,6 +2900,270 @@ class VersionedStore:
 
         return build(None)
 
+    # ------------------------------------------------------------------
+    # Provision delta storage
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _strip_toc_ids(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: VersionedStore._strip_toc_ids(item)
+                for key, item in value.items()
+                if key != "toc_id"
+            }
+        if isinstance(value, (list, tuple)):
+            return [VersionedStore._strip_toc_ids(item) for item in value]
+        return value
+
+    @staticmethod
+    def _payload_hash(payload: str) -> str:
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _provision_manifest(
+        self, provisions: Iterable[Provision]
+    ) -> Tuple[dict[str, List[Any]], dict[str, str]]:
+        """Return ``{key: [parent_key, position, hash]}`` and the payloads by hash.
+
+        Payloads omit children and every ``toc_id`` (TOC numbering shifts
+        whenever an earlier node is inserted), so a node's hash only changes
+        when its own content does.  Keys are stable ids, suffixed with
+        ``#n`` when a stable id repeats.
+        """
+
+        manifest: dict[str, List[Any]] = {}
+        payloads: dict[str, str] = {}
+        seen: defaultdict[str, int] = defaultdict(int)
+
+        def visit(nodes: Iterable[Provision], parent_key: Optional[str]) -> None:
+            for position, provision in enumerate(nodes):
+                data = provision.to_dict()
+                data.pop("children", None)
+                payload = json.dumps(
+                    self._strip_toc_ids(data), sort_keys=True, ensure_ascii=False
+                )
+                payload_hash = self._payload_hash(payload)
+                payloads[payload_hash] = payload
+                base = provision.stable_id or f"{parent_key or ''}/pos{position}"
+                seen[base] += 1
+                key = base if seen[base] == 1 else f"{base}#{seen[base]}"
+                manifest[key] = [parent_key, position, payload_hash]
+                visit(provision.children, key)
+
+        visit(provisions, None)
+        return manifest, payloads
+
+    @staticmethod
+    def _manifest_changes(
+        old: Mapping[str, List[Any]], new: Mapping[str, List[Any]]
+    ) -> List[ProvisionChange]:
+        changes: List[ProvisionChange] = []
+        for key, (parent_key, position, new_hash) in new.items():
+            previous = old.get(key)
+            if previous is None:
+                changes.append(ProvisionChange(key, "added", None, new_hash))
+            elif previous[2] != new_hash:
+                changes.append(ProvisionChange(key, "modified", previous[2], new_hash))
+            elif previous[0] != parent_key or previous[1] != position:
+                changes.append(ProvisionChange(key, "moved", new_hash, new_hash))
+        for key, previous in old.items():
+            if key not in new:
+                changes.append(ProvisionChange(key, "removed", previous[2], None))
+        return changes
+
+    def _delta_manifest(
+        self, doc_id: int, rev_id: int
+    ) -> Optional[Tuple[dict[str, List[Any]], str]]:
+        """Replay deltas from the nearest keyframe into ``(manifest, toc_hash)``."""
+
+        keyframe = self.conn.execute(
+            """
+            SELECT MAX(rev_id) FROM revision_deltas
+            WHERE doc_id = ? AND rev_id <= ? AND keyframe = 1
+            """,
+            (doc_id, rev_id),
+        ).fetchone()[0]
+        if keyframe is None:
+            return None
+        rows = self.conn.execute(
+            """
+            SELECT rev_id, keyframe, delta FROM revision_deltas
+            WHERE doc_id = ? AND rev_id BETWEEN ? AND ?
+            ORDER BY rev_id
+            """,
+            (doc_id, keyframe, rev_id),
+        ).fetchall()
+        if not rows or rows[-1]["rev_id"] != rev_id:
+            return None
+        manifest: dict[str, List[Any]] = {}
+        toc_hash = ""
+        for row in rows:
+            delta = json.loads(row["delta"])
+            toc_hash = delta["toc"]
+            if row["keyframe"]:
+                manifest = dict(delta["nodes"])
+                continue
+            for key in delta["removed"]:
+                manifest.pop(key, None)
+            manifest.update(delta["set"])
+        return manifest, toc_hash
+
+    def _has_delta(self, doc_id: int, rev_id: int) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM revision_deltas WHERE doc_id = ? AND rev_id = ?",
+            (doc_id, rev_id),
+        ).fetchone()
+        return row is not None
+
+    def _store_provision_delta(
+        self,
+        doc_id: int,
+        rev_id: int,
+        provisions: List[Provision],
+        toc_entries: List[Tuple[Any, ...]],
+    ) -> None:
+        """Store ``provisions`` as a delta against ``rev_id - 1``.
+
+        A revision without a delta-stored predecessor, or ``keyframe_interval``
+        revisions after the last keyframe, is stored as a full manifest.
+        """
+
+        manifest, payloads = self._provision_manifest(provisions)
+        toc_payload = json.dumps([list(entry) for entry in toc_entries])
+        toc_hash = self._payload_hash(toc_payload)
+        payloads[toc_hash] = toc_payload
+
+        previous = self._delta_manifest(doc_id, rev_id - 1) if rev_id > 1 else None
+        last_keyframe = self.conn.execute(
+            "SELECT MAX(rev_id) FROM revision_deltas WHERE doc_id = ? AND keyframe = 1",
+            (doc_id,),
+        ).fetchone()[0]
+        keyframe = (
+            previous is None
+            or last_keyframe is None
+            or rev_id - last_keyframe >= self.keyframe_interval
+        )
+        if keyframe:
+            delta: dict[str, Any] = {"toc": toc_hash, "nodes": manifest}
+        else:
+            old_manifest = previous[0]
+            delta = {
+                "toc": toc_hash,
+                "set": {
+                    key: entry
+                    for key, entry in manifest.items()
+                    if old_manifest.get(key) != entry
+                },
+                "removed": [key for key in old_manifest if key not in manifest],
+            }
+
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO provision_payloads (payload_hash, payload) VALUES (?, ?)",
+            list(payloads.items()),
+        )
+        self.conn.execute(
+            """
+            INSERT INTO revision_deltas (doc_id, rev_id, keyframe, delta)
+            VALUES (?, ?, ?, ?)
+            """,
+            (doc_id, rev_id, int(keyframe), json.dumps(delta)),
+        )
+        if previous is not None:
+            from_rev_id: Optional[int] = rev_id - 1
+            changes = self._manifest_changes(previous[0], manifest)
+        elif rev_id == 1:
+            from_rev_id = None
+            changes = self._manifest_changes({}, manifest)
+        else:
+            changes = []
+        if changes:
+            self.conn.executemany(
+                """
+                INSERT INTO revision_changes (
+                    doc_id, rev_id, from_rev_id, provision_key, change, old_hash, new_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        doc_id,
+                        rev_id,
+                        from_rev_id,
+                        change.provision_key,
+                        change.change,
+                        change.old_hash,
+                        change.new_hash,
+                    )
+                    for change in changes
+                ],
+            )
+
+    def _load_payloads(self, hashes: Iterable[str]) -> dict[str, str]:
+        wanted = list(dict.fromkeys(hashes))
+        payloads: dict[str, str] = {}
+        for offset in range(0, len(wanted), _DELTA_LOOKUP_CHUNK):
+            chunk = wanted[offset : offset + _DELTA_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                "SELECT payload_hash, payload FROM provision_payloads "
+                f"WHERE payload_hash IN ({placeholders})",
+                chunk,
+            )
+            payloads.update((row["payload_hash"], row["payload"]) for row in rows)
+        return payloads
+
+    def _load_delta_provisions(
+        self, doc_id: int, rev_id: int
+    ) -> Optional[Tuple[List[Provision], List[DocumentTOCEntry]]]:
+        """Rebuild the provisions and TOC of a delta-stored revision."""
+
+        state = self._delta_manifest(doc_id, rev_id)
+        if state is None:
+            return None
+        manifest, toc_hash = state
+        payloads = self._load_payloads(
+            [toc_hash, *(entry[2] for entry in manifest.values())]
+        )
+        toc_rows = [
+            dict(
+                zip(
+                    (
+                        "toc_id",
+                        "parent_id",
+                        "position",
+                        "stable_id",
+                        "node_type",
+                        "identifier",
+                        "title",
+                        "page_number",
+                    ),
+                    entry,
+                )
+            )
+            for entry in json.loads(payloads[toc_hash])
+        ]
+        toc_ids = {row["stable_id"]: row["toc_id"] for row in toc_rows}
+
+        nodes: dict[str, Provision] = {}
+        children: defaultdict[Optional[str], List[Tuple[int, str]]] = defaultdict(list)
+        for key, (parent_key, position, payload_hash) in manifest.items():
+            provision = Provision.from_dict(json.loads(payloads[payload_hash]))
+            provision.toc_id = toc_ids.get(provision.stable_id)
+            for rule_atom in provision.rule_atoms:
+                if rule_atom.toc_id is None:
+                    rule_atom.toc_id = provision.toc_id
+            nodes[key] = provision
+            children[parent_key].append((position, key))
+
+        def build(parent_key: Optional[str]) -> List[Provision]:
+            result: List[Provision] = []
+            for _, key in sorted(children.get(parent_key, [])):
+                node = nodes[key]
+                node.children = build(key)
+                result.append(node)
+            return result
+
+        roots = build(None)
+        return roots, self._toc_tree(toc_rows)
+
     def _slugify(self, value: Optional[str]) -> str:
         if value is None:
             return ""
@@ -2557,12 +3255,14 @@ class VersionedStore:
         has_provision_fts = self._object_type("provision_text_fts") is not None
         has_rule_atom_fts = self._object_type("rule_atom_text_fts") is not None
 
-        if has_provision_fts:
+        # FTS columns are UNINDEXED, so clearing a revision scans the whole
+        # table; bulk loads only ever write fresh revisions and skip it.
+        if has_provision_fts and self._bulk is None:
             self.conn.execute(
                 "DELETE FROM provision_text_fts WHERE doc_id = ? AND rev_id = ?",
                 (doc_id, rev_id),
             )
-        if has_rule_atom_fts:
+        if has_rule_atom_fts and self._bulk is None:
             self.conn.execute(
                 "DELETE FROM rule_atom_text_fts WHERE doc_id = ? AND rev_id = ?",
                 (doc_id, rev_id),
@@ -2885,7 +3585,7 @@ class VersionedStore:
         for occ in occurrences:
             lexeme_kinds.setdefault(occ.norm_text, occ.kind)
 
-        with self.conn:
+        with self._write_transaction():
             self.conn.executemany(
                 "INSERT OR IGNORE INTO lexemes (norm_text, norm_kind) VALUES (?, ?)",
                 [(norm_text, lexeme_kinds[norm_text]) for norm_text in lexeme_kinds],
@@ -2977,38 +3677,71 @@ class VersionedStore:
                     structural_payload,
                 )
 
-    def _load_provisions(
-        self, doc_id: int, rev_id: int
-    ) -> Tuple[List[Provision], bool]:
+    def _load_provisions(self, doc_id: int, rev_id: int) -> List[Provision]:
         """Load provisions and atoms for a revision."""
 
-        provision_rows = self.conn.execute(
+        return self._load_provisions_many([(doc_id, rev_id)]).get((doc_id, rev_id), [])
+
+    def _select_revisions(
+        self, sql: str, keys: List[Tuple[int, int]], alias: str = ""
+    ) -> List[sqlite3.Row]:
+        """Run ``sql`` once per chunk of ``(doc_id, rev_id)`` keys.
+
+        ``sql`` contains a ``{revisions}`` placeholder that is replaced by a
+        row-value ``IN (VALUES ...)`` filter on ``alias``.
+        """
+
+        prefix = f"{alias}." if alias else ""
+        rows: List[sqlite3.Row] = []
+        for offset in range(0, len(keys), _REVISION_LOOKUP_CHUNK):
+            chunk = keys[offset : offset + _REVISION_LOOKUP_CHUNK]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            revisions = f"({prefix}doc_id, {prefix}rev_id) IN (VALUES {values})"
+            params = [value for key in chunk for value in key]
+            rows.extend(
+                self.conn.execute(sql.format(revisions=revisions), params).fetchall()
+            )
+        return rows
+
+    def _load_provisions_many(
+        self, keys: Iterable[Tuple[int, int]]
+    ) -> dict[Tuple[int, int], List[Provision]]:
+        """Load provisions and atoms for many revisions with set-based queries."""
+
+        keys = list(dict.fromkeys(keys))
+        provision_rows = self._select_revisions(
             """
             SELECT doc_id, rev_id, provision_id, parent_id, position, identifier, heading,
                    node_type, toc_id, text, rule_tokens, references_json, principles, customs,
                    cultural_flags
             FROM provisions
-            WHERE doc_id = ? AND rev_id = ?
-            ORDER BY provision_id
+            WHERE {revisions}
+            ORDER BY doc_id, rev_id, provision_id
             """,
-            (doc_id, rev_id),
-        ).fetchall()
+            keys,
+        )
         if not provision_rows:
-            return []
+            return {}
+        keys = list(dict.fromkeys((row["doc_id"], row["rev_id"]) for row in provision_rows))
 
-        toc_rows = self.conn.execute(
+        toc_rows = self._select_revisions(
             """
-            SELECT toc_id, stable_id
+            SELECT doc_id, rev_id, toc_id, stable_id
             FROM toc
-            WHERE doc_id = ? AND rev_id = ?
+            WHERE {revisions}
             """,
-            (doc_id, rev_id),
-        ).fetchall()
-        toc_stable_map = {row["toc_id"]: row["stable_id"] for row in toc_rows}
+            keys,
+        )
+        toc_stable_map = {
+            (row["doc_id"], row["rev_id"], row["toc_id"]): row["stable_id"]
+            for row in toc_rows
+        }
 
-        rule_atom_rows = self.conn.execute(
+        rule_atom_rows = self._select_revisions(
             """
             SELECT
+                ra.doc_id,
+                ra.rev_id,
                 ra.provision_id,
                 ra.rule_id,
                 ra.toc_id,
@@ -3047,60 +3780,72 @@ class VersionedStore:
                 AND ra.rev_id = rs.rev_id
                 AND ra.provision_id = rs.provision_id
                 AND ra.rule_id = rs.rule_id
-            WHERE ra.doc_id = ? AND ra.rev_id = ?
-            ORDER BY ra.provision_id, ra.rule_id
+            WHERE {revisions}
+            ORDER BY ra.doc_id, ra.rev_id, ra.provision_id, ra.rule_id
             """,
-            (doc_id, rev_id),
-        ).fetchall()
+            keys,
+            "ra",
+        )
 
-        using_structured = bool(rule_atom_rows)
+        # Revisions with structured rule rows; the others fall back to the
+        # legacy atom tables.
+        structured = {(row["doc_id"], row["rev_id"]) for row in rule_atom_rows}
 
-        rule_atoms_by_provision: dict[int, List[RuleAtom]] = defaultdict(list)
+        rule_atoms_by_provision: dict[tuple[int, int, int], List[RuleAtom]] = defaultdict(
+            list
+        )
 
-        if using_structured:
-            atom_reference_rows = self.conn.execute(
+        if structured:
+            structured_keys = [key for key in keys if key in structured]
+            atom_reference_rows = self._select_revisions(
                 """
-                SELECT provision_id, rule_id, ref_index, work, section, pinpoint, citation_text, glossary_id
+                SELECT doc_id, rev_id, provision_id, rule_id, ref_index, work, section,
+                       pinpoint, citation_text, glossary_id
                 FROM rule_atom_references
-                WHERE doc_id = ? AND rev_id = ?
-                ORDER BY provision_id, rule_id, ref_index
+                WHERE {revisions}
+                ORDER BY doc_id, rev_id, provision_id, rule_id, ref_index
                 """,
-                (doc_id, rev_id),
-            ).fetchall()
-            element_rows = self.conn.execute(
+                structured_keys,
+            )
+            element_rows = self._select_revisions(
                 """
-                SELECT provision_id, rule_id, element_id, atom_type, role, text, conditions,
-                       gloss, gloss_metadata, glossary_id, span_start, span_end, span_source
+                SELECT doc_id, rev_id, provision_id, rule_id, element_id, atom_type, role,
+                       text, conditions, gloss, gloss_metadata, glossary_id, span_start,
+                       span_end, span_source
                 FROM rule_elements
-                WHERE doc_id = ? AND rev_id = ?
-                ORDER BY provision_id, rule_id, element_id
+                WHERE {revisions}
+                ORDER BY doc_id, rev_id, provision_id, rule_id, element_id
                 """,
-                (doc_id, rev_id),
-            ).fetchall()
-            element_reference_rows = self.conn.execute(
+                structured_keys,
+            )
+            element_reference_rows = self._select_revisions(
                 """
-                SELECT provision_id, rule_id, element_id, ref_index, work, section, pinpoint, citation_text, glossary_id
+                SELECT doc_id, rev_id, provision_id, rule_id, element_id, ref_index, work,
+                       section, pinpoint, citation_text, glossary_id
                 FROM rule_element_references
-                WHERE doc_id = ? AND rev_id = ?
-                ORDER BY provision_id, rule_id, element_id, ref_index
+                WHERE {revisions}
+                ORDER BY doc_id, rev_id, provision_id, rule_id, element_id, ref_index
                 """,
-                (doc_id, rev_id),
-            ).fetchall()
-            lint_rows = self.conn.execute(
+                structured_keys,
+            )
+            lint_rows = self._select_revisions(
                 """
-                SELECT provision_id, rule_id, lint_id, atom_type, code, message, metadata
+                SELECT doc_id, rev_id, provision_id, rule_id, lint_id, atom_type, code,
+                       message, metadata
                 FROM rule_lints
-                WHERE doc_id = ? AND rev_id = ?
-                ORDER BY provision_id, rule_id, lint_id
+                WHERE {revisions}
+                ORDER BY doc_id, rev_id, provision_id, rule_id, lint_id
                 """,
-                (doc_id, rev_id),
-            ).fetchall()
+                structured_keys,
+            )
 
-            atom_refs_map: dict[tuple[int, int], List[RuleReference]] = defaultdict(
-                list
+            atom_refs_map: dict[tuple[int, int, int, int], List[RuleReference]] = (
+                defaultdict(list)
             )
             for row in atom_reference_rows:
-                atom_refs_map[(row["provision_id"], row["rule_id"])].append(
+                atom_refs_map[
+                    (row["doc_id"], row["rev_id"], row["provision_id"], row["rule_id"])
+                ].append(
                     RuleReference(
                         work=row["work"],
                         section=row["section"],
@@ -3114,12 +3859,18 @@ class VersionedStore:
                     )
                 )
 
-            element_refs_map: dict[tuple[int, int, int], List[RuleReference]] = (
-                defaultdict(list)
-            )
+            element_refs_map: dict[
+                tuple[int, int, int, int, int], List[RuleReference]
+            ] = defaultdict(list)
             for row in element_reference_rows:
                 element_refs_map[
-                    (row["provision_id"], row["rule_id"], row["element_id"])
+                    (
+                        row["doc_id"],
+                        row["rev_id"],
+                        row["provision_id"],
+                        row["rule_id"],
+                        row["element_id"],
+                    )
                 ].append(
                     RuleReference(
                         work=row["work"],
@@ -3134,7 +3885,7 @@ class VersionedStore:
                     )
                 )
 
-            rule_lookup: dict[tuple[int, int], RuleAtom] = {}
+            rule_lookup: dict[tuple[int, int, int, int], RuleAtom] = {}
             for row in rule_atom_rows:
                 metadata = (
                     json.loads(row["subject_gloss_metadata"])
@@ -3152,7 +3903,8 @@ class VersionedStore:
                         ),
                     )
                     for ref in atom_refs_map.get(
-                        (row["provision_id"], row["rule_id"]), []
+                        (row["doc_id"], row["rev_id"], row["provision_id"], row["rule_id"]),
+                        [],
                     )
                 ]
                 subject_link: Optional[GlossaryLink]
@@ -3200,7 +3952,9 @@ class VersionedStore:
                     else "legacy_missing",
                 )
                 if not rule_atom.stable_id and row["toc_id"] is not None:
-                    rule_atom.stable_id = toc_stable_map.get(row["toc_id"])
+                    rule_atom.stable_id = toc_stable_map.get(
+                        (row["doc_id"], row["rev_id"], row["toc_id"])
+                    )
 
                 subject_metadata = (
                     json.loads(row["subject_gloss_metadata_json"])
@@ -3276,8 +4030,9 @@ class VersionedStore:
                     if subject_atom.gloss_metadata is not None:
                         rule_atom.subject_gloss_metadata = subject_atom.gloss_metadata
 
-                rule_atoms_by_provision[row["provision_id"]].append(rule_atom)
-                rule_lookup[(row["provision_id"], row["rule_id"])] = rule_atom
+                rule_key = (row["doc_id"], row["rev_id"], row["provision_id"])
+                rule_atoms_by_provision[rule_key].append(rule_atom)
+                rule_lookup[(*rule_key, row["rule_id"])] = rule_atom
 
             for row in element_rows:
                 metadata = (
@@ -3294,7 +4049,14 @@ class VersionedStore:
                         ),
                     )
                     for ref in element_refs_map.get(
-                        (row["provision_id"], row["rule_id"], row["element_id"]), []
+                        (
+                            row["doc_id"],
+                            row["rev_id"],
+                            row["provision_id"],
+                            row["rule_id"],
+                            row["element_id"],
+                        ),
+                        [],
                     )
                 ]
                 if (
@@ -3331,7 +4093,9 @@ class VersionedStore:
                     if row["span_start"] is not None
                     else "legacy_missing",
                 )
-                parent = rule_lookup.get((row["provision_id"], row["rule_id"]))
+                parent = rule_lookup.get(
+                    (row["doc_id"], row["rev_id"], row["provision_id"], row["rule_id"])
+                )
                 if parent is not None:
                     parent.elements.append(element)
 
@@ -3343,17 +4107,16 @@ class VersionedStore:
                     message=row["message"],
                     metadata=metadata,
                 )
-                parent = rule_lookup.get((row["provision_id"], row["rule_id"]))
+                parent = rule_lookup.get(
+                    (row["doc_id"], row["rev_id"], row["provision_id"], row["rule_id"])
+                )
                 if parent is not None:
                     parent.lints.append(lint)
 
-        else:
-            pass
-
-        provisions: dict[int, Provision] = {}
-        children_map: defaultdict[Optional[int], List[Tuple[int, int]]] = defaultdict(list)
+        provisions: dict[tuple[int, int, int], Provision] = {}
 
         for row in provision_rows:
+            revision = (row["doc_id"], row["rev_id"])
             rule_tokens = json.loads(row["rule_tokens"]) if row["rule_tokens"] else {}
             references: List[
                 Tuple[str, Optional[str], Optional[str], Optional[str], str]
@@ -3386,48 +4149,33 @@ class VersionedStore:
                 principles=list(principles),
                 customs=list(customs),
             )
-            provision.stable_id = toc_stable_map.get(row["toc_id"])
+            provision.stable_id = toc_stable_map.get((*revision, row["toc_id"]))
             provision.position = row["position"]
-            if using_structured:
+            if revision in structured:
                 provision.rule_atoms.extend(
-                    rule_atoms_by_provision.get(row["provision_id"], [])
+                    rule_atoms_by_provision.get((*revision, row["provision_id"]), [])
                 )
                 provision.sync_legacy_atoms()
             else:
                 provision.legacy_atoms_factory = self._make_legacy_atoms_factory(
-                    doc_id, rev_id, row["provision_id"]
+                    row["doc_id"], row["rev_id"], row["provision_id"]
                 )
                 provision.ensure_rule_atoms()
-            provisions[row["provision_id"]] = provision
-            position_value = row["position"] if row["position"] is not None else 0
-            children_map[row["parent_id"]].append((position_value, row["provision_id"]))
-        def build(parent_id: Optional[int]) -> List[Provision]:
-            ordered_children = sorted(
-                children_map.get(parent_id, []), key=lambda item: (item[0], item[1])
-            )
-            result: List[Provision] = []
-            for _, child_id in ordered_children:
-                child = provisions[child_id]
-                child.children = build(child_id)
-                result.append(child)
-            return result
+            provisions[(*revision, row["provision_id"])] = provision
 
-        root_ids: List[int] = []
+        roots: dict[Tuple[int, int], List[Provision]] = {key: [] for key in keys}
         for row in provision_rows:
+            revision = (row["doc_id"], row["rev_id"])
+            provision = provisions[(*revision, row["provision_id"])]
             parent_id = row["parent_id"]
-            current_id = row["provision_id"]
-            provision = provisions[current_id]
-            if parent_id is None:
-                root_ids.append(current_id)
+            parent = (
+                provisions.get((*revision, parent_id)) if parent_id is not None else None
+            )
+            if parent is None:
+                roots[revision].append(provision)
             else:
-                parent = provisions.get(parent_id)
-                if parent is None:
-                    root_ids.append(current_id)
-                else:
-                    parent.children.append(provision)
-
-        ordered_roots = [provisions[pid] for pid in root_ids]
-        return ordered_roots
+                parent.children.append(provision)
+        return roots
 
     def _make_legacy_atoms_factory(
         self, doc_id: int, rev_id: int, provision_id: int
@@ -3836,13 +4584,14 @@ class VersionedStore:
 
             if has_rule_atom_fts:
                 text_value = rule_atom.text or ""
-                self.conn.execute(
-                    """
-                    DELETE FROM rule_atom_text_fts
-                    WHERE doc_id = ? AND rev_id = ? AND provision_id = ? AND rule_id = ?
-                    """,
-                    (doc_id, rev_id, provision_id, rule_index),
-                )
+                if self._bulk is None:
+                    self.conn.execute(
+                        """
+                        DELETE FROM rule_atom_text_fts
+                        WHERE doc_id = ? AND rev_id = ? AND provision_id = ? AND rule_id = ?
+                        """,
+                        (doc_id, rev_id, provision_id, rule_index),
+                    )
                 self.conn.execute(
                     """
                     INSERT INTO rule_atom_text_fts(doc_id, rev_id, provision_id, rule_id, text)
@@ -3874,6 +4623,67 @@ class VersionedStore:
         )
         return "\n".join(diff)
 
+    def provision_changes(self, doc_id: int, rev_id: int) -> List[ProvisionChange]:
+        """Return the change set precomputed when ``rev_id`` was stored.
+
+        Only revisions stored with ``delta_provisions`` carry a change set;
+        other revisions return an empty list.
+        """
+
+        rows = self.conn.execute(
+            """
+            SELECT provision_key, change, old_hash, new_hash
+            FROM revision_changes
+            WHERE doc_id = ? AND rev_id = ?
+            ORDER BY provision_key
+            """,
+            (doc_id, rev_id),
+        ).fetchall()
+        return [
+            ProvisionChange(
+                row["provision_key"], row["change"], row["old_hash"], row["new_hash"]
+            )
+            for row in rows
+        ]
+
+    def diff_provisions(
+        self, doc_id: int, rev_a: int, rev_b: int
+    ) -> List[ProvisionChange]:
+        """Return provision-level changes from ``rev_a`` to ``rev_b``.
+
+        Consecutive delta-stored revisions are answered from the precomputed
+        change set; any other pair compares the two provision manifests.
+        """
+
+        if rev_b == rev_a + 1:
+            row = self.conn.execute(
+                """
+                SELECT 1 FROM revision_changes
+                WHERE doc_id = ? AND rev_id = ? AND from_rev_id = ?
+                LIMIT 1
+                """,
+                (doc_id, rev_b, rev_a),
+            ).fetchone()
+            if row is not None:
+                return self.provision_changes(doc_id, rev_b)
+        manifests = []
+        for rev_id in (rev_a, rev_b):
+            state = self._delta_manifest(doc_id, rev_id)
+            if state is not None:
+                manifests.append(state[0])
+                continue
+            exists = self.conn.execute(
+                "SELECT 1 FROM revisions WHERE doc_id = ? AND rev_id = ?",
+                (doc_id, rev_id),
+            ).fetchone()
+            if exists is None:
+                raise ValueError("Revision not found")
+            manifests.append(
+                self._provision_manifest(self._load_provisions(doc_id, rev_id))[0]
+            )
+        changes = self._manifest_changes(manifests[0], manifests[1])
+        return sorted(changes, key=lambda change: change.provision_key)
+
     def close(self) -> None:
         self.conn.close()
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Callable, Iterable, Iterator
 
 
 class TokenType(str, Enum):
@@ -51,9 +52,10 @@ def _consume_whitespace(text: str, start: int) -> int:
 
 def _consume_word(text: str, start: int) -> tuple[str, int, int]:
     i = start
-    while i < len(text):
+    length = len(text)
+    while i < length:
         ch = text[i]
-        if ch.isalnum() or ch in {"_", "'"}:
+        if ch.isalnum() or ch == "_" or ch == "'":
             i += 1
             continue
         break
@@ -348,12 +350,29 @@ def _consume_literal_sequence(text: str, start: int, parts: tuple[str, ...]) ->
     return cursor
 
 
+# (id(aliases), first character) -> aliases that can match there, with their
+# casefolded forms, in their original order.
+_ALIAS_CANDIDATES: dict[tuple[int, str], tuple[tuple[str, str], ...]] = {}
+
+
+def _alias_candidates(aliases: tuple[str, ...], ch: str) -> tuple[tuple[str, str], ...]:
+    key = (id(aliases), ch)
+    candidates = _ALIAS_CANDIDATES.get(key)
+    if candidates is None:
+        folded_ch = ch.casefold()
+        candidates = tuple(
+            (alias, alias.casefold()) for alias in aliases if alias.casefold().startswith(folded_ch)
+        )
+        _ALIAS_CANDIDATES[key] = candidates
+    return candidates
+
+
 def _consume_alias_phrase(text: str, start: int, aliases: tuple[str, ...]) -> tuple[str, int, int] | None:
-    if not _is_boundary_left(text, start):
+    if start >= len(text) or not _is_boundary_left(text, start):
         return None
-    for alias in aliases:
+    for alias, folded_alias in _alias_candidates(aliases, text[start]):
         end = start + len(alias)
-        if text[start:end].casefold() != alias.casefold():
+        if text[start:end].casefold() != folded_alias:
             continue
         if end < len(text) and (text[end].isalnum() or text[end] in {"_", "-"}):
             continue
@@ -417,34 +436,64 @@ def _consume_title_words(text: str, start: int) -> int:
     return cursor if consumed_any else start
 
 
+_COURT_ALIASES = (
+    "International Criminal Court",
+    "ICC",
+    "ICCt",
+    "International Court of Justice",
+    "ICJ",
+    "World Court",
+)
+
+_COURT_VARIANTS = (
+    ("u.s. supreme court", ("U.S.", "Supreme", "Court")),
+    ("united states supreme court", ("United", "States", "Supreme", "Court")),
+    ("united states district court", ("United", "States", "district", "court")),
+    ("u.s. district court", ("U.S.", "district", "court")),
+    ("united states court of appeals", ("United", "States", "Court", "of", "Appeals")),
+    ("u.s. court of appeals", ("U.S.", "Court", "of", "Appeals")),
+)
+
+_INSTITUTION_ALIASES = (
+    "United States Senate",
+    "U.S. Senate",
+    "US Senate",
+    "Senate of the United States",
+    "United States House of Representatives",
+    "U.S. House of Representatives",
+    "US House of Representatives",
+    "House of Representatives",
+    "United States Department of Defense",
+    "U.S. Department of Defense",
+    "Department of Defense",
+    "Defense Department",
+    "Central Intelligence Agency",
+    "CIA",
+    "Federal Bureau of Investigation",
+    "FBI",
+    "F.B.I.",
+    "United Nations Security Council",
+    "UN Security Council",
+    "U.N. Security Council",
+    "UNSC",
+    "Security Council",
+    "United Nations",
+    "United Nations Organization",
+    "UN",
+    "U.N.",
+    "UNO",
+)
+
+
 def _consume_court_reference(text: str, start: int) -> tuple[str, int, int] | None:
     if not _is_boundary_left(text, start):
         return None
 
-    seeded = _consume_alias_phrase(
-        text,
-        start,
-        (
-            "International Criminal Court",
-            "ICC",
-            "ICCt",
-            "International Court of Justice",
-            "ICJ",
-            "World Court",
-        ),
-    )
+    seeded = _consume_alias_phrase(text, start, _COURT_ALIASES)
     if seeded is not None:
         return seeded
 
-    variants = (
-        ("u.s. supreme court", ("U.S.", "Supreme", "Court")),
-        ("united states supreme court", ("United", "States", "Supreme", "Court")),
-        ("united states district court", ("United", "States", "district", "court")),
-        ("u.s. district court", ("U.S.", "district", "court")),
-        ("united states court of appeals", ("United", "States", "Court", "of", "Appeals")),
-        ("u.s. court of appeals", ("U.S.", "Court", "of", "Appeals")),
-    )
-    for _, parts in variants:
+    for _, parts in _COURT_VARIANTS:
         end = _consume_literal_sequence(text, start, parts)
         if end is None:
             continue
@@ -462,39 +511,9 @@ def _consume_court_reference(text: str, start: int) -> tuple[str, int, int] | No
 
 
 def _consume_institution_reference(text: str, start: int) -> tuple[str, int, int] | None:
-    return _consume_alias_phrase(
-        text,
-        start,
-        (
-            "United States Senate",
-            "U.S. Senate",
-            "US Senate",
-            "Senate of the United States",
-            "United States House of Representatives",
-            "U.S. House of Representatives",
-            "US House of Representatives",
-            "House of Representatives",
-            "United States Department of Defense",
-            "U.S. Department of Defense",
-            "Department of Defense",
-            "Defense Department",
-            "Central Intelligence Agency",
-            "CIA",
-            "Federal Bureau of Investigation",
-            "FBI",
-            "F.B.I.",
-            "United Nations Security Council",
-            "UN Security Council",
-            "U.N. Security Council",
-            "UNSC",
-            "Security Council",
-            "United Nations",
-            "United Nations Organization",
-            "UN",
-            "U.N.",
-            "UNO",
-        ),
-    )
+    return _consume_alias_phrase(text, start, _INSTITUTION_ALIASES)
+
+
 def _consume_article_reference(text: str, start: int) -> tuple[str, int, int] | None:
     ref = _consume_keyword_reference(
         text,
@@ -618,91 +637,198 @@ def _consume_section_reference(text: str, start: int) -> list[tuple[str, int, in
     return tokens
 
 
-def _tokenize_with_no_regex(text: str) -> list[tuple[str, int, int, TokenType]]:
-    tokens: list[tuple[str, int, int, TokenType]] = []
-    i = 0
-    length = len(text)
-    while i < length:
-        ch = text[i]
-        if ch.isspace():
-            i += 1
-            continue
+_TypedSpan = tuple[str, int, int, TokenType]
+_Probe = Callable[[str, int], "list[_TypedSpan] | None"]
 
-        section_parts = _consume_section_reference(text, i)
-        if section_parts is not None:
-            tokens.extend(section_parts)
-            i = section_parts[-1][2]
-            continue
 
-        keyword_reference = (
-            _consume_keyword_reference(text, i, keywords=("pt", "part"), token_type=TokenType.PART_REFERENCE)
-            or _consume_keyword_reference(text, i, keywords=("div", "division"), token_type=TokenType.DIVISION_REFERENCE)
-            or _consume_keyword_reference(text, i, keywords=("r", "rule"), token_type=TokenType.RULE_REFERENCE, allow_dots=True)
-            or _consume_keyword_reference(text, i, keywords=("sch", "schedule"), token_type=TokenType.SCHEDULE_REFERENCE)
-            or _consume_keyword_reference(text, i, keywords=("cl", "clause"), token_type=TokenType.CLAUSE_REFERENCE)
+def _keyword_probe(keywords: tuple[str, ...], token_type: TokenType, *, allow_dots: bool = False) -> _Probe:
+    def probe(text: str, start: int) -> list[_TypedSpan] | None:
+        ref = _consume_keyword_reference(
+            text, start, keywords=keywords, token_type=token_type, allow_dots=allow_dots
         )
-        if keyword_reference is not None:
-            tokens.append(keyword_reference)
-            i = keyword_reference[2]
-            continue
-
-        article_reference = _consume_article_reference(text, i)
-        if article_reference is not None:
-            text_span, start, end = article_reference
-            tokens.append((text_span, start, end, TokenType.ARTICLE_REFERENCE))
-            i = end
-            continue
+        return None if ref is None else [ref]
+
+    return probe
+
+
+def _span_probe(consume: Callable[[str, int], "tuple[str, int, int] | None"], token_type: TokenType) -> _Probe:
+    def probe(text: str, start: int) -> list[_TypedSpan] | None:
+        span = consume(text, start)
+        return None if span is None else [(*span, token_type)]
+
+    return probe
+
+
+# Keyword-led references, in the order they used to be probed.  The keyword
+# sets are disjoint, so the normalised head word selects at most one probe.
+_KEYWORD_PROBE_SPECS: tuple[tuple[tuple[str, ...], _Probe], ...] = (
+    (("s", "sec", "section"), _consume_section_reference),
+    (("pt", "part"), _keyword_probe(("pt", "part"), TokenType.PART_REFERENCE)),
+    (("div", "division"), _keyword_probe(("div", "division"), TokenType.DIVISION_REFERENCE)),
+    (("r", "rule"), _keyword_probe(("r", "rule"), TokenType.RULE_REFERENCE, allow_dots=True)),
+    (("sch", "schedule"), _keyword_probe(("sch", "schedule"), TokenType.SCHEDULE_REFERENCE)),
+    (("cl", "clause"), _keyword_probe(("cl", "clause"), TokenType.CLAUSE_REFERENCE)),
+    (("art", "article"), _span_probe(_consume_article_reference, TokenType.ARTICLE_REFERENCE)),
+)
+_KEYWORD_PROBES: dict[str, _Probe] = {
+    keyword: probe for keywords, probe in _KEYWORD_PROBE_SPECS for keyword in keywords
+}
+
+
+def _folded_prefix_of(ch: str, phrases: Iterable[str]) -> bool:
+    folded = ch.casefold()
+    return any(phrase.casefold().startswith(folded) for phrase in phrases)
+
+
+def _starts_title(ch: str) -> bool:
+    return ch.isalpha() and ch.isupper()
+
+
+# Remaining probes, in order, with a necessary condition on the first
+# character.  Casefolding is per code point, so a phrase can only match when
+# its folded form starts with the folded first character.
+_TAIL_PROBE_SPECS: tuple[tuple[Callable[[str], bool], _Probe], ...] = (
+    (_starts_title, _span_probe(_consume_act_reference, TokenType.ACT_REFERENCE)),
+    (
+        lambda ch: _starts_title(ch) or _folded_prefix_of(ch, ("un",)),
+        _span_probe(_consume_instrument_reference, TokenType.INSTRUMENT_REFERENCE),
+    ),
+    (
+        lambda ch: _folded_prefix_of(ch, _INSTITUTION_ALIASES),
+        _span_probe(_consume_institution_reference, TokenType.INSTITUTION_REFERENCE),
+    ),
+    (
+        lambda ch: _folded_prefix_of(ch, _COURT_ALIASES + tuple(parts[0] for _, parts in _COURT_VARIANTS)),
+        _span_probe(_consume_court_reference, TokenType.COURT_REFERENCE),
+    ),
+    (lambda ch: ch == "[", _span_probe(_consume_case_reference, TokenType.CASE_REFERENCE)),
+)
+
+# First character -> (may start a reference keyword, tail probes to try).
+_DISPATCH: dict[str, tuple[bool, tuple[_Probe, ...]]] = {}
+
+
+def _dispatch_plan(ch: str) -> tuple[bool, tuple[_Probe, ...]]:
+    plan = _DISPATCH.get(ch)
+    if plan is None:
+        plan = (
+            _folded_prefix_of(ch, _KEYWORD_PROBES),
+            tuple(probe for accepts, probe in _TAIL_PROBE_SPECS if accepts(ch)),
+        )
+        _DISPATCH[ch] = plan
+    return plan
 
-        act_reference = _consume_act_reference(text, i)
-        if act_reference is not None:
-            text_span, start, end = act_reference
-            tokens.append((text_span, start, end, TokenType.ACT_REFERENCE))
-            i = end
-            continue
 
-        instrument_reference = _consume_instrument_reference(text, i)
-        if instrument_reference is not None:
-            text_span, start, end = instrument_reference
-            tokens.append((text_span, start, end, TokenType.INSTRUMENT_REFERENCE))
-            i = end
-            continue
+def _scan(text: str, start: int, stop: int, tokens: list[_TypedSpan]) -> int:
+    """Append tokens starting in ``text[start:stop]`` and return the resume offset."""
 
-        institution_reference = _consume_institution_reference(text, i)
-        if institution_reference is not None:
-            text_span, start, end = institution_reference
-            tokens.append((text_span, start, end, TokenType.INSTITUTION_REFERENCE))
-            i = end
-            continue
-
-        court_reference = _consume_court_reference(text, i)
-        if court_reference is not None:
-            text_span, start, end = court_reference
-            tokens.append((text_span, start, end, TokenType.COURT_REFERENCE))
-            i = end
+    i = start
+    while i < stop:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
             continue
 
-        case_reference = _consume_case_reference(text, i)
-        if case_reference is not None:
-            text_span, start, end = case_reference
-            tokens.append((text_span, start, end, TokenType.CASE_REFERENCE))
-            i = end
+        may_be_keyword, probes = _dispatch_plan(ch)
+        parts = None
+        word_end = -1
+        if may_be_keyword:
+            word, _, word_end = _consume_word(text, i)
+            keyword_probe = _KEYWORD_PROBES.get(_normalize_keyword(word))
+            if keyword_probe is not None:
+                parts = keyword_probe(text, i)
+        if parts is None:
+            for probe in probes:
+                parts = probe(text, i)
+                if parts is not None:
+                    break
+        if parts is not None:
+            tokens.extend(parts)
+            i = parts[-1][2]
             continue
 
         if ch.isdigit():
             text_span, start, end = _consume_digits(text, i)
             token_type = TokenType.NUMBER
-        elif ch.isalpha() or ch in {"_"} or ch == "'":
-            text_span, start, end = _consume_word(text, i)
+        elif ch.isalpha() or ch == "_" or ch == "'":
+            if word_end > i:
+                text_span, start, end = word, i, word_end
+            else:
+                text_span, start, end = _consume_word(text, i)
             token_type = TokenType.WORD
         else:
             text_span, start, end = ch, i, i + 1
             token_type = TokenType.PUNCT
         tokens.append((text_span, start, end, token_type))
         i = end
+    return i
 
+
+def _tokenize_with_no_regex(text: str) -> list[_TypedSpan]:
+    tokens: list[_TypedSpan] = []
+    _scan(text, 0, len(text), tokens)
     return tokens
 
 
+def tokenize_typed_spans(text: str) -> list[tuple[str, int, int, TokenType]]:
+    """Return ``(text, start, end, token_type)`` tuples in a single pass.
+
+    This is the shared form behind :func:`tokenize_with_spans` and
+    :func:`tokenize_detailed` for callers that need both.
+    """
+
+    return _tokenize_with_no_regex(text)
+
+
+DEFAULT_STREAM_LOOKAHEAD = 4096
+
+
+def iter_tokens(
+    source: str | Iterable[str],
+    *,
+    lookahead: int = DEFAULT_STREAM_LOOKAHEAD,
+) -> Iterator[LexemeToken]:
+    """Yield tokens from a string or an iterable of text chunks.
+
+    Offsets are relative to the concatenated input.  A token is only emitted
+    once ``lookahead`` characters beyond its start are buffered (or the input
+    is exhausted), so output matches :func:`tokenize_detailed` on the whole
+    text unless a single reference (e.g. an unclosed parenthesis group) spans
+    more than ``lookahead`` characters.  Memory stays proportional to the
+    chunk size plus ``lookahead`` rather than to the token count.
+    """
+
+    if lookahead < 1:
+        raise ValueError("lookahead must be positive")
+    chunks = (source,) if isinstance(source, str) else source
+    buffer = ""
+    base = 0  # absolute offset of buffer[0]
+    cursor = 0  # buffer-relative resume offset
+    pending: list[_TypedSpan] = []
+
+    def drain(stop: int) -> Iterator[LexemeToken]:
+        nonlocal cursor
+        while cursor < stop:
+            # Bound each scan so long inputs are emitted incrementally.
+            cursor = _scan(buffer, cursor, min(stop, cursor + lookahead), pending)
+            for text_span, start, end, token_type in pending:
+                yield LexemeToken(token_type=token_type, text=text_span, start=base + start, end=base + end)
+            pending.clear()
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        yield from drain(len(buffer) - lookahead)
+        # Keep one character before the cursor for left-boundary checks.
+        keep_from = max(0, cursor - 1)
+        if keep_from:
+            buffer = buffer[keep_from:]
+            base += keep_from
+            cursor -= keep_from
+    yield from drain(len(buffer))
+
+
 def tokenize_with_spans(text: str) -> list[tuple[str, int, int]]:
     """Return deterministic text spans for canonical lexeme extraction."""
 
@@ -726,8 +852,11 @@ LEXEME_TOKENIZER_VERSION = "itir_legal_lexer_v2"
 __all__ = [
     "LEXEME_TOKENIZER_ID",
     "LEXEME_TOKENIZER_VERSION",
+    "DEFAULT_STREAM_LOOKAHEAD",
     "LexemeToken",
     "TokenType",
+    "iter_tokens",
     "tokenize_detailed",
+    "tokenize_typed_spans",
     "tokenize_with_spans",
 ]
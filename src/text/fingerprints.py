@@ -0,0 +1,292 @@
+"""Batched SimHash/MinHash fingerprints and a banded SimHash index.
+
+:func:`~src.text.similarity.simhash` and :func:`~src.text.similarity.minhash`
+hash every token occurrence with MD5/SHA1 and walk the bits in Python.  Their
+hex values are persisted (``receipts.simhash``/``receipts.minhash``), so they
+stay as they are.  This module is the bulk path for in-memory near-duplicate
+detection over large paragraph sets:
+
+* texts are tokenised exactly like :mod:`src.text.similarity` and each
+  distinct token is hashed once with 64-bit FNV-1a, vectorised over the
+  vocabulary;
+* :func:`simhash_many` and :func:`minhash_many` aggregate those token hashes
+  per text with NumPy segment reductions;
+* :class:`SimHashIndex` splits the 64 bits into ``threshold + 1`` bands.  By
+  the pigeonhole principle two fingerprints within ``threshold`` bits agree on
+  at least one band, so bucket lookups find every pair a brute-force Hamming
+  comparison would, without comparing all pairs.
+
+Fingerprints from this module are not interchangeable with the MD5-based hex
+values of :func:`~src.text.similarity.simhash`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Set, Tuple
+
+from .similarity import _tokenize
+
+try:  # pragma: no cover - exercised implicitly when NumPy is present
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+FNV_OFFSET_BASIS = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+SIMHASH_BITS = 64
+DEFAULT_NUM_PERM = 64
+DEFAULT_CHUNK_TOKENS = 1 << 18
+_MINHASH_EMPTY = 0xFFFFFFFF
+
+
+def _require_numpy() -> Any:
+    if np is None:
+        raise RuntimeError("NumPy is required for batched fingerprints")
+    return np
+
+
+def fnv1a_64(token: str) -> int:
+    """Return the 64-bit FNV-1a hash of ``token``'s UTF-8 bytes."""
+
+    value = FNV_OFFSET_BASIS
+    for byte in token.encode("utf-8"):
+        value = ((value ^ byte) * FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return value
+
+
+def hash_tokens(tokens: Sequence[str]) -> "np.ndarray":
+    """Return FNV-1a hashes for ``tokens`` as a ``uint64`` array.
+
+    Tokens are processed byte column by byte column, longest first, so each
+    step is a single vectorised XOR/multiply over the tokens still active.
+    """
+
+    numpy = _require_numpy()
+    encoded = [token.encode("utf-8") for token in tokens]
+    count = len(encoded)
+    hashes = numpy.full(count, FNV_OFFSET_BASIS, dtype=numpy.uint64)
+    if not count:
+        return hashes
+    lengths = numpy.fromiter((len(item) for item in encoded), dtype=numpy.int64, count=count)
+    order = numpy.argsort(-lengths, kind="stable")
+    lengths = lengths[order]
+    buffer = numpy.frombuffer(b"".join(encoded[i] for i in order), dtype=numpy.uint8)
+    starts = numpy.zeros(count, dtype=numpy.int64)
+    numpy.cumsum(lengths[:-1], out=starts[1:])
+    sorted_hashes = hashes.copy()
+    prime = numpy.uint64(FNV_PRIME)
+    # Number of tokens longer than each column; lengths are descending.
+    active_counts = numpy.searchsorted(-lengths, -numpy.arange(int(lengths[0])), side="left")
+    for column, active in enumerate(active_counts.tolist()):
+        column_bytes = buffer[starts[:active] + column].astype(numpy.uint64)
+        sorted_hashes[:active] = (sorted_hashes[:active] ^ column_bytes) * prime
+    hashes[order] = sorted_hashes
+    return hashes
+
+
+class _TokenBatch:
+    """Vocabulary-encoded tokens of several texts."""
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        numpy = _require_numpy()
+        vocabulary: Dict[str, int] = {}
+        token_ids: List[int] = []
+        offsets = [0]
+        for text in texts:
+            token_ids.extend(
+                vocabulary.setdefault(token, len(vocabulary)) for token in _tokenize(text)
+            )
+            offsets.append(len(token_ids))
+        self.token_ids = numpy.asarray(token_ids, dtype=numpy.int64)
+        self.offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        self.vocabulary_hashes = hash_tokens(list(vocabulary))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def chunks(self, chunk_tokens: int) -> Iterable[Tuple[int, int]]:
+        """Yield ``(first, last)`` text ranges holding about ``chunk_tokens`` tokens."""
+
+        numpy = _require_numpy()
+        count = len(self)
+        first = 0
+        while first < count:
+            limit = self.offsets[first] + max(1, chunk_tokens)
+            last = int(numpy.searchsorted(self.offsets, limit, side="right")) - 1
+            last = min(max(last, first + 1), count)
+            yield first, last
+            first = last
+
+    def segments(self, first: int, last: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Return token ids, local offsets and the non-empty mask for a range."""
+
+        bounds = self.offsets[first : last + 1]
+        ids = self.token_ids[bounds[0] : bounds[-1]]
+        starts = bounds[:-1] - bounds[0]
+        non_empty = bounds[1:] > bounds[:-1]
+        return ids, starts[non_empty], non_empty
+
+
+def simhash_many(
+    texts: Iterable[str], *, chunk_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> "np.ndarray":
+    """Return 64-bit SimHash fingerprints for ``texts`` as a ``uint64`` array.
+
+    Every token occurrence votes on every bit and a bit is set when the vote
+    is non-negative, matching :func:`~src.text.similarity.simhash` (texts
+    without tokens therefore fingerprint to all ones).
+    """
+
+    numpy = _require_numpy()
+    batch = _TokenBatch(texts)
+    bits = numpy.unpackbits(
+        batch.vocabulary_hashes.astype("<u8").view(numpy.uint8).reshape(-1, 8),
+        axis=1,
+        bitorder="little",
+    )
+    votes = bits.astype(numpy.int8) * 2 - 1
+    fingerprints = numpy.full(len(batch), 0xFFFFFFFFFFFFFFFF, dtype=numpy.uint64)
+    for first, last in batch.chunks(chunk_tokens):
+        ids, starts, non_empty = batch.segments(first, last)
+        if not len(starts):
+            continue
+        totals = numpy.add.reduceat(votes[ids], starts, axis=0, dtype=numpy.int32)
+        packed = numpy.packbits(totals >= 0, axis=1, bitorder="little")
+        fingerprints[first:last][non_empty] = packed.view("<u8").ravel()
+    return fingerprints
+
+
+def _permutation_parameters(num_perm: int, seed: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    numpy = _require_numpy()
+    rng = numpy.random.default_rng(seed)
+    high = numpy.iinfo(numpy.uint64).max
+    multipliers = rng.integers(1, high, size=num_perm, dtype=numpy.uint64, endpoint=True)
+    multipliers |= numpy.uint64(1)
+    increments = rng.integers(0, high, size=num_perm, dtype=numpy.uint64, endpoint=True)
+    return multipliers, increments
+
+
+def minhash_many(
+    texts: Iterable[str],
+    *,
+    num_perm: int = DEFAULT_NUM_PERM,
+    seed: int = 1,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+) -> "np.ndarray":
+    """Return ``(len(texts), num_perm)`` ``uint32`` MinHash signatures.
+
+    Permutations are multiply-shift hashes of the token FNV-1a values
+    (``(a * h + b) >> 32`` modulo 2**64), so each distinct token is permuted
+    once per batch.  Texts without tokens get an all-``0xFFFFFFFF`` signature.
+    """
+
+    if num_perm < 1:
+        raise ValueError("num_perm must be at least 1")
+    numpy = _require_numpy()
+    batch = _TokenBatch(texts)
+    multipliers, increments = _permutation_parameters(num_perm, seed)
+    permuted = (
+        (multipliers[:, None] * batch.vocabulary_hashes[None, :] + increments[:, None])
+        >> numpy.uint64(32)
+    ).astype(numpy.uint32)
+    signatures = numpy.full((len(batch), num_perm), _MINHASH_EMPTY, dtype=numpy.uint32)
+    for first, last in batch.chunks(max(1, chunk_tokens // num_perm)):
+        ids, starts, non_empty = batch.segments(first, last)
+        if not len(starts):
+            continue
+        minima = numpy.minimum.reduceat(permuted[:, ids], starts, axis=1)
+        signatures[first:last][non_empty] = minima.T
+    return signatures
+
+
+def minhash_jaccard(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+
+    if len(left) != len(right) or not len(left):
+        raise ValueError("Signatures must be non-empty and of equal length")
+    matches = sum(1 for a, b in zip(left, right) if a == b)
+    return matches / len(left)
+
+
+class SimHashIndex:
+    """Exact Hamming-radius lookup for 64-bit SimHash fingerprints.
+
+    Each fingerprint is bucketed under ``threshold + 1`` disjoint bit bands.
+    Any fingerprint within ``threshold`` bits of a query shares at least one
+    band with it, so :meth:`query` returns exactly the matches of a linear
+    scan while only inspecting the query's buckets.
+    """
+
+    def __init__(self, threshold: int = 3) -> None:
+        if threshold < 0:
+            raise ValueError("threshold must be non-negative")
+        self.threshold = threshold
+        self._keys: List[Hashable] = []
+        self._fingerprints: List[int] = []
+        band_count = threshold + 1
+        # Beyond 63 bits every fingerprint matches and bucketing buys nothing.
+        self._bands: List[Tuple[int, int]] = []
+        if band_count <= SIMHASH_BITS:
+            width, extra = divmod(SIMHASH_BITS, band_count)
+            shift = 0
+            for band in range(band_count):
+                bits = width + (1 if band < extra else 0)
+                self._bands.append((shift, (1 << bits) - 1))
+                shift += bits
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable, fingerprint: int) -> int:
+        """Index ``fingerprint`` under ``key`` and return its position."""
+
+        position = len(self._keys)
+        self._keys.append(key)
+        self._fingerprints.append(int(fingerprint))
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault((int(fingerprint) >> shift) & mask, []).append(position)
+        return position
+
+    def add_many(self, items: Iterable[Tuple[Hashable, int]]) -> None:
+        for key, fingerprint in items:
+            self.add(key, fingerprint)
+
+    def candidates(self, fingerprint: int) -> Set[int]:
+        """Return positions sharing at least one band with ``fingerprint``."""
+
+        if not self._bands:
+            return set(range(len(self._keys)))
+        found: Set[int] = set()
+        fingerprint = int(fingerprint)
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            found.update(buckets.get((fingerprint >> shift) & mask, ()))
+        return found
+
+    def query(self, fingerprint: int) -> List[Tuple[Hashable, int]]:
+        """Return ``(key, distance)`` for indexed fingerprints within the threshold."""
+
+        fingerprint = int(fingerprint)
+        matches = []
+        for position in sorted(self.candidates(fingerprint)):
+            distance = (self._fingerprints[position] ^ fingerprint).bit_count()
+            if distance <= self.threshold:
+                matches.append((self._keys[position], distance))
+        return matches
+
+    def fingerprint(self, position: int) -> int:
+        return self._fingerprints[position]
+
+    def key(self, position: int) -> Hashable:
+        return self._keys[position]
+
+
+__all__ = [
+    "DEFAULT_NUM_PERM",
+    "SimHashIndex",
+    "fnv1a_64",
+    "hash_tokens",
+    "minhash_jaccard",
+    "minhash_many",
+    "simhash_many",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
 import logging
 import os
@@ -13,7 +14,7 @@ from src.text.deterministic_legal_tokenizer import (
     LEXEME_TOKENIZER_VERSION,
     LexemeToken,
     TokenType,
-    tokenize_detailed,
+    tokenize_typed_spans,
     tokenize_with_spans,
 )
 
@@ -42,6 +43,8 @@ _LEXEME_TOKENIZER_MODE_ALIAS = {
     "icu_udpipe": "legacy_regex",
 }
 
+_PLAIN_TOKEN_TYPES = frozenset({TokenType.WORD, TokenType.NUMBER, TokenType.PUNCT})
+
 _REGEX_TOKENIZER_ID = "regex_legacy_v1"
 _REGEX_TOKENIZER_VERSION = "re_unicode_word_symbol_v1"
 _WARNED_LEGACY = False
@@ -118,6 +121,46 @@ def _collect_token_spans(text: str, mode: str) -> list[tuple[str, int, int]]:
     return list(_iter_regex_tokens(text))
 
 
+_INSTITUTION_ALIASES = {
+    "u.s. senate": "institution:u_s_senate",
+    "us senate": "institution:u_s_senate",
+    "united states senate": "institution:u_s_senate",
+    "senate of the united states": "institution:u_s_senate",
+    "house of representatives": "institution:u_s_house_of_representatives",
+    "u.s. house of representatives": "institution:u_s_house_of_representatives",
+    "us house of representatives": "institution:u_s_house_of_representatives",
+    "united states house of representatives": "institution:u_s_house_of_representatives",
+    "united states department of defense": "institution:united_states_department_of_defense",
+    "u.s. department of defense": "institution:united_states_department_of_defense",
+    "department of defense": "institution:united_states_department_of_defense",
+    "defense department": "institution:united_states_department_of_defense",
+    "central intelligence agency": "institution:central_intelligence_agency",
+    "cia": "institution:central_intelligence_agency",
+    "federal bureau of investigation": "institution:federal_bureau_of_investigation",
+    "fbi": "institution:federal_bureau_of_investigation",
+    "f.b.i.": "institution:federal_bureau_of_investigation",
+    "un": "institution:united_nations",
+    "u.n.": "institution:united_nations",
+    "uno": "institution:united_nations",
+    "united nations": "institution:united_nations",
+    "united nations organization": "institution:united_nations",
+    "security council": "institution:united_nations_security_council",
+    "un security council": "institution:united_nations_security_council",
+    "u.n. security council": "institution:united_nations_security_council",
+    "unsc": "institution:united_nations_security_council",
+    "united nations security council": "institution:united_nations_security_council",
+}
+
+_COURT_ALIASES = {
+    "international criminal court": "court:international_criminal_court",
+    "icc": "court:international_criminal_court",
+    "icct": "court:international_criminal_court",
+    "international court of justice": "court:international_court_of_justice",
+    "icj": "court:international_court_of_justice",
+    "world court": "court:international_court_of_justice",
+}
+
+
 def _canonicalize_legal_reference(token: LexemeToken):
     def compact_identifier(value: str) -> str:
         out: list[str] = []
@@ -147,55 +190,17 @@ def _canonicalize_legal_reference(token: LexemeToken):
             inner = inner[1:-1]
         return inner.strip().casefold()
 
-    institution_aliases = {
-        "u.s. senate": "institution:u_s_senate",
-        "us senate": "institution:u_s_senate",
-        "united states senate": "institution:u_s_senate",
-        "senate of the united states": "institution:u_s_senate",
-        "house of representatives": "institution:u_s_house_of_representatives",
-        "u.s. house of representatives": "institution:u_s_house_of_representatives",
-        "us house of representatives": "institution:u_s_house_of_representatives",
-        "united states house of representatives": "institution:u_s_house_of_representatives",
-        "united states department of defense": "institution:united_states_department_of_defense",
-        "u.s. department of defense": "institution:united_states_department_of_defense",
-        "department of defense": "institution:united_states_department_of_defense",
-        "defense department": "institution:united_states_department_of_defense",
-        "central intelligence agency": "institution:central_intelligence_agency",
-        "cia": "institution:central_intelligence_agency",
-        "federal bureau of investigation": "institution:federal_bureau_of_investigation",
-        "fbi": "institution:federal_bureau_of_investigation",
-        "f.b.i.": "institution:federal_bureau_of_investigation",
-        "un": "institution:united_nations",
-        "u.n.": "institution:united_nations",
-        "uno": "institution:united_nations",
-        "united nations": "institution:united_nations",
-        "united nations organization": "institution:united_nations",
-        "security council": "institution:united_nations_security_council",
-        "un security council": "institution:united_nations_security_council",
-        "u.n. security council": "institution:united_nations_security_council",
-        "unsc": "institution:united_nations_security_council",
-        "united nations security council": "institution:united_nations_security_council",
-    }
-    court_aliases = {
-        "international criminal court": "court:international_criminal_court",
-        "icc": "court:international_criminal_court",
-        "icct": "court:international_criminal_court",
-        "international court of justice": "court:international_court_of_justice",
-        "icj": "court:international_court_of_justice",
-        "world court": "court:international_court_of_justice",
-    }
-
     if token.token_type == TokenType.ACT_REFERENCE:
         return "act_ref", f"act:{compact_identifier(strip_leading_determiner(token.text))}"
     if token.token_type == TokenType.CASE_REFERENCE:
         return "case_ref", f"case:{compact_identifier(token.text)}"
     if token.token_type == TokenType.COURT_REFERENCE:
-        canonical = court_aliases.get(token.text.casefold())
+        canonical = _COURT_ALIASES.get(token.text.casefold())
         if canonical is not None:
             return "court_ref", canonical
         return "court_ref", f"court:{compact_identifier(token.text)}"
     if token.token_type == TokenType.INSTITUTION_REFERENCE:
-        canonical = institution_aliases.get(token.text.casefold())
+        canonical = _INSTITUTION_ALIASES.get(token.text.casefold())
         if canonical is not None:
             return "institution_ref", canonical
         return "institution_ref", f"institution:{compact_identifier(token.text)}"
@@ -224,6 +229,11 @@ def _canonicalize_legal_reference(token: LexemeToken):
     return None
 
 
+# normalize_lexeme is pure and returns a frozen value; surfaces repeat heavily
+# across documents, so a bounded memo skips most of the per-character work.
+_cached_normalize_lexeme = lru_cache(maxsize=65536)(normalize_lexeme)
+
+
 def _token_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
@@ -290,8 +300,14 @@ def collect_lexeme_occurrences_with_profile(
     shadow_mode = _LEXEME_TOKENIZER_SHADOW if enable_shadow is None else bool(enable_shadow)
 
     canonical_id, canonical_version = _tokenizer_profile_from_mode(canonical_mode)
-    canonical_spans = _collect_token_spans(text, canonical_mode)
-    canonical_detailed = tokenize_detailed(text) if canonical_mode == "deterministic_legal" else None
+    canonical_types: list[TokenType] | None = None
+    if canonical_mode == "deterministic_legal":
+        # One tokenizer pass feeds both the spans and the legal-reference kinds.
+        typed_spans = tokenize_typed_spans(text)
+        canonical_spans = [(span, start, end) for span, start, end, _ in typed_spans]
+        canonical_types = [token_type for _, _, _, token_type in typed_spans]
+    else:
+        canonical_spans = _collect_token_spans(text, canonical_mode)
 
     shadow_tokenizer_id = None
     mismatch_count = 0
@@ -328,15 +344,18 @@ def collect_lexeme_occurrences_with_profile(
 
     occurrences = []
     for idx, (token_text, start_char, end_char) in enumerate(canonical_spans):
-        if canonical_detailed is not None:
-            legal_norm = _canonicalize_legal_reference(canonical_detailed[idx])
-        else:
-            legal_norm = None
+        legal_norm = None
+        if canonical_types is not None:
+            token_type = canonical_types[idx]
+            if token_type not in _PLAIN_TOKEN_TYPES:
+                legal_norm = _canonicalize_legal_reference(
+                    LexemeToken(token_type=token_type, text=token_text, start=start_char, end=end_char)
+                )
         if legal_norm is not None:
             norm_kind, norm_text = legal_norm
             flags = 0
         else:
-            norm = normalize_lexeme(token_text)
+            norm = _cached_normalize_lexeme(token_text)
             norm_kind, norm_text, flags = norm.norm_kind, norm.norm_text, norm.flags
         occurrences.append(
             LexemeOccurrence(
@@ -21,6 +21,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
+from . import fingerprints
 from .similarity import simhash
 
 
@@ -100,12 +101,6 @@ def build_pin_cite_navigator(paragraphs: Iterable[Paragraph]) -> List[NavigatorE
     return entries
 
 
-def _hamming_distance(a: str, b: str) -> int:
-    """Return the Hamming distance between two hex-encoded fingerprints."""
-
-    return bin(int(a, 16) ^ int(b, 16)).count("1")
-
-
 @dataclass(frozen=True)
 class DuplicateHit:
     """Record of a duplicate paragraph discovered across drafts."""
@@ -127,10 +122,33 @@ class DuplicateDetector:
 
     The detector fingerprints each paragraph using SimHash and groups entries
     whose fingerprints fall within a configurable Hamming distance threshold.
+    Candidates come from a banded :class:`~src.text.fingerprints.SimHashIndex`
+    rather than an all-pairs comparison; the banding is exact, so grouping is
+    the same as comparing every pair.
+
+    ``engine`` selects the fingerprinting path: ``"legacy"`` (the default)
+    uses the MD5-based :func:`~src.text.similarity.simhash`, ``"batch"`` the
+    NumPy FNV-1a engine in :mod:`src.text.fingerprints`, and ``"auto"`` the
+    batch engine whenever NumPy is importable.  The batch fingerprints differ
+    from the MD5 ones, so ``DuplicateGroup.fingerprint`` and near-duplicate
+    grouping only change for callers that opt in.
     """
 
-    def __init__(self, *, threshold: int = 3) -> None:
+    ENGINES = ("auto", "batch", "legacy")
+
+    def __init__(self, *, threshold: int = 3, engine: str = "legacy") -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f"engine must be one of {', '.join(self.ENGINES)}")
         self.threshold = threshold
+        self.engine = engine
+
+    def _fingerprints(self, texts: Sequence[str]) -> List[int]:
+        engine = self.engine
+        if engine == "auto":
+            engine = "batch" if fingerprints.np is not None else "legacy"
+        if engine == "batch":
+            return fingerprints.simhash_many(texts).tolist()
+        return [int(simhash(text), 16) for text in texts]
 
     def find_duplicates(
         self, drafts: Sequence[Sequence[Paragraph]]
@@ -141,30 +159,37 @@ class DuplicateDetector:
         drafts, ensuring they highlight redundant reading between versions.
         """
 
-        fingerprints: List[Tuple[str, int, Paragraph]] = []
-        for draft_index, draft in enumerate(drafts):
-            for para in draft:
-                fingerprint = simhash(para.text)
-                fingerprints.append((fingerprint, draft_index, para))
+        if self.threshold < 0:
+            return []
+        entries: List[Tuple[int, Paragraph]] = [
+            (draft_index, para)
+            for draft_index, draft in enumerate(drafts)
+            for para in draft
+        ]
+        index = fingerprints.SimHashIndex(self.threshold)
+        values = self._fingerprints([para.text for _, para in entries])
+        for position, value in enumerate(values):
+            index.add(position, value)
 
         groups: List[DuplicateGroup] = []
         consumed: set[int] = set()
-        for idx, (fp, draft_index, paragraph) in enumerate(fingerprints):
+        for idx, (draft_index, paragraph) in enumerate(entries):
             if idx in consumed:
                 continue
+            fp = values[idx]
             hits = [DuplicateHit(draft_index=draft_index, paragraph=paragraph)]
-            for other_idx in range(idx + 1, len(fingerprints)):
-                if other_idx in consumed:
+            for other_idx in sorted(index.candidates(fp)):
+                if other_idx <= idx or other_idx in consumed:
                     continue
-                other_fp, other_draft, other_para = fingerprints[other_idx]
+                other_draft, other_para = entries[other_idx]
                 if other_draft == draft_index:
                     continue
-                if _hamming_distance(fp, other_fp) <= self.threshold:
+                if (fp ^ values[other_idx]).bit_count() <= self.threshold:
                     hits.append(DuplicateHit(draft_index=other_draft, paragraph=other_para))
                     consumed.add(other_idx)
             if len(hits) > 1:
                 consumed.add(idx)
-                groups.append(DuplicateGroup(fingerprint=fp, hits=tuple(hits)))
+                groups.append(DuplicateGroup(fingerprint=f"{fp:016x}", hits=tuple(hits)))
         return groups
 
 
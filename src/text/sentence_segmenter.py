@@ -0,0 +1,319 @@
+"""Rule-based sentence segmentation on character offsets.
+
+:func:`src.text.sentences.segment_sentences` used to build a blank-English
+spaCy ``Doc`` for every text, run the sentencizer over every token and walk the
+tokens again in Python to force paragraph breaks.  This module reproduces the
+same boundaries without a document-sized ``Doc``:
+
+* sentencizer semantics - after a token that is one of the sentencizer
+  punctuation characters, the next token that is neither punctuation nor
+  such a character starts a sentence;
+* paragraph semantics - the token after a whitespace token containing a blank
+  line (``"\\n\\n"``) starts a sentence.
+
+Only the neighbourhood of each candidate boundary is examined.  Whitespace is
+split exactly as spaCy's tokenizer splits it, and the whitespace-delimited
+chunk holding a punctuation candidate is tokenised with spaCy's tokenizer (a
+few characters, cached per distinct chunk) so abbreviation exceptions and affix
+rules match the spaCy path.  Without spaCy an approximation of the English
+affix rules is used.
+
+:func:`iter_sentences` streams sentences from a text or from an iterable of
+text pieces (e.g. a file read in blocks), holding back only the sentence that
+may still continue.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import re
+import unicodedata
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.models.sentence import Sentence
+
+# ``spacy.pipeline.Sentencizer.default_punct_chars`` (spaCy 3.x).
+SENTENCIZER_PUNCT_CHARS: Tuple[str, ...] = (
+    "!", ".", "?", "։", "؟", "۔", "܀", "܁", "܂", "߹", "।", "॥", "၊", "။", "።",
+    "፧", "፨", "᙮", "᜵", "᜶", "᠃", "᠉", "᥄", "᥅", "᪨", "᪩", "᪪", "᪫",
+    "᭚", "᭛", "᭞", "᭟", "᰻", "᰼", "᱾", "᱿", "‼", "‽", "⁇", "⁈", "⁉",
+    "⸮", "⸼", "꓿", "꘎", "꘏", "꛳", "꛷", "꡶", "꡷", "꣎", "꣏", "꤯", "꧈",
+    "꧉", "꩝", "꩞", "꩟", "꫰", "꫱", "꯫", "﹒", "﹖", "﹗", "！", "．", "？",
+    "𐩖", "𐩗", "𑁇", "𑁈", "𑂾", "𑂿", "𑃀", "𑃁", "𑅁", "𑅂", "𑅃", "𑇅",
+    "𑇆", "𑇍", "𑇞", "𑇟", "𑈸", "𑈹", "𑈻", "𑈼", "𑊩", "𑑋", "𑑌", "𑗂",
+    "𑗃", "𑗉", "𑗊", "𑗋", "𑗌", "𑗍", "𑗎", "𑗏", "𑗐", "𑗑", "𑗒", "𑗓",
+    "𑗔", "𑗕", "𑗖", "𑗗", "𑙁", "𑙂", "𑜼", "𑜽", "𑜾", "𑩂", "𑩃", "𑪛",
+    "𑪜", "𑱁", "𑱂", "𖩮", "𖩯", "𖫵", "𖬷", "𖬸", "𖭄", "𛲟", "𝪈", "｡", "。",
+)
+_PUNCT_CHARS = frozenset(SENTENCIZER_PUNCT_CHARS)
+_CANDIDATE_RE = re.compile("[" + re.escape("".join(SENTENCIZER_PUNCT_CHARS)) + "]")
+_PARAGRAPH_RE = re.compile(r"\n\n")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WHITESPACE_RE = re.compile(r"\S+")
+
+Token = Tuple[int, str]
+
+
+def _is_punct(text: str) -> bool:
+    # spaCy's ``is_punct`` lexical attribute.
+    return all(unicodedata.category(char).startswith("P") for char in text)
+
+
+def _spacy_tokenizer():
+    from src.text.sentences import get_nlp
+
+    nlp = get_nlp()
+    return None if nlp is None else nlp.tokenizer
+
+
+# Fallback affix rules, a subset of spaCy's English punctuation rules.
+_FALLBACK_PREFIX_RE = re.compile(r"""^(?:[\[\](){}<>"'`‘’“”«»¿¡§$£€#*&~_-]|\.\.+|…)""")
+_FALLBACK_SUFFIX_RE = re.compile(
+    r"""(?:[\[\](){}<>"'`‘’“”«»!?,:;%_#*&…]|\.\.+|(?<=[0-9a-z%²\-+"'”’)\]}!?,:;])\.|(?<=[A-Z][A-Z])\.)$"""
+)
+_FALLBACK_ABBREVIATIONS = frozenset(
+    {"Mr.", "Mrs.", "Ms.", "Dr.", "St.", "Jr.", "Sr.", "Inc.", "Ltd.", "Co.", "Corp.", "vs."}
+)
+_FALLBACK_INITIALS_RE = re.compile(r"^(?:[A-Za-z]\.)+[A-Za-z]?\.?$")
+
+
+def _fallback_chunk_tokens(chunk: str) -> Tuple[Token, ...]:
+    prefixes: List[Token] = []
+    suffixes: List[Token] = []
+    start, end = 0, len(chunk)
+    while start < end:
+        middle = chunk[start:end]
+        if middle in _FALLBACK_ABBREVIATIONS or _FALLBACK_INITIALS_RE.match(middle):
+            break
+        match = _FALLBACK_PREFIX_RE.match(chunk, start, end)
+        if match is not None and match.end() < end:
+            prefixes.append((start, match.group()))
+            start = match.end()
+            continue
+        match = _FALLBACK_SUFFIX_RE.search(chunk[start:end])
+        if match is not None and match.start() > 0:
+            suffixes.append((start + match.start(), match.group()))
+            end = start + match.start()
+            continue
+        break
+    middle = [(start, chunk[start:end])] if start < end else []
+    return tuple(prefixes + middle + suffixes[::-1])
+
+
+@lru_cache(maxsize=65536)
+def _chunk_tokens(chunk: str) -> Tuple[Token, ...]:
+    """Return ``(offset, text)`` tokens of one whitespace-free chunk."""
+
+    tokenizer = _spacy_tokenizer()
+    if tokenizer is None:
+        return _fallback_chunk_tokens(chunk)
+    return tuple((token.idx, token.text) for token in tokenizer(chunk))
+
+
+def _chunk_start(text: str, pos: int) -> int:
+    while pos > 0 and not text[pos - 1].isspace():
+        pos -= 1
+    return pos
+
+
+def _ws_start(text: str, pos: int) -> int:
+    while pos > 0 and text[pos - 1].isspace():
+        pos -= 1
+    return pos
+
+
+def _tokens_from(text: str, pos: int, end: int) -> Iterator[Token]:
+    """Yield tokens starting at whitespace/chunk boundary ``pos``.
+
+    Whitespace follows spaCy: one leading space of a run is the previous
+    token's trailing whitespace and the rest of the run is a token.
+    """
+
+    while pos < end:
+        if text[pos].isspace():
+            run_end = _WHITESPACE_RE.match(text, pos, end).end()
+            token_start = pos + 1 if text[pos] == " " else pos
+            if token_start < run_end:
+                yield token_start, text[token_start:run_end]
+            pos = run_end
+            continue
+        chunk_end = _NON_WHITESPACE_RE.match(text, pos, end).end()
+        for offset, token in _chunk_tokens(text[pos:chunk_end]):
+            yield pos + offset, token
+        pos = chunk_end
+
+
+def _sentencizer_start(tokens: Iterator[Token]) -> Optional[int]:
+    """Return where the sentence after a terminal token starts, if anywhere."""
+
+    for start, token in tokens:
+        if token in _PUNCT_CHARS or (not token.isspace() and _is_punct(token)):
+            continue
+        return start
+    return None
+
+
+def _boundaries_in(text: str, start: int, end: int) -> set[int]:
+    """Return sentence starts triggered by candidates in ``text[start:end]``.
+
+    ``start`` must be a chunk or whitespace boundary.
+    """
+
+    boundaries: set[int] = set()
+    seen_chunks: set[int] = set()
+    for match in _CANDIDATE_RE.finditer(text, start, end):
+        chunk_start = _chunk_start(text, match.start())
+        if chunk_start in seen_chunks:
+            continue
+        seen_chunks.add(chunk_start)
+        chunk_end = _NON_WHITESPACE_RE.match(text, chunk_start, end).end()
+        tokens = _chunk_tokens(text[chunk_start:chunk_end])
+        for index, (offset, token) in enumerate(tokens):
+            if token not in _PUNCT_CHARS:
+                continue
+            rest = ((chunk_start + o, t) for o, t in tokens[index + 1 :])
+            following = _tokens_from(text, chunk_end, end)
+            boundary = _sentencizer_start(_chain(rest, following))
+            if boundary is not None:
+                boundaries.add(boundary)
+    for match in _PARAGRAPH_RE.finditer(text, start, end):
+        run = _WHITESPACE_RE.match(text, _ws_start(text, match.start()), end)
+        if run.end() < end:
+            boundaries.add(run.end())
+    return boundaries
+
+
+def sentence_boundaries(text: str, *, end: Optional[int] = None) -> List[int]:
+    """Return the sorted character offsets at which sentences start.
+
+    ``end`` limits the scan to ``text[:end]``; boundaries that depend on text
+    after ``end`` are not reported.
+    """
+
+    end = len(text) if end is None else end
+    return sorted({0} | _boundaries_in(text, 0, end))
+
+
+def _chain(*iterables: Iterable[Token]) -> Iterator[Token]:
+    for iterable in iterables:
+        yield from iterable
+
+
+def _sentences_between(
+    text: str, boundaries: Sequence[int], stop: int, base: int, index: int
+) -> Iterator[Sentence]:
+    for position, start in enumerate(boundaries):
+        finish = boundaries[position + 1] if position + 1 < len(boundaries) else stop
+        raw = text[start:finish]
+        stripped = raw.strip()
+        if not stripped:
+            continue
+        leading = len(raw) - len(raw.lstrip())
+        trailing = len(raw) - len(raw.rstrip())
+        yield Sentence(
+            text=stripped,
+            start_char=base + start + leading,
+            end_char=base + finish - trailing,
+            index=index,
+        )
+        index += 1
+
+
+def segment(text: str) -> List[Sentence]:
+    """Segment ``text`` into :class:`Sentence` objects."""
+
+    if not text:
+        return []
+    return list(_sentences_between(text, sentence_boundaries(text), len(text), 0, 0))
+
+
+def segment_with_spacy(text: str) -> List[Sentence]:
+    """Segment ``text`` through a full spaCy ``Doc``; the reference for :func:`segment`."""
+
+    from src.text.sentences import iter_sentence_spans, make_doc
+
+    sentences: List[Sentence] = []
+    for index, span in enumerate(iter_sentence_spans(make_doc(text))):
+        raw = span.text
+        leading = len(raw) - len(raw.lstrip())
+        trailing = len(raw) - len(raw.rstrip())
+        sentences.append(
+            Sentence(
+                text=raw.strip(),
+                start_char=span.start_char + leading,
+                end_char=span.end_char - trailing,
+                index=index,
+            )
+        )
+    return sentences
+
+
+def _resolved_until(text: str, scan_from: int, end: int) -> int:
+    """Return a chunk start before which every boundary in ``text[:end]`` is known.
+
+    A candidate's boundary is the next non-punctuation token, so once an
+    alphanumeric character has been seen every earlier candidate is resolved;
+    only the chunk holding the last one (and what follows) needs rescanning.
+    """
+
+    for position in range(end - 1, scan_from - 1, -1):
+        if text[position].isalnum():
+            return _chunk_start(text, position)
+    return scan_from
+
+
+def iter_sentences(source: Union[str, Iterable[str]]) -> Iterator[Sentence]:
+    """Yield sentences from a text or from consecutive pieces of one text.
+
+    Offsets refer to the concatenated text and the sentences equal those of
+    :func:`segment` on it.  Only the trailing sentence, from the start of the
+    whitespace-delimited chunk it begins in, is buffered between pieces, and
+    each piece is scanned once apart from the chunk still awaiting a boundary.
+    """
+
+    pieces = (source,) if isinstance(source, str) else source
+    buffer = ""
+    base = 0
+    index = 0
+    # ``pending`` is where the unfinished sentence starts inside ``buffer``;
+    # ``buffer`` itself starts at that sentence's chunk so the chunk is always
+    # tokenised whole.  Candidates before ``scan_from`` are already resolved.
+    pending = 0
+    scan_from = 0
+    for piece in pieces:
+        if not piece:
+            continue
+        buffer += piece
+        # The final whitespace run and chunk may continue in the next piece.
+        safe_end = len(buffer)
+        if not buffer[-1].isspace():
+            safe_end = _chunk_start(buffer, safe_end)
+        safe_end = _ws_start(buffer, safe_end)
+        if safe_end <= scan_from:
+            continue
+        found = _boundaries_in(buffer, scan_from, safe_end)
+        scan_from = _resolved_until(buffer, scan_from, safe_end)
+        boundaries = [pending] + sorted(b for b in found if pending < b < safe_end)
+        if len(boundaries) < 2:
+            continue
+        for sentence in _sentences_between(buffer, boundaries[:-1], boundaries[-1], base, index):
+            index = sentence.index + 1
+            yield sentence
+        cut = _chunk_start(buffer, boundaries[-1])
+        base += cut
+        buffer = buffer[cut:]
+        pending = boundaries[-1] - cut
+        scan_from = max(scan_from - cut, 0)
+    if buffer:
+        found = _boundaries_in(buffer, scan_from, len(buffer))
+        boundaries = [pending] + sorted(b for b in found if b > pending)
+        yield from _sentences_between(buffer, boundaries, len(buffer), base, index)
+
+
+__all__ = [
+    "SENTENCIZER_PUNCT_CHARS",
+    "iter_sentences",
+    "segment",
+    "segment_with_spacy",
+    "sentence_boundaries",
+]
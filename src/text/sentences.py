@@ -12,6 +12,7 @@ if TYPE_CHECKING:  # pragma: no cover - type-only imports without an import-time
     from spacy.tokens import Doc, Span
 
 from src.models.sentence import Sentence
+from src.text import sentence_segmenter
 
 
 @dataclass(frozen=True)
@@ -91,39 +92,20 @@ def iter_sentence_spans(doc: "Doc") -> Iterator["Span"]:
             yield span
 
 
-def segment_sentences(text: str) -> List[Sentence]:
-    """Segment ``text`` into :class:`Sentence` objects."""
-
-    if get_nlp() is None:
-        if not text:
-            return []
-        # Minimal fallback: split on sentence terminators to maintain structure without spaCy.
-        parts = [part.strip() for part in text.replace("\n", " ").split(".") if part.strip()]
-        return [
-            Sentence(text=part, start_char=0, end_char=len(part), index=idx)
-            for idx, part in enumerate(parts)
-        ]
-
-    doc = make_doc(text)
-    sentences: List[Sentence] = []
-    for index, span in enumerate(iter_sentence_spans(doc)):
-        raw = span.text
-        stripped = raw.strip()
-        if not stripped:
-            continue
-        leading_ws = len(raw) - len(raw.lstrip())
-        trailing_ws = len(raw) - len(raw.rstrip())
-        start_char = span.start_char + leading_ws
-        end_char = span.end_char - trailing_ws
-        sentences.append(
-            Sentence(
-                text=stripped,
-                start_char=start_char,
-                end_char=end_char,
-                index=index,
-            )
-        )
-    return sentences
+def segment_sentences(text: str, *, engine: str = "rules") -> List[Sentence]:
+    """Segment ``text`` into :class:`Sentence` objects.
+
+    ``engine="rules"`` (the default) uses the offset-based segmenter in
+    :mod:`src.text.sentence_segmenter`; ``engine="spacy"`` builds a full
+    :func:`make_doc` and reads its sentence spans.  Both apply the same
+    sentencizer and blank-line paragraph rules.
+    """
+
+    if engine == "rules" or (engine == "spacy" and get_nlp() is None):
+        return sentence_segmenter.segment(text)
+    if engine != "spacy":
+        raise ValueError(f"Unknown sentence segmentation engine: {engine!r}")
+    return sentence_segmenter.segment_with_spacy(text)
 
 
 def _normalize_heading(value: Any) -> str:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import json
 import re
 import runpy
@@ -7,11 +8,19 @@ import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Iterator, Mapping
 
+from src.ingestion.fetch_pool import HostRateLimits
+from src.sources.rate_limit import RateLimit
 from src.wiki_timeline.revision_harness import build_revision_comparison_report
 from src.wiki_timeline.revision_pack_storage import (
     default_out_dir_for_pack,
@@ -42,6 +51,13 @@ _WS_RE = re.compile(r"\s+")
 _SECTION_RE = re.compile(r"^(={2,6})\s*(.*?)\s*\1\s*$", re.MULTILINE)
 _REVERT_RE = re.compile(r"\b(revert|reverted|reverting|undid|undo|rv|rollback)\b", re.IGNORECASE)
 
+EXECUTION_MODES = ("subprocess", "in_process")
+#: Matches ``wiki_pull_api.py --wiki-rps`` so a concurrent run is as polite
+#: per wiki as one serial subprocess.
+DEFAULT_WIKI_RATE_LIMIT = RateLimit(rps=1.0, burst=1)
+_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+_EXTRACTION_LOCK = threading.Lock()
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -836,6 +852,115 @@ def _subprocess_json(args: list[str], *, cwd: Path) -> dict[str, Any]:
     return json.loads(completed.stdout)
 
 
+def _script_globals(script_name: str, *, cached: bool) -> Mapping[str, Any]:
+    """Return the globals of a ``scripts/`` entry point.
+
+    ``cached=False`` re-executes the script file; ``cached=True`` imports it
+    once as ``scripts.<name>`` (as :mod:`src.wiki_timeline.article_state`
+    does) and shares the module.
+    """
+
+    if not cached:
+        return runpy.run_path(str(_SCRIPTS_DIR / script_name))
+    if str(_SCRIPTS_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(_SCRIPTS_DIR.parent))
+    return vars(importlib.import_module(f"scripts.{Path(script_name).stem}"))
+
+
+class _WikiPacer:
+    """``wiki_pull_api`` pacer backed by the run's shared per-wiki token bucket."""
+
+    def __init__(self, wiki_limits: HostRateLimits, wiki: str) -> None:
+        self._limiter = wiki_limits.limiter(wiki)
+
+    def wait(self) -> None:
+        self._limiter.acquire()
+
+
+def _wiki_pacer(wiki_limits: HostRateLimits | None, wiki: str) -> _WikiPacer | None:
+    return _WikiPacer(wiki_limits, wiki) if wiki_limits is not None else None
+
+
+class _WikiSlots:
+    """At most one ``wiki_pull_api.py`` subprocess per wiki at a time.
+
+    A subprocess pull makes several requests under its own pacing, so a token
+    per launch alone would let overlapping launches multiply the request rate
+    against one wiki.  Holding the wiki's lock for the whole subprocess keeps
+    each wiki at the rate a serial run would use.
+    """
+
+    def __init__(self, wiki_limits: HostRateLimits) -> None:
+        self._wiki_limits = wiki_limits
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def hold(self, article: Mapping[str, Any]) -> Iterator[None]:
+        wiki = str(article.get("wiki") or "enwiki")
+        with self._guard:
+            lock = self._locks.setdefault(wiki, threading.Lock())
+        with lock:
+            self._wiki_limits.limiter(wiki).acquire()
+            yield
+
+
+@contextmanager
+def _wiki_slot(wiki_slots: _WikiSlots | None, article: Mapping[str, Any]) -> Iterator[None]:
+    if wiki_slots is None:
+        yield
+        return
+    with wiki_slots.hold(article):
+        yield
+
+
+@contextmanager
+def _script_exit_as_error(script_name: str) -> Iterator[None]:
+    # The scripts report bad input with ``SystemExit``; in this process that
+    # would skip the per-article error handling and end the whole run.
+    try:
+        yield
+    except SystemExit as exc:
+        raise RuntimeError(f"{script_name} exited: {exc.code}") from exc
+
+
+def _in_process_pull_snapshot(
+    *,
+    article: Mapping[str, Any],
+    out_dir: Path,
+    wiki_limits: HostRateLimits | None,
+    revid: int | None = None,
+) -> dict[str, Any]:
+    pull = _script_globals("wiki_pull_api.py", cached=True)
+    wiki = str(article.get("wiki") or "enwiki")
+    options = {
+        "wiki": wiki,
+        "title": str(article.get("title") or ""),
+        "max_links": 50,
+        "max_categories": 50,
+        "include_wikitext": True,
+        "pacer": _wiki_pacer(wiki_limits, wiki),
+    }
+    with _script_exit_as_error("wiki_pull_api.py"):
+        if revid is not None:
+            snap = pull["_fetch_revision_wikitext"](revid=int(revid), timeout_s=30, **options)
+        elif _pywikibot_available():
+            snap = pull["_fetch_latest_pywikibot"](**options)
+        else:
+            snap = pull["_fetch_latest_wikitext"](timeout_s=30, **options)
+        snapshot_path = pull["_write_snapshot"](out_dir, snap)
+    return {"snapshot_path": snapshot_path, "snapshot_payload": snap.to_json()}
+
+
+def _pywikibot_available() -> bool:
+    # Mirrors wiki_pull_api's ``--driver auto`` choice for latest snapshots.
+    try:
+        import pywikibot  # noqa: F401, PLC0415
+    except Exception:
+        return False
+    return True
+
+
 def _looks_like_person_title(title: str) -> bool:
     parts = [part for part in _norm_text(title).split(" ") if part]
     if len(parts) < 2 or len(parts) > 4:
@@ -851,20 +976,26 @@ def _default_fetch_current_snapshot(
     out_dir: Path,
     python_cmd: str,
     repo_root: Path,
+    in_process: bool = False,
+    wiki_limits: HostRateLimits | None = None,
+    wiki_slots: _WikiSlots | None = None,
 ) -> dict[str, Any]:
-    payload = _subprocess_json(
-        [
-            python_cmd,
-            str(repo_root / "SensibLaw" / "scripts" / "wiki_pull_api.py"),
-            "--wiki",
-            str(article.get("wiki") or "enwiki"),
-            "--title",
-            str(article.get("title") or ""),
-            "--out-dir",
-            str(out_dir),
-        ],
-        cwd=repo_root,
-    )
+    if in_process:
+        return _in_process_pull_snapshot(article=article, out_dir=out_dir, wiki_limits=wiki_limits)
+    with _wiki_slot(wiki_slots, article):
+        payload = _subprocess_json(
+            [
+                python_cmd,
+                str(_SCRIPTS_DIR / "wiki_pull_api.py"),
+                "--wiki",
+                str(article.get("wiki") or "enwiki"),
+                "--title",
+                str(article.get("title") or ""),
+                "--out-dir",
+                str(out_dir),
+            ],
+            cwd=repo_root,
+        )
     snapshots = payload.get("snapshots") or []
     if not snapshots:
         raise RuntimeError(f"wiki pull returned no snapshots for {article.get('title')}")
@@ -882,22 +1013,28 @@ def _default_fetch_revision_snapshot(
     out_dir: Path,
     python_cmd: str,
     repo_root: Path,
+    in_process: bool = False,
+    wiki_limits: HostRateLimits | None = None,
+    wiki_slots: _WikiSlots | None = None,
 ) -> dict[str, Any]:
-    payload = _subprocess_json(
-        [
-            python_cmd,
-            str(repo_root / "SensibLaw" / "scripts" / "wiki_pull_api.py"),
-            "--wiki",
-            str(article.get("wiki") or "enwiki"),
-            "--title",
-            str(article.get("title") or ""),
-            "--revid",
-            str(revid),
-            "--out-dir",
-            str(out_dir),
-        ],
-        cwd=repo_root,
-    )
+    if in_process:
+        return _in_process_pull_snapshot(article=article, out_dir=out_dir, wiki_limits=wiki_limits, revid=revid)
+    with _wiki_slot(wiki_slots, article):
+        payload = _subprocess_json(
+            [
+                python_cmd,
+                str(_SCRIPTS_DIR / "wiki_pull_api.py"),
+                "--wiki",
+                str(article.get("wiki") or "enwiki"),
+                "--title",
+                str(article.get("title") or ""),
+                "--revid",
+                str(revid),
+                "--out-dir",
+                str(out_dir),
+            ],
+            cwd=repo_root,
+        )
     snapshots = payload.get("snapshots") or []
     if not snapshots:
         raise RuntimeError(f"wiki pull returned no snapshot for revision {revid}")
@@ -916,10 +1053,30 @@ def _default_fetch_revision_history(
     repo_root: Path,
     max_revisions: int,
     window_days: int,
+    in_process: bool = False,
+    wiki_limits: HostRateLimits | None = None,
+    wiki_slots: _WikiSlots | None = None,
 ) -> dict[str, Any]:
+    if in_process:
+        pull = _script_globals("wiki_pull_api.py", cached=True)
+        wiki = str(article.get("wiki") or "enwiki")
+        title = str(article.get("title") or "")
+        with _script_exit_as_error("wiki_pull_api.py"):
+            history_payload = pull["_fetch_revision_history"](
+                wiki=wiki,
+                title=title,
+                max_revisions=int(max_revisions),
+                window_days=int(window_days),
+                timeout_s=30,
+                pacer=_wiki_pacer(wiki_limits, wiki),
+            )
+            history_path = pull["_write_history_manifest"](
+                out_dir, wiki, str(history_payload.get("title") or title), history_payload
+            )
+        return {"history_path": history_path, "history_payload": history_payload}
     args = [
         python_cmd,
-        str(repo_root / "SensibLaw" / "scripts" / "wiki_pull_api.py"),
+        str(_SCRIPTS_DIR / "wiki_pull_api.py"),
         "--wiki",
         str(article.get("wiki") or "enwiki"),
         "--title",
@@ -931,7 +1088,8 @@ def _default_fetch_revision_history(
     ]
     if window_days > 0:
         args.extend(["--history-window-days", str(window_days)])
-    payload = _subprocess_json(args, cwd=repo_root)
+    with _wiki_slot(wiki_slots, article):
+        payload = _subprocess_json(args, cwd=repo_root)
     histories = payload.get("histories") or []
     if not histories:
         return {"history_path": None, "history_payload": {"rows": [], "warnings": ["no_history_manifest"]}}
@@ -949,19 +1107,21 @@ def _default_build_timeline(
     python_cmd: str,
     repo_root: Path,
     snapshot_payload: Mapping[str, Any] | None = None,
+    in_process: bool = False,
 ) -> dict[str, Any]:
-    module_globals = runpy.run_path(str(repo_root / "SensibLaw" / "scripts" / "wiki_timeline_extract.py"))
+    module_globals = _script_globals("wiki_timeline_extract.py", cached=in_process)
     build_timeline_payload_from_snapshot = module_globals["build_timeline_payload_from_snapshot"]
     if snapshot_payload is None:
         snapshot_payload = read_json_file(snapshot_path)
     if not isinstance(snapshot_payload, Mapping):
         raise RuntimeError(f"snapshot payload unreadable: {snapshot_path}")
-    payload = build_timeline_payload_from_snapshot(
-        snap=dict(snapshot_payload),
-        snapshot_path=snapshot_path,
-        max_events=220,
-        section_contains=[],
-    )
+    with _extraction_guard(in_process), _script_exit_as_error("wiki_timeline_extract.py"):
+        payload = build_timeline_payload_from_snapshot(
+            snap=dict(snapshot_payload),
+            snapshot_path=snapshot_path,
+            max_events=220,
+            section_contains=[],
+        )
     return {"timeline_path": None, "timeline_payload": payload}
 
 
@@ -973,8 +1133,9 @@ def _default_build_aoo(
     python_cmd: str,
     repo_root: Path,
     timeline_payload: Mapping[str, Any] | None = None,
+    in_process: bool = False,
 ) -> dict[str, Any]:
-    module_globals = runpy.run_path(str(repo_root / "SensibLaw" / "scripts" / "wiki_timeline_aoo_extract.py"))
+    module_globals = _script_globals("wiki_timeline_aoo_extract.py", cached=in_process)
     build_aoo_payload_from_timeline = module_globals["build_aoo_payload_from_timeline"]
     title = str(article.get("title") or "")
     root_actor = title if _looks_like_person_title(title) else "George W. Bush"
@@ -983,16 +1144,28 @@ def _default_build_aoo(
         timeline_payload = read_json_file(timeline_path)
     if not isinstance(timeline_payload, Mapping):
         raise RuntimeError("timeline payload unavailable for in-process AAO extraction")
-    payload = build_aoo_payload_from_timeline(
-        timeline_payload=dict(timeline_payload),
-        timeline_path=timeline_path,
-        root_actor=root_actor,
-        root_surname=root_surname,
-        no_db=True,
-    )
+    with _extraction_guard(in_process), _script_exit_as_error("wiki_timeline_aoo_extract.py"):
+        payload = build_aoo_payload_from_timeline(
+            timeline_payload=dict(timeline_payload),
+            timeline_path=timeline_path,
+            root_actor=root_actor,
+            root_surname=root_surname,
+            no_db=True,
+        )
     return {"aoo_path": None, "aoo_payload": payload}
 
 
+@contextmanager
+def _extraction_guard(shared: bool) -> Iterator[None]:
+    # Shared script globals may hold module-level caches; extraction is
+    # CPU-bound, so serialising it costs little while fetches still overlap.
+    if not shared:
+        yield
+        return
+    with _EXTRACTION_LOCK:
+        yield
+
+
 def _default_auto_review_context(
     *,
     packet: Mapping[str, Any],
@@ -1751,6 +1924,471 @@ def _build_pair_report(
     return pair
 
 
+@dataclass(frozen=True)
+class _ArticleEntryPoints:
+    fetch_current_snapshot: Callable[..., Mapping[str, Any]]
+    fetch_revision_history: Callable[..., Mapping[str, Any]]
+    fetch_revision_snapshot: Callable[..., Mapping[str, Any]]
+    build_timeline: Callable[..., Mapping[str, Any]]
+    build_aoo: Callable[..., Mapping[str, Any]]
+    auto_review_context: Callable[..., Mapping[str, Any]]
+
+
+@dataclass
+class _ArticleOutcome:
+    """Everything one article produced, recorded later on the run's connection."""
+
+    article_index: int
+    article: Mapping[str, Any]
+    article_id: str
+    previous_revid: int | None
+    current_snapshot_path: Path | None = None
+    current_snapshot_payload: dict[str, Any] = field(default_factory=dict)
+    current_revid: int | None = None
+    history_rows: list[dict[str, Any]] | None = None
+    pairs_considered: int = 0
+    scored_candidates: list[dict[str, Any]] = field(default_factory=list)
+    selected_pairs: list[dict[str, Any]] = field(default_factory=list)
+    contested_graph_payload: dict[str, Any] | None = None
+    status: str = "error"
+    top_severity: str = "none"
+    packet_counts: dict[str, Any] = field(default_factory=dict)
+    result_payload: dict[str, Any] = field(default_factory=dict)
+    error: Exception | None = None
+
+
+def _serialized_progress(
+    progress_callback: Callable[[str, Mapping[str, Any]], None] | None,
+) -> Callable[[str, Mapping[str, Any]], None] | None:
+    if not callable(progress_callback):
+        return progress_callback
+    lock = threading.Lock()
+
+    def emit(stage: str, details: Mapping[str, Any]) -> None:
+        with lock:
+            progress_callback(stage, details)
+
+    return emit
+
+
+def _process_article(
+    *,
+    pack: Mapping[str, Any],
+    article: Mapping[str, Any],
+    article_index: int,
+    total_articles: int,
+    previous_state: sqlite3.Row | None,
+    run_id: str,
+    out_dir: Path,
+    python_cmd: str,
+    repo_root: Path,
+    bridge_db_path: Path | None,
+    entry_points: _ArticleEntryPoints,
+    progress_callback: Callable[[str, Mapping[str, Any]], None] | None,
+) -> _ArticleOutcome:
+    """Fetch, score and report one article without touching the state DB."""
+
+    py = python_cmd
+    article_id = str(article.get("article_id") or "")
+    history_cfg = _history_config(pack, article)
+    previous_revid = int(previous_state["last_revid"]) if previous_state and previous_state["last_revid"] is not None else None
+    outcome = _ArticleOutcome(
+        article_index=article_index,
+        article=article,
+        article_id=article_id,
+        previous_revid=previous_revid,
+    )
+    try:
+        _emit_progress(
+            progress_callback,
+            "revision_pack_article_started",
+            {
+                "section": "wiki_revision_articles",
+                "completed": article_index - 1,
+                "total": max(total_articles, 1),
+                "article_id": article_id,
+                "message": f"Fetching current snapshot for {article.get('title')}.",
+            },
+        )
+        fetched = entry_points.fetch_current_snapshot(article=article, out_dir=out_dir / "snapshots", python_cmd=py, repo_root=repo_root)
+        current_snapshot_path = Path(str(fetched["snapshot_path"]))
+        outcome.current_snapshot_path = current_snapshot_path
+        current_snapshot_payload = dict(fetched["snapshot_payload"])
+        contract_error = _snapshot_contract_error(article, current_snapshot_payload)
+        if contract_error:
+            raise RuntimeError(contract_error)
+        current_revid = _safe_int(current_snapshot_payload.get("revid"))
+        current_paths = revision_artifact_paths(out_dir=out_dir, article_id=article_id, revid=current_revid)
+        if current_snapshot_path != current_paths["snapshot"]:
+            write_json_file(current_paths["snapshot"], current_snapshot_payload)
+            current_snapshot_path = current_paths["snapshot"]
+            outcome.current_snapshot_path = current_snapshot_path
+
+        history = entry_points.fetch_revision_history(
+            article=article,
+            out_dir=out_dir / "history",
+            python_cmd=py,
+            repo_root=repo_root,
+            max_revisions=history_cfg["max_revisions"],
+            window_days=history_cfg["window_days"],
+        )
+        history_rows = _ensure_history_contains_current(_normalize_history_rows(history.get("history_payload")), current_snapshot_payload)
+        outcome.history_rows = history_rows
+        _emit_progress(
+            progress_callback,
+            "revision_pack_article_history",
+            {
+                "section": "wiki_revision_articles",
+                "completed": article_index - 1,
+                "total": max(total_articles, 1),
+                "article_id": article_id,
+                "message": f"Loaded {len(history_rows)} history rows.",
+                "history_row_count": len(history_rows),
+            },
+        )
+
+        selected_pairs = outcome.selected_pairs
+        candidates = _candidate_pairs(history_rows, previous_state, current_revid)
+        scored_candidates: list[dict[str, Any]] = []
+        total_candidates = len(candidates)
+        _emit_progress(
+            progress_callback,
+            "revision_pack_article_candidates_started",
+            {
+                "section": "wiki_revision_candidates",
+                "completed": 0,
+                "total": max(total_candidates, 1),
+                "article_id": article_id,
+                "message": f"Scoring {total_candidates} candidate pairs.",
+            },
+        )
+        for candidate_index, candidate in enumerate(candidates, start=1):
+            older_revid = int(candidate["older_revid"])
+            newer_revid = int(candidate["newer_revid"])
+            older_snapshot = entry_points.fetch_revision_snapshot(article=article, revid=older_revid, out_dir=out_dir / "pair_snapshots", python_cmd=py, repo_root=repo_root)
+            newer_snapshot = entry_points.fetch_revision_snapshot(article=article, revid=newer_revid, out_dir=out_dir / "pair_snapshots", python_cmd=py, repo_root=repo_root)
+            older_payload = dict(older_snapshot["snapshot_payload"])
+            newer_payload = dict(newer_snapshot["snapshot_payload"])
+            older_error = _snapshot_contract_error(article, older_payload)
+            newer_error = _snapshot_contract_error(article, newer_payload)
+            if older_error:
+                raise RuntimeError(older_error)
+            if newer_error:
+                raise RuntimeError(newer_error)
+            candidate.update(
+                _score_candidate_pair(
+                    candidate,
+                    older_snapshot_payload=older_payload,
+                    newer_snapshot_payload=newer_payload,
+                    section_focus_limit=history_cfg["section_focus_limit"],
+                )
+            )
+            candidate["selected"] = False
+            candidate["status"] = "candidate"
+            scored_candidates.append(candidate)
+            _emit_progress(
+                progress_callback,
+                "revision_pack_article_candidates_progress",
+                {
+                    "section": "wiki_revision_candidates",
+                    "completed": candidate_index,
+                    "total": max(total_candidates, 1),
+                    "article_id": article_id,
+                    "message": f"Scored pair {candidate['pair_kind']} {older_revid}->{newer_revid}.",
+                },
+            )
+
+        scored_candidates.sort(
+            key=lambda row: (
+                -float(row.get("candidate_score") or 0.0),
+                -int(row.get("newer_revid") or 0),
+                str(row.get("pair_kind") or ""),
+            )
+        )
+        outcome.scored_candidates = scored_candidates
+        outcome.pairs_considered = len(scored_candidates)
+
+        selected_limit = min(len(scored_candidates), history_cfg["max_candidate_pairs"])
+        _emit_progress(
+            progress_callback,
+            "revision_pack_article_reports_started",
+            {
+                "section": "wiki_revision_reports",
+                "completed": 0,
+                "total": max(selected_limit, 1),
+                "article_id": article_id,
+                "message": f"Building up to {selected_limit} pair reports.",
+            },
+        )
+        for selected_index, candidate in enumerate(scored_candidates[: history_cfg["max_candidate_pairs"]], start=1):
+            selected = _build_pair_report(
+                article=article,
+                pair=dict(candidate),
+                out_dir=out_dir,
+                python_cmd=py,
+                repo_root=repo_root,
+                fetch_revision_snapshot_fn=entry_points.fetch_revision_snapshot,
+                build_timeline_fn=entry_points.build_timeline,
+                build_aoo_fn=entry_points.build_aoo,
+                auto_review_context_fn=entry_points.auto_review_context,
+                bridge_db_path=bridge_db_path,
+                section_focus_limit=history_cfg["section_focus_limit"],
+            )
+            selected_pairs.append(selected)
+            _emit_progress(
+                progress_callback,
+                "revision_pack_article_reports_progress",
+                {
+                    "section": "wiki_revision_reports",
+                    "completed": selected_index,
+                    "total": max(selected_limit, 1),
+                    "article_id": article_id,
+                    "message": f"Built pair report {selected.get('pair_id')}.",
+                },
+            )
+
+        if previous_revid is None:
+            with tempfile.TemporaryDirectory(prefix="wiki_current_", dir=str(out_dir)) as current_temp_dir_text:
+                current_temp_dir = Path(current_temp_dir_text)
+                current_temp_paths = revision_artifact_paths(
+                    out_dir=current_temp_dir,
+                    article_id=article_id,
+                    revid=current_revid,
+                )
+                current_timeline = _invoke_build_timeline(
+                    entry_points.build_timeline,
+                    snapshot_path=current_snapshot_path,
+                    out_path=current_temp_paths["timeline"],
+                    python_cmd=py,
+                    repo_root=repo_root,
+                    snapshot_payload=current_snapshot_payload,
+                )
+                _invoke_build_aoo(
+                    entry_points.build_aoo,
+                    article=article,
+                    timeline_path=current_temp_paths["timeline"],
+                    out_path=current_temp_paths["aoo"],
+                    python_cmd=py,
+                    repo_root=repo_root,
+                    timeline_payload=dict(current_timeline["timeline_payload"]),
+                )
+
+        status: str
+        if selected_pairs:
+            status = "changed"
+        elif previous_revid is None:
+            status = "baseline_initialized"
+        elif current_revid == previous_revid:
+            status = "unchanged"
+        else:
+            status = "no_candidate_delta"
+
+        top_severity = "none"
+        packet_counts: dict[str, Any] = {}
+        if selected_pairs:
+            for severity in ("high", "medium", "low"):
+                if any(pair.get("top_severity") == severity for pair in selected_pairs):
+                    top_severity = severity
+                    break
+            aggregate_counts = {"high": 0, "medium": 0, "low": 0}
+            for pair in selected_pairs:
+                for key, value in dict(pair.get("packet_counts") or {}).items():
+                    aggregate_counts[key] = aggregate_counts.get(key, 0) + int(value)
+            packet_counts = aggregate_counts
+        primary_pair = selected_pairs[0] if selected_pairs else None
+        contested_graph_summary: dict[str, Any] | None = None
+        if _graph_enabled(pack, article) and selected_pairs:
+            outcome.contested_graph_payload = _build_contested_region_graph(
+                article=article,
+                run_id=run_id,
+                selected_pairs=selected_pairs,
+                out_dir=out_dir,
+            )
+            contested_graph_summary = dict((outcome.contested_graph_payload.get("summary") or {}))
+
+        outcome.result_payload = {
+            "article_id": article_id,
+            "title": article.get("title"),
+            "status": status,
+            "baseline_initialized": previous_revid is None,
+            "previous_revid": previous_revid,
+            "current_revid": current_revid,
+            "top_severity": top_severity,
+            "history_window": {
+                "max_revisions": history_cfg["max_revisions"],
+                "window_days": history_cfg["window_days"],
+                "fetched_row_count": len(history_rows),
+            },
+            "candidate_pairs_considered": len(scored_candidates),
+            "candidate_pairs_selected": len(selected_pairs),
+            "selected_pair_ids": [str(pair["pair_id"]) for pair in selected_pairs],
+            "selected_primary_pair_id": primary_pair["pair_id"] if primary_pair else None,
+            "selected_primary_pair_kind": primary_pair["pair_kind"] if primary_pair else None,
+            "selected_primary_pair_kinds": list(primary_pair.get("pair_kinds") or []) if primary_pair else [],
+            "selected_primary_pair_score": primary_pair["candidate_score"] if primary_pair else None,
+            "pair_reports": [
+                {
+                    "pair_id": pair["pair_id"],
+                    "pair_kind": pair["pair_kind"],
+                    "pair_kinds": list(pair.get("pair_kinds") or []),
+                    "older_revid": pair["older_revid"],
+                    "newer_revid": pair["newer_revid"],
+                    "candidate_score": pair["candidate_score"],
+                    "top_severity": pair.get("top_severity", "none"),
+                    "pair_report_payload": pair.get("pair_report_payload"),
+                    "top_changed_sections": list(((pair.get("section_delta_summary") or {}).get("top_changed_sections")) or []),
+                }
+                for pair in selected_pairs
+            ],
+            "packet_counts": packet_counts,
+            "contested_graph_available": contested_graph_summary is not None,
+            "contested_graph_summary": contested_graph_summary,
+        }
+        outcome.current_snapshot_payload = current_snapshot_payload
+        outcome.current_revid = current_revid
+        outcome.status = status
+        outcome.top_severity = top_severity
+        outcome.packet_counts = packet_counts
+    except Exception as exc:
+        outcome.status = "error"
+        outcome.error = exc
+    return outcome
+
+
+def _record_article_outcome(
+    conn: sqlite3.Connection,
+    outcome: _ArticleOutcome,
+    *,
+    run_id: str,
+    total_articles: int,
+    summary_counts: dict[str, int],
+    candidate_pair_counts: dict[str, int],
+    contested_graph_counts: dict[str, int],
+    article_results: list[dict[str, Any]],
+    progress_callback: Callable[[str, Mapping[str, Any]], None] | None,
+) -> None:
+    """Write one article's outcome to the state DB; only the run's thread calls this."""
+
+    article = outcome.article
+    article_id = outcome.article_id
+    if outcome.history_rows is not None:
+        _insert_history_rows(conn, run_id=run_id, article_id=article_id, rows=outcome.history_rows)
+    candidate_pair_counts["considered"] += outcome.pairs_considered
+    candidate_pair_counts["selected"] += len(outcome.selected_pairs)
+    candidate_pair_counts["reported"] += len(outcome.selected_pairs)
+
+    if outcome.error is None:
+        try:
+            for candidate in outcome.scored_candidates:
+                materialized = next((row for row in outcome.selected_pairs if row["pair_id"] == candidate["pair_id"]), candidate)
+                _insert_candidate_pair(conn, run_id=run_id, article_id=article_id, pair_payload=materialized)
+            summary_counts[outcome.status] = summary_counts.get(outcome.status, 0) + 1
+            if outcome.contested_graph_payload is not None:
+                contested_graph_summary = outcome.result_payload["contested_graph_summary"]
+                _insert_contested_graph(
+                    conn,
+                    run_id=run_id,
+                    article_id=article_id,
+                    graph_payload=outcome.contested_graph_payload,
+                )
+                contested_graph_counts["articles_with_graphs"] += 1
+                contested_graph_counts["graphs_built"] += 1
+                contested_graph_counts["cycles_detected"] += int(contested_graph_summary.get("cycle_count") or 0)
+                contested_graph_counts["regions_detected"] += int(contested_graph_summary.get("region_count") or 0)
+
+            _upsert_article_state(
+                conn,
+                article_id=article_id,
+                revid=outcome.current_revid,
+                rev_timestamp=_norm_text(outcome.current_snapshot_payload.get("rev_timestamp")) or None,
+                fetched_at=_norm_text(outcome.current_snapshot_payload.get("fetched_at")) or None,
+                snapshot_path=outcome.current_snapshot_path,
+                status=outcome.status,
+            )
+            _insert_article_result(
+                conn,
+                run_id=run_id,
+                article_id=article_id,
+                status=outcome.status,
+                previous_revid=outcome.previous_revid,
+                current_revid=outcome.current_revid,
+                top_severity=outcome.top_severity,
+                packet_counts=outcome.packet_counts,
+                snapshot_path=outcome.current_snapshot_path,
+                result_payload=outcome.result_payload,
+            )
+            replace_issue_packets(
+                conn,
+                run_id=run_id,
+                article_id=article_id,
+                packet_rows=_selected_issue_packet_rows(outcome.selected_pairs),
+            )
+            replace_selected_pairs(
+                conn,
+                run_id=run_id,
+                article_id=article_id,
+                pair_rows=_selected_pair_rows(outcome.selected_pairs),
+            )
+        except Exception as exc:
+            outcome.error = exc
+        else:
+            article_results.append(outcome.result_payload)
+            _emit_progress(
+                progress_callback,
+                "revision_pack_article_finished",
+                {
+                    "section": "wiki_revision_articles",
+                    "completed": outcome.article_index,
+                    "total": max(total_articles, 1),
+                    "article_id": article_id,
+                    "status": outcome.status,
+                    "message": f"Finished {article.get('title')} with status {outcome.status}.",
+                },
+            )
+            return
+
+    exc = outcome.error
+    status = "error"
+    summary_counts[status] = summary_counts.get(status, 0) + 1
+    result_payload = {
+        "article_id": article_id,
+        "title": article.get("title"),
+        "status": status,
+        "previous_revid": outcome.previous_revid,
+        "current_revid": None,
+        "error": f"{type(exc).__name__}: {exc}",
+        "contested_graph_available": False,
+        "contested_graph_summary": None,
+    }
+    _insert_article_result(
+        conn,
+        run_id=run_id,
+        article_id=article_id,
+        status=status,
+        previous_revid=outcome.previous_revid,
+        current_revid=None,
+        top_severity="none",
+        packet_counts={},
+        snapshot_path=outcome.current_snapshot_path,
+        result_payload=result_payload,
+    )
+    replace_issue_packets(conn, run_id=run_id, article_id=article_id, packet_rows=[])
+    replace_selected_pairs(conn, run_id=run_id, article_id=article_id, pair_rows=[])
+    article_results.append(result_payload)
+    _emit_progress(
+        progress_callback,
+        "revision_pack_article_finished",
+        {
+            "section": "wiki_revision_articles",
+            "completed": outcome.article_index,
+            "total": max(total_articles, 1),
+            "article_id": article_id,
+            "status": status,
+            "message": f"Failed {article.get('title')}: {type(exc).__name__}.",
+        },
+    )
+
+
 def run(
     *,
     pack_path: Path,
@@ -1765,7 +2403,25 @@ def run(
     build_aoo_fn: Callable[..., Mapping[str, Any]] | None = None,
     auto_review_context_fn: Callable[..., Mapping[str, Any]] | None = None,
     progress_callback: Callable[[str, Mapping[str, Any]], None] | None = None,
+    execution: str = "subprocess",
+    max_workers: int = 1,
+    wiki_rate_limits: Mapping[str, RateLimit] | None = None,
 ) -> dict[str, Any]:
+    """Run a revision pack and return its summary.
+
+    ``execution="subprocess"`` pulls every snapshot and history through a
+    ``wiki_pull_api.py`` subprocess; ``"in_process"`` imports the pull,
+    timeline and AAO entry points once and calls them directly.  With
+    ``max_workers > 1`` articles run concurrently on a thread pool, throttled
+    per wiki by ``wiki_rate_limits`` (default :data:`DEFAULT_WIKI_RATE_LIMIT`),
+    while state DB writes, counts and results stay on this thread in pack
+    order.  Injected ``*_fn`` callables are used as given.
+    """
+
+    if execution not in EXECUTION_MODES:
+        raise ValueError(f"execution must be one of {EXECUTION_MODES}, got {execution!r}")
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
     pack = json.loads(pack_path.read_text(encoding="utf-8"))
     pack_id = str(pack.get("pack_id") or "wiki_revision_monitor")
     run_started = _utc_now_iso()
@@ -1775,12 +2431,29 @@ def run(
     repo_root = Path(__file__).resolve().parents[3]
     py = python_cmd or sys.executable
 
-    fetch_current_snapshot_fn = fetch_current_snapshot_fn or _default_fetch_current_snapshot
-    fetch_revision_history_fn = fetch_revision_history_fn or _default_fetch_revision_history
-    fetch_revision_snapshot_fn = fetch_revision_snapshot_fn or _default_fetch_revision_snapshot
-    build_timeline_fn = build_timeline_fn or _default_build_timeline
-    build_aoo_fn = build_aoo_fn or _default_build_aoo
-    auto_review_context_fn = auto_review_context_fn or _default_auto_review_context
+    in_process = execution == "in_process"
+    # Subprocess pulls pace themselves; the shared buckets only matter once
+    # pulls overlap or run in this process.
+    wiki_limits = (
+        HostRateLimits(DEFAULT_WIKI_RATE_LIMIT, wiki_rate_limits)
+        if in_process or max_workers > 1
+        else None
+    )
+    fetch_options = {
+        "in_process": in_process,
+        "wiki_limits": wiki_limits,
+        "wiki_slots": _WikiSlots(wiki_limits) if wiki_limits is not None and not in_process else None,
+    }
+    entry_points = _ArticleEntryPoints(
+        fetch_current_snapshot=fetch_current_snapshot_fn or partial(_default_fetch_current_snapshot, **fetch_options),
+        fetch_revision_history=fetch_revision_history_fn or partial(_default_fetch_revision_history, **fetch_options),
+        fetch_revision_snapshot=fetch_revision_snapshot_fn or partial(_default_fetch_revision_snapshot, **fetch_options),
+        build_timeline=build_timeline_fn or partial(_default_build_timeline, in_process=in_process),
+        build_aoo=build_aoo_fn or partial(_default_build_aoo, in_process=in_process),
+        auto_review_context=auto_review_context_fn or _default_auto_review_context,
+    )
+    if max_workers > 1:
+        progress_callback = _serialized_progress(progress_callback)
 
     article_results: list[dict[str, Any]] = []
     summary_counts: dict[str, int] = {"baseline_initialized": 0, "unchanged": 0, "changed": 0, "error": 0, "no_candidate_delta": 0}
@@ -1806,362 +2479,53 @@ def run(
             },
         )
 
-        for article_index, article in enumerate(articles, start=1):
-            if not isinstance(article, Mapping):
-                continue
-            article_id = str(article.get("article_id") or "")
-            history_cfg = _history_config(pack, article)
-            previous_state = _load_article_state(conn, article_id)
-            previous_revid = int(previous_state["last_revid"]) if previous_state and previous_state["last_revid"] is not None else None
-            current_snapshot_path: Path | None = None
-            contested_graph_summary: dict[str, Any] | None = None
-
-            try:
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_started",
-                    {
-                        "section": "wiki_revision_articles",
-                        "completed": article_index - 1,
-                        "total": max(total_articles, 1),
-                        "article_id": article_id,
-                        "message": f"Fetching current snapshot for {article.get('title')}.",
-                    },
-                )
-                fetched = fetch_current_snapshot_fn(article=article, out_dir=out_dir / "snapshots", python_cmd=py, repo_root=repo_root)
-                current_snapshot_path = Path(str(fetched["snapshot_path"]))
-                current_snapshot_payload = dict(fetched["snapshot_payload"])
-                contract_error = _snapshot_contract_error(article, current_snapshot_payload)
-                if contract_error:
-                    raise RuntimeError(contract_error)
-                current_revid = _safe_int(current_snapshot_payload.get("revid"))
-                current_paths = revision_artifact_paths(out_dir=out_dir, article_id=article_id, revid=current_revid)
-                if current_snapshot_path != current_paths["snapshot"]:
-                    write_json_file(current_paths["snapshot"], current_snapshot_payload)
-                    current_snapshot_path = current_paths["snapshot"]
-
-                history = fetch_revision_history_fn(
+        record = partial(
+            _record_article_outcome,
+            conn,
+            run_id=run_id,
+            total_articles=total_articles,
+            summary_counts=summary_counts,
+            candidate_pair_counts=candidate_pair_counts,
+            contested_graph_counts=contested_graph_counts,
+            article_results=article_results,
+            progress_callback=progress_callback,
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wiki-revision-pack") if max_workers > 1 else None
+        # Outcomes are recorded in pack order; the window keeps workers busy
+        # behind a slow article without buffering the whole pack.
+        window = 2 * max_workers
+        pending: deque[tuple[str, Future[_ArticleOutcome]]] = deque()
+        try:
+            for article_index, article in enumerate(articles, start=1):
+                article_id = str(article.get("article_id") or "")
+                # A repeated article_id must see the state its earlier entry
+                # records, as it would in a serial run.
+                while pending and (len(pending) >= window or any(pending_id == article_id for pending_id, _ in pending)):
+                    record(pending.popleft()[1].result())
+                task = partial(
+                    _process_article,
+                    pack=pack,
                     article=article,
-                    out_dir=out_dir / "history",
+                    article_index=article_index,
+                    total_articles=total_articles,
+                    previous_state=_load_article_state(conn, article_id),
+                    run_id=run_id,
+                    out_dir=out_dir,
                     python_cmd=py,
                     repo_root=repo_root,
-                    max_revisions=history_cfg["max_revisions"],
-                    window_days=history_cfg["window_days"],
+                    bridge_db_path=bridge_db_path,
+                    entry_points=entry_points,
+                    progress_callback=progress_callback,
                 )
-                history_rows = _ensure_history_contains_current(_normalize_history_rows(history.get("history_payload")), current_snapshot_payload)
-                _insert_history_rows(conn, run_id=run_id, article_id=article_id, rows=history_rows)
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_history",
-                    {
-                        "section": "wiki_revision_articles",
-                        "completed": article_index - 1,
-                        "total": max(total_articles, 1),
-                        "article_id": article_id,
-                        "message": f"Loaded {len(history_rows)} history rows.",
-                        "history_row_count": len(history_rows),
-                    },
-                )
-
-                selected_pairs: list[dict[str, Any]] = []
-                candidates = _candidate_pairs(history_rows, previous_state, current_revid)
-                scored_candidates: list[dict[str, Any]] = []
-                total_candidates = len(candidates)
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_candidates_started",
-                    {
-                        "section": "wiki_revision_candidates",
-                        "completed": 0,
-                        "total": max(total_candidates, 1),
-                        "article_id": article_id,
-                        "message": f"Scoring {total_candidates} candidate pairs.",
-                    },
-                )
-                for candidate_index, candidate in enumerate(candidates, start=1):
-                    older_revid = int(candidate["older_revid"])
-                    newer_revid = int(candidate["newer_revid"])
-                    older_snapshot = fetch_revision_snapshot_fn(article=article, revid=older_revid, out_dir=out_dir / "pair_snapshots", python_cmd=py, repo_root=repo_root)
-                    newer_snapshot = fetch_revision_snapshot_fn(article=article, revid=newer_revid, out_dir=out_dir / "pair_snapshots", python_cmd=py, repo_root=repo_root)
-                    older_payload = dict(older_snapshot["snapshot_payload"])
-                    newer_payload = dict(newer_snapshot["snapshot_payload"])
-                    older_error = _snapshot_contract_error(article, older_payload)
-                    newer_error = _snapshot_contract_error(article, newer_payload)
-                    if older_error:
-                        raise RuntimeError(older_error)
-                    if newer_error:
-                        raise RuntimeError(newer_error)
-                    candidate.update(
-                        _score_candidate_pair(
-                            candidate,
-                            older_snapshot_payload=older_payload,
-                            newer_snapshot_payload=newer_payload,
-                            section_focus_limit=history_cfg["section_focus_limit"],
-                        )
-                    )
-                    candidate["selected"] = False
-                    candidate["status"] = "candidate"
-                    scored_candidates.append(candidate)
-                    _emit_progress(
-                        progress_callback,
-                        "revision_pack_article_candidates_progress",
-                        {
-                            "section": "wiki_revision_candidates",
-                            "completed": candidate_index,
-                            "total": max(total_candidates, 1),
-                            "article_id": article_id,
-                            "message": f"Scored pair {candidate['pair_kind']} {older_revid}->{newer_revid}.",
-                        },
-                    )
-
-                scored_candidates.sort(
-                    key=lambda row: (
-                        -float(row.get("candidate_score") or 0.0),
-                        -int(row.get("newer_revid") or 0),
-                        str(row.get("pair_kind") or ""),
-                    )
-                )
-                candidate_pair_counts["considered"] += len(scored_candidates)
-
-                selected_limit = min(len(scored_candidates), history_cfg["max_candidate_pairs"])
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_reports_started",
-                    {
-                        "section": "wiki_revision_reports",
-                        "completed": 0,
-                        "total": max(selected_limit, 1),
-                        "article_id": article_id,
-                        "message": f"Building up to {selected_limit} pair reports.",
-                    },
-                )
-                for selected_index, candidate in enumerate(scored_candidates[: history_cfg["max_candidate_pairs"]], start=1):
-                    selected = _build_pair_report(
-                        article=article,
-                        pair=dict(candidate),
-                        out_dir=out_dir,
-                        python_cmd=py,
-                        repo_root=repo_root,
-                        fetch_revision_snapshot_fn=fetch_revision_snapshot_fn,
-                        build_timeline_fn=build_timeline_fn,
-                        build_aoo_fn=build_aoo_fn,
-                        auto_review_context_fn=auto_review_context_fn,
-                        bridge_db_path=bridge_db_path,
-                        section_focus_limit=history_cfg["section_focus_limit"],
-                    )
-                    selected_pairs.append(selected)
-                    candidate_pair_counts["selected"] += 1
-                    candidate_pair_counts["reported"] += 1
-                    _emit_progress(
-                        progress_callback,
-                        "revision_pack_article_reports_progress",
-                        {
-                            "section": "wiki_revision_reports",
-                            "completed": selected_index,
-                            "total": max(selected_limit, 1),
-                            "article_id": article_id,
-                            "message": f"Built pair report {selected.get('pair_id')}.",
-                        },
-                    )
-
-                for candidate in scored_candidates:
-                    materialized = next((row for row in selected_pairs if row["pair_id"] == candidate["pair_id"]), candidate)
-                    _insert_candidate_pair(conn, run_id=run_id, article_id=article_id, pair_payload=materialized)
-
-                if previous_revid is None:
-                    with tempfile.TemporaryDirectory(prefix="wiki_current_", dir=str(out_dir)) as current_temp_dir_text:
-                        current_temp_dir = Path(current_temp_dir_text)
-                        current_temp_paths = revision_artifact_paths(
-                            out_dir=current_temp_dir,
-                            article_id=article_id,
-                            revid=current_revid,
-                        )
-                        current_timeline = _invoke_build_timeline(
-                            build_timeline_fn,
-                            snapshot_path=current_snapshot_path,
-                            out_path=current_temp_paths["timeline"],
-                            python_cmd=py,
-                            repo_root=repo_root,
-                            snapshot_payload=current_snapshot_payload,
-                        )
-                        _invoke_build_aoo(
-                            build_aoo_fn,
-                            article=article,
-                            timeline_path=current_temp_paths["timeline"],
-                            out_path=current_temp_paths["aoo"],
-                            python_cmd=py,
-                            repo_root=repo_root,
-                            timeline_payload=dict(current_timeline["timeline_payload"]),
-                        )
-
-                status: str
-                if selected_pairs:
-                    status = "changed"
-                elif previous_revid is None:
-                    status = "baseline_initialized"
-                elif current_revid == previous_revid:
-                    status = "unchanged"
+                if executor is None:
+                    record(task())
                 else:
-                    status = "no_candidate_delta"
-                summary_counts[status] = summary_counts.get(status, 0) + 1
-
-                top_severity = "none"
-                packet_counts: dict[str, Any] = {}
-                if selected_pairs:
-                    for severity in ("high", "medium", "low"):
-                        if any(pair.get("top_severity") == severity for pair in selected_pairs):
-                            top_severity = severity
-                            break
-                    aggregate_counts = {"high": 0, "medium": 0, "low": 0}
-                    for pair in selected_pairs:
-                        for key, value in dict(pair.get("packet_counts") or {}).items():
-                            aggregate_counts[key] = aggregate_counts.get(key, 0) + int(value)
-                    packet_counts = aggregate_counts
-                primary_pair = selected_pairs[0] if selected_pairs else None
-                if _graph_enabled(pack, article) and selected_pairs:
-                    contested_graph_payload = _build_contested_region_graph(
-                        article=article,
-                        run_id=run_id,
-                        selected_pairs=selected_pairs,
-                        out_dir=out_dir,
-                    )
-                    contested_graph_summary = dict((contested_graph_payload.get("summary") or {}))
-                    _insert_contested_graph(
-                        conn,
-                        run_id=run_id,
-                        article_id=article_id,
-                        graph_payload=contested_graph_payload,
-                    )
-                    contested_graph_counts["articles_with_graphs"] += 1
-                    contested_graph_counts["graphs_built"] += 1
-                    contested_graph_counts["cycles_detected"] += int(contested_graph_summary.get("cycle_count") or 0)
-                    contested_graph_counts["regions_detected"] += int(contested_graph_summary.get("region_count") or 0)
-
-                result_payload = {
-                    "article_id": article_id,
-                    "title": article.get("title"),
-                    "status": status,
-                    "baseline_initialized": previous_revid is None,
-                    "previous_revid": previous_revid,
-                    "current_revid": current_revid,
-                    "top_severity": top_severity,
-                    "history_window": {
-                        "max_revisions": history_cfg["max_revisions"],
-                        "window_days": history_cfg["window_days"],
-                        "fetched_row_count": len(history_rows),
-                    },
-                    "candidate_pairs_considered": len(scored_candidates),
-                    "candidate_pairs_selected": len(selected_pairs),
-                    "selected_pair_ids": [str(pair["pair_id"]) for pair in selected_pairs],
-                    "selected_primary_pair_id": primary_pair["pair_id"] if primary_pair else None,
-                    "selected_primary_pair_kind": primary_pair["pair_kind"] if primary_pair else None,
-                    "selected_primary_pair_kinds": list(primary_pair.get("pair_kinds") or []) if primary_pair else [],
-                    "selected_primary_pair_score": primary_pair["candidate_score"] if primary_pair else None,
-                    "pair_reports": [
-                        {
-                            "pair_id": pair["pair_id"],
-                            "pair_kind": pair["pair_kind"],
-                            "pair_kinds": list(pair.get("pair_kinds") or []),
-                            "older_revid": pair["older_revid"],
-                            "newer_revid": pair["newer_revid"],
-                            "candidate_score": pair["candidate_score"],
-                            "top_severity": pair.get("top_severity", "none"),
-                            "pair_report_payload": pair.get("pair_report_payload"),
-                            "top_changed_sections": list(((pair.get("section_delta_summary") or {}).get("top_changed_sections")) or []),
-                        }
-                        for pair in selected_pairs
-                    ],
-                    "packet_counts": packet_counts,
-                    "contested_graph_available": contested_graph_summary is not None,
-                    "contested_graph_summary": contested_graph_summary,
-                }
-
-                _upsert_article_state(
-                    conn,
-                    article_id=article_id,
-                    revid=current_revid,
-                    rev_timestamp=_norm_text(current_snapshot_payload.get("rev_timestamp")) or None,
-                    fetched_at=_norm_text(current_snapshot_payload.get("fetched_at")) or None,
-                    snapshot_path=current_snapshot_path,
-                    status=status,
-                )
-                _insert_article_result(
-                    conn,
-                    run_id=run_id,
-                    article_id=article_id,
-                    status=status,
-                    previous_revid=previous_revid,
-                    current_revid=current_revid,
-                    top_severity=top_severity,
-                    packet_counts=packet_counts,
-                    snapshot_path=current_snapshot_path,
-                    result_payload=result_payload,
-                )
-                replace_issue_packets(
-                    conn,
-                    run_id=run_id,
-                    article_id=article_id,
-                    packet_rows=_selected_issue_packet_rows(selected_pairs),
-                )
-                replace_selected_pairs(
-                    conn,
-                    run_id=run_id,
-                    article_id=article_id,
-                    pair_rows=_selected_pair_rows(selected_pairs),
-                )
-                article_results.append(result_payload)
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_finished",
-                    {
-                        "section": "wiki_revision_articles",
-                        "completed": article_index,
-                        "total": max(total_articles, 1),
-                        "article_id": article_id,
-                        "status": status,
-                        "message": f"Finished {article.get('title')} with status {status}.",
-                    },
-                )
-            except Exception as exc:
-                status = "error"
-                summary_counts[status] = summary_counts.get(status, 0) + 1
-                result_payload = {
-                    "article_id": article_id,
-                    "title": article.get("title"),
-                    "status": status,
-                    "previous_revid": previous_revid,
-                    "current_revid": None,
-                    "error": f"{type(exc).__name__}: {exc}",
-                    "contested_graph_available": False,
-                    "contested_graph_summary": None,
-                }
-                _insert_article_result(
-                    conn,
-                    run_id=run_id,
-                    article_id=article_id,
-                    status=status,
-                    previous_revid=previous_revid,
-                    current_revid=None,
-                    top_severity="none",
-                    packet_counts={},
-                    snapshot_path=current_snapshot_path,
-                    result_payload=result_payload,
-                )
-                replace_issue_packets(conn, run_id=run_id, article_id=article_id, packet_rows=[])
-                replace_selected_pairs(conn, run_id=run_id, article_id=article_id, pair_rows=[])
-                article_results.append(result_payload)
-                _emit_progress(
-                    progress_callback,
-                    "revision_pack_article_finished",
-                    {
-                        "section": "wiki_revision_articles",
-                        "completed": article_index,
-                        "total": max(total_articles, 1),
-                        "article_id": article_id,
-                        "status": status,
-                        "message": f"Failed {article.get('title')}: {type(exc).__name__}.",
-                    },
-                )
+                    pending.append((article_id, executor.submit(task)))
+            while pending:
+                record(pending.popleft()[1].result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         summary = build_run_summary(
             schema_version=STATE_SCHEMA_VERSION,
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+pytest.importorskip("fastapi")
+
+from src.api import routes  # noqa: E402
+from src.graph.models import EdgeType, GraphEdge, GraphNode, NodeType  # noqa: E402
+
+
+def test_generate_subgraph_is_cached_and_invalidated_by_new_edges():
+    graph = routes._graph
+    graph.nodes.clear()
+    graph.edges.clear()
+    routes._subgraph_cache.clear()
+    for identifier in ("seed", "a", "b"):
+        graph.add_node(GraphNode(type=NodeType.CASE, identifier=identifier))
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="seed", target="a"))
+    before = routes.subgraph_cache_endpoint()
+
+    first = routes.generate_subgraph("seed", 1)
+    assert routes.generate_subgraph("seed", 1) is first
+
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="seed", target="b"))
+    refreshed = routes.generate_subgraph("seed", 1)
+    assert {edge["target"] for edge in refreshed["edges"]} == {"a", "b"}
+
+    after = routes.subgraph_cache_endpoint()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 2
@@ -0,0 +1,93 @@
+"""Import-time budget for CLI startup.
+
+The batch orchestrator shells out to ``python -m src.cli`` many thousands of
+times a day, so ``--help`` and ``get`` must not pull in heavy subcommand
+dependencies. Budgets can be loosened on slow machines through
+``SENSIBLAW_CLI_IMPORT_BUDGET_MS``.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+IMPORT_BUDGET_MS = float(os.environ.get("SENSIBLAW_CLI_IMPORT_BUDGET_MS", "750"))
+
+# Dependencies only specific subcommands need.
+_HEAVY_MODULES = (
+    "requests",
+    "spacy",
+    "torch",
+    "pandas",
+    "pdfminer",
+    "src.activation",
+    "src.graph",
+    "src.obligations",
+    "src.ontology.enrichment",
+    "src.pipeline",
+    "src.policy",
+    "src.sensiblaw.interfaces",
+    "src.storage.postgres_compiler",
+)
+
+
+def _importtime(args: Sequence[str], tmp_path: Path) -> Tuple[str, Dict[str, int]]:
+    """Run the CLI under ``-X importtime``; return stdout and cumulative µs per module."""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT), str(ROOT / "src")])
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli", *args],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _self_us, cumulative_us, module = line.split("|")
+        cumulative[module.strip()] = int(cumulative_us)
+    return completed.stdout, cumulative
+
+
+def _assert_light(imports: Dict[str, int]) -> None:
+    heavy = sorted(
+        name
+        for name in imports
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in _HEAVY_MODULES)
+    )
+    assert heavy == []
+    assert imports["cli"] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_cli_help_startup_is_light(tmp_path: Path) -> None:
+    _stdout, imports = _importtime(["--help"], tmp_path)
+    _assert_light(imports)
+
+
+def test_cli_get_startup_is_light(tmp_path: Path) -> None:
+    stdout, imports = _importtime(
+        ["get", "--db", str(tmp_path / "store.db"), "--id", "1"], tmp_path
+    )
+    _assert_light(imports)
+    assert stdout.strip() == "Not found"
+
+
+def test_cli_lazy_attributes_match_their_sources() -> None:
+    cli_main = pytest.importorskip("cli.__main__")
+    from src.ontology import enrichment
+
+    assert cli_main._ONTOLOGY_PROVIDER_NAMES is enrichment.PROVIDER_NAMES
+    assert cli_main.requests.get is __import__("requests").get
+    assert cli_main.obligation_to_dict.__module__ == "src.obligations"
@@ -0,0 +1,65 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.concepts.automaton import CompiledAutomaton, load_or_compile  # noqa: E402
+from src.concepts.matcher import ConceptHit, ConceptMatcher  # noqa: E402
+
+
+def _reference(triggers, text):
+    # Brute force: every trigger occurrence, ordered by end then by the
+    # automaton's output order (longest suffix first).
+    text = text.lower()
+    hits = []
+    for end in range(1, len(text) + 1):
+        found = [
+            (concept_id, end - len(trigger), end)
+            for trigger, concept_id in triggers
+            if trigger and text.endswith(trigger, 0, end)
+        ]
+        hits.extend(sorted(found, key=lambda hit: hit[1]))
+    return hits
+
+
+@pytest.mark.parametrize("wide", [False, True])
+def test_compiled_automaton_matches_brute_force(wide):
+    triggers = [("he", "A"), ("she", "B"), ("his", "C"), ("hers", "D"), ("", "E")]
+    if wide:
+        # More than 255 character classes switches to the UTF-32 code path.
+        triggers += [(chr(0x4E00 + n) * 2, f"W{n}") for n in range(300)]
+    automaton = CompiledAutomaton.from_triggers(triggers)
+    texts = ["ushers", "SHE said his hers", "", "nothing", chr(0x4E00) * 3 + "he"]
+    assert automaton.match_many(texts) == [_reference(triggers, text) for text in texts]
+
+
+def test_matcher_caches_and_refreshes_compiled_automaton(tmp_path: Path):
+    data_dir = tmp_path / "concepts"
+    data_dir.mkdir()
+    (data_dir / "animal.json").write_text(json.dumps({"id": "animal", "phrases": ["Dog"]}))
+    cache_dir = tmp_path / "cache"
+
+    matcher = ConceptMatcher(data_dir, cache_dir=cache_dir)
+    assert matcher.match_many(["a dog", "cat"]) == [[ConceptHit("animal", 2, 5)], []]
+    (compiled,) = cache_dir.iterdir()
+    assert load_or_compile(data_dir, cache_dir).digest == matcher.automaton.digest
+
+    (data_dir / "animal.json").write_text(json.dumps({"id": "animal", "phrases": ["cat"]}))
+    os.utime(data_dir / "animal.json", ns=(1, 1))
+    refreshed = ConceptMatcher(data_dir, cache_dir=cache_dir)
+    assert [hit.concept_id for hit in refreshed.match("cat")] == ["animal"]
+    (current,) = set(cache_dir.iterdir()) - {compiled}
+
+    # A corrupt cache file is recompiled (unlink first: ``refreshed`` maps it).
+    current.unlink()
+    current.write_bytes(b"garbage")
+    recovered = ConceptMatcher(data_dir, cache_dir=cache_dir)
+    assert [hit.concept_id for hit in recovered.match("cat")] == ["animal"]
+    assert CompiledAutomaton.open(current).digest == refreshed.automaton.digest
+    assert ConceptMatcher(data_dir, cache_dir=None).match("dog") == []
+    assert ConceptMatcher(tmp_path / "missing", cache_dir=cache_dir).match("dog") == []
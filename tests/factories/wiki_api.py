@@ -0,0 +1,103 @@
+"""Local stub of the MediaWiki API queries made by ``wiki_pull_api.py``."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
+REVISIONS_PER_ARTICLE = 4
+
+
+def _article_revisions(title: str) -> dict[int, dict]:
+    base = (sum(title.encode("utf-8")) % 1000 + 1) * 100
+    revisions = {}
+    for step in range(1, REVISIONS_PER_ARTICLE + 1):
+        revid = base + step
+        paragraphs = " ".join(
+            f"In {1990 + n} the {title} council adopted measure {n} after revision {step}."
+            for n in range(3 + step)
+        )
+        revisions[revid] = {
+            "revid": revid,
+            "parentid": revid - 1 if step > 1 else 0,
+            "timestamp": f"2026-03-0{step}T00:00:00Z",
+            "size": len(paragraphs),
+            "comment": "reverted edit" if step == 3 else f"edit {step}",
+            "user": "stub",
+            "content": f"Intro for {title}.\n== History ==\n{paragraphs}\n== Legacy ==\nLegacy {step}.\n",
+        }
+    return revisions
+
+
+def _page(title: str, revision: dict) -> dict:
+    return {
+        "pageid": revision["revid"] // 100,
+        "title": title,
+        "revisions": [
+            {
+                "revid": revision["revid"],
+                "timestamp": revision["timestamp"],
+                "slots": {"main": {"content": revision["content"]}},
+            }
+        ],
+        "categories": [],
+        "links": [],
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    latency_s = 0.0
+    titles_by_revid: dict[int, str] = {}
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        time.sleep(self.latency_s)
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        if "revids" in params:
+            revid = int(params["revids"])
+            title = self.titles_by_revid[revid]
+            body = {"query": {"pages": [_page(title, _article_revisions(title)[revid])]}}
+        else:
+            title = params["titles"]
+            revisions = _article_revisions(title)
+            if "user" in params.get("rvprop", ""):
+                rows = [
+                    {key: value for key, value in revision.items() if key != "content"}
+                    for revision in sorted(revisions.values(), key=lambda row: -row["revid"])
+                ]
+                body = {"query": {"pages": [{"title": title, "revisions": rows}]}}
+            else:
+                body = {"query": {"pages": [_page(title, revisions[max(revisions)])]}}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@contextmanager
+def stub_wiki_api(titles: list[str], *, latency_s: float) -> Iterator[str]:
+    handler = type(
+        "StubHandler",
+        (_StubHandler,),
+        {
+            "latency_s": latency_s,
+            "titles_by_revid": {revid: title for title in titles for revid in _article_revisions(title)},
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+    finally:
+        server.shutdown()
+        server.server_close()
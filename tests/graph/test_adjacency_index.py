@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from src.graph import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType
+from src.graph.query import traverse_edges
+
+
+def _graph() -> LegalGraph:
+    graph = LegalGraph()
+    for identifier in ("a", "b", "c", "d"):
+        graph.add_node(GraphNode(type=NodeType.CASE, identifier=identifier))
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="a", target="b", weight=0.5))
+    graph.add_edge(GraphEdge(type=EdgeType.FOLLOWS, source="a", target="c"))
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="b", target="c"))
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="a", target="c", weight=2.0))
+    return graph
+
+
+def _pairs(edges):
+    return [(edge.source, edge.target, edge.type) for edge in edges]
+
+
+def test_find_edges_uses_indexes_and_keeps_insertion_order():
+    graph = _graph()
+
+    assert _pairs(graph.find_edges(source="a")) == [
+        ("a", "b", EdgeType.CITES),
+        ("a", "c", EdgeType.FOLLOWS),
+        ("a", "c", EdgeType.CITES),
+    ]
+    assert _pairs(graph.find_edges(target="c", type=EdgeType.CITES)) == [
+        ("b", "c", EdgeType.CITES),
+        ("a", "c", EdgeType.CITES),
+    ]
+    assert _pairs(graph.find_edges(source="a", min_weight=1.0)) == [
+        ("a", "c", EdgeType.FOLLOWS),
+        ("a", "c", EdgeType.CITES),
+    ]
+    assert graph.find_edges(source="d") == []
+    assert graph.find_edges(type=EdgeType.OVERRULES) == []
+    assert graph.degree("c") == 3
+    assert _pairs(graph.in_edges("b")) == [("a", "b", EdgeType.CITES)]
+
+
+def test_direct_edge_list_mutation_keeps_indexes_in_sync():
+    graph = _graph()
+
+    removed = graph.edges.pop(0)
+    assert removed.target == "b"
+    assert graph.find_edges(target="b") == []
+
+    graph.edges.clear()
+    assert graph.find_edges(source="a") == []
+
+    edge = GraphEdge(type=EdgeType.APPLIES, source="d", target="a")
+    graph.edges.append(edge)
+    assert graph.find_edges(source="d", type=EdgeType.APPLIES) == [edge]
+
+    graph.edges = [GraphEdge(type=EdgeType.CITES, source="b", target="d")]
+    assert graph.find_edges(source="d") == []
+    assert _pairs(graph.out_edges("b")) == [("b", "d", EdgeType.CITES)]
+
+
+def test_traverse_edges_visits_incident_edges_in_both_directions():
+    data = {
+        "nodes": [{"id": node_id, "type": "case"} for node_id in ("a", "b", "c", "d", "e")],
+        "edges": [
+            {"source": "a", "target": "b"},
+            {"source": "c", "target": "b"},
+            {"source": "c", "target": "d"},
+            {"source": "d", "target": "e"},
+        ],
+    }
+
+    one_hop = traverse_edges(data, "b", depth=1)
+    assert {node["id"] for node in one_hop["nodes"]} == {"a", "b", "c"}
+
+    two_hops = traverse_edges(data, "b", depth=2)
+    assert {node["id"] for node in two_hops["nodes"]} == {"a", "b", "c", "d"}
+    assert [(e["source"], e["target"]) for e in two_hops["edges"]] == [
+        ("a", "b"),
+        ("c", "b"),
+        ("c", "d"),
+    ]
@@ -0,0 +1,101 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from src.graph import (
+    CaseNode,
+    ColumnarLegalGraph,
+    EdgeType,
+    ExtrinsicNode,
+    GraphEdge,
+    GraphNode,
+    LegalGraph,
+    NodeType,
+)
+
+
+def _graph() -> LegalGraph:
+    graph = LegalGraph()
+    graph.add_node(
+        CaseNode(
+            identifier="mabo",
+            court_rank=0,
+            date=date(1992, 6, 3),
+            metadata={"court": "HCA"},
+        )
+    )
+    graph.add_node(GraphNode(type=NodeType.CASE, identifier="house"))
+    graph.add_node(ExtrinsicNode(type=NodeType.EXTRINSIC, identifier="speech", role="minister"))
+    graph.add_edge(
+        GraphEdge(
+            type=EdgeType.CITES,
+            source="house",
+            target="mabo",
+            metadata={"relation": "followed"},
+            date=date(2001, 2, 3),
+            weight=0.5,
+        )
+    )
+    graph.add_edge(GraphEdge(type=EdgeType.FOLLOWS, source="speech", target="mabo"))
+    graph.add_edge(
+        GraphEdge(type=EdgeType.CITES, source="house", target="speech", identifier="e3")
+    )
+    return graph
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {"source": "house"},
+        {"target": "mabo"},
+        {"type": EdgeType.CITES},
+        {"min_weight": 0.75},
+        {"source": "house", "target": "speech"},
+        {"target": "mabo", "type": EdgeType.FOLLOWS},
+        {"source": "missing"},
+    ],
+)
+def test_columnar_find_edges_matches_legal_graph(criteria):
+    graph = _graph()
+    columnar = ColumnarLegalGraph.from_legal_graph(graph)
+
+    assert columnar.find_edges(**criteria) == graph.find_edges(**criteria)
+
+
+def test_columnar_round_trips_nodes_edges_and_metadata():
+    graph = _graph()
+    columnar = ColumnarLegalGraph.from_legal_graph(graph)
+
+    assert list(columnar.edges) == list(graph.edges)
+    assert dict(columnar.nodes) == graph.nodes
+    assert isinstance(columnar.get_node("mabo"), CaseNode)
+    assert columnar.get_node("missing") is None
+    assert "speech" in columnar.nodes
+    assert columnar.degree("mabo") == 2
+    assert columnar.to_legal_graph().find_edges(target="mabo") == graph.find_edges(
+        target="mabo"
+    )
+
+
+def test_columnar_save_and_memory_mapped_load(tmp_path):
+    graph = _graph()
+    ColumnarLegalGraph.from_legal_graph(graph).save(tmp_path)
+
+    with ColumnarLegalGraph.load(tmp_path) as mapped:
+        assert list(mapped.edges) == list(graph.edges)
+        assert mapped.in_edges("mabo") == graph.in_edges("mabo")
+        assert mapped.get_node("mabo") == graph.get_node("mabo")
+
+
+def test_columnar_builder_rejects_dangling_edges():
+    with pytest.raises(ValueError):
+        ColumnarLegalGraph.from_elements(
+            [GraphNode(type=NodeType.CASE, identifier="a")],
+            [GraphEdge(type=EdgeType.CITES, source="a", target="b")],
+        )
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.graph.embedding_store import EmbeddingStore, build_embedding_store
+
+
+def _brute_force(matrix, identifiers, row, k):
+    distances = np.linalg.norm(matrix.astype(np.float64) - matrix[row], axis=1)
+    order = np.lexsort((np.arange(len(matrix)), distances))
+    return [identifiers[i] for i in order if i != row][:k]
+
+
+def _clustered(n_clusters=12, per_cluster=60, dim=8, seed=3):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(scale=10.0, size=(n_clusters, dim))
+    matrix = np.concatenate([centre + rng.normal(size=(per_cluster, dim)) for centre in centres])
+    return [f"node-{i}" for i in range(len(matrix))], matrix.astype(np.float32)
+
+
+def test_exact_search_matches_brute_force_across_blocks():
+    identifiers, matrix = _clustered()
+    store = EmbeddingStore.from_vectors(identifiers, matrix)
+
+    for row in (0, 61, len(matrix) - 1):
+        neighbours = store.nearest(identifiers[row], 7, block_rows=50)
+        assert [identifier for identifier, _ in neighbours] == _brute_force(matrix, identifiers, row, 7)
+        assert neighbours[0][1] == pytest.approx(
+            float(np.linalg.norm(matrix[row].astype(np.float64) - store.vector(neighbours[0][0])))
+        )
+
+    assert store.nearest("missing", 3) == []
+    assert store.nearest(matrix[5], 1)[0] == ("node-5", 0.0)
+    with pytest.raises(ValueError):
+        store.nearest([1.0, 2.0], 1)
+
+
+@pytest.mark.parametrize("offset", [100.0, 1000.0])
+@pytest.mark.parametrize("spread", [0.1, 1.0])
+def test_exact_search_is_accurate_far_from_the_origin(offset, spread):
+    rng = np.random.default_rng(11)
+    matrix = (offset + spread * rng.normal(size=(400, 16))).astype(np.float32)
+    identifiers = [f"node-{i}" for i in range(len(matrix))]
+    store = EmbeddingStore.from_vectors(identifiers, matrix)
+
+    for row in (0, 137, len(matrix) - 1):
+        neighbours = store.nearest(identifiers[row], 10, block_rows=64)
+        assert [identifier for identifier, _ in neighbours] == _brute_force(matrix, identifiers, row, 10)
+        expected = np.linalg.norm(matrix.astype(np.float64) - matrix[row].astype(np.float64), axis=1)
+        for identifier, distance in neighbours:
+            assert distance == pytest.approx(float(expected[store.index_of(identifier)]), rel=1e-12)
+
+
+def test_ivf_assignment_is_accurate_far_from_the_origin():
+    identifiers, matrix = _clustered(dim=8)
+    matrix = (1000.0 + 0.03 * matrix).astype(np.float32)
+    store = EmbeddingStore.from_vectors(identifiers, matrix)
+    store.build_ivf(12)
+    store.ivf_nprobe = 2
+
+    recall = []
+    for row in range(0, len(matrix), 37):
+        approximate = {identifier for identifier, _ in store.nearest(identifiers[row], 10)}
+        recall.append(len(approximate & set(_brute_force(matrix, identifiers, row, 10))) / 10)
+    assert sum(recall) / len(recall) >= 0.95
+
+
+def test_ties_are_broken_by_row_order():
+    store = EmbeddingStore.from_mapping({"b": [1.0, 0.0], "a": [0.0, 0.0], "c": [-1.0, 0.0], "d": [0.0, 1.0]})
+    assert [identifier for identifier, _ in store.nearest("a", 3, block_rows=2)] == ["b", "c", "d"]
+
+
+def test_saved_store_is_memory_mapped_and_ivf_finds_cluster_neighbours(tmp_path: Path):
+    identifiers, matrix = _clustered()
+    store = build_embedding_store((identifiers, matrix), tmp_path / "store", ivf_lists=12, ivf_nprobe=2)
+
+    assert isinstance(store.vectors, np.memmap)
+    assert store.has_ivf and store.ivf_lists == 12
+    assert store.index_of("node-100") == 100 and "node-100" in store and "node-x" not in store
+
+    recall = []
+    for row in range(0, len(matrix), 37):
+        approximate = {identifier for identifier, _ in store.nearest(identifiers[row], 10)}
+        recall.append(len(approximate & set(_brute_force(matrix, identifiers, row, 10))) / 10)
+    assert sum(recall) / len(recall) >= 0.95
+    assert [i for i, _ in store.nearest("node-3", 5, exact=True)] == _brute_force(matrix, identifiers, 3, 5)
+
+    # Rebuilding without an index drops the stale IVF files.
+    exact_only = build_embedding_store(dict(zip(identifiers, matrix.tolist())), tmp_path / "store")
+    assert not exact_only.has_ivf
+    assert not (tmp_path / "store" / "ivf_rows.npy").exists()
+
+
+def test_rejects_inconsistent_inputs():
+    with pytest.raises(ValueError):
+        EmbeddingStore.from_mapping({"a": [1.0, 2.0], "b": [1.0]})
+    with pytest.raises(ValueError):
+        EmbeddingStore.from_vectors(["a", "a"], [[1.0], [2.0]])
@@ -135,6 +135,124 @@ def test_train_transe_and_score_predictions(monkeypatch: pytest.MonkeyPatch) ->
     assert scores == [RawPrediction(case_id="case-1", provision_id="prov-1", score=0.875)]
 
 
+class DistMultLikeModel:
+    """Numpy DistMult scorer exposing ``score_hrt`` and, optionally, ``score_t``."""
+
+    def __init__(self, num_entities: int, *, with_score_t: bool) -> None:
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        self.entities = rng.normal(size=(num_entities, 4))
+        # Quantised relation weights produce tied scores across provisions.
+        self.relation = np.array([[1.0, 0.0, 0.0, 0.0]])
+        self.entities[:, 0] = np.round(self.entities[:, 0], 1)
+        self.calls = 0
+        if with_score_t:
+            self.score_t = self._score_t
+
+    def score_hrt(self, batch):  # noqa: ANN001
+        import numpy as np
+
+        self.calls += 1
+        rows = np.asarray(batch)
+        heads = self.entities[rows[:, 0]] * self.relation[rows[:, 1]]
+        return (heads * self.entities[rows[:, 2]]).sum(axis=1)
+
+    def _score_t(self, batch):  # noqa: ANN001
+        import numpy as np
+
+        self.calls += 1
+        rows = np.asarray(batch)
+        return (self.entities[rows[:, 0]] * self.relation[rows[:, 1]]) @ self.entities.T
+
+
+@pytest.mark.parametrize("with_score_t", [False, True])
+def test_block_scoring_matches_per_pair_ranking(with_score_t: bool) -> None:
+    pytest.importorskip("numpy")
+
+    cases = [f"case-{index}" for index in range(7)]
+    provisions = [f"prov-{index}" for index in range(11)]
+    factory = DummyTriplesFactory([])
+    factory.entity_to_id = {name: index for index, name in enumerate(cases + provisions)}
+    model = DistMultLikeModel(len(factory.entity_to_id), with_score_t=with_score_t)
+    result = DummyPipelineResult(model)  # type: ignore[arg-type]
+
+    legacy = score_applies_predictions(result, factory, cases=cases, provisions=provisions)
+    assert model.calls == len(cases) * len(provisions)
+    expected = rank_predictions(legacy, top_k=3)
+
+    model.calls = 0
+    blocked = score_applies_predictions(
+        result,
+        factory,
+        cases=cases,
+        provisions=provisions + ["unknown"],
+        top_k=3,
+        head_batch_size=3,
+        max_block_scores=1 << 10 if with_score_t else 4,
+    )
+    # score_t: three blocks of up to three cases.  score_hrt: the four-score
+    # budget allows one case per block, scored in tail chunks of 4, 4 and 3.
+    assert model.calls == (3 if with_score_t else 7 * 3)
+    assert [(p.case_id, p.provision_id) for p in blocked] == [
+        (p.case_id, p.provision_id) for p in expected
+    ]
+    assert [p.score for p in blocked] == pytest.approx([p.score for p in expected])
+    assert rank_predictions(blocked, top_k=3) == expected
+
+    full = score_applies_predictions(
+        result, factory, cases=cases, provisions=provisions, head_batch_size=4
+    )
+    assert len(full) == len(legacy)
+    assert [(p.case_id, p.provision_id) for p in rank_predictions(full)] == [
+        (p.case_id, p.provision_id) for p in rank_predictions(legacy)
+    ]
+
+
+def test_block_scoring_runs_without_autograd(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    import sys
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+
+    grad_state = {"enabled": True}
+
+    @contextmanager
+    def no_grad():
+        grad_state["enabled"] = False
+        try:
+            yield
+        finally:
+            grad_state["enabled"] = True
+
+    fake_torch = SimpleNamespace(long="long", no_grad=no_grad, as_tensor=lambda rows, **_: rows)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    cases = ["case-0", "case-1"]
+    provisions = ["prov-0", "prov-1", "prov-2"]
+    factory = DummyTriplesFactory([])
+    factory.entity_to_id = {name: index for index, name in enumerate(cases + provisions)}
+    model = DistMultLikeModel(len(factory.entity_to_id), with_score_t=False)
+    grad_during_scoring = []
+    score_hrt = model.score_hrt
+
+    def recording_score_hrt(batch):  # noqa: ANN001
+        grad_during_scoring.append(grad_state["enabled"])
+        return score_hrt(batch)
+
+    model.score_hrt = recording_score_hrt  # type: ignore[method-assign]
+    score_applies_predictions(
+        DummyPipelineResult(model),  # type: ignore[arg-type]
+        factory,
+        cases=cases,
+        provisions=provisions,
+        top_k=1,
+    )
+
+    assert grad_during_scoring == [False]
+    assert grad_state["enabled"] is True
+
+
 @pytest.mark.parametrize(
     "trainer, expected_model",
     [
@@ -0,0 +1,84 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from src.graph.models import EdgeType, GraphEdge, GraphNode, LegalGraph, NodeType
+from src.graph.subgraph_cache import SubgraphCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _graph() -> LegalGraph:
+    graph = LegalGraph()
+    for identifier in ("mabo", "house", "wik", "other"):
+        graph.add_node(GraphNode(type=NodeType.CASE, identifier=identifier))
+    graph.add_edge(GraphEdge(type=EdgeType.CITES, source="wik", target="mabo"))
+    return graph
+
+
+def _builder(calls, payload, dependencies):
+    def build():
+        calls.append(payload)
+        return payload, dependencies
+
+    return build
+
+
+def test_hits_misses_ttl_and_lru_eviction():
+    clock = _Clock()
+    cache = SubgraphCache(_graph(), max_entries=2, ttl_seconds=10, clock=clock)
+    calls = []
+
+    assert cache.get_or_build("mabo", 1, False, _builder(calls, "m1", ["wik"])) == "m1"
+    assert cache.get_or_build("mabo", 1, False, _builder(calls, "m2", ["wik"])) == "m1"
+    assert cache.get_or_build("mabo", 1, True, _builder(calls, "mc", [])) == "mc"
+    assert cache.get_or_build("house", 1, False, _builder(calls, "h", [])) == "h"
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11
+    assert cache.get_or_build("house", 1, False, _builder(calls, "h2", [])) == "h2"
+    stats = cache.stats()
+    assert calls == ["m1", "mc", "h", "h2"]
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 4, 1)
+
+
+def test_graph_mutations_invalidate_only_touched_neighbourhoods():
+    graph = _graph()
+    cache = SubgraphCache(graph)
+    calls = []
+    cache.get_or_build("mabo", 1, False, _builder(calls, "mabo", ["mabo", "wik"]))
+    cache.get_or_build("house", 1, False, _builder(calls, "house", ["house"]))
+
+    graph.add_edge(GraphEdge(type=EdgeType.FOLLOWS, source="other", target="wik"))
+    assert len(cache) == 1
+    cache.get_or_build("house", 1, False, _builder(calls, "house-again", ["house"]))
+    assert calls == ["mabo", "house"]
+
+    graph.add_node(GraphNode(type=NodeType.CASE, identifier="house", metadata={"x": 1}))
+    assert len(cache) == 0
+
+    cache.get_or_build("house", 1, False, _builder(calls, "house-2", ["house"]))
+    graph.edges.clear()
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_close_detaches_the_cache_from_the_graph():
+    graph = _graph()
+    cache = SubgraphCache(graph)
+    cache.get_or_build("mabo", 1, False, _builder([], "mabo", ["mabo"]))
+
+    cache.close()
+    assert len(cache) == 0
+    assert graph._listeners == []
+    graph.add_node(GraphNode(type=NodeType.CASE, identifier="mabo", metadata={"x": 1}))
+    assert cache.stats()["invalidations"] == 0
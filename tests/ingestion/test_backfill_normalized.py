@@ -32,3 +32,158 @@ def test_backfill_documents_migrates_rule_atoms(tmp_path):
         assert conn.execute("SELECT COUNT(*) FROM legal_sources").fetchone()[0] == 1
     finally:
         conn.close()
+
+
+def _judgment(ref: str, text: str) -> Document:
+    document = Document(
+        metadata=DocumentMetadata(
+            jurisdiction="AU",
+            citation=ref,
+            date=date(2023, 1, 1),
+            title=ref,
+        ),
+        body=text,
+    )
+    provision = Provision(text=text)
+    provision.rule_atoms = [RuleAtom(actor="respondent", action="pay", text=text)]
+    document.provisions.append(provision)
+    return document
+
+
+def test_stream_backfill_checkpoints_skips_unchanged_and_resumes(tmp_path):
+    from io import StringIO
+
+    from src.ingestion.backfill import stream_backfill
+    from src.runtime.progress import PhaseRecorder
+    from src.sources.base import FetchResult
+
+    corpus = {f"[2023] HCA {n}": f"The respondent must pay {n}".encode() for n in range(5)}
+    broken = {"[2023] HCA 3"}
+    fetched: list[str] = []
+    parsed: list[str] = []
+
+    def fetch(ref):
+        fetched.append(ref)
+        if ref in broken:
+            raise ConnectionError("reset")
+        return FetchResult(corpus[ref], "text/html", ref, {})
+
+    def parse(ref, result):
+        parsed.append(ref)
+        return _judgment(ref, result.content.decode())
+
+    db_path = tmp_path / "backfill.db"
+    options = dict(fetch=fetch, parse=parse, db_path=db_path, source_kind="jade", queue_size=2)
+    recorder = PhaseRecorder(stream=StringIO())
+
+    first = stream_backfill(list(corpus), recorder=recorder, **options)
+    assert (first.persisted, first.failed, first.rules_migrated) == (4, 1, 4)
+    assert recorder.events[-1]["state"] == "completed"
+    assert recorder.events[-1]["completed"] == 5
+
+    broken.clear()
+    corpus["[2023] HCA 0"] = b"The respondent must pay more"
+    parsed.clear()
+    second = stream_backfill(list(corpus), **options)
+    assert (second.unchanged, second.parsed, second.failed) == (3, 2, 0)
+    assert sorted(parsed) == ["[2023] HCA 0", "[2023] HCA 3"]
+
+    fetched.clear()
+    third = stream_backfill(list(corpus), resume=True, **options)
+    assert third.resumed == 5
+    assert fetched == []
+
+    conn = sqlite3.connect(db_path)
+    try:
+        statuses = conn.execute("SELECT DISTINCT status FROM backfill_checkpoints").fetchall()
+        assert statuses == [("persisted",)]
+    finally:
+        conn.close()
+
+
+def test_stream_backfill_fetch_failure_keeps_the_settled_digest(tmp_path):
+    from src.ingestion.backfill import stream_backfill
+    from src.sources.base import FetchResult
+
+    failing = set()
+    parsed: list[str] = []
+
+    def fetch(ref):
+        if ref in failing:
+            raise ConnectionError("reset")
+        return FetchResult(b"The respondent must pay", "text/html", ref, {})
+
+    def parse(ref, result):
+        parsed.append(ref)
+        return _judgment(ref, result.content.decode())
+
+    db_path = tmp_path / "backfill.db"
+    options = dict(fetch=fetch, parse=parse, db_path=db_path, source_kind="jade")
+
+    def checkpoint():
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                "SELECT content_digest, status, rules_migrated, error FROM backfill_checkpoints"
+            ).fetchone()
+        finally:
+            conn.close()
+
+    stream_backfill(["[2023] HCA 1"], **options)
+    digest, status, rules, error = checkpoint()
+    assert (status, rules, error) == ("persisted", 1, None)
+
+    failing.add("[2023] HCA 1")
+    assert stream_backfill(["[2023] HCA 1"], **options).failed == 1
+    assert checkpoint()[:3] == (digest, "persisted", 1)
+    assert "reset" in checkpoint()[3]
+
+    failing.clear()
+    parsed.clear()
+    assert stream_backfill(["[2023] HCA 1"], **options).unchanged == 1
+    assert parsed == []
+
+
+def test_stream_backfill_reraises_source_errors_without_hanging(tmp_path):
+    import threading
+
+    import pytest
+
+    from src.ingestion.backfill import stream_backfill
+    from src.sources.base import FetchResult
+
+    def refs():
+        yield "[2023] HCA 1"
+        raise RuntimeError("listing failed")
+
+    def fetch(ref):
+        return FetchResult(b"The respondent must pay", "text/html", ref, {})
+
+    outcome: dict[str, BaseException] = {}
+    db_path = tmp_path / "backfill.db"
+
+    def run() -> None:
+        try:
+            stream_backfill(
+                refs(),
+                fetch=fetch,
+                parse=lambda ref, result: _judgment(ref, result.content.decode()),
+                db_path=db_path,
+                source_kind="jade",
+            )
+        except BaseException as exc:  # noqa: BLE001 - inspected below
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError, match="listing failed"):
+        raise outcome["error"]
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT source_ref, status FROM backfill_checkpoints").fetchall()
+    finally:
+        conn.close()
+    assert rows == [("[2023] HCA 1", "persisted")]
@@ -1,3 +1,4 @@
+import io
 import sys
 from pathlib import Path
 
@@ -6,6 +7,7 @@ sys.path.insert(0, str(ROOT))
 sys.path.insert(0, str(ROOT / "src"))
 
 import pytest
+import requests
 
 from src.ingestion.cache import HTTPCache
 
@@ -17,7 +19,7 @@ class DummySession:
         self.last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
         self.last_headers = None
 
-    def get(self, url, headers=None):
+    def get(self, url, headers=None, **kwargs):
         self.calls += 1
         self.last_headers = headers or {}
         class Resp:
@@ -149,3 +151,49 @@ def test_source_manifests_exist():
     assert frl["base_url"].startswith("https://")
     assert hca["base_url"].startswith("https://")
 
+
+
+class _RecordingAdapter(requests.adapters.BaseAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.user_agents: list[str] = []
+
+    def send(self, request, **kwargs):
+        self.user_agents.append(request.headers.get("User-Agent"))
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(request.url.encode("utf-8"))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def test_fetch_many_gives_each_worker_a_cloned_session(tmp_path: Path):
+    template = requests.Session()
+    template.headers["User-Agent"] = "SensibLawBot/test"
+    adapter = _RecordingAdapter()
+    template.mount("http://", adapter)
+    cache = HTTPCache(tmp_path, session=template, max_workers=2)
+
+    sessions: dict[str, requests.Session] = {}
+
+    def grab(name: str) -> None:
+        sessions[name] = cache.pool.session()
+
+    threads = [threading.Thread(target=grab, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessions["a"] is not sessions["b"]
+    assert template not in sessions.values()
+    assert all(s.headers["User-Agent"] == "SensibLawBot/test" for s in sessions.values())
+
+    urls = [f"http://example.com/{index}" for index in range(4)]
+    results = cache.fetch_many(urls)
+    assert [result.read_bytes() for result in results] == [url.encode() for url in urls]
+    assert adapter.user_agents == ["SensibLawBot/test"] * 4
@@ -0,0 +1,99 @@
+import hashlib
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.ingestion.fetch_pool import FetchPool, HostRateLimits, ResponseStore  # noqa: E402
+from src.sources.rate_limit import RateLimit  # noqa: E402
+
+
+def _start_server(bodies: dict[str, bytes]):
+    requests_seen: list[tuple[str, str | None]] = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802 (method name from BaseHTTPRequestHandler)
+            with lock:
+                requests_seen.append((self.path, self.headers.get("If-None-Match")))
+            body = bodies.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = hashlib.sha256(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pragma: no cover - silence
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    except PermissionError:
+        pytest.skip("Local sockets are not permitted in this environment")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}", requests_seen
+
+
+def test_fetch_many_streams_to_store_and_revalidates(tmp_path: Path):
+    bodies = {f"/doc/{n}": f"document {n}".encode() * 5000 for n in range(6)}
+    bodies["/dup"] = bodies["/doc/0"]
+    server, base, seen = _start_server(bodies)
+    pool = FetchPool(ResponseStore(tmp_path), max_workers=4, chunk_size=1024)
+    urls = [base + path for path in bodies] + [base + "/missing"]
+    try:
+        first = pool.fetch_many(urls)
+        second = pool.fetch_many(urls)
+    finally:
+        pool.close()
+        server.shutdown()
+
+    assert [result.url for result in first] == urls
+    assert [result.status for result in first] == ["fetched"] * len(bodies) + ["failed"]
+    assert [result.read_bytes() for result in first[:-1]] == list(bodies.values())
+    # Identical bodies share one object on disk.
+    assert first[0].path == first[len(bodies) - 1].path
+    assert len(list((tmp_path / "objects").iterdir())) == len(bodies) - 1
+    assert [result.status for result in second] == ["not_modified"] * len(bodies) + ["failed"]
+    assert all(etag for path, etag in seen[len(urls) :] if path != "/missing")
+
+
+def test_host_rate_limits_keep_a_bucket_per_host():
+    clock = [0.0]
+    waits: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        waits.append(seconds)
+        clock[0] += seconds
+
+    limits = HostRateLimits(
+        RateLimit(rps=1.0, burst=1),
+        {"slow.example": RateLimit(rps=0.5, burst=1)},
+        now=lambda: clock[0],
+        sleep=sleep,
+    )
+    limits.acquire("https://a.example/1")
+    limits.acquire("https://b.example/1")
+    limits.acquire("https://slow.example/1")
+    assert waits == []
+
+    limits.acquire("https://a.example/2")
+    limits.acquire("https://slow.example/2")
+    assert waits == [1.0, 1.0]
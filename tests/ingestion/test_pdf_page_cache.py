@@ -0,0 +1,137 @@
+import hashlib
+from pathlib import Path
+
+from pdfminer.pdftypes import PDFObjRef
+
+import src.pdf_ingest as pdf_ingest
+from src.ingestion.pdf_page_cache import PdfPageCache, digest_pdf_file
+
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / (
+    "SensibLaw_ Open Legal Knowledge Graph & Reasoning Platform.pdf"
+)
+
+
+def _recording_extract_pages(monkeypatch):
+    calls = []
+    real_extract_pages = pdf_ingest.extract_pages
+
+    def fake_extract_pages(stream, *args, **kwargs):
+        calls.append(sorted(kwargs.get("page_numbers") or ()))
+        return real_extract_pages(stream, *args, **kwargs)
+
+    monkeypatch.setattr(pdf_ingest, "extract_pages", fake_extract_pages)
+    return calls
+
+
+def test_warm_run_skips_layout_analysis(tmp_path, monkeypatch):
+    uncached = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF))
+    cache = PdfPageCache(tmp_path / "pages")
+
+    cold = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=cache))
+    assert cold == uncached
+
+    calls = _recording_extract_pages(monkeypatch)
+    warm = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=PdfPageCache(tmp_path / "pages")))
+
+    assert warm == uncached
+    assert calls == []
+
+
+def test_only_uncached_pages_are_recomputed(tmp_path, monkeypatch):
+    cache = PdfPageCache(tmp_path / "pages")
+    expected = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=cache))
+
+    # Simulate a re-issued PDF: the document manifest no longer matches and
+    # page 3's content fingerprint has never been seen before.
+    with SAMPLE_PDF.open("rb") as handle:
+        fingerprints = pdf_ingest._pdf_page_fingerprints(handle)
+    cache._key_path(cache.page_key(fingerprints[2], 3)).unlink()
+    cache._key_path(cache.document_key(digest_pdf_file(SAMPLE_PDF))).unlink()
+
+    calls = _recording_extract_pages(monkeypatch)
+    rerun_cache = PdfPageCache(tmp_path / "pages")
+    pages = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=rerun_cache))
+
+    assert pages == expected
+    assert calls == [[2]]
+    assert rerun_cache.stats()["page_misses"] == 1
+
+
+def test_partial_document_hit_counts_each_page_once(tmp_path, monkeypatch):
+    cache = PdfPageCache(tmp_path / "pages")
+    expected = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=cache))
+    with SAMPLE_PDF.open("rb") as handle:
+        fingerprints = pdf_ingest._pdf_page_fingerprints(handle)
+    cache._key_path(cache.page_key(fingerprints[2], 3)).unlink()
+
+    def no_read_bytes(self):
+        raise AssertionError(f"{self} was read into memory")
+
+    monkeypatch.setattr(Path, "read_bytes", no_read_bytes)
+    calls = _recording_extract_pages(monkeypatch)
+    rerun_cache = PdfPageCache(tmp_path / "pages")
+    pages = list(pdf_ingest.extract_pdf_text(SAMPLE_PDF, page_cache=rerun_cache))
+
+    assert pages == expected
+    assert calls == [[2]]
+    assert rerun_cache.stats() == {
+        "page_hits": len(fingerprints) - 1,
+        "page_misses": 1,
+        "document_hits": 1,
+        "document_misses": 0,
+    }
+
+
+def test_page_fingerprints_are_stable_and_page_local():
+    with SAMPLE_PDF.open("rb") as handle:
+        first = pdf_ingest._pdf_page_fingerprints(handle)
+    with SAMPLE_PDF.open("rb") as handle:
+        second = pdf_ingest._pdf_page_fingerprints(handle)
+
+    assert first == second
+    assert len(set(first)) == len(first)
+
+
+def _fingerprint(value, memo=None):
+    digest = hashlib.sha256()
+    pdf_ingest._feed_pdf_object(digest, value, {} if memo is None else memo, set())
+    return digest.hexdigest()
+
+
+def test_fingerprint_sees_differences_at_any_depth():
+    def nested(leaf, depth=40):
+        value = leaf
+        for _ in range(depth):
+            value = {"Kids": [value]}
+        return value
+
+    assert _fingerprint(nested(1)) != _fingerprint(nested(2))
+
+
+class _FakeDocument:
+    def __init__(self, objects):
+        self.objects = objects
+
+    def getobj(self, objid):
+        return self.objects[objid]
+
+
+def test_memoised_fingerprints_do_not_depend_on_visit_path():
+    document = _FakeDocument({})
+    ref = lambda objid: PDFObjRef(document, objid)
+    # Object 1 and 2 form a cycle; object 3 is reachable from inside it.
+    document.objects.update(
+        {
+            1: {"Next": ref(2)},
+            2: {"Prev": ref(1), "Font": ref(3)},
+            3: {"Name": "F1"},
+        }
+    )
+
+    memo = {}
+    via_cycle = _fingerprint({"A": ref(1)}, memo)
+    assert 1 not in memo and 2 not in memo
+    assert 3 in memo
+
+    assert _fingerprint({"A": ref(2)}, memo) == _fingerprint({"A": ref(2)})
+    assert _fingerprint({"A": ref(1)}, memo) == via_cycle
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from src.nlp.parse_cache import PARSE_CACHE_ENV, SpacyParseCache, pipeline_fingerprint  # noqa: E402
+from src.nlp.spacy_adapter import parse, parse_many, pipe_docs  # noqa: E402
+
+_TEXTS = [
+    "This is a test. Here's another sentence!",
+    "The tenant must pay rent.",
+    "This is a test. Here's another sentence!",
+    "",
+]
+
+
+def _nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def test_parse_many_matches_per_text_parse() -> None:
+    nlp = _nlp()
+    assert parse_many(_TEXTS, nlp=nlp, cache=None) == [
+        parse(text, nlp=nlp, cache=None) for text in _TEXTS
+    ]
+    assert parse_many([], nlp=nlp, cache=None) == []
+    with pytest.raises(TypeError):
+        parse_many(["ok", 3], nlp=nlp, cache=None)  # type: ignore[list-item]
+
+
+def test_cache_roundtrip_preserves_parse(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("src.nlp.parse_cache.SEGMENT_SIZE", 2)
+    nlp = _nlp()
+    cache = SpacyParseCache(tmp_path / "parses.sqlite")
+    cold = parse_many(_TEXTS, nlp=nlp, cache=cache)
+    assert cache.stats() == {"entries": 3, "hits": 0, "misses": 3, "writes": 3}
+
+    warm = parse_many(_TEXTS, nlp=nlp, cache=cache)
+    assert warm == cold
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["writes"] == 3
+    cache.close()
+
+    reopened = SpacyParseCache(tmp_path / "parses.sqlite")
+    assert parse_many(_TEXTS[:2], nlp=nlp, cache=reopened) == cold[:2]
+    assert reopened.stats()["hits"] == 2
+
+
+def test_cache_separates_pipelines(tmp_path: Path) -> None:
+    cache = SpacyParseCache(tmp_path / "parses.sqlite")
+    with_sents = _nlp()
+    tokens_only = spacy.blank("en")
+    assert pipeline_fingerprint(with_sents) != pipeline_fingerprint(tokens_only)
+
+    pipe_docs(_TEXTS, nlp=with_sents, cache=cache)
+    pipe_docs(_TEXTS, nlp=tokens_only, cache=cache)
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["entries"] == 6
+
+
+def test_default_cache_follows_environment(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv(PARSE_CACHE_ENV, raising=False)
+    nlp = _nlp()
+    pipe_docs(_TEXTS, nlp=nlp)
+    assert not list(tmp_path.iterdir())
+
+    monkeypatch.setenv(PARSE_CACHE_ENV, str(tmp_path / "env" / "parses.sqlite"))
+    pipe_docs(_TEXTS, nlp=nlp)
+    assert (tmp_path / "env" / "parses.sqlite").exists()
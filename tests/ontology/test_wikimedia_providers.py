@@ -147,3 +147,54 @@ def test_wiktionary_batches_multiple_titles_in_one_request() -> None:
         "lexical_sense_unresolved" in row.candidate_sets[0].residuals
         for row in results
     )
+
+
+def test_sqlite_lookup_cache_persists_across_runners_and_reports_stats(tmp_path) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    from src.ontology.wikimedia_lookup_cache import SQLiteLookupCache
+
+    demands = (ExternalLookupDemand("demand:a", "factor:a", "the United States"),)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    path = tmp_path / "lookups.sqlite"
+
+    session = WikidataSession()
+    first = WikimediaMicrobatchRunner(
+        [WikidataProvider(session=session)], cache=SQLiteLookupCache(path)
+    )
+    cold = first.run(demands, progress_stream=StringIO(), now=now)
+    assert first.last_cache_stats["misses"] == 1
+    assert first.last_cache_stats["writes"] == 1
+
+    second = WikimediaMicrobatchRunner(
+        [WikidataProvider(session=session)], cache=SQLiteLookupCache(path)
+    )
+    warm = second.run(demands, progress_stream=StringIO(), now=now + timedelta(days=1))
+    assert len(session.calls) == 2
+    assert warm[0].cache_state == "fresh_cache_hit"
+    assert warm[0].to_dict()["candidate_sets"] == cold[0].to_dict()["candidate_sets"]
+    assert second.last_cache_stats["hits"] == 1
+
+    second.run(demands, progress_stream=StringIO(), now=now + timedelta(days=31))
+    assert len(session.calls) == 4
+    assert second.last_cache_stats["expired"] == 1
+
+
+def test_sqlite_lookup_cache_evicts_beyond_max_entries(tmp_path) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    from src.ontology.wikimedia_lookup_cache import SQLiteLookupCache
+    from src.ontology.wikimedia_providers import ProviderLookup
+
+    cache = SQLiteLookupCache(tmp_path / "lookups.sqlite", max_entries=2)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for offset, key in enumerate(("a", "b", "c")):
+        cache.put(
+            ProviderLookup(key, "provider", (), (), ()),
+            now=now + timedelta(seconds=offset),
+            ttl=timedelta(days=1),
+        )
+
+    assert set(cache.get_many("provider", ["a", "b", "c"], now=now)) == {"b", "c"}
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,62 @@
+import mmap
+from pathlib import Path
+
+import src.pdf_ingest as pdf_ingest
+from src.pdf_ingest import _MappedPdfFile, extract_pdf_text
+
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / (
+    "SensibLaw_ Open Legal Knowledge Graph & Reasoning Platform.pdf"
+)
+
+
+def test_parallel_extraction_matches_serial_pages_in_order():
+    serial = list(extract_pdf_text(SAMPLE_PDF))
+    parallel = list(extract_pdf_text(SAMPLE_PDF, workers=2, shard_size=3))
+
+    assert parallel == serial
+    assert [page["page"] for page in parallel] == sorted(page["page"] for page in parallel)
+
+
+def test_parallel_extraction_falls_back_to_serial_when_page_count_fails(monkeypatch):
+    serial = list(extract_pdf_text(SAMPLE_PDF))
+    monkeypatch.setattr(pdf_ingest, "_count_pdf_pages", lambda _path: None)
+
+    assert list(extract_pdf_text(SAMPLE_PDF, workers=2, shard_size=3)) == serial
+
+
+def test_shard_worker_parses_the_document_once_for_many_shards(monkeypatch):
+    serial = {page["page"]: page for page in extract_pdf_text(SAMPLE_PDF)}
+    parsed = []
+    original = pdf_ingest.PDFDocument
+
+    def counting_document(*args, **kwargs):
+        parsed.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(pdf_ingest, "PDFDocument", counting_document)
+    pdf_ingest._close_shard_document()
+    try:
+        records = pdf_ingest._extract_pdf_shard(str(SAMPLE_PDF), [3, 4], {})
+        records += pdf_ingest._extract_pdf_shard(str(SAMPLE_PDF), [1, 2], {})
+    finally:
+        pdf_ingest._close_shard_document()
+
+    assert len(parsed) == 1
+    assert {number: record for number, record in records if record is not None} == {
+        number: serial[number] for number in (1, 2, 3, 4) if number in serial
+    }
+
+
+def test_mapped_pdf_file_reads_and_seeks_without_copying_whole_file(tmp_path):
+    path = tmp_path / "bytes.bin"
+    path.write_bytes(b"%PDF-1.4\nbody\n%%EOF")
+
+    with path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, _MappedPdfFile(mapped) as stream:
+        assert stream.read(8) == b"%PDF-1.4"
+        assert stream.tell() == 8
+        stream.seek(-5, 2)
+        assert stream.read() == b"%%EOF"
+        stream.seek(1)
+        assert stream.read(3) == b"PDF"
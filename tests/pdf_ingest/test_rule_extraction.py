@@ -12,7 +12,7 @@ def test_rule_extraction(monkeypatch, tmp_path):
     from src.models.provision import Provision
     import src.pdf_ingest as pdf_ingest
 
-    def fake_extract_pdf_text(_path: Path):
+    def fake_extract_pdf_text(_path: Path, **_options):
         yield {
             "page": 1,
             "heading": "Heading",
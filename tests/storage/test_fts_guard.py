@@ -25,7 +25,7 @@ class _FailingConnection:
 
 
 def test_text_index_raises_clear_message_when_fts_missing(monkeypatch, tmp_path) -> None:
-    monkeypatch.setattr(sqlite3, "connect", lambda _path: _FailingConnection())
+    monkeypatch.setattr(sqlite3, "connect", lambda _path, **_kwargs: _FailingConnection())
 
     with pytest.raises(RuntimeError, match="FTS5"):
         TextIndex(tmp_path / "fts.db")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.models.document import Document, DocumentMetadata
+from src.storage.occurrence_columns import OccurrenceColumns, export_occurrence_columns
+from src.storage.versioned_store import VersionedStore
+
+
+def _store(tmp_path: Path) -> VersionedStore:
+    store = VersionedStore(tmp_path / "store.db")
+    meta = DocumentMetadata(jurisdiction="AU", citation="1", date=date(2020, 1, 1))
+    bodies = [
+        "The court held that the duty of care applies under section 5.",
+        "The duty applies. The court dismissed the appeal under section 5.",
+        "No duty arises here.",
+    ]
+    for body in bodies:
+        doc_id = store.generate_id()
+        store.add_revision(doc_id, Document(meta, body), date(2020, 1, 1))
+    return store
+
+
+def test_export_matches_sqlite_and_reports_run_on_columns(tmp_path: Path):
+    store = _store(tmp_path)
+    try:
+        report = export_occurrence_columns(store, tmp_path / "columns")
+        expected = Counter(
+            {
+                row[0]: row[1]
+                for row in store.conn.execute(
+                    "SELECT l.norm_text, COUNT(*) FROM lexeme_occurrences o "
+                    "JOIN lexemes l USING (lexeme_id) GROUP BY l.norm_text"
+                )
+            }
+        )
+        occurrences = store.conn.execute(
+            "SELECT doc_id, rev_id, lexeme_id, start_char, end_char FROM lexeme_occurrences "
+            "WHERE doc_id = 2 ORDER BY occ_id"
+        ).fetchall()
+        duty_rows = store.conn.execute(
+            "SELECT doc_id, rev_id, start_char, end_char FROM lexeme_occurrences "
+            "JOIN lexemes USING (lexeme_id) WHERE norm_text = 'duty' "
+            "ORDER BY doc_id, rev_id, occ_id"
+        ).fetchall()
+    finally:
+        store.close()
+
+    assert report.revisions == 3
+    assert report.rows["lexeme_occurrences"] == sum(expected.values())
+
+    columns = OccurrenceColumns(tmp_path / "columns")
+    lexemes = columns.lexemes
+    assert dict(lexemes.frequencies()) == dict(expected)
+    assert lexemes.frequencies(top=1)[0][1] == max(expected.values())
+    assert dict(lexemes.document_frequencies())["duty"] == 3
+    assert dict(lexemes.document_frequencies())["court"] == 2
+
+    revision = lexemes.revision(2, 1)
+    assert list(zip(revision["lexeme_id"], revision["start_char"], revision["end_char"])) == [
+        (row[2], row[3], row[4]) for row in occurrences
+    ]
+    assert lexemes.revision(99, 1)["lexeme_id"].size == 0
+
+    assert lexemes.concordance("duty") == [tuple(row) for row in duty_rows]
+    near_duty = dict(lexemes.cooccurrences("duty", window=1))
+    assert near_duty["the"] == 2 and near_duty["of"] == 1 and "duty" not in near_duty
+    assert near_duty["no"] == 1 and "appeal" not in near_duty
+    # The third revision starts two tokens before its "duty"; a window that
+    # crossed into the previous revision would also count its final ".".
+    assert dict(lexemes.cooccurrences("duty", window=2))["."] == 1
+
+
+def test_reader_requires_a_complete_export(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        OccurrenceColumns(tmp_path)
+
+
+def test_export_of_many_revisions_is_chunked(tmp_path: Path, monkeypatch):
+    store = _store(tmp_path)
+    # More (doc_id, rev_id) pairs than SQLite will bind in one statement.
+    wanted = [(3, 1), (1, 1)] + [(doc_id, 1) for doc_id in range(100, 20_100)]
+    try:
+        full = export_occurrence_columns(store, tmp_path / "full", revisions=wanted)
+        monkeypatch.setattr("src.storage.occurrence_columns._REVISION_CHUNK", 1)
+        tiny = export_occurrence_columns(store, tmp_path / "tiny", revisions=wanted)
+    finally:
+        store.close()
+
+    assert full.revisions == tiny.revisions == 2
+    assert full.rows == tiny.rows
+    first, second = OccurrenceColumns(tmp_path / "full"), OccurrenceColumns(tmp_path / "tiny")
+    assert first.lexemes.revisions.tolist() == second.lexemes.revisions.tolist()
+    assert first.lexemes.ids.tolist() == second.lexemes.ids.tolist()
+    assert [tuple(row)[:2] for row in first.lexemes.revisions] == [(1, 1), (3, 1)]
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.storage.sqlite_pool import SQLitePool
+from src.storage.sqlite_runtime import connect_sqlite
+
+
+def test_pool_gives_each_thread_its_own_wal_connection(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite", mmap_size=1 << 20, wal=True)
+    conn = pool.proxy()
+    try:
+        with conn:
+            conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO demo(value) VALUES ('main')")
+
+        seen: dict[str, object] = {}
+
+        def worker() -> None:
+            seen["connection"] = pool.connection()
+            seen["value"] = conn.execute("SELECT value FROM demo").fetchone()["value"]
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["value"] == "main"
+        assert seen["connection"] is not pool.connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+    finally:
+        conn.close()
+
+
+def test_readers_are_not_blocked_by_an_open_write_transaction(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite", wal=True)
+    conn = pool.proxy()
+    try:
+        with conn:
+            conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY)")
+            conn.execute("INSERT INTO demo DEFAULT VALUES")
+
+        counts: list[int] = []
+        with conn:
+            conn.execute("INSERT INTO demo DEFAULT VALUES")
+
+            def reader() -> None:
+                counts.append(conn.execute("SELECT COUNT(*) FROM demo").fetchone()[0])
+
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=5)
+
+        assert counts == [1]
+        assert conn.execute("SELECT COUNT(*) FROM demo").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_concurrent_writers_are_serialised(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite", busy_timeout_ms=100)
+    conn = pool.proxy()
+    with conn:
+        conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY, worker INTEGER)")
+    errors: list[BaseException] = []
+
+    def writer(worker_id: int) -> None:
+        try:
+            for _ in range(25):
+                with conn:
+                    conn.execute("INSERT INTO demo(worker) VALUES (?)", (worker_id,))
+        except BaseException as exc:  # pragma: no cover - surfaced by assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert errors == []
+        assert conn.execute("SELECT COUNT(*) FROM demo").fetchone()[0] == 100
+    finally:
+        conn.close()
+
+
+def test_memory_database_is_shared_across_threads() -> None:
+    pool = SQLitePool(":memory:")
+    conn = pool.proxy()
+    with conn:
+        conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY)")
+    names: list[str] = []
+    thread = threading.Thread(
+        target=lambda: names.extend(
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
+        )
+    )
+    thread.start()
+    thread.join()
+    conn.close()
+    assert names == ["demo"]
+
+
+def test_connect_sqlite_applies_busy_timeout_and_wal(tmp_path) -> None:
+    conn = connect_sqlite(tmp_path / "runtime.sqlite", busy_timeout_ms=1234, wal=True)
+    try:
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert isinstance(conn, sqlite3.Connection)
+    finally:
+        conn.close()
+
+
+def test_journal_mode_and_synchronous_are_opt_in(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite")
+    conn = pool.proxy()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_bare_write_transactions_hold_the_writer_lock(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite", busy_timeout_ms=100, wal=True)
+    conn = pool.proxy()
+    conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY, worker INTEGER)")
+    errors: list[BaseException] = []
+
+    def writer(worker_id: int) -> None:
+        try:
+            for _ in range(25):
+                conn.execute("BEGIN")
+                conn.execute("INSERT INTO demo(worker) VALUES (?)", (worker_id,))
+                conn.execute("UPDATE demo SET worker = worker WHERE id = 1")
+                conn.commit()
+        except BaseException as exc:  # pragma: no cover - surfaced by assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert errors == []
+        assert conn.execute("SELECT COUNT(*) FROM demo").fetchone()[0] == 100
+        # Every transaction has ended, so the lock is free for another thread.
+        acquired: list[bool] = []
+        probe = threading.Thread(
+            target=lambda: acquired.append(pool.write_lock.acquire(timeout=1))
+        )
+        probe.start()
+        probe.join()
+        assert acquired == [True]
+    finally:
+        conn.close()
+
+
+def test_thread_connections_close_when_the_thread_exits(tmp_path) -> None:
+    pool = SQLitePool(tmp_path / "pool.sqlite")
+    opened: list[sqlite3.Connection] = []
+
+    thread = threading.Thread(target=lambda: opened.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    try:
+        assert pool._connections == []
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+    finally:
+        pool.close()
@@ -81,3 +81,60 @@ def test_hit_selection_by_index(monkeypatch, tmp_path):
     )
     assert fetch_adapter.last_url.endswith("/2003/2.html")
     assert stored == 1
+
+
+def test_backfill_pdfs_streams_fetched_pdfs_into_the_ontology(monkeypatch, tmp_path):
+    import sqlite3
+    from datetime import date
+
+    from src.ingestion.austlii_pipeline import backfill_pdfs
+    from src.models.document import Document, DocumentMetadata
+    from src.models.provision import Provision, RuleAtom
+
+    outputs = []
+
+    def fake_process(pdf_path, output=None, db_path=None, **kwargs):
+        assert Path(pdf_path).read_bytes() == b"%PDF-1.4 fake"
+        assert db_path is None
+        outputs.append(Path(output))
+        document = Document(
+            metadata=DocumentMetadata(
+                jurisdiction="AU",
+                citation=f"[2023] HCA {len(outputs)}",
+                date=date(2023, 1, 1),
+                title="Example",
+            ),
+            body="",
+        )
+        provision = Provision(text="The respondent must pay")
+        provision.rule_atoms = [RuleAtom(actor="respondent", action="pay", text="The respondent must pay")]
+        document.provisions.append(provision)
+        return document, None
+
+    monkeypatch.setattr("src.ingestion.austlii_pipeline.process_pdf", fake_process)
+
+    urls = [f"https://www.austlii.edu.au/au/cases/cth/HCA/2023/{n}.pdf" for n in (1, 2)]
+    fetch_adapter = FakeFetchAdapter()
+    db_path = tmp_path / "ontology.db"
+    summary = backfill_pdfs(
+        urls,
+        db_path=db_path,
+        fetch_adapter=fetch_adapter,
+        temp_dir=tmp_path,
+        fetch_workers=2,
+        parse_workers=1,
+    )
+
+    assert summary.persisted == 2
+    assert summary.rules_migrated == 2
+    assert all(not output.exists() for output in outputs)
+
+    rerun = backfill_pdfs(urls, db_path=db_path, fetch_adapter=fetch_adapter, resume=True)
+    assert rerun.resumed == 2
+    assert fetch_adapter.calls == 2
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM legal_sources").fetchone()[0] == 2
+    finally:
+        conn.close()
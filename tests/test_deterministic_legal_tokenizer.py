@@ -120,3 +120,40 @@ def test_deterministic_legal_tokenizer_negative_ambiguity_suite() -> None:
     for text, forbidden in negative_cases.items():
         token_types = set(token.token_type for token in tokenize_detailed(text))
         assert token_types.isdisjoint(forbidden), (text, token_types)
+
+
+def test_deterministic_legal_tokenizer_dispatch_handles_casefold_edge_cases() -> None:
+    from src.text.deterministic_legal_tokenizer import tokenize_detailed
+
+    # U+017F casefolds to "s", so it must still reach the section probe.
+    assert tokenize_detailed("ſ 5 applies")[0].token_type is TokenType.SECTION_REFERENCE
+    assert tokenize_detailed("SECTION 3(1) provides")[0].token_type is TokenType.SECTION_REFERENCE
+    assert tokenize_detailed("ß 5 applies")[0].token_type is TokenType.WORD
+    assert [token.token_type for token in tokenize_detailed("un Security Council")] == [
+        TokenType.INSTRUMENT_REFERENCE
+    ]
+
+
+def test_deterministic_legal_tokenizer_stream_matches_whole_text() -> None:
+    from src.text.deterministic_legal_tokenizer import (
+        iter_tokens,
+        tokenize_detailed,
+        tokenize_typed_spans,
+    )
+
+    text = " ".join(
+        [
+            "Civil Liability Act 2002 (NSW) s 5B(2)(a) applies if a person ought to have foreseen the risk.",
+            "Sch 1 cl 4 and r 7.32 were discussed; see [2003] HCA 2.",
+            "The ruling was vacated by the United States Court of Appeals for the Sixth Circuit.",
+            "UN inspectors briefed the United Nations Security Council.",
+        ]
+        * 20
+    )
+    expected = tokenize_detailed(text)
+    assert [(t.text, t.start, t.end, t.token_type) for t in expected] == tokenize_typed_spans(text)
+    assert list(iter_tokens(text)) == expected
+
+    chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+    assert list(iter_tokens(chunks, lookahead=256)) == expected
+    assert list(iter_tokens(iter(chunks))) == expected
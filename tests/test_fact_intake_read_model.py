@@ -19,6 +19,7 @@ from src.fact_intake import (
     build_fact_intake_payload_from_au_semantic_report,
     build_fact_intake_payload_from_transcript_report,
     build_fact_review_acceptance_report,
+    build_fact_review_materialization_status,
     build_fact_review_operator_views,
     build_fact_intake_payload_from_text_units,
     build_fact_intake_report,
@@ -27,11 +28,13 @@ from src.fact_intake import (
     build_fact_review_workbench_payload,
     build_mary_fact_workflow_projection,
     list_semantic_refresh_runs,
+    load_materialized_fact_review_payload,
     persist_fact_intake_payload,
     persist_fact_semantic_materialization,
     find_latest_fact_workflow_link,
     list_fact_review_sources,
     record_fact_workflow_link,
+    refresh_fact_review_materializations,
     resolve_fact_run_id,
     resolve_fact_run_link,
 )
@@ -969,3 +972,98 @@ def test_agent_feedback_payload_includes_policy_messages_and_counts() -> None:
     assert feedback["summary"]["active_policy_count"] >= 5
     assert "Human review required before relying on this fact." in feedback["global_messages"]
     assert "Preserve the original source boundary in any summary or handoff." in feedback["global_messages"]
+
+
+def test_materialized_workbench_is_served_from_cache_until_reviews_or_observations_change() -> None:
+    conn = sqlite3.connect(":memory:")
+    units = [
+        TextUnit(
+            unit_id="unit:mat:1",
+            source_id="source-mat",
+            source_type="context_file",
+            text="On 2024-02-01 the tenant reported the leak.",
+        ),
+        TextUnit(
+            unit_id="unit:mat:2",
+            source_id="source-mat",
+            source_type="context_file",
+            text="The landlord denied receiving any report.",
+        ),
+    ]
+    payload = build_fact_intake_payload_from_text_units(units, source_label="materialized_demo")
+    persist_fact_intake_payload(conn, payload)
+    run_id = payload["run"]["run_id"]
+    fact_id = payload["fact_candidates"][0]["fact_id"]
+
+    first = load_materialized_fact_review_payload(conn, run_id=run_id)
+    assert first["materialization"]["status"] == "miss"
+    assert first["payload"] == json.loads(json.dumps(build_fact_review_workbench_payload(conn, run_id=run_id)))
+    second = load_materialized_fact_review_payload(conn, run_id=run_id)
+    assert second["materialization"]["status"] == "hit"
+    assert second["payload"] == first["payload"]
+    assert second["materialization"]["payload_sha256"] == first["materialization"]["payload_sha256"]
+
+    conn.execute(
+        """
+        INSERT INTO fact_reviews(review_id, fact_id, review_status, reviewer, note, provenance_json)
+        VALUES ('review:mat', ?, 'accepted', 'reviewer@example', 'Checked against the lease.', '{}')
+        """,
+        (fact_id,),
+    )
+    conn.execute(
+        """
+        INSERT INTO fact_observations(
+          observation_id, run_id, statement_id, predicate_key, predicate_family, object_text, observation_status
+        ) VALUES ('obs:mat:actor', ?, ?, 'actor', ?, 'Tenant', 'captured')
+        """,
+        (run_id, payload["statements"][0]["statement_id"], OBSERVATION_PREDICATE_TO_FAMILY["actor"]),
+    )
+    conn.commit()
+
+    status = build_fact_review_materialization_status(conn, run_id=run_id)
+    workbench_status = next(row for row in status["materializations"] if row["payload_kind"] == "workbench")
+    assert workbench_status["status"] == "stale"
+    assert workbench_status["stale_generations"] == 2
+    assert next(row for row in status["materializations"] if row["payload_kind"] == "report")["status"] == "missing"
+
+    stale = load_materialized_fact_review_payload(conn, run_id=run_id, allow_stale=True)
+    assert stale["materialization"]["status"] == "stale"
+    assert stale["payload"]["facts"] == first["payload"]["facts"]
+
+    refreshed = load_materialized_fact_review_payload(conn, run_id=run_id)
+    assert refreshed["materialization"]["status"] == "refreshed"
+    assert refreshed["materialization"]["previous_generation"] == first["materialization"]["generation"]
+    assert refreshed["materialization"]["stale_generations"] == 0
+    refreshed_fact = next(row for row in refreshed["payload"]["facts"] if row["fact_id"] == fact_id)
+    assert refreshed_fact["latest_review_status"] == "accepted"
+    assert any(row["observation_id"] == "obs:mat:actor" for row in refreshed["payload"]["observations"])
+    assert refreshed["payload"] == json.loads(json.dumps(build_fact_review_workbench_payload(conn, run_id=run_id)))
+
+
+def test_semantic_refresh_reprimes_materialized_payloads_and_refresh_reports_cost() -> None:
+    conn = sqlite3.connect(":memory:")
+    units = [
+        TextUnit(
+            unit_id="unit:defer",
+            source_id="source-defer",
+            source_type="context_file",
+            text="The hearing was adjourned on 2024-03-04.",
+        )
+    ]
+    payload = build_fact_intake_payload_from_text_units(units, source_label="deferred_materialized_demo")
+    persist_fact_intake_payload(conn, payload, deferred_refresh=True)
+    run_id = payload["run"]["run_id"]
+
+    built = refresh_fact_review_materializations(conn, run_id=run_id, payload_kinds=["report", "operator_views"])
+    assert [row["status"] for row in built["materializations"]] == ["built", "built"]
+    assert built["refreshed_count"] == 2
+    assert all(row["build_seconds"] >= 0 and row["payload_bytes"] > 0 for row in built["materializations"])
+    assert refresh_fact_review_materializations(conn, run_id=run_id, payload_kinds=["report"])["refreshed_count"] == 0
+
+    semantic = persist_fact_semantic_materialization(conn, run_id=run_id)
+    assert [row["payload_kind"] for row in semantic["materialization"]["materializations"]] == ["operator_views", "report"]
+    assert {row["status"] for row in semantic["materialization"]["materializations"]} == {"refreshed"}
+    assert load_materialized_fact_review_payload(conn, run_id=run_id, payload_kind="report")["materialization"]["status"] == "hit"
+
+    with pytest.raises(ValueError):
+        load_materialized_fact_review_payload(conn, run_id=run_id, payload_kind="unknown")
@@ -1,11 +1,13 @@
 import pytest
 
-from src.judicial_behavior.model import CaseObservation
+from src.judicial_behavior.logistic import build_sparse_binary_design, fit_ridge_logistic_map
+from src.judicial_behavior.model import CaseObservation, ObservationColumns
 from src.judicial_behavior.bayes import beta_cdf, beta_ppf
 from src.judicial_behavior.stats import (
     IndividualStatsDisabledError,
     SliceDeclarationError,
     aggregate_beta_binomial,
+    aggregate_gamma_poisson,
     aggregate_outcomes,
     aggregate_ridge_logistic_map,
     aggregate_lognormal_tail,
@@ -190,3 +192,73 @@ def test_lognormal_tail_requires_slice_declaration_and_is_deterministic():
     assert out1["corpus"]["n_total"] == 2
     assert out1["corpus"]["time_min"] == "2020-01-01"
     assert out1["corpus"]["time_max"] == "2020-06-01"
+
+
+def _corpus():
+    courts = [("AU-NSW", "NSWSC", "trial"), ("AU-NSW", "NSWCA", "appeal"), ("AU-VIC", "VSC", "trial")]
+    outcomes = ["plaintiff", "defendant", "applicant", "partial", ""]
+    rows = []
+    for i in range(60):
+        jurisdiction, court, level = courts[i % 3]
+        rows.append(
+            CaseObservation(
+                case_id=f"c{i}",
+                jurisdiction_id=jurisdiction,
+                court_id=court,
+                court_level=level,
+                decision_date=f"{2015 + i % 7}-0{1 + i % 9}-01" if i % 5 else None,
+                wrong_type_id=("negligence", "defamation", None)[i % 4 % 3],
+                predicate_keys=tuple(k for j, k in enumerate(("a", "b", "c", "d")) if (i >> j) & 1),
+                outcome=outcomes[i * 7 % 5],
+            )
+        )
+    rows.append(CaseObservation(case_id="", jurisdiction_id="AU-NSW", court_id="NSWSC", court_level="trial"))
+    return rows
+
+
+def test_columnar_inputs_match_observation_inputs():
+    rows = _corpus()
+    columns = ObservationColumns.from_observations(rows)
+    mapping = {
+        name: [getattr(r, name) for r in rows]
+        for name in ("case_id", "jurisdiction_id", "court_id", "court_level", "decision_date", "wrong_type_id", "predicate_keys", "outcome")
+    }
+    assert len(columns) == 60
+    assert ObservationColumns.from_mapping(mapping) == columns
+
+    for group_by in (("jurisdiction_id", "court_id", "court_level"), ("court_level", "decision_year", "wrong_type_id")):
+        slice_decl = {"filters": {}, "group_by": list(group_by), "time_bounds_declared": {"start": None, "end": None}}
+        calls = (
+            lambda obs: aggregate_outcomes(obs, group_by=group_by, slice=slice_decl),
+            lambda obs: aggregate_beta_binomial(obs, group_by=group_by, baseline_by=("jurisdiction_id",), slice=slice_decl),
+            lambda obs: aggregate_gamma_poisson(obs, event_key="b", group_by=group_by, slice=slice_decl),
+            lambda obs: aggregate_ridge_logistic_map(obs, group_by=group_by, slice=slice_decl),
+        )
+        for call in calls:
+            expected = call(list(reversed(rows)))
+            assert call(columns) == expected
+            assert call(mapping) == expected
+
+    with pytest.raises(ValueError):
+        ObservationColumns.from_mapping({"case_id": ["c1"]})
+
+
+def test_ridge_logistic_backends_agree():
+    pytest.importorskip("numpy")
+    y = [i % 2 if i % 3 else 1 for i in range(40)]
+    keys = [[k for j, k in enumerate(("a", "b", "c", "d", "e")) if (i * 7 >> j) & 1] for i in range(40)]
+    names, rows = build_sparse_binary_design(y, keys)
+    rows.append((1, (0, 2, 2, 99)))  # duplicate and out-of-range indices
+    reference = fit_ridge_logistic_map(rows, n_features=len(names), backend="python")
+    fitted = fit_ridge_logistic_map(rows, n_features=len(names), backend="numpy")
+    assert fitted[2:] == reference[2:]
+    assert fitted[0] == pytest.approx(reference[0], abs=1e-12)
+    assert fitted[1] == pytest.approx(reference[1], abs=1e-12)
+    assert fit_ridge_logistic_map(rows, n_features=len(names), backend="numpy") == fitted
+    assert fit_ridge_logistic_map(rows, n_features=len(names)) == reference
+    for degenerate in ([], [(1, [])], [(1, [99])]):
+        expected = ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0), True, 1)
+        assert fit_ridge_logistic_map(degenerate, n_features=3, backend="python") == expected
+        assert fit_ridge_logistic_map(degenerate, n_features=3, backend="numpy") == expected
+    with pytest.raises(ValueError):
+        fit_ridge_logistic_map(rows, n_features=len(names), backend="gpu")
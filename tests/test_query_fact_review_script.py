@@ -198,6 +198,43 @@ def test_query_fact_review_script_lists_runs_and_summaries(tmp_path, capsys) ->
     assert summary_payload["summary"]["summary"]["missing_actor_review_queue_count"] >= 1
 
 
+def test_query_fact_review_script_serves_materialized_workbench(tmp_path, capsys) -> None:
+    db_path = tmp_path / "itir.sqlite"
+    run_id = _seed_fact_review_run(db_path)
+
+    exit_code = main(["--db-path", str(db_path), "workbench", "--run-id", run_id])
+    direct = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert "materialization" not in direct
+
+    statuses = []
+    for _ in range(2):
+        exit_code = main(["--db-path", str(db_path), "workbench", "--run-id", run_id, "--materialized"])
+        materialized = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert materialized["workbench"] == direct["workbench"]
+        statuses.append(materialized["materialization"]["status"])
+    assert statuses == ["miss", "hit"]
+
+    exit_code = main(
+        ["--db-path", str(db_path), "view", "--run-id", run_id, "--view-kind", "contested_items", "--materialized"]
+    )
+    view_payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert view_payload["materialization"]["payload_kind"] == "operator_views"
+    assert view_payload["run"]["run_id"] == run_id
+
+    exit_code = main(["--db-path", str(db_path), "materialization", "--run-id", run_id, "--refresh"])
+    refresh_payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert {row["payload_kind"]: row["status"] for row in refresh_payload["materialization"]["materializations"]} == {
+        "report": "built",
+        "run_summary": "fresh",
+        "operator_views": "fresh",
+        "workbench": "fresh",
+    }
+
+
 def test_query_fact_review_script_reports_review_queue_and_chronology(tmp_path, capsys) -> None:
     db_path = tmp_path / "itir.sqlite"
     run_id = _seed_fact_review_run(db_path)
@@ -38,3 +38,52 @@ def test_cli_search(tmp_path: Path):
     completed = subprocess.run(cmd, capture_output=True, text=True, check=True)
     data = json.loads(completed.stdout)
     assert any(r["type"] == "case" for r in data)
+
+
+def test_index_many_streams_batches_and_replaces(tmp_path: Path):
+    db = tmp_path / "bulk.db"
+    index = TextIndex(str(db))
+    records = (
+        {"identifier": f"prov{i}", "type": "provision", "text": f"provision {i} about dogs"}
+        for i in range(25)
+    )
+    assert index.index_many(records, batch_size=10) == 25
+    assert index.graph.nodes == {}
+
+    written = index.index_many(
+        [
+            ("prov3", "provision", "replaced text about cats"),
+            ("case1", "case", "a case about cats", {"court": "HCA"}),
+        ]
+    )
+    assert written == 2
+    assert index.graph.get_node("case1").metadata == {"court": "HCA"}
+    assert {r["id"] for r in index.search("cats")} == {"prov3", "case1"}
+    assert len(index.search("dogs", limit=100)) == 24
+    index.close()
+
+    reopened = TextIndex(str(db))
+    assert "prov3" not in reopened.graph.nodes
+    hits = reopened.search("cats")
+    assert {r["id"] for r in hits} == {"prov3", "case1"}
+    assert reopened.graph.get_node("prov3") is not None
+    reopened.close()
+
+
+def test_cli_search_index_maintenance(tmp_path: Path):
+    db_path = setup_index(tmp_path)
+    for action in ("rebuild", "optimize", "merge"):
+        cmd = ["python", "-m", "src.cli", "search-index", action, "--db", db_path]
+        completed = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        report = json.loads(completed.stdout)
+        assert report["action"] == action
+        assert report["rows"] == 4
+
+
+def test_closing_an_index_releases_a_shared_graph(tmp_path: Path):
+    from src.graph.models import LegalGraph
+
+    graph = LegalGraph()
+    for name in ("first", "second"):
+        TextIndex(str(tmp_path / f"{name}.db"), graph=graph).close()
+    assert graph._listeners == []
@@ -99,3 +99,41 @@ def test_relational_bundle_contract_matches_hedging_volatility_shape() -> None:
         if relation["type"] == "composition"
     ]
     assert "question" in composition_values
+
+
+def test_relational_bundle_parses_sentence_batches_in_bounded_chunks(monkeypatch) -> None:
+    from sensiblaw.interfaces import shared_reducer
+
+    events: list[object] = []
+    real_parse_many = shared_reducer._parse_many_with_spacy_or_fallback
+
+    def recording_parse_many(texts):
+        events.append(("parse", len(texts)))
+        return real_parse_many(texts)
+
+    monkeypatch.setattr(shared_reducer, "_parse_many_with_spacy_or_fallback", recording_parse_many)
+    monkeypatch.setattr(shared_reducer, "_RELATIONAL_BUNDLE_BATCH_MAX_SENTENCES", 1)
+    text = " ".join(f"The tenant paid rent {n}." for n in range(10))
+
+    bundle = collect_canonical_relational_bundle(
+        text,
+        progress_callback=lambda stage, details: events.append(stage),
+    )
+
+    _validate_relational_bundle_v1(bundle)
+    assert [event for event in events if isinstance(event, tuple)] == [("parse", 8), ("parse", 2)]
+    first_parse_done = events.index(("parse", 8))
+    assert "relational_bundle_progress" in events[first_parse_done:events.index(("parse", 2))]
+
+
+def test_relational_bundle_reparses_batches_with_an_empty_parse(monkeypatch) -> None:
+    from sensiblaw.interfaces import shared_reducer
+
+    batches = [
+        {"text": "The tenant paid rent.", "start_char": 0, "sentences": (), "parsed": {}},
+        {"text": "The landlord kept it.", "start_char": 22, "sentences": ()},
+    ]
+    parsed = list(shared_reducer._iter_batch_parses(batches))
+
+    assert [batch for batch, _ in parsed] == batches
+    assert all(payload.get("sents") for _, payload in parsed)
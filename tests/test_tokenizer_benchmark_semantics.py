@@ -38,3 +38,12 @@ def test_deterministic_benchmark_captures_gwb_reference_atoms():
     assert deterministic["legal_atom_capture_rate"] > legacy["legal_atom_capture_rate"]
     assert deterministic["linked_entity_capture_rate"] is not None
     assert deterministic["linked_entity_capture_rate"] > 0.0
+
+
+def test_missing_corpus_inputs_are_reported(tmp_path):
+    from SensibLaw.scripts.benchmark_tokenizer_corpora import _load_json
+
+    missing: list[str] = []
+    absent = tmp_path / "absent.json"
+    assert _load_json(absent, missing) == {}
+    assert missing == [str(absent)]
@@ -2,9 +2,11 @@
 
 import json
 import sqlite3
+import subprocess
 from datetime import date, datetime
 from pathlib import Path
 import sys
+import textwrap
 
 import pytest
 
@@ -253,6 +255,154 @@ def test_diff(tmp_path: Path):
     store.close()
 
 
+def test_snapshots_batch_and_cache(tmp_path: Path):
+    _, doc_id = make_store(tmp_path)
+    store = VersionedStore(str(tmp_path / "store.db"), snapshot_cache_size=128)
+    try:
+        other_id = store.generate_id()
+        meta = DocumentMetadata(jurisdiction="AU", citation="789", date=date(2019, 1, 1))
+        store.add_revision(
+            other_id,
+            Document(meta, "other", provisions=[Provision(text="Other", identifier="1")]),
+            date(2019, 1, 1),
+        )
+        requests = [
+            (doc_id, date(2020, 6, 1)),
+            (other_id, date(2021, 6, 1)),
+            (doc_id, date(2019, 6, 1)),
+            (doc_id, date(2021, 6, 1)),
+            (doc_id, date(2020, 6, 1)),
+        ]
+        batch = store.snapshots(requests)
+        assert [doc.body if doc else None for doc in batch] == [
+            "first",
+            "other",
+            None,
+            "second",
+            "first",
+        ]
+        for (requested_id, as_at), doc in zip(requests, batch):
+            single = store.snapshot(requested_id, as_at)
+            assert (single.to_dict() if single else None) == (doc.to_dict() if doc else None)
+        assert batch[3].provisions[0].atoms[0].text == "Perform the second duty"
+        assert store.snapshot(doc_id, date(2020, 6, 1)) is batch[0]
+
+        stats = store.snapshot_cache_stats()
+        assert stats["enabled"] and stats["entries"] == 3 and stats["hits"] >= 5
+
+        store.add_revision(doc_id, Document(meta, "third"), date(2022, 1, 1))
+        assert store.snapshot_cache_stats()["entries"] == 1
+        assert store.snapshot(doc_id, date(2022, 6, 1)).body == "third"
+    finally:
+        store.close()
+
+    uncached = VersionedStore(str(tmp_path / "store.db"))
+    try:
+        assert uncached.snapshot(doc_id, date(2020, 6, 1)).body == "first"
+        assert uncached.snapshot_cache_stats() == {"enabled": False}
+    finally:
+        uncached.close()
+
+
+def test_default_snapshots_are_owned_by_the_caller(tmp_path: Path):
+    store, doc_id = make_store(tmp_path)
+    try:
+        mutated = store.snapshot(doc_id, date(2021, 6, 1))
+        mutated.body = "scribbled"
+        mutated.provisions[0].text = "scribbled"
+
+        again = store.snapshot(doc_id, date(2021, 6, 1))
+        assert again is not mutated
+        assert again.body == "second"
+        assert again.provisions[0].text != "scribbled"
+    finally:
+        store.close()
+
+
+def test_delta_provisions_reconstruct_snapshots(tmp_path: Path):
+    meta = DocumentMetadata(jurisdiction="US", citation="456", date=date(2020, 1, 1))
+
+    def build(texts: dict[str, str]) -> list[Provision]:
+        part = Provision(text="Part", identifier="1", heading="Part", node_type="part")
+        part.children = [
+            Provision(
+                text=text,
+                identifier=identifier,
+                node_type="section",
+                rule_atoms=[RuleAtom(atom_type="rule", role="duty", text=text)],
+            )
+            for identifier, text in texts.items()
+        ]
+        return [part]
+
+    def outline(provisions: list[Provision]) -> list[tuple]:
+        return [
+            (
+                p.stable_id,
+                p.toc_id,
+                p.text,
+                [(atom.text, atom.toc_id) for atom in p.rule_atoms],
+                outline(p.children),
+            )
+            for p in provisions
+        ]
+
+    versions = [
+        {"s 1": "One", "s 2": "Two", "s 3": "Three"},
+        {"s 1": "One", "s 2": "Two amended", "s 3": "Three"},
+        {"s 1": "One", "s 2": "Two amended", "s 4": "Four"},
+        {"s 4": "Four", "s 1": "One", "s 2": "Two amended"},
+    ]
+    store = VersionedStore(
+        str(tmp_path / "delta.db"), delta_provisions=True, keyframe_interval=3
+    )
+    try:
+        doc_id = store.generate_id()
+        documents = []
+        for year, texts in enumerate(versions, start=2020):
+            document = Document(meta, str(texts), provisions=build(texts))
+            store.add_revision(doc_id, document, date(year, 1, 1))
+            documents.append(document)
+
+        keyframes = store.conn.execute(
+            "SELECT rev_id, keyframe FROM revision_deltas ORDER BY rev_id"
+        ).fetchall()
+        assert [tuple(row) for row in keyframes] == [(1, 1), (2, 0), (3, 0), (4, 1)]
+        stored_revs = store.conn.execute(
+            "SELECT DISTINCT rev_id FROM provisions ORDER BY rev_id"
+        ).fetchall()
+        assert [row[0] for row in stored_revs] == [1]
+
+        for year, document in enumerate(documents, start=2020):
+            snapshot = store.snapshot(doc_id, date(year, 6, 1))
+            assert snapshot is not None
+            assert outline(snapshot.provisions) == outline(document.provisions)
+            sections = snapshot.provisions[0].children
+            assert [p.rule_atoms[0].toc_id for p in sections] == [p.toc_id for p in sections]
+            assert [entry.identifier for entry in snapshot.toc_entries[0].children] == [
+                p.identifier for p in sections
+            ]
+
+        changes = {c.provision_key: c.change for c in store.diff_provisions(doc_id, 1, 2)}
+        assert changes == {"us/456/part-1/section-s-2": "modified"}
+        changes = {c.provision_key: c.change for c in store.provision_changes(doc_id, 3)}
+        assert changes == {
+            "us/456/part-1/section-s-3": "removed",
+            "us/456/part-1/section-s-4": "added",
+        }
+        changes = {c.provision_key: c.change for c in store.diff_provisions(doc_id, 3, 4)}
+        assert set(changes.values()) == {"moved"}
+        changes = {c.provision_key: c.change for c in store.diff_provisions(doc_id, 1, 4)}
+        assert changes == {
+            "us/456/part-1/section-s-1": "moved",
+            "us/456/part-1/section-s-2": "modified",
+            "us/456/part-1/section-s-3": "removed",
+            "us/456/part-1/section-s-4": "added",
+        }
+    finally:
+        store.close()
+
+
 def test_provenance_metadata(tmp_path: Path):
     store, doc_id = make_store(tmp_path)
     snap = store.snapshot(doc_id, date(2022, 1, 1))
@@ -1885,7 +2035,7 @@ def test_process_pdf_persists_normalized(tmp_path: Path, monkeypatch):
     db_path = tmp_path / "store.db"
     output_path = tmp_path / "out.json"
 
-    def fake_extract_pdf_text(_path: Path):
+    def fake_extract_pdf_text(_path: Path, **_options):
         yield {
             "page": 1,
             "heading": "1 Heading",
@@ -2057,3 +2207,146 @@ def test_revisions_effective_date_index(tmp_path: Path) -> None:
         assert effective_row["desc"] == 1
     finally:
         store.close()
+
+
+def _bulk_document(index: int) -> Document:
+    meta = DocumentMetadata(
+        jurisdiction="AU",
+        citation=f"bulk-{index}",
+        date=date(2020, 1, 1),
+        canonical_id=f"bulk-{index}",
+    )
+    provision = Provision(
+        text=f"Section {index} of the Native Title Act 1993 (Cth) applies.",
+        identifier=f"s {index}",
+        heading=f"Heading {index}",
+        node_type="section",
+    )
+    return Document(meta, provision.text, provisions=[provision])
+
+
+def test_bulk_load_batches_revisions_and_restores_indexes(tmp_path: Path) -> None:
+    store = VersionedStore(str(tmp_path / "bulk.db"))
+    try:
+        indexes_before = {
+            row["name"]
+            for row in store.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'lexeme_occurrences'"
+            )
+        }
+        doc_ids = [store.generate_id() for _ in range(5)]
+        with store.bulk_load(batch_size=2) as report:
+            assert "idx_lexeme_occurrences_lexeme" not in {
+                row["name"]
+                for row in store.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            for index, doc_id in enumerate(doc_ids, start=1):
+                store.add_revision(doc_id, _bulk_document(index), date(2020, 1, 1))
+
+        assert report.revisions == 5
+        assert report.commits == 3
+        assert report.rows["revisions"] == 5
+        assert report.rows["provisions"] == 5
+        assert report.rows["provision_text_fts"] == 5
+        assert report.rows["lexeme_occurrences"] > 0
+        assert set(report.rows_per_second()) == set(report.rows)
+        assert report.to_dict()["rows"] == report.rows
+
+        indexes_after = {
+            row["name"]
+            for row in store.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'lexeme_occurrences'"
+            )
+        }
+        assert indexes_after == indexes_before
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert store.conn.execute("SELECT COUNT(*) FROM bulk_load_deferred_indexes").fetchone()[0] == 0
+        hits = store.conn.execute(
+            "SELECT doc_id FROM provision_text_fts WHERE provision_text_fts MATCH 'native'"
+        ).fetchall()
+        assert len(hits) == 5
+        snapshot = store.snapshot(doc_ids[2], date(2021, 1, 1))
+        assert snapshot is not None
+        assert snapshot.provisions[0].identifier == "s 3"
+    finally:
+        store.close()
+
+
+def test_bulk_load_rolls_back_only_the_uncommitted_batch(tmp_path: Path) -> None:
+    store = VersionedStore(str(tmp_path / "bulk.db"))
+    try:
+        doc_ids = [store.generate_id() for _ in range(3)]
+        with pytest.raises(RuntimeError, match="stop"):
+            with store.bulk_load(batch_size=2):
+                for index, doc_id in enumerate(doc_ids, start=1):
+                    store.add_revision(doc_id, _bulk_document(index), date(2020, 1, 1))
+                raise RuntimeError("stop")
+
+        stored = store.conn.execute("SELECT COUNT(*) FROM revisions").fetchone()[0]
+        assert stored == 2
+        assert store.conn.in_transaction is False
+    finally:
+        store.close()
+
+
+def test_bulk_load_keeps_a_wal_store_in_wal(tmp_path: Path) -> None:
+    store = VersionedStore(str(tmp_path / "bulk.db"), wal=True)
+    try:
+        with store.bulk_load():
+            store.add_revision(store.generate_id(), _bulk_document(1), date(2020, 1, 1))
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        store.close()
+
+
+def test_reopen_rebuilds_indexes_dropped_by_an_interrupted_bulk_load(tmp_path: Path) -> None:
+    path = str(tmp_path / "bulk.db")
+
+    def index_names(conn) -> set[str]:
+        return {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'lexeme_occurrences'"
+            )
+        }
+
+    store = VersionedStore(path)
+    try:
+        indexes_before = index_names(store.conn)
+    finally:
+        store.close()
+
+    # The process dies inside the load, without running its finaliser.
+    crash = textwrap.dedent(
+        f"""
+        import os
+        from datetime import date
+        from src.models.document import Document, DocumentMetadata
+        from src.models.provision import Provision
+        from src.storage import VersionedStore
+
+        meta = DocumentMetadata(jurisdiction="AU", citation="bulk-1", date=date(2020, 1, 1), canonical_id="bulk-1")
+        provision = Provision(text="Section 1 applies.", identifier="s 1", heading="Heading", node_type="section")
+        store = VersionedStore({path!r})
+        doc_id = store.generate_id()
+        with store.bulk_load():
+            store.add_revision(doc_id, Document(meta, provision.text, provisions=[provision]), date(2020, 1, 1))
+            os._exit(0)
+        """
+    )
+    subprocess.run([sys.executable, "-c", crash], cwd=Path(__file__).resolve().parents[1], check=True)
+    with sqlite3.connect(path) as conn:
+        assert index_names(conn) < indexes_before
+
+    reopened = VersionedStore(path)
+    try:
+        assert index_names(reopened.conn) == indexes_before
+        assert reopened.conn.execute("SELECT COUNT(*) FROM bulk_load_deferred_indexes").fetchone()[0] == 0
+        automerge = reopened.conn.execute(
+            "SELECT v FROM provision_text_fts_config WHERE k = 'automerge'"
+        ).fetchone()
+        assert automerge[0] == 4
+    finally:
+        reopened.close()
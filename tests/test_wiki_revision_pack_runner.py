@@ -923,3 +923,203 @@ def test_pack_runner_keeps_pair_payload_in_memory_not_json_working_state() -> No
     assert 'report_path=current_report_path or (Path(str(previous_state["report_path"]))' not in source
     assert 'timeline_path=current_timeline_path or (Path(str(previous_state["timeline_path"]))' not in source
     assert 'aoo_path=current_aoo_path or (Path(str(previous_state["aoo_path"]))' not in source
+
+
+def _multi_article_pack(tmp_path: Path, article_ids: list[str]) -> Path:
+    pack_path = _pack(tmp_path)
+    payload = json.loads(pack_path.read_text(encoding="utf-8"))
+    template = payload["articles"][0]
+    payload["articles"] = [dict(template, article_id=article_id) for article_id in article_ids]
+    pack_path.write_text(json.dumps(payload), encoding="utf-8")
+    return pack_path
+
+
+def test_pack_runner_concurrent_workers_match_serial_run(tmp_path: Path) -> None:
+    pack_path = _multi_article_pack(tmp_path, [f"article_{index}" for index in range(5)])
+    fetch_current, fetch_revision, fetch_history, build_timeline, build_aoo, auto_review_context = _fake_env(tmp_path, {"value": 2})
+
+    def run_with(name: str, **options):
+        seen: list[tuple[str, dict]] = []
+        summary = run(
+            pack_path=pack_path,
+            out_dir=tmp_path / name / "out",
+            state_db_path=tmp_path / name / "state.sqlite",
+            fetch_current_snapshot_fn=fetch_current,
+            fetch_revision_history_fn=fetch_history,
+            fetch_revision_snapshot_fn=fetch_revision,
+            build_timeline_fn=build_timeline,
+            build_aoo_fn=build_aoo,
+            auto_review_context_fn=auto_review_context,
+            progress_callback=lambda stage, details: seen.append((stage, details)),
+            **options,
+        )
+        finished = [details["completed"] for stage, details in seen if stage == "revision_pack_article_finished"]
+        with sqlite3.connect(tmp_path / name / "state.sqlite") as conn:
+            state = conn.execute("SELECT article_id, last_revid FROM wiki_revision_monitor_article_state ORDER BY article_id").fetchall()
+        return summary, finished, state
+
+    serial, serial_finished, serial_state = run_with("serial")
+    concurrent, concurrent_finished, concurrent_state = run_with("concurrent", max_workers=3)
+
+    assert concurrent["counts"] == serial["counts"]
+    assert concurrent["candidate_pair_counts"] == serial["candidate_pair_counts"]
+    assert [(row["article_id"], row["status"]) for row in concurrent["articles"]] == [
+        (row["article_id"], row["status"]) for row in serial["articles"]
+    ]
+    assert {row["status"] for row in serial["articles"]} == {"changed"}
+    assert concurrent_finished == serial_finished == [1, 2, 3, 4, 5]
+    assert concurrent_state == serial_state
+
+
+def test_pack_runner_in_process_pulls_from_wiki_api(tmp_path: Path, monkeypatch) -> None:
+    from tests.factories.wiki_api import stub_wiki_api
+    from src.sources.rate_limit import RateLimit
+
+    titles = ["Stub Article One", "Stub Article Two"]
+    pack_path = tmp_path / "pack.json"
+    pack_path.write_text(
+        json.dumps(
+            {
+                "pack_id": "stub_pack",
+                "history_defaults": {"max_revisions": 4, "window_days": 0, "max_candidate_pairs": 1},
+                "articles": [{"article_id": f"stub_{index}", "wiki": "enwiki", "title": title} for index, title in enumerate(titles)],
+            }
+        ),
+        encoding="utf-8",
+    )
+    _, _, _, build_timeline, build_aoo, _ = _fake_env(tmp_path, {"value": 1})
+
+    with stub_wiki_api(titles, latency_s=0.0) as api:
+        monkeypatch.setenv("WIKI_PULL_API_BASE", api)
+        result = run(
+            pack_path=pack_path,
+            out_dir=tmp_path / "out",
+            state_db_path=tmp_path / "state.sqlite",
+            build_timeline_fn=build_timeline,
+            build_aoo_fn=build_aoo,
+            auto_review_context_fn=lambda **_: {},
+            execution="in_process",
+            max_workers=2,
+            wiki_rate_limits={"enwiki": RateLimit(rps=100.0, burst=100)},
+        )
+
+    assert result["counts"]["error"] == 0
+    assert result["counts"]["changed"] == 2
+    assert [row["history_window"]["fetched_row_count"] for row in result["articles"]] == [4, 4]
+
+
+def test_pack_runner_in_process_reports_unknown_wiki_as_article_error(tmp_path: Path, monkeypatch) -> None:
+    from tests.factories.wiki_api import stub_wiki_api
+
+    titles = ["Stub Article One", "Stub Article Two"]
+    pack_path = tmp_path / "pack.json"
+    pack_path.write_text(
+        json.dumps(
+            {
+                "pack_id": "stub_pack",
+                "history_defaults": {"max_revisions": 4, "window_days": 0, "max_candidate_pairs": 1},
+                "articles": [
+                    {"article_id": "stub_bad", "wiki": "nosuchwiki", "title": titles[0]},
+                    {"article_id": "stub_good", "wiki": "enwiki", "title": titles[1]},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    _, _, _, build_timeline, build_aoo, _ = _fake_env(tmp_path, {"value": 1})
+
+    with stub_wiki_api(titles, latency_s=0.0) as api:
+        monkeypatch.setenv("WIKI_PULL_API_BASE", api)
+        result = run(
+            pack_path=pack_path,
+            out_dir=tmp_path / "out",
+            state_db_path=tmp_path / "state.sqlite",
+            build_timeline_fn=build_timeline,
+            build_aoo_fn=build_aoo,
+            auto_review_context_fn=lambda **_: {},
+            execution="in_process",
+        )
+
+    assert result["counts"]["error"] == 1
+    assert result["counts"]["changed"] == 1
+    bad = result["articles"][0]
+    assert bad["status"] == "error"
+    assert bad["error"].startswith("RuntimeError: wiki_pull_api.py exited: unknown wiki 'nosuchwiki'")
+
+
+def test_pack_runner_concurrent_repeated_article_ids_match_serial_run(tmp_path: Path) -> None:
+    import pytest
+
+    pack_path = _multi_article_pack(tmp_path, ["article_a", "article_a", "article_b", "article_b"])
+    fetch_current, fetch_revision, _, build_timeline, build_aoo, auto_review_context = _fake_env(tmp_path, {"value": 2})
+
+    def fetch_history(*, article, out_dir, python_cmd, repo_root, max_revisions, window_days):
+        return {"history_path": None, "history_payload": {"rows": []}}
+
+    def statuses(name: str, **options) -> list[tuple[str, str]]:
+        seen: list[tuple[str, str]] = []
+        # The run summary keys changed articles by (run_id, article_id), so a
+        # repeated id fails there; the per-article outcomes come first.
+        with pytest.raises(sqlite3.IntegrityError):
+            run(
+                pack_path=pack_path,
+                out_dir=tmp_path / name / "out",
+                state_db_path=tmp_path / name / "state.sqlite",
+                fetch_current_snapshot_fn=fetch_current,
+                fetch_revision_history_fn=fetch_history,
+                fetch_revision_snapshot_fn=fetch_revision,
+                build_timeline_fn=build_timeline,
+                build_aoo_fn=build_aoo,
+                auto_review_context_fn=auto_review_context,
+                progress_callback=lambda stage, details: seen.append((details["article_id"], details["status"]))
+                if stage == "revision_pack_article_finished"
+                else None,
+                **options,
+            )
+        return seen
+
+    serial = statuses("serial")
+    assert serial == [
+        ("article_a", "baseline_initialized"),
+        ("article_a", "unchanged"),
+        ("article_b", "baseline_initialized"),
+        ("article_b", "unchanged"),
+    ]
+    assert statuses("concurrent", max_workers=3) == serial
+
+
+def test_pack_runner_runs_one_pull_subprocess_per_wiki(tmp_path: Path, monkeypatch) -> None:
+    import threading
+    import time
+
+    from src.sources.rate_limit import RateLimit
+    from src.wiki_timeline import revision_pack_runner
+
+    pack_path = _multi_article_pack(tmp_path, [f"article_{index}" for index in range(4)])
+    _, _, _, build_timeline, build_aoo, _ = _fake_env(tmp_path, {"value": 1})
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def fake_subprocess_json(args, *, cwd):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        return {"snapshots": [], "histories": []}
+
+    monkeypatch.setattr(revision_pack_runner, "_subprocess_json", fake_subprocess_json)
+    result = run(
+        pack_path=pack_path,
+        out_dir=tmp_path / "out",
+        state_db_path=tmp_path / "state.sqlite",
+        build_timeline_fn=build_timeline,
+        build_aoo_fn=build_aoo,
+        auto_review_context_fn=lambda **_: {},
+        max_workers=4,
+        wiki_rate_limits={"enwiki": RateLimit(rps=1000.0, burst=1000)},
+    )
+
+    assert result["counts"]["error"] == 4
+    assert running["peak"] == 1
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+np = pytest.importorskip("numpy")
+
+from src.text.fingerprints import (  # noqa: E402
+    SimHashIndex,
+    fnv1a_64,
+    hash_tokens,
+    minhash_jaccard,
+    minhash_many,
+    simhash_many,
+)
+from src.text.similarity import _tokenize  # noqa: E402
+
+_WORDS = ["claimant", "relief", "section", "é", "affidavit", "exhibit", "x" * 40, "12"]
+
+
+def _reference_simhash(text: str) -> int:
+    votes = [0] * 64
+    for token in _tokenize(text):
+        value = fnv1a_64(token)
+        for bit in range(64):
+            votes[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if votes[bit] >= 0)
+
+
+def _texts(count: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(_WORDS) for _ in range(rng.randrange(0, 15)))
+        for _ in range(count)
+    ]
+
+
+def test_hash_tokens_matches_scalar_fnv1a():
+    tokens = ["alpha", "", "é", "x" * 40, "a", "alpha"]
+    assert hash_tokens(tokens).tolist() == [fnv1a_64(token) for token in tokens]
+    assert fnv1a_64("") == 0xCBF29CE484222325
+
+
+def test_simhash_many_matches_per_text_reference_across_chunks():
+    texts = _texts(300)
+    expected = [_reference_simhash(text) for text in texts]
+    assert simhash_many(texts).tolist() == expected
+    assert simhash_many(texts, chunk_tokens=5).tolist() == expected
+    assert simhash_many(["", "..."]).tolist() == [0xFFFFFFFFFFFFFFFF] * 2
+
+
+def test_minhash_many_is_chunk_independent_and_estimates_jaccard():
+    texts = _texts(200) + [
+        "the claimant seeks relief under section 12 of the act",
+        "the claimant seeks relief under section 13 of the act",
+    ]
+    signatures = minhash_many(texts, num_perm=128)
+    assert signatures.shape == (len(texts), 128)
+    assert (minhash_many(texts, num_perm=128, chunk_tokens=64) == signatures).all()
+    estimate = minhash_jaccard(signatures[-1], signatures[-2])
+    # True token Jaccard is 9/11.
+    assert abs(estimate - 9 / 11) < 0.15
+    with pytest.raises(ValueError):
+        minhash_many(texts, num_perm=0)
+
+
+@pytest.mark.parametrize("threshold", [0, 3, 10, 64])
+def test_simhash_index_matches_linear_scan(threshold):
+    rng = random.Random(threshold)
+    base = [rng.getrandbits(64) for _ in range(40)]
+    fingerprints = [value ^ (1 << rng.randrange(64)) * rng.randrange(2) for value in base * 5]
+    index = SimHashIndex(threshold)
+    index.add_many(enumerate(fingerprints))
+    for probe in fingerprints[:30]:
+        expected = [
+            (position, (value ^ probe).bit_count())
+            for position, value in enumerate(fingerprints)
+            if (value ^ probe).bit_count() <= threshold
+        ]
+        assert index.query(probe) == expected
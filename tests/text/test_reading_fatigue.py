@@ -11,6 +11,7 @@ from src.text.reading_fatigue import (
     build_pin_cite_navigator,
     focus_lane,
 )
+from src.text.similarity import simhash
 
 
 def _paragraph(pid: str, text: str, *, issues=(), factors=(), deadlines=()):
@@ -56,6 +57,8 @@ def test_duplicate_detector_groups_across_drafts():
     assert len(groups) == 1
     group = groups[0]
     assert {hit.paragraph.pid for hit in group.hits} == {"p1", "p3"}
+    # The default stays on the MD5 SimHash used before the batch engine.
+    assert group.fingerprint == simhash("The claimant seeks relief under section 12.")
 
 
 def test_focus_lane_defaults_to_metadata_paragraphs():
@@ -79,3 +82,48 @@ def test_focus_lane_filters_by_explicit_targets():
     focused = focus_lane(paragraphs, focus_issues=["liability"], focus_deadlines=["lodgement"])
     assert [p.pid for p in focused] == ["p2", "p3"]
 
+
+
+def test_duplicate_detector_engines_match_pairwise_grouping():
+    import random
+
+    rng = random.Random(5)
+    words = [f"term{n}" for n in range(400)]
+    base = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(30)]
+    drafts = [
+        [
+            _paragraph(f"d{d}p{i}", text if rng.random() < 0.7 else text + " amended")
+            for i, text in enumerate(base)
+        ]
+        for d in range(3)
+    ]
+
+    def pairwise(threshold):
+        flat = [(d, p) for d, draft in enumerate(drafts) for p in draft]
+        fps = [int(simhash(p.text), 16) for _, p in flat]
+        consumed, groups = set(), []
+        for i, (d, p) in enumerate(flat):
+            if i in consumed:
+                continue
+            hits = [p.pid]
+            for j in range(i + 1, len(flat)):
+                if j in consumed or flat[j][0] == d:
+                    continue
+                if (fps[i] ^ fps[j]).bit_count() <= threshold:
+                    hits.append(flat[j][1].pid)
+                    consumed.add(j)
+            if len(hits) > 1:
+                consumed.add(i)
+                groups.append(tuple(hits))
+        return groups
+
+    for threshold in (0, 3, 8):
+        legacy = DuplicateDetector(threshold=threshold, engine="legacy").find_duplicates(drafts)
+        assert [tuple(h.paragraph.pid for h in g.hits) for g in legacy] == pairwise(threshold)
+
+    batch = DuplicateDetector(threshold=3, engine="batch").find_duplicates(drafts)
+    assert {frozenset(h.paragraph.pid for h in g.hits) for g in batch} >= {
+        frozenset(f"d{d}p{i}" for d in range(3))
+        for i in range(len(base))
+        if len({drafts[d][i].text for d in range(3)}) == 1
+    }
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+pytest.importorskip("spacy")
+
+from src.text.sentence_segmenter import iter_sentences, segment
+from src.text.sentences import build_canonical_sentence_units, segment_sentences
+
+CORPORA = Path(__file__).resolve().parents[1] / "fixtures" / "corpora"
+
+_WORDS = [
+    "the", "Court", "held", "s.", "5(1).", "Mr.", "e.g.", "i.e.", "U.S.", "3.5", "No.",
+    '"yes."', "(no.)", "'a.'", "...", "!", "?", "?!", "x?)", "etc.", "—", "。", "\n", "\n\n",
+    " \n \n", "  ", "\t",
+]
+
+
+def _spacy_rows(text: str) -> list[tuple[str, int, int, int]]:
+    return [(s.text, s.start_char, s.end_char, s.index) for s in segment_sentences(text, engine="spacy")]
+
+
+def _rows(sentences) -> list[tuple[str, int, int, int]]:
+    return [(s.text, s.start_char, s.end_char, s.index) for s in sentences]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        "First sentence. Second sentence.",
+        "Heading\n\nBody continues? Indeed!",
+        " A short clause. And another one!  Final bit?",
+        'Mr. Smith said "Stop." Then (again.) he left... Really?! Yes',
+        "See s. 5(1). The rate is 3.5 per cent. E.g. this, i.e. that. U.S. law.",
+        "Trailing paragraph.\n\n",
+        "\n\nLeading paragraph\n \n next one\nsame one.",
+        "No terminal punctuation at all",
+    ],
+)
+def test_rules_engine_matches_spacy_on_examples(text: str) -> None:
+    assert _rows(segment(text)) == _spacy_rows(text)
+
+
+def test_rules_engine_matches_spacy_on_fixture_corpora() -> None:
+    paths = sorted(CORPORA.rglob("*.txt"))
+    assert paths
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        assert _rows(segment(text)) == _spacy_rows(text), path
+
+
+@settings(max_examples=200, deadline=None)
+@given(st.lists(st.sampled_from(_WORDS), max_size=30), st.integers(min_value=1, max_value=9))
+def test_rules_engine_and_stream_match_spacy(words: list[str], piece_size: int) -> None:
+    text = " ".join(words)
+    expected = _spacy_rows(text)
+    assert _rows(segment(text)) == expected
+    pieces = (text[i : i + piece_size] for i in range(0, len(text), piece_size))
+    assert _rows(iter_sentences(pieces)) == expected
+
+
+def _split(text: str, cuts: list[int]) -> list[str]:
+    points = sorted({0, len(text), *(cut % (len(text) + 1) for cut in cuts)})
+    return [text[start:stop] for start, stop in zip(points, points[1:])]
+
+
+def test_stream_keeps_a_sentence_started_mid_chunk_whole() -> None:
+    text = 'Hello ss."Ltd.   world. Bye.'
+    assert _rows(iter_sentences([text[:15], text[15:]])) == _rows(segment(text))
+
+
+@settings(max_examples=300, deadline=None)
+@given(
+    st.lists(st.sampled_from(_WORDS + ['ss."Ltd.', "Inc.", '."Co.', "a.)b."]), max_size=40),
+    st.lists(st.integers(min_value=0), max_size=12),
+)
+def test_stream_matches_segment_at_random_split_points(words: list[str], cuts: list[int]) -> None:
+    text = " ".join(words)
+    assert _rows(iter_sentences(_split(text, cuts))) == _rows(segment(text))
+
+
+def test_stream_matches_segment_on_fixture_corpora_split_randomly() -> None:
+    import random
+
+    rng = random.Random(20261016)
+    for path in sorted(CORPORA.rglob("*.txt")):
+        text = path.read_text(encoding="utf-8")
+        cuts = [rng.randrange(len(text) + 1) for _ in range(len(text) // 40 + 1)]
+        assert _rows(iter_sentences(_split(text, cuts))) == _rows(segment(text)), path
+
+
+def test_canonical_units_use_the_rules_engine() -> None:
+    units = build_canonical_sentence_units([{"page": 1, "text": "One. Two\n\nthree"}])
+    assert [unit.sentence.text for unit in units] == ["One.", "Two", "three"]
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        segment_sentences("text", engine="regex")